@@ -14,237 +14,252 @@
 
 from __future__ import absolute_import
 
-# import apis into sdk package
-from deep_lynx.api.authentication_api import AuthenticationApi
-from deep_lynx.api.containers_api import ContainersApi
-from deep_lynx.api.data_export_api import DataExportApi
-from deep_lynx.api.data_query_api import DataQueryApi
-from deep_lynx.api.data_sources_api import DataSourcesApi
-from deep_lynx.api.data_targets_api import DataTargetsApi
-from deep_lynx.api.data_type_mappings_api import DataTypeMappingsApi
-from deep_lynx.api.events_api import EventsApi
-from deep_lynx.api.graph_api import GraphApi
-from deep_lynx.api.imports_api import ImportsApi
-from deep_lynx.api.metatype_keys_api import MetatypeKeysApi
-from deep_lynx.api.metatype_relationship_keys_api import MetatypeRelationshipKeysApi
-from deep_lynx.api.metatype_relationship_pairs_api import MetatypeRelationshipPairsApi
-from deep_lynx.api.metatype_relationships_api import MetatypeRelationshipsApi
-from deep_lynx.api.metatypes_api import MetatypesApi
-from deep_lynx.api.misc_api import MiscApi
-from deep_lynx.api.tags_api import TagsApi
-from deep_lynx.api.tasks_api import TasksApi
-from deep_lynx.api.time_series_api import TimeSeriesApi
-from deep_lynx.api.users_api import UsersApi
-from deep_lynx.api.default_api import DefaultApi
-# import ApiClient
-from deep_lynx.api_client import ApiClient
-from deep_lynx.configuration import Configuration
-# import models into sdk package
-from deep_lynx.models.add_data_to_import_response import AddDataToImportResponse
-from deep_lynx.models.assign_role_request import AssignRoleRequest
-from deep_lynx.models.batch_container_update_request import BatchContainerUpdateRequest
-from deep_lynx.models.batch_container_update_request_inner import BatchContainerUpdateRequestInner
-from deep_lynx.models.batch_update_container_response import BatchUpdateContainerResponse
-from deep_lynx.models.container import Container
-from deep_lynx.models.container_config import ContainerConfig
-from deep_lynx.models.container_id_data_source_templates_body import ContainerIdDataSourceTemplatesBody
-from deep_lynx.models.container_import_request import ContainerImportRequest
-from deep_lynx.models.container_import_response import ContainerImportResponse
-from deep_lynx.models.container_import_update_response import ContainerImportUpdateResponse
-from deep_lynx.models.container_invite import ContainerInvite
-from deep_lynx.models.containerscontainer_iddata_source_templates_custom_fields import ContainerscontainerIddataSourceTemplatesCustomFields
-from deep_lynx.models.create_container_request import CreateContainerRequest
-from deep_lynx.models.create_container_response import CreateContainerResponse
-from deep_lynx.models.create_data_export_request import CreateDataExportRequest
-from deep_lynx.models.create_data_source_config import CreateDataSourceConfig
-from deep_lynx.models.create_data_source_request import CreateDataSourceRequest
-from deep_lynx.models.create_data_sources_response import CreateDataSourcesResponse
-from deep_lynx.models.create_data_target_config import CreateDataTargetConfig
-from deep_lynx.models.create_data_target_request import CreateDataTargetRequest
-from deep_lynx.models.create_data_targets_response import CreateDataTargetsResponse
-from deep_lynx.models.create_event_action_request import CreateEventActionRequest
-from deep_lynx.models.create_event_action_response import CreateEventActionResponse
-from deep_lynx.models.create_event_request import CreateEventRequest
-from deep_lynx.models.create_event_response import CreateEventResponse
-from deep_lynx.models.create_import_response import CreateImportResponse
-from deep_lynx.models.create_manual_import import CreateManualImport
-from deep_lynx.models.create_manual_import_response import CreateManualImportResponse
-from deep_lynx.models.create_metatype_key_request import CreateMetatypeKeyRequest
-from deep_lynx.models.create_metatype_keys_response import CreateMetatypeKeysResponse
-from deep_lynx.models.create_metatype_relationship_key_request import CreateMetatypeRelationshipKeyRequest
-from deep_lynx.models.create_metatype_relationship_keys_response import CreateMetatypeRelationshipKeysResponse
-from deep_lynx.models.create_metatype_relationship_pair_request import CreateMetatypeRelationshipPairRequest
-from deep_lynx.models.create_metatype_relationship_pairs_response import CreateMetatypeRelationshipPairsResponse
-from deep_lynx.models.create_metatype_relationship_request import CreateMetatypeRelationshipRequest
-from deep_lynx.models.create_metatype_relationships_response import CreateMetatypeRelationshipsResponse
-from deep_lynx.models.create_metatype_request import CreateMetatypeRequest
-from deep_lynx.models.create_metatypes_response import CreateMetatypesResponse
-from deep_lynx.models.create_or_update_edges_request import CreateOrUpdateEdgesRequest
-from deep_lynx.models.create_or_update_nodes_request import CreateOrUpdateNodesRequest
-from deep_lynx.models.create_service_user import CreateServiceUser
-from deep_lynx.models.create_service_user_response import CreateServiceUserResponse
-from deep_lynx.models.create_task_response import CreateTaskResponse
-from deep_lynx.models.create_transformation_response import CreateTransformationResponse
-from deep_lynx.models.create_type_mapping_transformations_request import CreateTypeMappingTransformationsRequest
-from deep_lynx.models.data_export_config import DataExportConfig
-from deep_lynx.models.data_source import DataSource
-from deep_lynx.models.data_source_config import DataSourceConfig
-from deep_lynx.models.data_source_id_files_body import DataSourceIdFilesBody
-from deep_lynx.models.data_source_id_imports_body import DataSourceIdImportsBody
-from deep_lynx.models.data_source_id_imports_body1 import DataSourceIdImportsBody1
-from deep_lynx.models.data_source_import import DataSourceImport
-from deep_lynx.models.data_staging import DataStaging
-from deep_lynx.models.data_target import DataTarget
-from deep_lynx.models.data_target_config import DataTargetConfig
-from deep_lynx.models.edge import Edge
-from deep_lynx.models.error_model import ErrorModel
-from deep_lynx.models.error_response import ErrorResponse
-from deep_lynx.models.event import Event
-from deep_lynx.models.event_action import EventAction
-from deep_lynx.models.event_action_status import EventActionStatus
-from deep_lynx.models.exporter import Exporter
-from deep_lynx.models.exporter_config import ExporterConfig
-from deep_lynx.models.file_info import FileInfo
-from deep_lynx.models.file_model import FileModel
-from deep_lynx.models.files_file_id_body import FilesFileIdBody
-from deep_lynx.models.files_file_id_body1 import FilesFileIdBody1
-from deep_lynx.models.generic200_response import Generic200Response
-from deep_lynx.models.get_container_response import GetContainerResponse
-from deep_lynx.models.get_data_export_response import GetDataExportResponse
-from deep_lynx.models.get_data_source_response import GetDataSourceResponse
-from deep_lynx.models.get_data_target_response import GetDataTargetResponse
-from deep_lynx.models.get_data_type_mapping_response import GetDataTypeMappingResponse
-from deep_lynx.models.get_edge_response import GetEdgeResponse
-from deep_lynx.models.get_event_action_response import GetEventActionResponse
-from deep_lynx.models.get_event_action_status_response import GetEventActionStatusResponse
-from deep_lynx.models.get_file_info_response import GetFileInfoResponse
-from deep_lynx.models.get_import_data_response import GetImportDataResponse
-from deep_lynx.models.get_metatype_key_response import GetMetatypeKeyResponse
-from deep_lynx.models.get_metatype_relationship_key_response import GetMetatypeRelationshipKeyResponse
-from deep_lynx.models.get_metatype_relationship_pair_response import GetMetatypeRelationshipPairResponse
-from deep_lynx.models.get_metatype_relationship_response import GetMetatypeRelationshipResponse
-from deep_lynx.models.get_metatype_response import GetMetatypeResponse
-from deep_lynx.models.get_node_response import GetNodeResponse
-from deep_lynx.models.get_task_response import GetTaskResponse
-from deep_lynx.models.get_user_response import GetUserResponse
-from deep_lynx.models.graphs_tags_body import GraphsTagsBody
-from deep_lynx.models.graphs_webgl_body import GraphsWebglBody
-from deep_lynx.models.import_data_type_mapping_response import ImportDataTypeMappingResponse
-from deep_lynx.models.import_data_type_mapping_response_inner import ImportDataTypeMappingResponseInner
-from deep_lynx.models.import_data_type_mappings_request import ImportDataTypeMappingsRequest
-from deep_lynx.models.import_id_data_body import ImportIdDataBody
-from deep_lynx.models.import_model import ImportModel
-from deep_lynx.models.inline_response200 import InlineResponse200
-from deep_lynx.models.inline_response2001 import InlineResponse2001
-from deep_lynx.models.inline_response20010 import InlineResponse20010
-from deep_lynx.models.inline_response20010_value import InlineResponse20010Value
-from deep_lynx.models.inline_response20011 import InlineResponse20011
-from deep_lynx.models.inline_response20011_value import InlineResponse20011Value
-from deep_lynx.models.inline_response2002 import InlineResponse2002
-from deep_lynx.models.inline_response2003 import InlineResponse2003
-from deep_lynx.models.inline_response2004 import InlineResponse2004
-from deep_lynx.models.inline_response2004_metatype_id import InlineResponse2004MetatypeId
-from deep_lynx.models.inline_response2004_origin_properties import InlineResponse2004OriginProperties
-from deep_lynx.models.inline_response2004_value import InlineResponse2004Value
-from deep_lynx.models.inline_response2005 import InlineResponse2005
-from deep_lynx.models.inline_response2006 import InlineResponse2006
-from deep_lynx.models.inline_response2007 import InlineResponse2007
-from deep_lynx.models.inline_response2008 import InlineResponse2008
-from deep_lynx.models.inline_response2009 import InlineResponse2009
-from deep_lynx.models.inline_response2009_value import InlineResponse2009Value
-from deep_lynx.models.inline_response200_custom_fields import InlineResponse200CustomFields
-from deep_lynx.models.inline_response200_value import InlineResponse200Value
-from deep_lynx.models.inline_response500 import InlineResponse500
-from deep_lynx.models.key_validation import KeyValidation
-from deep_lynx.models.list_container_invites_response import ListContainerInvitesResponse
-from deep_lynx.models.list_container_response import ListContainerResponse
-from deep_lynx.models.list_data_exports_response import ListDataExportsResponse
-from deep_lynx.models.list_data_source_imports_response import ListDataSourceImportsResponse
-from deep_lynx.models.list_data_sources_response import ListDataSourcesResponse
-from deep_lynx.models.list_data_targets_response import ListDataTargetsResponse
-from deep_lynx.models.list_data_type_mapping_response import ListDataTypeMappingResponse
-from deep_lynx.models.list_edge_files import ListEdgeFiles
-from deep_lynx.models.list_edges_for_node_ids_response import ListEdgesForNodeIDsResponse
-from deep_lynx.models.list_edges_response import ListEdgesResponse
-from deep_lynx.models.list_event_action_response import ListEventActionResponse
-from deep_lynx.models.list_event_action_status_response import ListEventActionStatusResponse
-from deep_lynx.models.list_import_data_response import ListImportDataResponse
-from deep_lynx.models.list_metatype_keys_response import ListMetatypeKeysResponse
-from deep_lynx.models.list_metatype_relationship_keys_response import ListMetatypeRelationshipKeysResponse
-from deep_lynx.models.list_metatype_relationship_pairs_response import ListMetatypeRelationshipPairsResponse
-from deep_lynx.models.list_metatype_relationships_response import ListMetatypeRelationshipsResponse
-from deep_lynx.models.list_metatypes_response import ListMetatypesResponse
-from deep_lynx.models.list_node_files import ListNodeFiles
-from deep_lynx.models.list_nodes_by_metatype_response import ListNodesByMetatypeResponse
-from deep_lynx.models.list_nodes_response import ListNodesResponse
-from deep_lynx.models.list_service_user_response import ListServiceUserResponse
-from deep_lynx.models.list_tasks_response import ListTasksResponse
-from deep_lynx.models.list_transformation_response import ListTransformationResponse
-from deep_lynx.models.list_user_invites_response import ListUserInvitesResponse
-from deep_lynx.models.list_user_permissions_response import ListUserPermissionsResponse
-from deep_lynx.models.list_user_roles import ListUserRoles
-from deep_lynx.models.list_users_for_container_response import ListUsersForContainerResponse
-from deep_lynx.models.list_users_response import ListUsersResponse
-from deep_lynx.models.metatype import Metatype
-from deep_lynx.models.metatype_key import MetatypeKey
-from deep_lynx.models.metatype_relationship import MetatypeRelationship
-from deep_lynx.models.node import Node
-from deep_lynx.models.node_metatype_body import NodeMetatypeBody
-from deep_lynx.models.nodes_edges_body import NodesEdgesBody
-from deep_lynx.models.not_found404 import NotFound404
-from deep_lynx.models.rsa_cancel_request import RSACancelRequest
-from deep_lynx.models.rsa_init_request import RSAInitRequest
-from deep_lynx.models.rsa_response import RSAResponse
-from deep_lynx.models.rsa_response_value import RSAResponseValue
-from deep_lynx.models.rsa_response_value_challenge_methods import RSAResponseValueChallengeMethods
-from deep_lynx.models.rsa_response_value_challenge_methods_challenges import RSAResponseValueChallengeMethodsChallenges
-from deep_lynx.models.rsa_response_value_challenge_methods_prompt import RSAResponseValueChallengeMethodsPrompt
-from deep_lynx.models.rsa_response_value_challenge_methods_required_methods import RSAResponseValueChallengeMethodsRequiredMethods
-from deep_lynx.models.rsa_response_value_challenge_methods_versions import RSAResponseValueChallengeMethodsVersions
-from deep_lynx.models.rsa_response_value_context import RSAResponseValueContext
-from deep_lynx.models.rsa_response_value_credential_validation_results import RSAResponseValueCredentialValidationResults
-from deep_lynx.models.rsa_status_request import RSAStatusRequest
-from deep_lynx.models.rsa_status_response import RSAStatusResponse
-from deep_lynx.models.rsa_verify_request import RSAVerifyRequest
-from deep_lynx.models.relationship_key import RelationshipKey
-from deep_lynx.models.relationship_pair import RelationshipPair
-from deep_lynx.models.relationship_pair_destination_metatype import RelationshipPairDestinationMetatype
-from deep_lynx.models.service_user import ServiceUser
-from deep_lynx.models.service_user_id_permissions_body import ServiceUserIdPermissionsBody
-from deep_lynx.models.service_user_keys import ServiceUserKeys
-from deep_lynx.models.tag_id_edges_body import TagIdEdgesBody
-from deep_lynx.models.tag_id_nodes_body import TagIdNodesBody
-from deep_lynx.models.tags_tag_id_body import TagsTagIdBody
-from deep_lynx.models.task import Task
-from deep_lynx.models.task_config import TaskConfig
-from deep_lynx.models.token_exchange_request import TokenExchangeRequest
-from deep_lynx.models.transformation import Transformation
-from deep_lynx.models.transformation_condition import TransformationCondition
-from deep_lynx.models.transformation_key import TransformationKey
-from deep_lynx.models.type_mapping import TypeMapping
-from deep_lynx.models.type_mapping_export_payload import TypeMappingExportPayload
-from deep_lynx.models.update_container_request import UpdateContainerRequest
-from deep_lynx.models.update_container_request_config import UpdateContainerRequestConfig
-from deep_lynx.models.update_container_response import UpdateContainerResponse
-from deep_lynx.models.update_data_source_response import UpdateDataSourceResponse
-from deep_lynx.models.update_data_target_response import UpdateDataTargetResponse
-from deep_lynx.models.update_data_type_mapping_response import UpdateDataTypeMappingResponse
-from deep_lynx.models.update_event_action_response import UpdateEventActionResponse
-from deep_lynx.models.update_event_action_status_request import UpdateEventActionStatusRequest
-from deep_lynx.models.update_event_action_status_response import UpdateEventActionStatusResponse
-from deep_lynx.models.update_import_data_response import UpdateImportDataResponse
-from deep_lynx.models.update_metatype_key_response import UpdateMetatypeKeyResponse
-from deep_lynx.models.update_metatype_relationship_key_response import UpdateMetatypeRelationshipKeyResponse
-from deep_lynx.models.update_metatype_relationship_pair_response import UpdateMetatypeRelationshipPairResponse
-from deep_lynx.models.update_metatype_relationship_request import UpdateMetatypeRelationshipRequest
-from deep_lynx.models.update_metatype_relationship_response import UpdateMetatypeRelationshipResponse
-from deep_lynx.models.update_metatype_request import UpdateMetatypeRequest
-from deep_lynx.models.update_metatype_response import UpdateMetatypeResponse
-from deep_lynx.models.update_task_response import UpdateTaskResponse
-from deep_lynx.models.update_transformation_response import UpdateTransformationResponse
-from deep_lynx.models.upload_file_response import UploadFileResponse
-from deep_lynx.models.upload_file_response_value import UploadFileResponseValue
-from deep_lynx.models.user import User
-from deep_lynx.models.user_key import UserKey
-from deep_lynx.models.validate_metatype_properties_request import ValidateMetatypePropertiesRequest
-from deep_lynx.models.validate_metatype_properties_response import ValidateMetatypePropertiesResponse
+from deep_lynx import lazy
+
+# names are imported from their modules on first use, see `deep_lynx.lazy`
+__getattr__, __dir__, __all__ = lazy.attach(__name__, {
+    # apis
+    'AuthenticationApi': 'deep_lynx.api.authentication_api',
+    'ContainersApi': 'deep_lynx.api.containers_api',
+    'DataExportApi': 'deep_lynx.api.data_export_api',
+    'DataQueryApi': 'deep_lynx.api.data_query_api',
+    'DataSourcesApi': 'deep_lynx.api.data_sources_api',
+    'DataTargetsApi': 'deep_lynx.api.data_targets_api',
+    'DataTypeMappingsApi': 'deep_lynx.api.data_type_mappings_api',
+    'EventsApi': 'deep_lynx.api.events_api',
+    'GraphApi': 'deep_lynx.api.graph_api',
+    'ImportsApi': 'deep_lynx.api.imports_api',
+    'MetatypeKeysApi': 'deep_lynx.api.metatype_keys_api',
+    'MetatypeRelationshipKeysApi': 'deep_lynx.api.metatype_relationship_keys_api',
+    'MetatypeRelationshipPairsApi': 'deep_lynx.api.metatype_relationship_pairs_api',
+    'MetatypeRelationshipsApi': 'deep_lynx.api.metatype_relationships_api',
+    'MetatypesApi': 'deep_lynx.api.metatypes_api',
+    'MiscApi': 'deep_lynx.api.misc_api',
+    'TagsApi': 'deep_lynx.api.tags_api',
+    'TasksApi': 'deep_lynx.api.tasks_api',
+    'TimeSeriesApi': 'deep_lynx.api.time_series_api',
+    'UsersApi': 'deep_lynx.api.users_api',
+    'DefaultApi': 'deep_lynx.api.default_api',
+    # clients and helpers
+    'ApiClient': 'deep_lynx.api_client',
+    'AsyncApiClient': 'deep_lynx.async_api_client',
+    'TokenManager': 'deep_lynx.auth',
+    'Configuration': 'deep_lynx.configuration',
+    'ResponseCache': 'deep_lynx.cache',
+    'CircuitBreakers': 'deep_lynx.circuit',
+    'CircuitOpenError': 'deep_lynx.circuit',
+    'SingleFlight': 'deep_lynx.coalesce',
+    'ClientSpec': 'deep_lynx.forksafe',
+    'MetricsCollector': 'deep_lynx.metrics',
+    'UploadFile': 'deep_lynx.multipart',
+    'NodeIndex': 'deep_lynx.node_index',
+    # models
+    'AddDataToImportResponse': 'deep_lynx.models.add_data_to_import_response',
+    'AssignRoleRequest': 'deep_lynx.models.assign_role_request',
+    'BatchContainerUpdateRequest': 'deep_lynx.models.batch_container_update_request',
+    'BatchContainerUpdateRequestInner': 'deep_lynx.models.batch_container_update_request_inner',
+    'BatchUpdateContainerResponse': 'deep_lynx.models.batch_update_container_response',
+    'Container': 'deep_lynx.models.container',
+    'ContainerConfig': 'deep_lynx.models.container_config',
+    'ContainerIdDataSourceTemplatesBody': 'deep_lynx.models.container_id_data_source_templates_body',
+    'ContainerImportRequest': 'deep_lynx.models.container_import_request',
+    'ContainerImportResponse': 'deep_lynx.models.container_import_response',
+    'ContainerImportUpdateResponse': 'deep_lynx.models.container_import_update_response',
+    'ContainerInvite': 'deep_lynx.models.container_invite',
+    'ContainerscontainerIddataSourceTemplatesCustomFields': 'deep_lynx.models.containerscontainer_iddata_source_templates_custom_fields',
+    'CreateContainerRequest': 'deep_lynx.models.create_container_request',
+    'CreateContainerResponse': 'deep_lynx.models.create_container_response',
+    'CreateDataExportRequest': 'deep_lynx.models.create_data_export_request',
+    'CreateDataSourceConfig': 'deep_lynx.models.create_data_source_config',
+    'CreateDataSourceRequest': 'deep_lynx.models.create_data_source_request',
+    'CreateDataSourcesResponse': 'deep_lynx.models.create_data_sources_response',
+    'CreateDataTargetConfig': 'deep_lynx.models.create_data_target_config',
+    'CreateDataTargetRequest': 'deep_lynx.models.create_data_target_request',
+    'CreateDataTargetsResponse': 'deep_lynx.models.create_data_targets_response',
+    'CreateEventActionRequest': 'deep_lynx.models.create_event_action_request',
+    'CreateEventActionResponse': 'deep_lynx.models.create_event_action_response',
+    'CreateEventRequest': 'deep_lynx.models.create_event_request',
+    'CreateEventResponse': 'deep_lynx.models.create_event_response',
+    'CreateImportResponse': 'deep_lynx.models.create_import_response',
+    'CreateManualImport': 'deep_lynx.models.create_manual_import',
+    'CreateManualImportResponse': 'deep_lynx.models.create_manual_import_response',
+    'CreateMetatypeKeyRequest': 'deep_lynx.models.create_metatype_key_request',
+    'CreateMetatypeKeysResponse': 'deep_lynx.models.create_metatype_keys_response',
+    'CreateMetatypeRelationshipKeyRequest': 'deep_lynx.models.create_metatype_relationship_key_request',
+    'CreateMetatypeRelationshipKeysResponse': 'deep_lynx.models.create_metatype_relationship_keys_response',
+    'CreateMetatypeRelationshipPairRequest': 'deep_lynx.models.create_metatype_relationship_pair_request',
+    'CreateMetatypeRelationshipPairsResponse': 'deep_lynx.models.create_metatype_relationship_pairs_response',
+    'CreateMetatypeRelationshipRequest': 'deep_lynx.models.create_metatype_relationship_request',
+    'CreateMetatypeRelationshipsResponse': 'deep_lynx.models.create_metatype_relationships_response',
+    'CreateMetatypeRequest': 'deep_lynx.models.create_metatype_request',
+    'CreateMetatypesResponse': 'deep_lynx.models.create_metatypes_response',
+    'CreateOrUpdateEdgesRequest': 'deep_lynx.models.create_or_update_edges_request',
+    'CreateOrUpdateNodesRequest': 'deep_lynx.models.create_or_update_nodes_request',
+    'CreateServiceUser': 'deep_lynx.models.create_service_user',
+    'CreateServiceUserResponse': 'deep_lynx.models.create_service_user_response',
+    'CreateTaskResponse': 'deep_lynx.models.create_task_response',
+    'CreateTransformationResponse': 'deep_lynx.models.create_transformation_response',
+    'CreateTypeMappingTransformationsRequest': 'deep_lynx.models.create_type_mapping_transformations_request',
+    'DataExportConfig': 'deep_lynx.models.data_export_config',
+    'DataSource': 'deep_lynx.models.data_source',
+    'DataSourceConfig': 'deep_lynx.models.data_source_config',
+    'DataSourceIdFilesBody': 'deep_lynx.models.data_source_id_files_body',
+    'DataSourceIdImportsBody': 'deep_lynx.models.data_source_id_imports_body',
+    'DataSourceIdImportsBody1': 'deep_lynx.models.data_source_id_imports_body1',
+    'DataSourceImport': 'deep_lynx.models.data_source_import',
+    'DataStaging': 'deep_lynx.models.data_staging',
+    'DataTarget': 'deep_lynx.models.data_target',
+    'DataTargetConfig': 'deep_lynx.models.data_target_config',
+    'Edge': 'deep_lynx.models.edge',
+    'ErrorModel': 'deep_lynx.models.error_model',
+    'ErrorResponse': 'deep_lynx.models.error_response',
+    'Event': 'deep_lynx.models.event',
+    'EventAction': 'deep_lynx.models.event_action',
+    'EventActionStatus': 'deep_lynx.models.event_action_status',
+    'Exporter': 'deep_lynx.models.exporter',
+    'ExporterConfig': 'deep_lynx.models.exporter_config',
+    'FileInfo': 'deep_lynx.models.file_info',
+    'FileModel': 'deep_lynx.models.file_model',
+    'FilesFileIdBody': 'deep_lynx.models.files_file_id_body',
+    'FilesFileIdBody1': 'deep_lynx.models.files_file_id_body1',
+    'Generic200Response': 'deep_lynx.models.generic200_response',
+    'GetContainerResponse': 'deep_lynx.models.get_container_response',
+    'GetDataExportResponse': 'deep_lynx.models.get_data_export_response',
+    'GetDataSourceResponse': 'deep_lynx.models.get_data_source_response',
+    'GetDataTargetResponse': 'deep_lynx.models.get_data_target_response',
+    'GetDataTypeMappingResponse': 'deep_lynx.models.get_data_type_mapping_response',
+    'GetEdgeResponse': 'deep_lynx.models.get_edge_response',
+    'GetEventActionResponse': 'deep_lynx.models.get_event_action_response',
+    'GetEventActionStatusResponse': 'deep_lynx.models.get_event_action_status_response',
+    'GetFileInfoResponse': 'deep_lynx.models.get_file_info_response',
+    'GetImportDataResponse': 'deep_lynx.models.get_import_data_response',
+    'GetMetatypeKeyResponse': 'deep_lynx.models.get_metatype_key_response',
+    'GetMetatypeRelationshipKeyResponse': 'deep_lynx.models.get_metatype_relationship_key_response',
+    'GetMetatypeRelationshipPairResponse': 'deep_lynx.models.get_metatype_relationship_pair_response',
+    'GetMetatypeRelationshipResponse': 'deep_lynx.models.get_metatype_relationship_response',
+    'GetMetatypeResponse': 'deep_lynx.models.get_metatype_response',
+    'GetNodeResponse': 'deep_lynx.models.get_node_response',
+    'GetTaskResponse': 'deep_lynx.models.get_task_response',
+    'GetUserResponse': 'deep_lynx.models.get_user_response',
+    'GraphsTagsBody': 'deep_lynx.models.graphs_tags_body',
+    'GraphsWebglBody': 'deep_lynx.models.graphs_webgl_body',
+    'ImportDataTypeMappingResponse': 'deep_lynx.models.import_data_type_mapping_response',
+    'ImportDataTypeMappingResponseInner': 'deep_lynx.models.import_data_type_mapping_response_inner',
+    'ImportDataTypeMappingsRequest': 'deep_lynx.models.import_data_type_mappings_request',
+    'ImportIdDataBody': 'deep_lynx.models.import_id_data_body',
+    'ImportModel': 'deep_lynx.models.import_model',
+    'InlineResponse200': 'deep_lynx.models.inline_response200',
+    'InlineResponse2001': 'deep_lynx.models.inline_response2001',
+    'InlineResponse20010': 'deep_lynx.models.inline_response20010',
+    'InlineResponse20010Value': 'deep_lynx.models.inline_response20010_value',
+    'InlineResponse20011': 'deep_lynx.models.inline_response20011',
+    'InlineResponse20011Value': 'deep_lynx.models.inline_response20011_value',
+    'InlineResponse2002': 'deep_lynx.models.inline_response2002',
+    'InlineResponse2003': 'deep_lynx.models.inline_response2003',
+    'InlineResponse2004': 'deep_lynx.models.inline_response2004',
+    'InlineResponse2004MetatypeId': 'deep_lynx.models.inline_response2004_metatype_id',
+    'InlineResponse2004OriginProperties': 'deep_lynx.models.inline_response2004_origin_properties',
+    'InlineResponse2004Value': 'deep_lynx.models.inline_response2004_value',
+    'InlineResponse2005': 'deep_lynx.models.inline_response2005',
+    'InlineResponse2006': 'deep_lynx.models.inline_response2006',
+    'InlineResponse2007': 'deep_lynx.models.inline_response2007',
+    'InlineResponse2008': 'deep_lynx.models.inline_response2008',
+    'InlineResponse2009': 'deep_lynx.models.inline_response2009',
+    'InlineResponse2009Value': 'deep_lynx.models.inline_response2009_value',
+    'InlineResponse200CustomFields': 'deep_lynx.models.inline_response200_custom_fields',
+    'InlineResponse200Value': 'deep_lynx.models.inline_response200_value',
+    'InlineResponse500': 'deep_lynx.models.inline_response500',
+    'KeyValidation': 'deep_lynx.models.key_validation',
+    'ListContainerInvitesResponse': 'deep_lynx.models.list_container_invites_response',
+    'ListContainerResponse': 'deep_lynx.models.list_container_response',
+    'ListDataExportsResponse': 'deep_lynx.models.list_data_exports_response',
+    'ListDataSourceImportsResponse': 'deep_lynx.models.list_data_source_imports_response',
+    'ListDataSourcesResponse': 'deep_lynx.models.list_data_sources_response',
+    'ListDataTargetsResponse': 'deep_lynx.models.list_data_targets_response',
+    'ListDataTypeMappingResponse': 'deep_lynx.models.list_data_type_mapping_response',
+    'ListEdgeFiles': 'deep_lynx.models.list_edge_files',
+    'ListEdgesForNodeIDsResponse': 'deep_lynx.models.list_edges_for_node_ids_response',
+    'ListEdgesResponse': 'deep_lynx.models.list_edges_response',
+    'ListEventActionResponse': 'deep_lynx.models.list_event_action_response',
+    'ListEventActionStatusResponse': 'deep_lynx.models.list_event_action_status_response',
+    'ListImportDataResponse': 'deep_lynx.models.list_import_data_response',
+    'ListMetatypeKeysResponse': 'deep_lynx.models.list_metatype_keys_response',
+    'ListMetatypeRelationshipKeysResponse': 'deep_lynx.models.list_metatype_relationship_keys_response',
+    'ListMetatypeRelationshipPairsResponse': 'deep_lynx.models.list_metatype_relationship_pairs_response',
+    'ListMetatypeRelationshipsResponse': 'deep_lynx.models.list_metatype_relationships_response',
+    'ListMetatypesResponse': 'deep_lynx.models.list_metatypes_response',
+    'ListNodeFiles': 'deep_lynx.models.list_node_files',
+    'ListNodesByMetatypeResponse': 'deep_lynx.models.list_nodes_by_metatype_response',
+    'ListNodesResponse': 'deep_lynx.models.list_nodes_response',
+    'ListServiceUserResponse': 'deep_lynx.models.list_service_user_response',
+    'ListTasksResponse': 'deep_lynx.models.list_tasks_response',
+    'ListTransformationResponse': 'deep_lynx.models.list_transformation_response',
+    'ListUserInvitesResponse': 'deep_lynx.models.list_user_invites_response',
+    'ListUserPermissionsResponse': 'deep_lynx.models.list_user_permissions_response',
+    'ListUserRoles': 'deep_lynx.models.list_user_roles',
+    'ListUsersForContainerResponse': 'deep_lynx.models.list_users_for_container_response',
+    'ListUsersResponse': 'deep_lynx.models.list_users_response',
+    'Metatype': 'deep_lynx.models.metatype',
+    'MetatypeKey': 'deep_lynx.models.metatype_key',
+    'MetatypeRelationship': 'deep_lynx.models.metatype_relationship',
+    'Node': 'deep_lynx.models.node',
+    'NodeMetatypeBody': 'deep_lynx.models.node_metatype_body',
+    'NodesEdgesBody': 'deep_lynx.models.nodes_edges_body',
+    'NotFound404': 'deep_lynx.models.not_found404',
+    'RSACancelRequest': 'deep_lynx.models.rsa_cancel_request',
+    'RSAInitRequest': 'deep_lynx.models.rsa_init_request',
+    'RSAResponse': 'deep_lynx.models.rsa_response',
+    'RSAResponseValue': 'deep_lynx.models.rsa_response_value',
+    'RSAResponseValueChallengeMethods': 'deep_lynx.models.rsa_response_value_challenge_methods',
+    'RSAResponseValueChallengeMethodsChallenges': 'deep_lynx.models.rsa_response_value_challenge_methods_challenges',
+    'RSAResponseValueChallengeMethodsPrompt': 'deep_lynx.models.rsa_response_value_challenge_methods_prompt',
+    'RSAResponseValueChallengeMethodsRequiredMethods': 'deep_lynx.models.rsa_response_value_challenge_methods_required_methods',
+    'RSAResponseValueChallengeMethodsVersions': 'deep_lynx.models.rsa_response_value_challenge_methods_versions',
+    'RSAResponseValueContext': 'deep_lynx.models.rsa_response_value_context',
+    'RSAResponseValueCredentialValidationResults': 'deep_lynx.models.rsa_response_value_credential_validation_results',
+    'RSAStatusRequest': 'deep_lynx.models.rsa_status_request',
+    'RSAStatusResponse': 'deep_lynx.models.rsa_status_response',
+    'RSAVerifyRequest': 'deep_lynx.models.rsa_verify_request',
+    'RelationshipKey': 'deep_lynx.models.relationship_key',
+    'RelationshipPair': 'deep_lynx.models.relationship_pair',
+    'RelationshipPairDestinationMetatype': 'deep_lynx.models.relationship_pair_destination_metatype',
+    'ServiceUser': 'deep_lynx.models.service_user',
+    'ServiceUserIdPermissionsBody': 'deep_lynx.models.service_user_id_permissions_body',
+    'ServiceUserKeys': 'deep_lynx.models.service_user_keys',
+    'TagIdEdgesBody': 'deep_lynx.models.tag_id_edges_body',
+    'TagIdNodesBody': 'deep_lynx.models.tag_id_nodes_body',
+    'TagsTagIdBody': 'deep_lynx.models.tags_tag_id_body',
+    'Task': 'deep_lynx.models.task',
+    'TaskConfig': 'deep_lynx.models.task_config',
+    'TokenExchangeRequest': 'deep_lynx.models.token_exchange_request',
+    'Transformation': 'deep_lynx.models.transformation',
+    'TransformationCondition': 'deep_lynx.models.transformation_condition',
+    'TransformationKey': 'deep_lynx.models.transformation_key',
+    'TypeMapping': 'deep_lynx.models.type_mapping',
+    'TypeMappingExportPayload': 'deep_lynx.models.type_mapping_export_payload',
+    'UpdateContainerRequest': 'deep_lynx.models.update_container_request',
+    'UpdateContainerRequestConfig': 'deep_lynx.models.update_container_request_config',
+    'UpdateContainerResponse': 'deep_lynx.models.update_container_response',
+    'UpdateDataSourceResponse': 'deep_lynx.models.update_data_source_response',
+    'UpdateDataTargetResponse': 'deep_lynx.models.update_data_target_response',
+    'UpdateDataTypeMappingResponse': 'deep_lynx.models.update_data_type_mapping_response',
+    'UpdateEventActionResponse': 'deep_lynx.models.update_event_action_response',
+    'UpdateEventActionStatusRequest': 'deep_lynx.models.update_event_action_status_request',
+    'UpdateEventActionStatusResponse': 'deep_lynx.models.update_event_action_status_response',
+    'UpdateImportDataResponse': 'deep_lynx.models.update_import_data_response',
+    'UpdateMetatypeKeyResponse': 'deep_lynx.models.update_metatype_key_response',
+    'UpdateMetatypeRelationshipKeyResponse': 'deep_lynx.models.update_metatype_relationship_key_response',
+    'UpdateMetatypeRelationshipPairResponse': 'deep_lynx.models.update_metatype_relationship_pair_response',
+    'UpdateMetatypeRelationshipRequest': 'deep_lynx.models.update_metatype_relationship_request',
+    'UpdateMetatypeRelationshipResponse': 'deep_lynx.models.update_metatype_relationship_response',
+    'UpdateMetatypeRequest': 'deep_lynx.models.update_metatype_request',
+    'UpdateMetatypeResponse': 'deep_lynx.models.update_metatype_response',
+    'UpdateTaskResponse': 'deep_lynx.models.update_task_response',
+    'UpdateTransformationResponse': 'deep_lynx.models.update_transformation_response',
+    'UploadFileResponse': 'deep_lynx.models.upload_file_response',
+    'UploadFileResponseValue': 'deep_lynx.models.upload_file_response_value',
+    'User': 'deep_lynx.models.user',
+    'UserKey': 'deep_lynx.models.user_key',
+    'ValidateMetatypePropertiesRequest': 'deep_lynx.models.validate_metatype_properties_request',
+    'ValidateMetatypePropertiesResponse': 'deep_lynx.models.validate_metatype_properties_response',
+})
@@ -2,25 +2,29 @@ from __future__ import absolute_import
 
 # flake8: noqa
 
-# import apis into api package
-from deep_lynx.api.authentication_api import AuthenticationApi
-from deep_lynx.api.containers_api import ContainersApi
-from deep_lynx.api.data_export_api import DataExportApi
-from deep_lynx.api.data_query_api import DataQueryApi
-from deep_lynx.api.data_sources_api import DataSourcesApi
-from deep_lynx.api.data_targets_api import DataTargetsApi
-from deep_lynx.api.data_type_mappings_api import DataTypeMappingsApi
-from deep_lynx.api.events_api import EventsApi
-from deep_lynx.api.graph_api import GraphApi
-from deep_lynx.api.imports_api import ImportsApi
-from deep_lynx.api.metatype_keys_api import MetatypeKeysApi
-from deep_lynx.api.metatype_relationship_keys_api import MetatypeRelationshipKeysApi
-from deep_lynx.api.metatype_relationship_pairs_api import MetatypeRelationshipPairsApi
-from deep_lynx.api.metatype_relationships_api import MetatypeRelationshipsApi
-from deep_lynx.api.metatypes_api import MetatypesApi
-from deep_lynx.api.misc_api import MiscApi
-from deep_lynx.api.tags_api import TagsApi
-from deep_lynx.api.tasks_api import TasksApi
-from deep_lynx.api.time_series_api import TimeSeriesApi
-from deep_lynx.api.users_api import UsersApi
-from deep_lynx.api.default_api import DefaultApi
+from deep_lynx import lazy
+
+# names are imported from their modules on first use, see `deep_lynx.lazy`
+__getattr__, __dir__, __all__ = lazy.attach(__name__, {
+    'AuthenticationApi': 'deep_lynx.api.authentication_api',
+    'ContainersApi': 'deep_lynx.api.containers_api',
+    'DataExportApi': 'deep_lynx.api.data_export_api',
+    'DataQueryApi': 'deep_lynx.api.data_query_api',
+    'DataSourcesApi': 'deep_lynx.api.data_sources_api',
+    'DataTargetsApi': 'deep_lynx.api.data_targets_api',
+    'DataTypeMappingsApi': 'deep_lynx.api.data_type_mappings_api',
+    'EventsApi': 'deep_lynx.api.events_api',
+    'GraphApi': 'deep_lynx.api.graph_api',
+    'ImportsApi': 'deep_lynx.api.imports_api',
+    'MetatypeKeysApi': 'deep_lynx.api.metatype_keys_api',
+    'MetatypeRelationshipKeysApi': 'deep_lynx.api.metatype_relationship_keys_api',
+    'MetatypeRelationshipPairsApi': 'deep_lynx.api.metatype_relationship_pairs_api',
+    'MetatypeRelationshipsApi': 'deep_lynx.api.metatype_relationships_api',
+    'MetatypesApi': 'deep_lynx.api.metatypes_api',
+    'MiscApi': 'deep_lynx.api.misc_api',
+    'TagsApi': 'deep_lynx.api.tags_api',
+    'TasksApi': 'deep_lynx.api.tasks_api',
+    'TimeSeriesApi': 'deep_lynx.api.time_series_api',
+    'UsersApi': 'deep_lynx.api.users_api',
+    'DefaultApi': 'deep_lynx.api.default_api',
+})
@@ -12,12 +12,8 @@
 
 from __future__ import absolute_import
 
-import re  # noqa: F401
-
-# python 2 and python 3 compatibility library
-import six
-
 from deep_lynx.api_client import ApiClient
+from deep_lynx import operations
 
 
 class AuthenticationApi(object):
@@ -48,11 +44,7 @@ class AuthenticationApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.exchange_o_auth_token_with_http_info(**kwargs)  # noqa: E501
-        else:
-            (data) = self.exchange_o_auth_token_with_http_info(**kwargs)  # noqa: E501
-            return data
+        return self.exchange_o_auth_token_with_http_info(**kwargs)  # noqa: E501
 
     def exchange_o_auth_token_with_http_info(self, **kwargs):  # noqa: E501
         """Exchange OAuth Token  # noqa: E501
@@ -69,63 +61,9 @@ class AuthenticationApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method exchange_o_auth_token" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/oauth/exchange', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='str',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'exchange_o_auth_token',
+            (), kwargs)
 
     def list_service_keys_for_container(self, container_id, **kwargs):  # noqa: E501
         """List Service User Keys for Container  # noqa: E501
@@ -144,11 +82,7 @@ class AuthenticationApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.list_service_keys_for_container_with_http_info(container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.list_service_keys_for_container_with_http_info(container_id, **kwargs)  # noqa: E501
-            return data
+        return self.list_service_keys_for_container_with_http_info(container_id, **kwargs)  # noqa: E501
 
     def list_service_keys_for_container_with_http_info(self, container_id, **kwargs):  # noqa: E501
         """List Service User Keys for Container  # noqa: E501
@@ -166,65 +100,9 @@ class AuthenticationApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'note']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_service_keys_for_container" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `list_service_keys_for_container`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-        if 'note' in params:
-            query_params.append(('note', params['note']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/service-users/keys', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='InlineResponse20011',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'list_service_keys_for_container',
+            (container_id,), kwargs)
 
     def retrieve_o_auth_token(self, x_api_key, x_api_secret, **kwargs):  # noqa: E501
         """Retrieve OAuth Token  # noqa: E501
@@ -244,11 +122,7 @@ class AuthenticationApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.retrieve_o_auth_token_with_http_info(x_api_key, x_api_secret, **kwargs)  # noqa: E501
-        else:
-            (data) = self.retrieve_o_auth_token_with_http_info(x_api_key, x_api_secret, **kwargs)  # noqa: E501
-            return data
+        return self.retrieve_o_auth_token_with_http_info(x_api_key, x_api_secret, **kwargs)  # noqa: E501
 
     def retrieve_o_auth_token_with_http_info(self, x_api_key, x_api_secret, **kwargs):  # noqa: E501
         """Retrieve OAuth Token  # noqa: E501
@@ -267,71 +141,9 @@ class AuthenticationApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['x_api_key', 'x_api_secret', 'x_api_expiry']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method retrieve_o_auth_token" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'x_api_key' is set
-        if ('x_api_key' not in params or
-                params['x_api_key'] is None):
-            raise ValueError("Missing the required parameter `x_api_key` when calling `retrieve_o_auth_token`")  # noqa: E501
-        # verify the required parameter 'x_api_secret' is set
-        if ('x_api_secret' not in params or
-                params['x_api_secret'] is None):
-            raise ValueError("Missing the required parameter `x_api_secret` when calling `retrieve_o_auth_token`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-        if 'x_api_key' in params:
-            header_params['x-api-key'] = params['x_api_key']  # noqa: E501
-        if 'x_api_secret' in params:
-            header_params['x-api-secret'] = params['x_api_secret']  # noqa: E501
-        if 'x_api_expiry' in params:
-            header_params['x-api-expiry'] = params['x_api_expiry']  # noqa: E501
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'text/plain'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/oauth/token', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='str',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'retrieve_o_auth_token',
+            (x_api_key, x_api_secret), kwargs)
 
     def rsa_cancel(self, **kwargs):  # noqa: E501
         """RSA Cancel  # noqa: E501
@@ -349,11 +161,7 @@ class AuthenticationApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.rsa_cancel_with_http_info(**kwargs)  # noqa: E501
-        else:
-            (data) = self.rsa_cancel_with_http_info(**kwargs)  # noqa: E501
-            return data
+        return self.rsa_cancel_with_http_info(**kwargs)  # noqa: E501
 
     def rsa_cancel_with_http_info(self, **kwargs):  # noqa: E501
         """RSA Cancel  # noqa: E501
@@ -370,63 +178,7 @@ class AuthenticationApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method rsa_cancel" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/rsa/cancel', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='RSAResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(self.api_client, 'rsa_cancel', (), kwargs)
 
     def rsa_initialize(self, **kwargs):  # noqa: E501
         """RSA Initialize  # noqa: E501
@@ -444,11 +196,7 @@ class AuthenticationApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.rsa_initialize_with_http_info(**kwargs)  # noqa: E501
-        else:
-            (data) = self.rsa_initialize_with_http_info(**kwargs)  # noqa: E501
-            return data
+        return self.rsa_initialize_with_http_info(**kwargs)  # noqa: E501
 
     def rsa_initialize_with_http_info(self, **kwargs):  # noqa: E501
         """RSA Initialize  # noqa: E501
@@ -465,63 +213,7 @@ class AuthenticationApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method rsa_initialize" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/rsa/initialize', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='RSAResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(self.api_client, 'rsa_initialize', (), kwargs)
 
     def rsa_status(self, **kwargs):  # noqa: E501
         """RSA Status  # noqa: E501
@@ -539,11 +231,7 @@ class AuthenticationApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.rsa_status_with_http_info(**kwargs)  # noqa: E501
-        else:
-            (data) = self.rsa_status_with_http_info(**kwargs)  # noqa: E501
-            return data
+        return self.rsa_status_with_http_info(**kwargs)  # noqa: E501
 
     def rsa_status_with_http_info(self, **kwargs):  # noqa: E501
         """RSA Status  # noqa: E501
@@ -560,63 +248,7 @@ class AuthenticationApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method rsa_status" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/rsa/status', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='RSAStatusResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(self.api_client, 'rsa_status', (), kwargs)
 
     def rsa_verify(self, **kwargs):  # noqa: E501
         """RSA Verify  # noqa: E501
@@ -634,11 +266,7 @@ class AuthenticationApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.rsa_verify_with_http_info(**kwargs)  # noqa: E501
-        else:
-            (data) = self.rsa_verify_with_http_info(**kwargs)  # noqa: E501
-            return data
+        return self.rsa_verify_with_http_info(**kwargs)  # noqa: E501
 
     def rsa_verify_with_http_info(self, **kwargs):  # noqa: E501
         """RSA Verify  # noqa: E501
@@ -655,60 +283,4 @@ class AuthenticationApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method rsa_verify" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/rsa/verify', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='RSAResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(self.api_client, 'rsa_verify', (), kwargs)
@@ -12,12 +12,8 @@
 
 from __future__ import absolute_import
 
-import re  # noqa: F401
-
-# python 2 and python 3 compatibility library
-import six
-
 from deep_lynx.api_client import ApiClient
+from deep_lynx import operations
 
 
 class ContainersApi(object):
@@ -49,11 +45,7 @@ class ContainersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.acknowledge_container_alert_with_http_info(container_id, alert_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.acknowledge_container_alert_with_http_info(container_id, alert_id, **kwargs)  # noqa: E501
-            return data
+        return self.acknowledge_container_alert_with_http_info(container_id, alert_id, **kwargs)  # noqa: E501
 
     def acknowledge_container_alert_with_http_info(self, container_id, alert_id, **kwargs):  # noqa: E501
         """Acknowledge Container Alert  # noqa: E501
@@ -71,65 +63,9 @@ class ContainersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'alert_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method acknowledge_container_alert" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `acknowledge_container_alert`")  # noqa: E501
-        # verify the required parameter 'alert_id' is set
-        if ('alert_id' not in params or
-                params['alert_id'] is None):
-            raise ValueError("Missing the required parameter `alert_id` when calling `acknowledge_container_alert`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'alert_id' in params:
-            path_params['alert_id'] = params['alert_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/alerts/{alert_id}', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'acknowledge_container_alert',
+            (container_id, alert_id), kwargs)
 
     def approve_ontology_version(self, container_id, ontology_version_id, **kwargs):  # noqa: E501
         """Approve Ontology Version  # noqa: E501
@@ -148,11 +84,7 @@ class ContainersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.approve_ontology_version_with_http_info(container_id, ontology_version_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.approve_ontology_version_with_http_info(container_id, ontology_version_id, **kwargs)  # noqa: E501
-            return data
+        return self.approve_ontology_version_with_http_info(container_id, ontology_version_id, **kwargs)  # noqa: E501
 
     def approve_ontology_version_with_http_info(self, container_id, ontology_version_id, **kwargs):  # noqa: E501
         """Approve Ontology Version  # noqa: E501
@@ -170,65 +102,9 @@ class ContainersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'ontology_version_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method approve_ontology_version" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `approve_ontology_version`")  # noqa: E501
-        # verify the required parameter 'ontology_version_id' is set
-        if ('ontology_version_id' not in params or
-                params['ontology_version_id'] is None):
-            raise ValueError("Missing the required parameter `ontology_version_id` when calling `approve_ontology_version`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'ontology_version_id' in params:
-            path_params['ontology_version_id'] = params['ontology_version_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/ontology/versions/{ontology_version_id}/approve', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'approve_ontology_version',
+            (container_id, ontology_version_id), kwargs)
 
     def archive_container(self, container_id, **kwargs):  # noqa: E501
         """Archive Container  # noqa: E501
@@ -247,11 +123,7 @@ class ContainersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.archive_container_with_http_info(container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.archive_container_with_http_info(container_id, **kwargs)  # noqa: E501
-            return data
+        return self.archive_container_with_http_info(container_id, **kwargs)  # noqa: E501
 
     def archive_container_with_http_info(self, container_id, **kwargs):  # noqa: E501
         """Archive Container  # noqa: E501
@@ -269,65 +141,9 @@ class ContainersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'permanent']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method archive_container" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `archive_container`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-        if 'permanent' in params:
-            query_params.append(('permanent', params['permanent']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='Generic200Response',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'archive_container',
+            (container_id,), kwargs)
 
     def container_batch_update(self, body, **kwargs):  # noqa: E501
         """Container Batch Update  # noqa: E501
@@ -345,11 +161,7 @@ class ContainersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.container_batch_update_with_http_info(body, **kwargs)  # noqa: E501
-        else:
-            (data) = self.container_batch_update_with_http_info(body, **kwargs)  # noqa: E501
-            return data
+        return self.container_batch_update_with_http_info(body, **kwargs)  # noqa: E501
 
     def container_batch_update_with_http_info(self, body, **kwargs):  # noqa: E501
         """Container Batch Update  # noqa: E501
@@ -366,67 +178,9 @@ class ContainersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method container_batch_update" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `container_batch_update`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='BatchUpdateContainerResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'container_batch_update',
+            (body,), kwargs)
 
     def create_container(self, body, **kwargs):  # noqa: E501
         """Create Container  # noqa: E501
@@ -444,11 +198,7 @@ class ContainersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.create_container_with_http_info(body, **kwargs)  # noqa: E501
-        else:
-            (data) = self.create_container_with_http_info(body, **kwargs)  # noqa: E501
-            return data
+        return self.create_container_with_http_info(body, **kwargs)  # noqa: E501
 
     def create_container_with_http_info(self, body, **kwargs):  # noqa: E501
         """Create Container  # noqa: E501
@@ -465,67 +215,9 @@ class ContainersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method create_container" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `create_container`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='CreateContainerResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'create_container',
+            (body,), kwargs)
 
     def delete_data_template(self, template_id, container_id, **kwargs):  # noqa: E501
         """Delete Data Source Template  # noqa: E501
@@ -544,11 +236,7 @@ class ContainersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.delete_data_template_with_http_info(template_id, container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.delete_data_template_with_http_info(template_id, container_id, **kwargs)  # noqa: E501
-            return data
+        return self.delete_data_template_with_http_info(template_id, container_id, **kwargs)  # noqa: E501
 
     def delete_data_template_with_http_info(self, template_id, container_id, **kwargs):  # noqa: E501
         """Delete Data Source Template  # noqa: E501
@@ -566,69 +254,9 @@ class ContainersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['template_id', 'container_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_data_template" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'template_id' is set
-        if ('template_id' not in params or
-                params['template_id'] is None):
-            raise ValueError("Missing the required parameter `template_id` when calling `delete_data_template`")  # noqa: E501
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `delete_data_template`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'template_id' in params:
-            path_params['template_id'] = params['template_id']  # noqa: E501
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/data_source_templates/{template_id}', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='Generic200Response',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'delete_data_template',
+            (template_id, container_id), kwargs)
 
     def import_container(self, export_file, container_id, **kwargs):  # noqa: E501
         """Import Container  # noqa: E501
@@ -651,11 +279,7 @@ class ContainersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.import_container_with_http_info(export_file, container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.import_container_with_http_info(export_file, container_id, **kwargs)  # noqa: E501
-            return data
+        return self.import_container_with_http_info(export_file, container_id, **kwargs)  # noqa: E501
 
     def import_container_with_http_info(self, export_file, container_id, **kwargs):  # noqa: E501
         """Import Container  # noqa: E501
@@ -677,81 +301,9 @@ class ContainersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['export_file', 'container_id', 'dryrun', 'import_ontology', 'import_data_sources', 'import_type_mappings']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method import_container" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'export_file' is set
-        if ('export_file' not in params or
-                params['export_file'] is None):
-            raise ValueError("Missing the required parameter `export_file` when calling `import_container`")  # noqa: E501
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `import_container`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-        if 'dryrun' in params:
-            query_params.append(('dryrun', params['dryrun']))  # noqa: E501
-        if 'import_ontology' in params:
-            query_params.append(('importOntology', params['import_ontology']))  # noqa: E501
-        if 'import_data_sources' in params:
-            query_params.append(('importDataSources', params['import_data_sources']))  # noqa: E501
-        if 'import_type_mappings' in params:
-            query_params.append(('importTypeMappings', params['import_type_mappings']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-        if 'export_file' in params:
-            local_var_files['export_file'] = params['export_file']  # noqa: E501
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['multipart/form-data'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/import', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='ContainerImportResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'import_container',
+            (export_file, container_id), kwargs)
 
     def list_container_alerts(self, container_id, **kwargs):  # noqa: E501
         """List Container Alerts  # noqa: E501
@@ -769,11 +321,7 @@ class ContainersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.list_container_alerts_with_http_info(container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.list_container_alerts_with_http_info(container_id, **kwargs)  # noqa: E501
-            return data
+        return self.list_container_alerts_with_http_info(container_id, **kwargs)  # noqa: E501
 
     def list_container_alerts_with_http_info(self, container_id, **kwargs):  # noqa: E501
         """List Container Alerts  # noqa: E501
@@ -790,59 +338,9 @@ class ContainersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_container_alerts" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `list_container_alerts`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/alerts', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'list_container_alerts',
+            (container_id,), kwargs)
 
     def list_containers(self, **kwargs):  # noqa: E501
         """List Containers  # noqa: E501
@@ -859,11 +357,7 @@ class ContainersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.list_containers_with_http_info(**kwargs)  # noqa: E501
-        else:
-            (data) = self.list_containers_with_http_info(**kwargs)  # noqa: E501
-            return data
+        return self.list_containers_with_http_info(**kwargs)  # noqa: E501
 
     def list_containers_with_http_info(self, **kwargs):  # noqa: E501
         """List Containers  # noqa: E501
@@ -879,57 +373,7 @@ class ContainersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = []  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_containers" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='ListContainerResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(self.api_client, 'list_containers', (), kwargs)
 
     def list_data_templates(self, container_id, **kwargs):  # noqa: E501
         """List Data Source Templates  # noqa: E501
@@ -947,11 +391,7 @@ class ContainersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.list_data_templates_with_http_info(container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.list_data_templates_with_http_info(container_id, **kwargs)  # noqa: E501
-            return data
+        return self.list_data_templates_with_http_info(container_id, **kwargs)  # noqa: E501
 
     def list_data_templates_with_http_info(self, container_id, **kwargs):  # noqa: E501
         """List Data Source Templates  # noqa: E501
@@ -968,63 +408,9 @@ class ContainersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_data_templates" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `list_data_templates`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/data_source_templates', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='InlineResponse200',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'list_data_templates',
+            (container_id,), kwargs)
 
     def list_ontology_versions(self, container_id, **kwargs):  # noqa: E501
         """List Ontology Versions  # noqa: E501
@@ -1042,11 +428,7 @@ class ContainersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.list_ontology_versions_with_http_info(container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.list_ontology_versions_with_http_info(container_id, **kwargs)  # noqa: E501
-            return data
+        return self.list_ontology_versions_with_http_info(container_id, **kwargs)  # noqa: E501
 
     def list_ontology_versions_with_http_info(self, container_id, **kwargs):  # noqa: E501
         """List Ontology Versions  # noqa: E501
@@ -1063,63 +445,9 @@ class ContainersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_ontology_versions" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `list_ontology_versions`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/ontology/versions', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='InlineResponse2009',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'list_ontology_versions',
+            (container_id,), kwargs)
 
     def publish_ontology_version(self, container_id, ontology_version_id, **kwargs):  # noqa: E501
         """Publish Ontology Version  # noqa: E501
@@ -1138,11 +466,7 @@ class ContainersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.publish_ontology_version_with_http_info(container_id, ontology_version_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.publish_ontology_version_with_http_info(container_id, ontology_version_id, **kwargs)  # noqa: E501
-            return data
+        return self.publish_ontology_version_with_http_info(container_id, ontology_version_id, **kwargs)  # noqa: E501
 
     def publish_ontology_version_with_http_info(self, container_id, ontology_version_id, **kwargs):  # noqa: E501
         """Publish Ontology Version  # noqa: E501
@@ -1160,65 +484,9 @@ class ContainersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'ontology_version_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method publish_ontology_version" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `publish_ontology_version`")  # noqa: E501
-        # verify the required parameter 'ontology_version_id' is set
-        if ('ontology_version_id' not in params or
-                params['ontology_version_id'] is None):
-            raise ValueError("Missing the required parameter `ontology_version_id` when calling `publish_ontology_version`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'ontology_version_id' in params:
-            path_params['ontology_version_id'] = params['ontology_version_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/ontology/versions/{ontology_version_id}/publish', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'publish_ontology_version',
+            (container_id, ontology_version_id), kwargs)
 
     def reject_ontology_version_approval(self, container_id, ontology_version_id, **kwargs):  # noqa: E501
         """Reject Ontology Version Approval  # noqa: E501
@@ -1237,11 +505,7 @@ class ContainersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.reject_ontology_version_approval_with_http_info(container_id, ontology_version_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.reject_ontology_version_approval_with_http_info(container_id, ontology_version_id, **kwargs)  # noqa: E501
-            return data
+        return self.reject_ontology_version_approval_with_http_info(container_id, ontology_version_id, **kwargs)  # noqa: E501
 
     def reject_ontology_version_approval_with_http_info(self, container_id, ontology_version_id, **kwargs):  # noqa: E501
         """Reject Ontology Version Approval  # noqa: E501
@@ -1259,65 +523,9 @@ class ContainersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'ontology_version_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method reject_ontology_version_approval" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `reject_ontology_version_approval`")  # noqa: E501
-        # verify the required parameter 'ontology_version_id' is set
-        if ('ontology_version_id' not in params or
-                params['ontology_version_id'] is None):
-            raise ValueError("Missing the required parameter `ontology_version_id` when calling `reject_ontology_version_approval`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'ontology_version_id' in params:
-            path_params['ontology_version_id'] = params['ontology_version_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/ontology/versions/{ontology_version_id}/approve', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'reject_ontology_version_approval',
+            (container_id, ontology_version_id), kwargs)
 
     def repair_container_permissions(self, container_id, **kwargs):  # noqa: E501
         """Repair Container Permissions  # noqa: E501
@@ -1335,11 +543,7 @@ class ContainersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.repair_container_permissions_with_http_info(container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.repair_container_permissions_with_http_info(container_id, **kwargs)  # noqa: E501
-            return data
+        return self.repair_container_permissions_with_http_info(container_id, **kwargs)  # noqa: E501
 
     def repair_container_permissions_with_http_info(self, container_id, **kwargs):  # noqa: E501
         """Repair Container Permissions  # noqa: E501
@@ -1356,63 +560,9 @@ class ContainersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method repair_container_permissions" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `repair_container_permissions`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/permissions', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='Generic200Response',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'repair_container_permissions',
+            (container_id,), kwargs)
 
     def retrieve_container(self, container_id, **kwargs):  # noqa: E501
         """Retrieve Container  # noqa: E501
@@ -1430,11 +580,7 @@ class ContainersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.retrieve_container_with_http_info(container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.retrieve_container_with_http_info(container_id, **kwargs)  # noqa: E501
-            return data
+        return self.retrieve_container_with_http_info(container_id, **kwargs)  # noqa: E501
 
     def retrieve_container_with_http_info(self, container_id, **kwargs):  # noqa: E501
         """Retrieve Container  # noqa: E501
@@ -1451,63 +597,9 @@ class ContainersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method retrieve_container" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `retrieve_container`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='GetContainerResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'retrieve_container',
+            (container_id,), kwargs)
 
     def retrieve_ontology_version(self, container_id, version_id, **kwargs):  # noqa: E501
         """Retrieve Ontology Version  # noqa: E501
@@ -1526,11 +618,7 @@ class ContainersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.retrieve_ontology_version_with_http_info(container_id, version_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.retrieve_ontology_version_with_http_info(container_id, version_id, **kwargs)  # noqa: E501
-            return data
+        return self.retrieve_ontology_version_with_http_info(container_id, version_id, **kwargs)  # noqa: E501
 
     def retrieve_ontology_version_with_http_info(self, container_id, version_id, **kwargs):  # noqa: E501
         """Retrieve Ontology Version  # noqa: E501
@@ -1548,69 +636,9 @@ class ContainersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'version_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method retrieve_ontology_version" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `retrieve_ontology_version`")  # noqa: E501
-        # verify the required parameter 'version_id' is set
-        if ('version_id' not in params or
-                params['version_id'] is None):
-            raise ValueError("Missing the required parameter `version_id` when calling `retrieve_ontology_version`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'version_id' in params:
-            path_params['version_id'] = params['version_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/ontology/versions/{version_id}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='InlineResponse20010',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'retrieve_ontology_version',
+            (container_id, version_id), kwargs)
 
     def rollback_ontology_version(self, container_id, version_id, **kwargs):  # noqa: E501
         """Rollback Ontology Version  # noqa: E501
@@ -1629,11 +657,7 @@ class ContainersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.rollback_ontology_version_with_http_info(container_id, version_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.rollback_ontology_version_with_http_info(container_id, version_id, **kwargs)  # noqa: E501
-            return data
+        return self.rollback_ontology_version_with_http_info(container_id, version_id, **kwargs)  # noqa: E501
 
     def rollback_ontology_version_with_http_info(self, container_id, version_id, **kwargs):  # noqa: E501
         """Rollback Ontology Version  # noqa: E501
@@ -1651,65 +675,9 @@ class ContainersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'version_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method rollback_ontology_version" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `rollback_ontology_version`")  # noqa: E501
-        # verify the required parameter 'version_id' is set
-        if ('version_id' not in params or
-                params['version_id'] is None):
-            raise ValueError("Missing the required parameter `version_id` when calling `rollback_ontology_version`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'version_id' in params:
-            path_params['version_id'] = params['version_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/ontology/versions/{version_id}/rollback', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'rollback_ontology_version',
+            (container_id, version_id), kwargs)
 
     def send_ontology_version_for_approval(self, container_id, ontology_version_id, **kwargs):  # noqa: E501
         """Send Ontology Version for Approval  # noqa: E501
@@ -1728,11 +696,7 @@ class ContainersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.send_ontology_version_for_approval_with_http_info(container_id, ontology_version_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.send_ontology_version_for_approval_with_http_info(container_id, ontology_version_id, **kwargs)  # noqa: E501
-            return data
+        return self.send_ontology_version_for_approval_with_http_info(container_id, ontology_version_id, **kwargs)  # noqa: E501
 
     def send_ontology_version_for_approval_with_http_info(self, container_id, ontology_version_id, **kwargs):  # noqa: E501
         """Send Ontology Version for Approval  # noqa: E501
@@ -1750,65 +714,9 @@ class ContainersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'ontology_version_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method send_ontology_version_for_approval" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `send_ontology_version_for_approval`")  # noqa: E501
-        # verify the required parameter 'ontology_version_id' is set
-        if ('ontology_version_id' not in params or
-                params['ontology_version_id'] is None):
-            raise ValueError("Missing the required parameter `ontology_version_id` when calling `send_ontology_version_for_approval`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'ontology_version_id' in params:
-            path_params['ontology_version_id'] = params['ontology_version_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/ontology/versions/{ontology_version_id}/approve', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'send_ontology_version_for_approval',
+            (container_id, ontology_version_id), kwargs)
 
     def set_container_active(self, container_id, **kwargs):  # noqa: E501
         """Set Container Active  # noqa: E501
@@ -1826,11 +734,7 @@ class ContainersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.set_container_active_with_http_info(container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.set_container_active_with_http_info(container_id, **kwargs)  # noqa: E501
-            return data
+        return self.set_container_active_with_http_info(container_id, **kwargs)  # noqa: E501
 
     def set_container_active_with_http_info(self, container_id, **kwargs):  # noqa: E501
         """Set Container Active  # noqa: E501
@@ -1847,63 +751,9 @@ class ContainersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method set_container_active" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `set_container_active`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/active', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='Generic200Response',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'set_container_active',
+            (container_id,), kwargs)
 
     def update_container(self, body, container_id, **kwargs):  # noqa: E501
         """Update Container  # noqa: E501
@@ -1922,11 +772,7 @@ class ContainersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.update_container_with_http_info(body, container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.update_container_with_http_info(body, container_id, **kwargs)  # noqa: E501
-            return data
+        return self.update_container_with_http_info(body, container_id, **kwargs)  # noqa: E501
 
     def update_container_with_http_info(self, body, container_id, **kwargs):  # noqa: E501
         """Update Container  # noqa: E501
@@ -1944,73 +790,9 @@ class ContainersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body', 'container_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method update_container" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `update_container`")  # noqa: E501
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `update_container`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='UpdateContainerResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'update_container',
+            (body, container_id), kwargs)
 
     def update_container_import(self, export_file, container_id, **kwargs):  # noqa: E501
         """Update Container Import  # noqa: E501
@@ -2029,11 +811,7 @@ class ContainersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.update_container_import_with_http_info(export_file, container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.update_container_import_with_http_info(export_file, container_id, **kwargs)  # noqa: E501
-            return data
+        return self.update_container_import_with_http_info(export_file, container_id, **kwargs)  # noqa: E501
 
     def update_container_import_with_http_info(self, export_file, container_id, **kwargs):  # noqa: E501
         """Update Container Import  # noqa: E501
@@ -2051,70 +829,6 @@ class ContainersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['export_file', 'container_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method update_container_import" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'export_file' is set
-        if ('export_file' not in params or
-                params['export_file'] is None):
-            raise ValueError("Missing the required parameter `export_file` when calling `update_container_import`")  # noqa: E501
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `update_container_import`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-        if 'export_file' in params:
-            local_var_files['export_file'] = params['export_file']  # noqa: E501
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['multipart/form-data'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/import/{container_id}', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='ContainerImportUpdateResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'update_container_import',
+            (export_file, container_id), kwargs)
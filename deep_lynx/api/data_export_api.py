@@ -12,12 +12,8 @@
 
 from __future__ import absolute_import
 
-import re  # noqa: F401
-
-# python 2 and python 3 compatibility library
-import six
-
 from deep_lynx.api_client import ApiClient
+from deep_lynx import operations
 
 
 class DataExportApi(object):
@@ -49,11 +45,7 @@ class DataExportApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.create_data_export_with_http_info(body, container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.create_data_export_with_http_info(body, container_id, **kwargs)  # noqa: E501
-            return data
+        return self.create_data_export_with_http_info(body, container_id, **kwargs)  # noqa: E501
 
     def create_data_export_with_http_info(self, body, container_id, **kwargs):  # noqa: E501
         """Create Data Export  # noqa: E501
@@ -71,73 +63,9 @@ class DataExportApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body', 'container_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method create_data_export" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `create_data_export`")  # noqa: E501
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `create_data_export`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/data/export', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='Generic200Response',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'create_data_export',
+            (body, container_id), kwargs)
 
     def delete_data_export(self, container_id, export_id, **kwargs):  # noqa: E501
         """Delete Data Export  # noqa: E501
@@ -156,11 +84,7 @@ class DataExportApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.delete_data_export_with_http_info(container_id, export_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.delete_data_export_with_http_info(container_id, export_id, **kwargs)  # noqa: E501
-            return data
+        return self.delete_data_export_with_http_info(container_id, export_id, **kwargs)  # noqa: E501
 
     def delete_data_export_with_http_info(self, container_id, export_id, **kwargs):  # noqa: E501
         """Delete Data Export  # noqa: E501
@@ -178,69 +102,9 @@ class DataExportApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'export_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_data_export" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `delete_data_export`")  # noqa: E501
-        # verify the required parameter 'export_id' is set
-        if ('export_id' not in params or
-                params['export_id'] is None):
-            raise ValueError("Missing the required parameter `export_id` when calling `delete_data_export`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'export_id' in params:
-            path_params['export_id'] = params['export_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/data/export/{export_id}', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='Generic200Response',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'delete_data_export',
+            (container_id, export_id), kwargs)
 
     def list_data_exports(self, container_id, **kwargs):  # noqa: E501
         """List Data Exports  # noqa: E501
@@ -263,11 +127,7 @@ class DataExportApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.list_data_exports_with_http_info(container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.list_data_exports_with_http_info(container_id, **kwargs)  # noqa: E501
-            return data
+        return self.list_data_exports_with_http_info(container_id, **kwargs)  # noqa: E501
 
     def list_data_exports_with_http_info(self, container_id, **kwargs):  # noqa: E501
         """List Data Exports  # noqa: E501
@@ -289,73 +149,9 @@ class DataExportApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'count', 'limit', 'offset', 'sort_by', 'sort_desc']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_data_exports" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `list_data_exports`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-        if 'count' in params:
-            query_params.append(('count', params['count']))  # noqa: E501
-        if 'limit' in params:
-            query_params.append(('limit', params['limit']))  # noqa: E501
-        if 'offset' in params:
-            query_params.append(('offset', params['offset']))  # noqa: E501
-        if 'sort_by' in params:
-            query_params.append(('sortBy', params['sort_by']))  # noqa: E501
-        if 'sort_desc' in params:
-            query_params.append(('sortDesc', params['sort_desc']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/data/export', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='ListDataExportsResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'list_data_exports',
+            (container_id,), kwargs)
 
     def retrieve_data_export(self, container_id, export_id, **kwargs):  # noqa: E501
         """Retrieve Data Export  # noqa: E501
@@ -374,11 +170,7 @@ class DataExportApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.retrieve_data_export_with_http_info(container_id, export_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.retrieve_data_export_with_http_info(container_id, export_id, **kwargs)  # noqa: E501
-            return data
+        return self.retrieve_data_export_with_http_info(container_id, export_id, **kwargs)  # noqa: E501
 
     def retrieve_data_export_with_http_info(self, container_id, export_id, **kwargs):  # noqa: E501
         """Retrieve Data Export  # noqa: E501
@@ -396,69 +188,9 @@ class DataExportApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'export_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method retrieve_data_export" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `retrieve_data_export`")  # noqa: E501
-        # verify the required parameter 'export_id' is set
-        if ('export_id' not in params or
-                params['export_id'] is None):
-            raise ValueError("Missing the required parameter `export_id` when calling `retrieve_data_export`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'export_id' in params:
-            path_params['export_id'] = params['export_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/data/export/{export_id}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='GetDataExportResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'retrieve_data_export',
+            (container_id, export_id), kwargs)
 
     def start_data_export(self, container_id, export_id, **kwargs):  # noqa: E501
         """Start Data Export  # noqa: E501
@@ -477,11 +209,7 @@ class DataExportApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.start_data_export_with_http_info(container_id, export_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.start_data_export_with_http_info(container_id, export_id, **kwargs)  # noqa: E501
-            return data
+        return self.start_data_export_with_http_info(container_id, export_id, **kwargs)  # noqa: E501
 
     def start_data_export_with_http_info(self, container_id, export_id, **kwargs):  # noqa: E501
         """Start Data Export  # noqa: E501
@@ -499,69 +227,9 @@ class DataExportApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'export_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method start_data_export" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `start_data_export`")  # noqa: E501
-        # verify the required parameter 'export_id' is set
-        if ('export_id' not in params or
-                params['export_id'] is None):
-            raise ValueError("Missing the required parameter `export_id` when calling `start_data_export`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'export_id' in params:
-            path_params['export_id'] = params['export_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/data/export/{export_id}', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='Generic200Response',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'start_data_export',
+            (container_id, export_id), kwargs)
 
     def stop_data_export(self, container_id, export_id, **kwargs):  # noqa: E501
         """Stop Data Export  # noqa: E501
@@ -580,11 +248,7 @@ class DataExportApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.stop_data_export_with_http_info(container_id, export_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.stop_data_export_with_http_info(container_id, export_id, **kwargs)  # noqa: E501
-            return data
+        return self.stop_data_export_with_http_info(container_id, export_id, **kwargs)  # noqa: E501
 
     def stop_data_export_with_http_info(self, container_id, export_id, **kwargs):  # noqa: E501
         """Stop Data Export  # noqa: E501
@@ -602,66 +266,6 @@ class DataExportApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'export_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method stop_data_export" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `stop_data_export`")  # noqa: E501
-        # verify the required parameter 'export_id' is set
-        if ('export_id' not in params or
-                params['export_id'] is None):
-            raise ValueError("Missing the required parameter `export_id` when calling `stop_data_export`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'export_id' in params:
-            path_params['export_id'] = params['export_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/data/export/{export_id}', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='Generic200Response',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'stop_data_export',
+            (container_id, export_id), kwargs)
@@ -12,12 +12,8 @@
 
 from __future__ import absolute_import
 
-import re  # noqa: F401
-
-# python 2 and python 3 compatibility library
-import six
-
 from deep_lynx.api_client import ApiClient
+from deep_lynx import operations
 
 
 class DataQueryApi(object):
@@ -51,241 +47,7 @@ class DataQueryApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.data_query_with_http_info(body, container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.data_query_with_http_info(body, container_id, **kwargs)  # noqa: E501
-            return data
-
-    def data_query_with_http_info(self, body, container_id, **kwargs):  # noqa: E501
-        """Query Data  # noqa: E501
-
-        Query data from your container using GraphQL. You can learn more here - https://github.com/idaholab/Deep-Lynx/wiki/Querying-Data-With-GraphQL  # noqa: E501
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.data_query_with_http_info(body, container_id, async_req=True)
-        >>> result = thread.get()
-
-        :param async_req bool
-        :param object body: (required)
-        :param str container_id: (required)
-        :param bool raw_metadata_enabled:
-        :param str point_in_time:
-        :return: InlineResponse2002
-                 If the method is called asynchronously,
-                 returns the request thread.
-        """
-
-        all_params = ['body', 'container_id', 'raw_metadata_enabled', 'point_in_time']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method data_query" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `data_query`")  # noqa: E501
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `data_query`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-        if 'raw_metadata_enabled' in params:
-            query_params.append(('rawMetadataEnabled', params['raw_metadata_enabled']))  # noqa: E501
-        if 'point_in_time' in params:
-            query_params.append(('pointInTime', params['point_in_time']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json', 'text/plain', 'application/xml'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/data', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='InlineResponse2002',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
-
-    def data_query(self, body, container_id, **kwargs):  # noqa: E501
-        """Query Data  # noqa: E501
-
-        Query data from your container using GraphQL. You can learn more here - https://github.com/idaholab/Deep-Lynx/wiki/Querying-Data-With-GraphQL  # noqa: E501
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.data_query(body, container_id, async_req=True)
-        >>> result = thread.get()
-
-        :param async_req bool
-        :param object body: (required)
-        :param str container_id: (required)
-        :param bool raw_metadata_enabled:
-        :param str point_in_time:
-        :return: InlineResponse2002
-                 If the method is called asynchronously,
-                 returns the request thread.
-        """
-        kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.data_query_with_http_info(body, container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.data_query_with_http_info(body, container_id, **kwargs)  # noqa: E501
-            return data
-
-    def data_query_with_http_info(self, body, container_id, **kwargs):  # noqa: E501
-        """Query Data  # noqa: E501
-
-        Query data from your container using GraphQL. You can learn more here - https://github.com/idaholab/Deep-Lynx/wiki/Querying-Data-With-GraphQL  # noqa: E501
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.data_query_with_http_info(body, container_id, async_req=True)
-        >>> result = thread.get()
-
-        :param async_req bool
-        :param object body: (required)
-        :param str container_id: (required)
-        :param bool raw_metadata_enabled:
-        :param str point_in_time:
-        :return: InlineResponse2002
-                 If the method is called asynchronously,
-                 returns the request thread.
-        """
-
-        all_params = ['body', 'container_id', 'raw_metadata_enabled', 'point_in_time']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method data_query" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `data_query`")  # noqa: E501
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `data_query`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-        if 'raw_metadata_enabled' in params:
-            query_params.append(('rawMetadataEnabled', params['raw_metadata_enabled']))  # noqa: E501
-        if 'point_in_time' in params:
-            query_params.append(('pointInTime', params['point_in_time']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json', 'text/plain', 'application/xml'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/data', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='InlineResponse2002',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
-
-    def data_query(self, body, container_id, **kwargs):  # noqa: E501
-        """Query Data  # noqa: E501
-
-        Query data from your container using GraphQL. You can learn more here - https://github.com/idaholab/Deep-Lynx/wiki/Querying-Data-With-GraphQL  # noqa: E501
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.data_query(body, container_id, async_req=True)
-        >>> result = thread.get()
-
-        :param async_req bool
-        :param object body: (required)
-        :param str container_id: (required)
-        :param bool raw_metadata_enabled:
-        :param str point_in_time:
-        :return: InlineResponse2002
-                 If the method is called asynchronously,
-                 returns the request thread.
-        """
-        kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.data_query_with_http_info(body, container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.data_query_with_http_info(body, container_id, **kwargs)  # noqa: E501
-            return data
+        return self.data_query_with_http_info(body, container_id, **kwargs)  # noqa: E501
 
     def data_query_with_http_info(self, body, container_id, **kwargs):  # noqa: E501
         """Query Data  # noqa: E501
@@ -305,77 +67,9 @@ class DataQueryApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body', 'container_id', 'raw_metadata_enabled', 'point_in_time']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method data_query" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `data_query`")  # noqa: E501
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `data_query`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-        if 'raw_metadata_enabled' in params:
-            query_params.append(('rawMetadataEnabled', params['raw_metadata_enabled']))  # noqa: E501
-        if 'point_in_time' in params:
-            query_params.append(('pointInTime', params['point_in_time']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json', 'text/plain', 'application/xml'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/data', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='InlineResponse2002',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'data_query',
+            (body, container_id), kwargs)
 
     def query_graph(self, body, container_id, **kwargs):  # noqa: E501
         """Query Graph (Deprecated)  # noqa: E501
@@ -394,11 +88,7 @@ class DataQueryApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.query_graph_with_http_info(body, container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.query_graph_with_http_info(body, container_id, **kwargs)  # noqa: E501
-            return data
+        return self.query_graph_with_http_info(body, container_id, **kwargs)  # noqa: E501
 
     def query_graph_with_http_info(self, body, container_id, **kwargs):  # noqa: E501
         """Query Graph (Deprecated)  # noqa: E501
@@ -416,177 +106,6 @@ class DataQueryApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body', 'container_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method query_graph" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `query_graph`")  # noqa: E501
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `query_graph`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json', 'text/plain'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/query', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='InlineResponse2002',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
-
-    def query_graph(self, body, container_id, **kwargs):  # noqa: E501
-        """Query Graph (Deprecated)  # noqa: E501
-
-        Query the graph of the specified container using GraphQL. GraphQL queries may be formatted as json or plain text. This has been deprecated in favor of the `/containers/{container_id}/data` endpoint.  # noqa: E501
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.query_graph(body, container_id, async_req=True)
-        >>> result = thread.get()
-
-        :param async_req bool
-        :param object body: (required)
-        :param str container_id: (required)
-        :return: InlineResponse2002
-                 If the method is called asynchronously,
-                 returns the request thread.
-        """
-        kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.query_graph_with_http_info(body, container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.query_graph_with_http_info(body, container_id, **kwargs)  # noqa: E501
-            return data
-
-    def query_graph_with_http_info(self, body, container_id, **kwargs):  # noqa: E501
-        """Query Graph (Deprecated)  # noqa: E501
-
-        Query the graph of the specified container using GraphQL. GraphQL queries may be formatted as json or plain text. This has been deprecated in favor of the `/containers/{container_id}/data` endpoint.  # noqa: E501
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.query_graph_with_http_info(body, container_id, async_req=True)
-        >>> result = thread.get()
-
-        :param async_req bool
-        :param object body: (required)
-        :param str container_id: (required)
-        :return: InlineResponse2002
-                 If the method is called asynchronously,
-                 returns the request thread.
-        """
-
-        all_params = ['body', 'container_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method query_graph" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `query_graph`")  # noqa: E501
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `query_graph`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json', 'text/plain'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/query', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='InlineResponse2002',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'query_graph',
+            (body, container_id), kwargs)
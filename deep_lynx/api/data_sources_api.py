@@ -12,15 +12,12 @@
 
 from __future__ import absolute_import
 
-import re  # noqa: F401
-
-# python 2 and python 3 compatibility library
-import six
-
 from deep_lynx.api_client import ApiClient
+from deep_lynx.api_helpers import DataSourcesApiHelpers
+from deep_lynx import operations
 
 
-class DataSourcesApi(object):
+class DataSourcesApi(DataSourcesApiHelpers):
     """NOTE: This class is auto generated by the swagger code generator program.
 
     Do not edit the class manually.
@@ -52,11 +49,7 @@ class DataSourcesApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.archive_data_source_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.archive_data_source_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
-            return data
+        return self.archive_data_source_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
 
     def archive_data_source_with_http_info(self, container_id, data_source_id, **kwargs):  # noqa: E501
         """Archive Data Source  # noqa: E501
@@ -77,75 +70,9 @@ class DataSourcesApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'data_source_id', 'archive', 'force_delete', 'remove_data']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method archive_data_source" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `archive_data_source`")  # noqa: E501
-        # verify the required parameter 'data_source_id' is set
-        if ('data_source_id' not in params or
-                params['data_source_id'] is None):
-            raise ValueError("Missing the required parameter `data_source_id` when calling `archive_data_source`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'data_source_id' in params:
-            path_params['data_source_id'] = params['data_source_id']  # noqa: E501
-
-        query_params = []
-        if 'archive' in params:
-            query_params.append(('archive', params['archive']))  # noqa: E501
-        if 'force_delete' in params:
-            query_params.append(('forceDelete', params['force_delete']))  # noqa: E501
-        if 'remove_data' in params:
-            query_params.append(('removeData', params['remove_data']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/import/datasources/{data_source_id}', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='Generic200Response',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'archive_data_source',
+            (container_id, data_source_id), kwargs)
 
     def create_data_source(self, body, container_id, **kwargs):  # noqa: E501
         """Create Data Source  # noqa: E501
@@ -164,11 +91,7 @@ class DataSourcesApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.create_data_source_with_http_info(body, container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.create_data_source_with_http_info(body, container_id, **kwargs)  # noqa: E501
-            return data
+        return self.create_data_source_with_http_info(body, container_id, **kwargs)  # noqa: E501
 
     def create_data_source_with_http_info(self, body, container_id, **kwargs):  # noqa: E501
         """Create Data Source  # noqa: E501
@@ -186,73 +109,9 @@ class DataSourcesApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body', 'container_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method create_data_source" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `create_data_source`")  # noqa: E501
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `create_data_source`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/import/datasources', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='CreateDataSourcesResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'create_data_source',
+            (body, container_id), kwargs)
 
     def create_manual_import(self, container_id, data_source_id, **kwargs):  # noqa: E501
         """Create Manual Import  # noqa: E501
@@ -272,11 +131,7 @@ class DataSourcesApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.create_manual_import_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.create_manual_import_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
-            return data
+        return self.create_manual_import_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
 
     def create_manual_import_with_http_info(self, container_id, data_source_id, **kwargs):  # noqa: E501
         """Create Manual Import  # noqa: E501
@@ -295,75 +150,9 @@ class DataSourcesApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'data_source_id', 'body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method create_manual_import" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `create_manual_import`")  # noqa: E501
-        # verify the required parameter 'data_source_id' is set
-        if ('data_source_id' not in params or
-                params['data_source_id'] is None):
-            raise ValueError("Missing the required parameter `data_source_id` when calling `create_manual_import`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'data_source_id' in params:
-            path_params['data_source_id'] = params['data_source_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/import/datasources/{data_source_id}/imports', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='dict(str, object)',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'create_manual_import',
+            (container_id, data_source_id), kwargs)
 
     def create_manual_import_from_path(self, container_id, data_source_id, **kwargs):  # noqa: E501
         """Create Manual Import From Path  # noqa: E501
@@ -384,11 +173,7 @@ class DataSourcesApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.create_manual_import_from_path_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.create_manual_import_from_path_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
-            return data
+        return self.create_manual_import_from_path_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
 
     def create_manual_import_from_path_with_http_info(self, container_id, data_source_id, **kwargs):  # noqa: E501
         """Create Manual Import From Path  # noqa: E501
@@ -408,77 +193,9 @@ class DataSourcesApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'data_source_id', 'import_path', 'fast_load']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method create_manual_import_from_path" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `create_manual_import_from_path`")  # noqa: E501
-        # verify the required parameter 'data_source_id' is set
-        if ('data_source_id' not in params or
-                params['data_source_id'] is None):
-            raise ValueError("Missing the required parameter `data_source_id` when calling `create_manual_import_from_path`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'data_source_id' in params:
-            path_params['data_source_id'] = params['data_source_id']  # noqa: E501
-
-        query_params = []
-        if 'fast_load' in params:
-            query_params.append(('fastLoad', params['fast_load']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-        if 'import_path' in params:
-            local_var_files['import_path'] = params['import_path']  # noqa: E501
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['multipart/form-data'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/import/datasources/{data_source_id}/imports', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'create_manual_import_from_path',
+            (container_id, data_source_id), kwargs)
 
     def download_data_source(self, container_id, data_source_id, **kwargs):  # noqa: E501
         """Download Timeseries Data Source  # noqa: E501
@@ -497,11 +214,7 @@ class DataSourcesApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.download_data_source_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.download_data_source_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
-            return data
+        return self.download_data_source_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
 
     def download_data_source_with_http_info(self, container_id, data_source_id, **kwargs):  # noqa: E501
         """Download Timeseries Data Source  # noqa: E501
@@ -519,69 +232,9 @@ class DataSourcesApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'data_source_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method download_data_source" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `download_data_source`")  # noqa: E501
-        # verify the required parameter 'data_source_id' is set
-        if ('data_source_id' not in params or
-                params['data_source_id'] is None):
-            raise ValueError("Missing the required parameter `data_source_id` when calling `download_data_source`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'data_source_id' in params:
-            path_params['data_source_id'] = params['data_source_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/import/datasources/{data_source_id}/download', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='GetDataSourceResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'download_data_source',
+            (container_id, data_source_id), kwargs)
 
     def download_file(self, container_id, file_id, **kwargs):  # noqa: E501
         """Download File  # noqa: E501
@@ -600,11 +253,7 @@ class DataSourcesApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.download_file_with_http_info(container_id, file_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.download_file_with_http_info(container_id, file_id, **kwargs)  # noqa: E501
-            return data
+        return self.download_file_with_http_info(container_id, file_id, **kwargs)  # noqa: E501
 
     def download_file_with_http_info(self, container_id, file_id, **kwargs):  # noqa: E501
         """Download File  # noqa: E501
@@ -622,69 +271,9 @@ class DataSourcesApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'file_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method download_file" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `download_file`")  # noqa: E501
-        # verify the required parameter 'file_id' is set
-        if ('file_id' not in params or
-                params['file_id'] is None):
-            raise ValueError("Missing the required parameter `file_id` when calling `download_file`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'file_id' in params:
-            path_params['file_id'] = params['file_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/octet-stream'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/files/{file_id}/download', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='file',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'download_file',
+            (container_id, file_id), kwargs)
 
     def list_data_sources(self, container_id, **kwargs):  # noqa: E501
         """List Data Sources  # noqa: E501
@@ -706,11 +295,7 @@ class DataSourcesApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.list_data_sources_with_http_info(container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.list_data_sources_with_http_info(container_id, **kwargs)  # noqa: E501
-            return data
+        return self.list_data_sources_with_http_info(container_id, **kwargs)  # noqa: E501
 
     def list_data_sources_with_http_info(self, container_id, **kwargs):  # noqa: E501
         """List Data Sources  # noqa: E501
@@ -731,71 +316,9 @@ class DataSourcesApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'decrypted', 'timeseries', 'count', 'archived']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_data_sources" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `list_data_sources`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-        if 'decrypted' in params:
-            query_params.append(('decrypted', params['decrypted']))  # noqa: E501
-        if 'timeseries' in params:
-            query_params.append(('timeseries', params['timeseries']))  # noqa: E501
-        if 'count' in params:
-            query_params.append(('count', params['count']))  # noqa: E501
-        if 'archived' in params:
-            query_params.append(('archived', params['archived']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/import/datasources', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='ListDataSourcesResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'list_data_sources',
+            (container_id,), kwargs)
 
     def list_imports_for_data_source(self, container_id, data_source_id, **kwargs):  # noqa: E501
         """List Imports for Data Source  # noqa: E501
@@ -809,16 +332,14 @@ class DataSourcesApi(object):
         :param async_req bool
         :param str container_id: (required)
         :param str data_source_id: (required)
+        :param int limit:
+        :param int offset:
         :return: ListDataSourceImportsResponse
                  If the method is called asynchronously,
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.list_imports_for_data_source_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.list_imports_for_data_source_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
-            return data
+        return self.list_imports_for_data_source_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
 
     def list_imports_for_data_source_with_http_info(self, container_id, data_source_id, **kwargs):  # noqa: E501
         """List Imports for Data Source  # noqa: E501
@@ -832,73 +353,15 @@ class DataSourcesApi(object):
         :param async_req bool
         :param str container_id: (required)
         :param str data_source_id: (required)
+        :param int limit:
+        :param int offset:
         :return: ListDataSourceImportsResponse
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'data_source_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_imports_for_data_source" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `list_imports_for_data_source`")  # noqa: E501
-        # verify the required parameter 'data_source_id' is set
-        if ('data_source_id' not in params or
-                params['data_source_id'] is None):
-            raise ValueError("Missing the required parameter `data_source_id` when calling `list_imports_for_data_source`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'data_source_id' in params:
-            path_params['data_source_id'] = params['data_source_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/import/datasources/{data_source_id}/imports', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='ListDataSourceImportsResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'list_imports_for_data_source',
+            (container_id, data_source_id), kwargs)
 
     def retrieve_data_source(self, container_id, data_source_id, **kwargs):  # noqa: E501
         """Retrieve Data Source  # noqa: E501
@@ -917,11 +380,7 @@ class DataSourcesApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.retrieve_data_source_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.retrieve_data_source_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
-            return data
+        return self.retrieve_data_source_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
 
     def retrieve_data_source_with_http_info(self, container_id, data_source_id, **kwargs):  # noqa: E501
         """Retrieve Data Source  # noqa: E501
@@ -939,69 +398,9 @@ class DataSourcesApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'data_source_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method retrieve_data_source" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `retrieve_data_source`")  # noqa: E501
-        # verify the required parameter 'data_source_id' is set
-        if ('data_source_id' not in params or
-                params['data_source_id'] is None):
-            raise ValueError("Missing the required parameter `data_source_id` when calling `retrieve_data_source`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'data_source_id' in params:
-            path_params['data_source_id'] = params['data_source_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/import/datasources/{data_source_id}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='GetDataSourceResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'retrieve_data_source',
+            (container_id, data_source_id), kwargs)
 
     def retrieve_file(self, container_id, file_id, **kwargs):  # noqa: E501
         """Retrieve File  # noqa: E501
@@ -1020,11 +419,7 @@ class DataSourcesApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.retrieve_file_with_http_info(container_id, file_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.retrieve_file_with_http_info(container_id, file_id, **kwargs)  # noqa: E501
-            return data
+        return self.retrieve_file_with_http_info(container_id, file_id, **kwargs)  # noqa: E501
 
     def retrieve_file_with_http_info(self, container_id, file_id, **kwargs):  # noqa: E501
         """Retrieve File  # noqa: E501
@@ -1042,69 +437,9 @@ class DataSourcesApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'file_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method retrieve_file" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `retrieve_file`")  # noqa: E501
-        # verify the required parameter 'file_id' is set
-        if ('file_id' not in params or
-                params['file_id'] is None):
-            raise ValueError("Missing the required parameter `file_id` when calling `retrieve_file`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'file_id' in params:
-            path_params['file_id'] = params['file_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/files/{file_id}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='GetFileInfoResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'retrieve_file',
+            (container_id, file_id), kwargs)
 
     def set_data_source_active(self, container_id, data_source_id, **kwargs):  # noqa: E501
         """Set Data Source Active  # noqa: E501
@@ -1123,11 +458,7 @@ class DataSourcesApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.set_data_source_active_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.set_data_source_active_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
-            return data
+        return self.set_data_source_active_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
 
     def set_data_source_active_with_http_info(self, container_id, data_source_id, **kwargs):  # noqa: E501
         """Set Data Source Active  # noqa: E501
@@ -1145,69 +476,9 @@ class DataSourcesApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'data_source_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method set_data_source_active" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `set_data_source_active`")  # noqa: E501
-        # verify the required parameter 'data_source_id' is set
-        if ('data_source_id' not in params or
-                params['data_source_id'] is None):
-            raise ValueError("Missing the required parameter `data_source_id` when calling `set_data_source_active`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'data_source_id' in params:
-            path_params['data_source_id'] = params['data_source_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/import/datasources/{data_source_id}/active', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='Generic200Response',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'set_data_source_active',
+            (container_id, data_source_id), kwargs)
 
     def set_data_source_configuration(self, body, container_id, data_source_id, **kwargs):  # noqa: E501
         """Set Data Source Configuration  # noqa: E501
@@ -1227,11 +498,7 @@ class DataSourcesApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.set_data_source_configuration_with_http_info(body, container_id, data_source_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.set_data_source_configuration_with_http_info(body, container_id, data_source_id, **kwargs)  # noqa: E501
-            return data
+        return self.set_data_source_configuration_with_http_info(body, container_id, data_source_id, **kwargs)  # noqa: E501
 
     def set_data_source_configuration_with_http_info(self, body, container_id, data_source_id, **kwargs):  # noqa: E501
         """Set Data Source Configuration  # noqa: E501
@@ -1250,79 +517,9 @@ class DataSourcesApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body', 'container_id', 'data_source_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method set_data_source_configuration" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `set_data_source_configuration`")  # noqa: E501
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `set_data_source_configuration`")  # noqa: E501
-        # verify the required parameter 'data_source_id' is set
-        if ('data_source_id' not in params or
-                params['data_source_id'] is None):
-            raise ValueError("Missing the required parameter `data_source_id` when calling `set_data_source_configuration`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'data_source_id' in params:
-            path_params['data_source_id'] = params['data_source_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/import/datasources/{data_source_id}', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='UpdateDataSourceResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'set_data_source_configuration',
+            (body, container_id, data_source_id), kwargs)
 
     def set_data_source_inactive(self, container_id, data_source_id, **kwargs):  # noqa: E501
         """Set Data Source Inactive  # noqa: E501
@@ -1341,11 +538,7 @@ class DataSourcesApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.set_data_source_inactive_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.set_data_source_inactive_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
-            return data
+        return self.set_data_source_inactive_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
 
     def set_data_source_inactive_with_http_info(self, container_id, data_source_id, **kwargs):  # noqa: E501
         """Set Data Source Inactive  # noqa: E501
@@ -1363,69 +556,9 @@ class DataSourcesApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'data_source_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method set_data_source_inactive" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `set_data_source_inactive`")  # noqa: E501
-        # verify the required parameter 'data_source_id' is set
-        if ('data_source_id' not in params or
-                params['data_source_id'] is None):
-            raise ValueError("Missing the required parameter `data_source_id` when calling `set_data_source_inactive`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'data_source_id' in params:
-            path_params['data_source_id'] = params['data_source_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/import/datasources/{data_source_id}/active', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='Generic200Response',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'set_data_source_inactive',
+            (container_id, data_source_id), kwargs)
 
     def upload_file(self, container_id, data_source_id, **kwargs):  # noqa: E501
         """Upload File  # noqa: E501
@@ -1447,11 +580,7 @@ class DataSourcesApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.upload_file_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.upload_file_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
-            return data
+        return self.upload_file_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
 
     def upload_file_with_http_info(self, container_id, data_source_id, **kwargs):  # noqa: E501
         """Upload File  # noqa: E501
@@ -1472,76 +601,6 @@ class DataSourcesApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'data_source_id', 'file', 'metadata', 'import_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method upload_file" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `upload_file`")  # noqa: E501
-        # verify the required parameter 'data_source_id' is set
-        if ('data_source_id' not in params or
-                params['data_source_id'] is None):
-            raise ValueError("Missing the required parameter `data_source_id` when calling `upload_file`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'data_source_id' in params:
-            path_params['data_source_id'] = params['data_source_id']  # noqa: E501
-
-        query_params = []
-        if 'import_id' in params:
-            query_params.append(('importID', params['import_id']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-        if 'file' in params:
-            local_var_files['file'] = params['file']  # noqa: E501
-        if 'metadata' in params:
-            local_var_files['metadata'] = params['metadata']  # noqa: E501
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['multipart/form-data'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/import/datasources/{data_source_id}/files', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='UploadFileResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'upload_file',
+            (container_id, data_source_id), kwargs)
@@ -12,12 +12,8 @@
 
 from __future__ import absolute_import
 
-import re  # noqa: F401
-
-# python 2 and python 3 compatibility library
-import six
-
 from deep_lynx.api_client import ApiClient
+from deep_lynx import operations
 
 
 class DataTypeMappingsApi(object):
@@ -51,11 +47,7 @@ class DataTypeMappingsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.copy_transformations_with_http_info(container_id, source_id, mapping_id, original_mapping_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.copy_transformations_with_http_info(container_id, source_id, mapping_id, original_mapping_id, **kwargs)  # noqa: E501
-            return data
+        return self.copy_transformations_with_http_info(container_id, source_id, mapping_id, original_mapping_id, **kwargs)  # noqa: E501
 
     def copy_transformations_with_http_info(self, container_id, source_id, mapping_id, original_mapping_id, **kwargs):  # noqa: E501
         """copy_transformations  # noqa: E501
@@ -75,77 +67,9 @@ class DataTypeMappingsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'source_id', 'mapping_id', 'original_mapping_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method copy_transformations" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `copy_transformations`")  # noqa: E501
-        # verify the required parameter 'source_id' is set
-        if ('source_id' not in params or
-                params['source_id'] is None):
-            raise ValueError("Missing the required parameter `source_id` when calling `copy_transformations`")  # noqa: E501
-        # verify the required parameter 'mapping_id' is set
-        if ('mapping_id' not in params or
-                params['mapping_id'] is None):
-            raise ValueError("Missing the required parameter `mapping_id` when calling `copy_transformations`")  # noqa: E501
-        # verify the required parameter 'original_mapping_id' is set
-        if ('original_mapping_id' not in params or
-                params['original_mapping_id'] is None):
-            raise ValueError("Missing the required parameter `original_mapping_id` when calling `copy_transformations`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'source_id' in params:
-            path_params['sourceID'] = params['source_id']  # noqa: E501
-        if 'mapping_id' in params:
-            path_params['mappingID'] = params['mapping_id']  # noqa: E501
-        if 'original_mapping_id' in params:
-            path_params['originalMappingID'] = params['original_mapping_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/import/datasources/{sourceID}/mappings/{mappingID}/copy/{originalMappingID}', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'copy_transformations',
+            (container_id, source_id, mapping_id, original_mapping_id), kwargs)
 
     def create_transformation(self, body, container_id, data_source_id, mapping_id, **kwargs):  # noqa: E501
         """Create Data Type Mapping's Transformations  # noqa: E501
@@ -166,11 +90,7 @@ class DataTypeMappingsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.create_transformation_with_http_info(body, container_id, data_source_id, mapping_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.create_transformation_with_http_info(body, container_id, data_source_id, mapping_id, **kwargs)  # noqa: E501
-            return data
+        return self.create_transformation_with_http_info(body, container_id, data_source_id, mapping_id, **kwargs)  # noqa: E501
 
     def create_transformation_with_http_info(self, body, container_id, data_source_id, mapping_id, **kwargs):  # noqa: E501
         """Create Data Type Mapping's Transformations  # noqa: E501
@@ -190,85 +110,9 @@ class DataTypeMappingsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body', 'container_id', 'data_source_id', 'mapping_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method create_transformation" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `create_transformation`")  # noqa: E501
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `create_transformation`")  # noqa: E501
-        # verify the required parameter 'data_source_id' is set
-        if ('data_source_id' not in params or
-                params['data_source_id'] is None):
-            raise ValueError("Missing the required parameter `data_source_id` when calling `create_transformation`")  # noqa: E501
-        # verify the required parameter 'mapping_id' is set
-        if ('mapping_id' not in params or
-                params['mapping_id'] is None):
-            raise ValueError("Missing the required parameter `mapping_id` when calling `create_transformation`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'data_source_id' in params:
-            path_params['data_source_id'] = params['data_source_id']  # noqa: E501
-        if 'mapping_id' in params:
-            path_params['mapping_id'] = params['mapping_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/import/datasources/{data_source_id}/mappings/{mapping_id}/transformations', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='CreateTransformationResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'create_transformation',
+            (body, container_id, data_source_id, mapping_id), kwargs)
 
     def delete_data_type_mapping(self, container_id, data_source_id, mapping_id, **kwargs):  # noqa: E501
         """Delete Data Type Mapping  # noqa: E501
@@ -288,11 +132,7 @@ class DataTypeMappingsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.delete_data_type_mapping_with_http_info(container_id, data_source_id, mapping_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.delete_data_type_mapping_with_http_info(container_id, data_source_id, mapping_id, **kwargs)  # noqa: E501
-            return data
+        return self.delete_data_type_mapping_with_http_info(container_id, data_source_id, mapping_id, **kwargs)  # noqa: E501
 
     def delete_data_type_mapping_with_http_info(self, container_id, data_source_id, mapping_id, **kwargs):  # noqa: E501
         """Delete Data Type Mapping  # noqa: E501
@@ -311,75 +151,9 @@ class DataTypeMappingsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'data_source_id', 'mapping_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_data_type_mapping" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `delete_data_type_mapping`")  # noqa: E501
-        # verify the required parameter 'data_source_id' is set
-        if ('data_source_id' not in params or
-                params['data_source_id'] is None):
-            raise ValueError("Missing the required parameter `data_source_id` when calling `delete_data_type_mapping`")  # noqa: E501
-        # verify the required parameter 'mapping_id' is set
-        if ('mapping_id' not in params or
-                params['mapping_id'] is None):
-            raise ValueError("Missing the required parameter `mapping_id` when calling `delete_data_type_mapping`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'data_source_id' in params:
-            path_params['data_source_id'] = params['data_source_id']  # noqa: E501
-        if 'mapping_id' in params:
-            path_params['mapping_id'] = params['mapping_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/import/datasources/{data_source_id}/mappings/{mapping_id}', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='Generic200Response',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'delete_data_type_mapping',
+            (container_id, data_source_id, mapping_id), kwargs)
 
     def delete_transformation(self, container_id, data_source_id, mapping_id, transformation_id, **kwargs):  # noqa: E501
         """Delete Data Type Mapping's Transformations  # noqa: E501
@@ -400,11 +174,7 @@ class DataTypeMappingsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.delete_transformation_with_http_info(container_id, data_source_id, mapping_id, transformation_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.delete_transformation_with_http_info(container_id, data_source_id, mapping_id, transformation_id, **kwargs)  # noqa: E501
-            return data
+        return self.delete_transformation_with_http_info(container_id, data_source_id, mapping_id, transformation_id, **kwargs)  # noqa: E501
 
     def delete_transformation_with_http_info(self, container_id, data_source_id, mapping_id, transformation_id, **kwargs):  # noqa: E501
         """Delete Data Type Mapping's Transformations  # noqa: E501
@@ -424,81 +194,9 @@ class DataTypeMappingsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'data_source_id', 'mapping_id', 'transformation_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_transformation" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `delete_transformation`")  # noqa: E501
-        # verify the required parameter 'data_source_id' is set
-        if ('data_source_id' not in params or
-                params['data_source_id'] is None):
-            raise ValueError("Missing the required parameter `data_source_id` when calling `delete_transformation`")  # noqa: E501
-        # verify the required parameter 'mapping_id' is set
-        if ('mapping_id' not in params or
-                params['mapping_id'] is None):
-            raise ValueError("Missing the required parameter `mapping_id` when calling `delete_transformation`")  # noqa: E501
-        # verify the required parameter 'transformation_id' is set
-        if ('transformation_id' not in params or
-                params['transformation_id'] is None):
-            raise ValueError("Missing the required parameter `transformation_id` when calling `delete_transformation`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'data_source_id' in params:
-            path_params['data_source_id'] = params['data_source_id']  # noqa: E501
-        if 'mapping_id' in params:
-            path_params['mapping_id'] = params['mapping_id']  # noqa: E501
-        if 'transformation_id' in params:
-            path_params['transformation_id'] = params['transformation_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/import/datasources/{data_source_id}/mappings/{mapping_id}/transformations/{transformation_id}', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='Generic200Response',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'delete_transformation',
+            (container_id, data_source_id, mapping_id, transformation_id), kwargs)
 
     def export_type_mappings(self, container_id, data_source_id, **kwargs):  # noqa: E501
         """Export Type Mappings  # noqa: E501
@@ -518,11 +216,7 @@ class DataTypeMappingsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.export_type_mappings_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.export_type_mappings_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
-            return data
+        return self.export_type_mappings_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
 
     def export_type_mappings_with_http_info(self, container_id, data_source_id, **kwargs):  # noqa: E501
         """Export Type Mappings  # noqa: E501
@@ -541,75 +235,9 @@ class DataTypeMappingsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'data_source_id', 'body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method export_type_mappings" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `export_type_mappings`")  # noqa: E501
-        # verify the required parameter 'data_source_id' is set
-        if ('data_source_id' not in params or
-                params['data_source_id'] is None):
-            raise ValueError("Missing the required parameter `data_source_id` when calling `export_type_mappings`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'data_source_id' in params:
-            path_params['data_source_id'] = params['data_source_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/import/datasources/{data_source_id}/mappings/export', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='list[TypeMapping]',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'export_type_mappings',
+            (container_id, data_source_id), kwargs)
 
     def import_data_type_mappings(self, container_id, data_source_id, **kwargs):  # noqa: E501
         """Import Data Type Mappings  # noqa: E501
@@ -630,11 +258,7 @@ class DataTypeMappingsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.import_data_type_mappings_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.import_data_type_mappings_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
-            return data
+        return self.import_data_type_mappings_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
 
     def import_data_type_mappings_with_http_info(self, container_id, data_source_id, **kwargs):  # noqa: E501
         """Import Data Type Mappings  # noqa: E501
@@ -654,77 +278,9 @@ class DataTypeMappingsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'data_source_id', 'body', 'is_enabled']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method import_data_type_mappings" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `import_data_type_mappings`")  # noqa: E501
-        # verify the required parameter 'data_source_id' is set
-        if ('data_source_id' not in params or
-                params['data_source_id'] is None):
-            raise ValueError("Missing the required parameter `data_source_id` when calling `import_data_type_mappings`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'data_source_id' in params:
-            path_params['data_source_id'] = params['data_source_id']  # noqa: E501
-
-        query_params = []
-        if 'is_enabled' in params:
-            query_params.append(('isEnabled', params['is_enabled']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/import/datasources/{data_source_id}/mappings/import', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='ImportDataTypeMappingResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'import_data_type_mappings',
+            (container_id, data_source_id), kwargs)
 
     def list_data_type_mappings(self, container_id, data_source_id, **kwargs):  # noqa: E501
         """List Data Type Mappings  # noqa: E501
@@ -751,11 +307,7 @@ class DataTypeMappingsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.list_data_type_mappings_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.list_data_type_mappings_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
-            return data
+        return self.list_data_type_mappings_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
 
     def list_data_type_mappings_with_http_info(self, container_id, data_source_id, **kwargs):  # noqa: E501
         """List Data Type Mappings  # noqa: E501
@@ -781,85 +333,9 @@ class DataTypeMappingsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'data_source_id', 'limit', 'offset', 'needs_transformations', 'count', 'sort_by', 'sort_desc', 'resulting_metatype_name', 'resulting_metatype_relationship_name']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_data_type_mappings" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `list_data_type_mappings`")  # noqa: E501
-        # verify the required parameter 'data_source_id' is set
-        if ('data_source_id' not in params or
-                params['data_source_id'] is None):
-            raise ValueError("Missing the required parameter `data_source_id` when calling `list_data_type_mappings`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'data_source_id' in params:
-            path_params['data_source_id'] = params['data_source_id']  # noqa: E501
-
-        query_params = []
-        if 'limit' in params:
-            query_params.append(('limit', params['limit']))  # noqa: E501
-        if 'offset' in params:
-            query_params.append(('offset', params['offset']))  # noqa: E501
-        if 'needs_transformations' in params:
-            query_params.append(('needsTransformations', params['needs_transformations']))  # noqa: E501
-        if 'count' in params:
-            query_params.append(('count', params['count']))  # noqa: E501
-        if 'sort_by' in params:
-            query_params.append(('sortBy', params['sort_by']))  # noqa: E501
-        if 'sort_desc' in params:
-            query_params.append(('sortDesc', params['sort_desc']))  # noqa: E501
-        if 'resulting_metatype_name' in params:
-            query_params.append(('resultingMetatypeName', params['resulting_metatype_name']))  # noqa: E501
-        if 'resulting_metatype_relationship_name' in params:
-            query_params.append(('resultingMetatypeRelationshipName', params['resulting_metatype_relationship_name']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/import/datasources/{data_source_id}/mappings', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='ListDataTypeMappingResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'list_data_type_mappings',
+            (container_id, data_source_id), kwargs)
 
     def list_transformations(self, container_id, data_source_id, mapping_id, **kwargs):  # noqa: E501
         """List Data Type Mapping's Transformations  # noqa: E501
@@ -879,11 +355,7 @@ class DataTypeMappingsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.list_transformations_with_http_info(container_id, data_source_id, mapping_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.list_transformations_with_http_info(container_id, data_source_id, mapping_id, **kwargs)  # noqa: E501
-            return data
+        return self.list_transformations_with_http_info(container_id, data_source_id, mapping_id, **kwargs)  # noqa: E501
 
     def list_transformations_with_http_info(self, container_id, data_source_id, mapping_id, **kwargs):  # noqa: E501
         """List Data Type Mapping's Transformations  # noqa: E501
@@ -902,75 +374,9 @@ class DataTypeMappingsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'data_source_id', 'mapping_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_transformations" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `list_transformations`")  # noqa: E501
-        # verify the required parameter 'data_source_id' is set
-        if ('data_source_id' not in params or
-                params['data_source_id'] is None):
-            raise ValueError("Missing the required parameter `data_source_id` when calling `list_transformations`")  # noqa: E501
-        # verify the required parameter 'mapping_id' is set
-        if ('mapping_id' not in params or
-                params['mapping_id'] is None):
-            raise ValueError("Missing the required parameter `mapping_id` when calling `list_transformations`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'data_source_id' in params:
-            path_params['data_source_id'] = params['data_source_id']  # noqa: E501
-        if 'mapping_id' in params:
-            path_params['mapping_id'] = params['mapping_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/import/datasources/{data_source_id}/mappings/{mapping_id}/transformations', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='ListTransformationResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'list_transformations',
+            (container_id, data_source_id, mapping_id), kwargs)
 
     def retrieve_data_type_mapping(self, container_id, data_source_id, mapping_id, **kwargs):  # noqa: E501
         """Retrieve Data Type Mapping  # noqa: E501
@@ -990,11 +396,7 @@ class DataTypeMappingsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.retrieve_data_type_mapping_with_http_info(container_id, data_source_id, mapping_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.retrieve_data_type_mapping_with_http_info(container_id, data_source_id, mapping_id, **kwargs)  # noqa: E501
-            return data
+        return self.retrieve_data_type_mapping_with_http_info(container_id, data_source_id, mapping_id, **kwargs)  # noqa: E501
 
     def retrieve_data_type_mapping_with_http_info(self, container_id, data_source_id, mapping_id, **kwargs):  # noqa: E501
         """Retrieve Data Type Mapping  # noqa: E501
@@ -1013,75 +415,9 @@ class DataTypeMappingsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'data_source_id', 'mapping_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method retrieve_data_type_mapping" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `retrieve_data_type_mapping`")  # noqa: E501
-        # verify the required parameter 'data_source_id' is set
-        if ('data_source_id' not in params or
-                params['data_source_id'] is None):
-            raise ValueError("Missing the required parameter `data_source_id` when calling `retrieve_data_type_mapping`")  # noqa: E501
-        # verify the required parameter 'mapping_id' is set
-        if ('mapping_id' not in params or
-                params['mapping_id'] is None):
-            raise ValueError("Missing the required parameter `mapping_id` when calling `retrieve_data_type_mapping`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'data_source_id' in params:
-            path_params['data_source_id'] = params['data_source_id']  # noqa: E501
-        if 'mapping_id' in params:
-            path_params['mapping_id'] = params['mapping_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/import/datasources/{data_source_id}/mappings/{mapping_id}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='GetDataTypeMappingResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'retrieve_data_type_mapping',
+            (container_id, data_source_id, mapping_id), kwargs)
 
     def update_data_type_mapping(self, container_id, data_source_id, mapping_id, **kwargs):  # noqa: E501
         """Update Data Type Mapping  # noqa: E501
@@ -1102,11 +438,7 @@ class DataTypeMappingsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.update_data_type_mapping_with_http_info(container_id, data_source_id, mapping_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.update_data_type_mapping_with_http_info(container_id, data_source_id, mapping_id, **kwargs)  # noqa: E501
-            return data
+        return self.update_data_type_mapping_with_http_info(container_id, data_source_id, mapping_id, **kwargs)  # noqa: E501
 
     def update_data_type_mapping_with_http_info(self, container_id, data_source_id, mapping_id, **kwargs):  # noqa: E501
         """Update Data Type Mapping  # noqa: E501
@@ -1126,81 +458,9 @@ class DataTypeMappingsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'data_source_id', 'mapping_id', 'body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method update_data_type_mapping" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `update_data_type_mapping`")  # noqa: E501
-        # verify the required parameter 'data_source_id' is set
-        if ('data_source_id' not in params or
-                params['data_source_id'] is None):
-            raise ValueError("Missing the required parameter `data_source_id` when calling `update_data_type_mapping`")  # noqa: E501
-        # verify the required parameter 'mapping_id' is set
-        if ('mapping_id' not in params or
-                params['mapping_id'] is None):
-            raise ValueError("Missing the required parameter `mapping_id` when calling `update_data_type_mapping`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'data_source_id' in params:
-            path_params['data_source_id'] = params['data_source_id']  # noqa: E501
-        if 'mapping_id' in params:
-            path_params['mapping_id'] = params['mapping_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/import/datasources/{data_source_id}/mappings/{mapping_id}', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='UpdateDataTypeMappingResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'update_data_type_mapping',
+            (container_id, data_source_id, mapping_id), kwargs)
 
     def update_transformation(self, body, container_id, data_source_id, mapping_id, transformation_id, **kwargs):  # noqa: E501
         """Update Data Type Mapping's Transformations  # noqa: E501
@@ -1222,11 +482,7 @@ class DataTypeMappingsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.update_transformation_with_http_info(body, container_id, data_source_id, mapping_id, transformation_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.update_transformation_with_http_info(body, container_id, data_source_id, mapping_id, transformation_id, **kwargs)  # noqa: E501
-            return data
+        return self.update_transformation_with_http_info(body, container_id, data_source_id, mapping_id, transformation_id, **kwargs)  # noqa: E501
 
     def update_transformation_with_http_info(self, body, container_id, data_source_id, mapping_id, transformation_id, **kwargs):  # noqa: E501
         """Update Data Type Mapping's Transformations  # noqa: E501
@@ -1247,88 +503,6 @@ class DataTypeMappingsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body', 'container_id', 'data_source_id', 'mapping_id', 'transformation_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method update_transformation" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `update_transformation`")  # noqa: E501
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `update_transformation`")  # noqa: E501
-        # verify the required parameter 'data_source_id' is set
-        if ('data_source_id' not in params or
-                params['data_source_id'] is None):
-            raise ValueError("Missing the required parameter `data_source_id` when calling `update_transformation`")  # noqa: E501
-        # verify the required parameter 'mapping_id' is set
-        if ('mapping_id' not in params or
-                params['mapping_id'] is None):
-            raise ValueError("Missing the required parameter `mapping_id` when calling `update_transformation`")  # noqa: E501
-        # verify the required parameter 'transformation_id' is set
-        if ('transformation_id' not in params or
-                params['transformation_id'] is None):
-            raise ValueError("Missing the required parameter `transformation_id` when calling `update_transformation`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'data_source_id' in params:
-            path_params['data_source_id'] = params['data_source_id']  # noqa: E501
-        if 'mapping_id' in params:
-            path_params['mapping_id'] = params['mapping_id']  # noqa: E501
-        if 'transformation_id' in params:
-            path_params['transformation_id'] = params['transformation_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/import/datasources/{data_source_id}/mappings/{mapping_id}/transformations/{transformation_id}', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='UpdateTransformationResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'update_transformation',
+            (body, container_id, data_source_id, mapping_id, transformation_id), kwargs)
@@ -12,12 +12,8 @@
 
 from __future__ import absolute_import
 
-import re  # noqa: F401
-
-# python 2 and python 3 compatibility library
-import six
-
 from deep_lynx.api_client import ApiClient
+from deep_lynx import operations
 
 
 class DefaultApi(object):
@@ -49,11 +45,7 @@ class DefaultApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.delete_containers_container_id_graphs_tags_tag_id_edges_with_http_info(container_id, tag_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.delete_containers_container_id_graphs_tags_tag_id_edges_with_http_info(container_id, tag_id, **kwargs)  # noqa: E501
-            return data
+        return self.delete_containers_container_id_graphs_tags_tag_id_edges_with_http_info(container_id, tag_id, **kwargs)  # noqa: E501
 
     def delete_containers_container_id_graphs_tags_tag_id_edges_with_http_info(self, container_id, tag_id, **kwargs):  # noqa: E501
         """Bulk Detach Tag from Edges  # noqa: E501
@@ -71,65 +63,9 @@ class DefaultApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'tag_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_containers_container_id_graphs_tags_tag_id_edges" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `delete_containers_container_id_graphs_tags_tag_id_edges`")  # noqa: E501
-        # verify the required parameter 'tag_id' is set
-        if ('tag_id' not in params or
-                params['tag_id'] is None):
-            raise ValueError("Missing the required parameter `tag_id` when calling `delete_containers_container_id_graphs_tags_tag_id_edges`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'tag_id' in params:
-            path_params['tag_id'] = params['tag_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/tags/{tag_id}/edges', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'delete_containers_container_id_graphs_tags_tag_id_edges',
+            (container_id, tag_id), kwargs)
 
     def delete_containers_container_id_graphs_tags_tag_id_nodes(self, container_id, tag_id, **kwargs):  # noqa: E501
         """Bulk Detach Tag from Nodes  # noqa: E501
@@ -148,11 +84,7 @@ class DefaultApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.delete_containers_container_id_graphs_tags_tag_id_nodes_with_http_info(container_id, tag_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.delete_containers_container_id_graphs_tags_tag_id_nodes_with_http_info(container_id, tag_id, **kwargs)  # noqa: E501
-            return data
+        return self.delete_containers_container_id_graphs_tags_tag_id_nodes_with_http_info(container_id, tag_id, **kwargs)  # noqa: E501
 
     def delete_containers_container_id_graphs_tags_tag_id_nodes_with_http_info(self, container_id, tag_id, **kwargs):  # noqa: E501
         """Bulk Detach Tag from Nodes  # noqa: E501
@@ -170,65 +102,9 @@ class DefaultApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'tag_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_containers_container_id_graphs_tags_tag_id_nodes" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `delete_containers_container_id_graphs_tags_tag_id_nodes`")  # noqa: E501
-        # verify the required parameter 'tag_id' is set
-        if ('tag_id' not in params or
-                params['tag_id'] is None):
-            raise ValueError("Missing the required parameter `tag_id` when calling `delete_containers_container_id_graphs_tags_tag_id_nodes`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'tag_id' in params:
-            path_params['tag_id'] = params['tag_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/tags/{tag_id}/nodes', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'delete_containers_container_id_graphs_tags_tag_id_nodes',
+            (container_id, tag_id), kwargs)
 
     def list_ts_for_node(self, container_id, node_id, **kwargs):  # noqa: E501
         """List Timeseries Sources for Node  # noqa: E501
@@ -247,11 +123,7 @@ class DefaultApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.list_ts_for_node_with_http_info(container_id, node_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.list_ts_for_node_with_http_info(container_id, node_id, **kwargs)  # noqa: E501
-            return data
+        return self.list_ts_for_node_with_http_info(container_id, node_id, **kwargs)  # noqa: E501
 
     def list_ts_for_node_with_http_info(self, container_id, node_id, **kwargs):  # noqa: E501
         """List Timeseries Sources for Node  # noqa: E501
@@ -269,69 +141,9 @@ class DefaultApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'node_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_ts_for_node" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `list_ts_for_node`")  # noqa: E501
-        # verify the required parameter 'node_id' is set
-        if ('node_id' not in params or
-                params['node_id'] is None):
-            raise ValueError("Missing the required parameter `node_id` when calling `list_ts_for_node`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'node_id' in params:
-            path_params['node_id'] = params['node_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/nodes/{node_id}/timeseries', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='InlineResponse2005',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'list_ts_for_node',
+            (container_id, node_id), kwargs)
 
     def post_containers_container_id_data_source_templates(self, container_id, **kwargs):  # noqa: E501
         """Save Data Source Templates  # noqa: E501
@@ -350,11 +162,7 @@ class DefaultApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.post_containers_container_id_data_source_templates_with_http_info(container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.post_containers_container_id_data_source_templates_with_http_info(container_id, **kwargs)  # noqa: E501
-            return data
+        return self.post_containers_container_id_data_source_templates_with_http_info(container_id, **kwargs)  # noqa: E501
 
     def post_containers_container_id_data_source_templates_with_http_info(self, container_id, **kwargs):  # noqa: E501
         """Save Data Source Templates  # noqa: E501
@@ -372,69 +180,9 @@ class DefaultApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method post_containers_container_id_data_source_templates" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `post_containers_container_id_data_source_templates`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/data_source_templates', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='InlineResponse2001',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'post_containers_container_id_data_source_templates',
+            (container_id,), kwargs)
 
     def put_containers_container_id_graphs_tags_tag_id_edges(self, container_id, tag_id, **kwargs):  # noqa: E501
         """Bulk Add Tag to Edge  # noqa: E501
@@ -454,11 +202,7 @@ class DefaultApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.put_containers_container_id_graphs_tags_tag_id_edges_with_http_info(container_id, tag_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.put_containers_container_id_graphs_tags_tag_id_edges_with_http_info(container_id, tag_id, **kwargs)  # noqa: E501
-            return data
+        return self.put_containers_container_id_graphs_tags_tag_id_edges_with_http_info(container_id, tag_id, **kwargs)  # noqa: E501
 
     def put_containers_container_id_graphs_tags_tag_id_edges_with_http_info(self, container_id, tag_id, **kwargs):  # noqa: E501
         """Bulk Add Tag to Edge  # noqa: E501
@@ -477,71 +221,9 @@ class DefaultApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'tag_id', 'body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method put_containers_container_id_graphs_tags_tag_id_edges" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `put_containers_container_id_graphs_tags_tag_id_edges`")  # noqa: E501
-        # verify the required parameter 'tag_id' is set
-        if ('tag_id' not in params or
-                params['tag_id'] is None):
-            raise ValueError("Missing the required parameter `tag_id` when calling `put_containers_container_id_graphs_tags_tag_id_edges`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'tag_id' in params:
-            path_params['tag_id'] = params['tag_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/tags/{tag_id}/edges', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'put_containers_container_id_graphs_tags_tag_id_edges',
+            (container_id, tag_id), kwargs)
 
     def put_containers_container_id_graphs_tags_tag_id_nodes(self, container_id, tag_id, **kwargs):  # noqa: E501
         """Bulk Add Tag to Nodes  # noqa: E501
@@ -561,11 +243,7 @@ class DefaultApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.put_containers_container_id_graphs_tags_tag_id_nodes_with_http_info(container_id, tag_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.put_containers_container_id_graphs_tags_tag_id_nodes_with_http_info(container_id, tag_id, **kwargs)  # noqa: E501
-            return data
+        return self.put_containers_container_id_graphs_tags_tag_id_nodes_with_http_info(container_id, tag_id, **kwargs)  # noqa: E501
 
     def put_containers_container_id_graphs_tags_tag_id_nodes_with_http_info(self, container_id, tag_id, **kwargs):  # noqa: E501
         """Bulk Add Tag to Nodes  # noqa: E501
@@ -584,68 +262,6 @@ class DefaultApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'tag_id', 'body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method put_containers_container_id_graphs_tags_tag_id_nodes" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `put_containers_container_id_graphs_tags_tag_id_nodes`")  # noqa: E501
-        # verify the required parameter 'tag_id' is set
-        if ('tag_id' not in params or
-                params['tag_id'] is None):
-            raise ValueError("Missing the required parameter `tag_id` when calling `put_containers_container_id_graphs_tags_tag_id_nodes`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'tag_id' in params:
-            path_params['tag_id'] = params['tag_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/tags/{tag_id}/nodes', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'put_containers_container_id_graphs_tags_tag_id_nodes',
+            (container_id, tag_id), kwargs)
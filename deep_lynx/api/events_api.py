@@ -12,12 +12,8 @@
 
 from __future__ import absolute_import
 
-import re  # noqa: F401
-
-# python 2 and python 3 compatibility library
-import six
-
 from deep_lynx.api_client import ApiClient
+from deep_lynx import operations
 
 
 class EventsApi(object):
@@ -48,11 +44,7 @@ class EventsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.create_event_with_http_info(body, **kwargs)  # noqa: E501
-        else:
-            (data) = self.create_event_with_http_info(body, **kwargs)  # noqa: E501
-            return data
+        return self.create_event_with_http_info(body, **kwargs)  # noqa: E501
 
     def create_event_with_http_info(self, body, **kwargs):  # noqa: E501
         """Create Event  # noqa: E501
@@ -69,67 +61,9 @@ class EventsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method create_event" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `create_event`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/events', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='CreateEventResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'create_event',
+            (body,), kwargs)
 
     def create_event_action(self, body, **kwargs):  # noqa: E501
         """Create Event Action  # noqa: E501
@@ -147,11 +81,7 @@ class EventsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.create_event_action_with_http_info(body, **kwargs)  # noqa: E501
-        else:
-            (data) = self.create_event_action_with_http_info(body, **kwargs)  # noqa: E501
-            return data
+        return self.create_event_action_with_http_info(body, **kwargs)  # noqa: E501
 
     def create_event_action_with_http_info(self, body, **kwargs):  # noqa: E501
         """Create Event Action  # noqa: E501
@@ -168,67 +98,9 @@ class EventsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method create_event_action" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `create_event_action`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/event_actions', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='CreateEventActionResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'create_event_action',
+            (body,), kwargs)
 
     def delete_event_action(self, action_id, **kwargs):  # noqa: E501
         """Delete Event Action  # noqa: E501
@@ -246,11 +118,7 @@ class EventsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.delete_event_action_with_http_info(action_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.delete_event_action_with_http_info(action_id, **kwargs)  # noqa: E501
-            return data
+        return self.delete_event_action_with_http_info(action_id, **kwargs)  # noqa: E501
 
     def delete_event_action_with_http_info(self, action_id, **kwargs):  # noqa: E501
         """Delete Event Action  # noqa: E501
@@ -267,63 +135,9 @@ class EventsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['action_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_event_action" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'action_id' is set
-        if ('action_id' not in params or
-                params['action_id'] is None):
-            raise ValueError("Missing the required parameter `action_id` when calling `delete_event_action`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'action_id' in params:
-            path_params['action_id'] = params['action_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/event_actions/{action_id}', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='Generic200Response',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'delete_event_action',
+            (action_id,), kwargs)
 
     def list_event_action_statuses(self, **kwargs):  # noqa: E501
         """List Event Action Statuses  # noqa: E501
@@ -341,11 +155,7 @@ class EventsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.list_event_action_statuses_with_http_info(**kwargs)  # noqa: E501
-        else:
-            (data) = self.list_event_action_statuses_with_http_info(**kwargs)  # noqa: E501
-            return data
+        return self.list_event_action_statuses_with_http_info(**kwargs)  # noqa: E501
 
     def list_event_action_statuses_with_http_info(self, **kwargs):  # noqa: E501
         """List Event Action Statuses  # noqa: E501
@@ -362,59 +172,9 @@ class EventsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['event_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_event_action_statuses" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-        if 'event_id' in params:
-            query_params.append(('eventID', params['event_id']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/event_action_status', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='ListEventActionStatusResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'list_event_action_statuses',
+            (), kwargs)
 
     def list_event_actions(self, **kwargs):  # noqa: E501
         """List Event Actions  # noqa: E501
@@ -432,11 +192,7 @@ class EventsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.list_event_actions_with_http_info(**kwargs)  # noqa: E501
-        else:
-            (data) = self.list_event_actions_with_http_info(**kwargs)  # noqa: E501
-            return data
+        return self.list_event_actions_with_http_info(**kwargs)  # noqa: E501
 
     def list_event_actions_with_http_info(self, **kwargs):  # noqa: E501
         """List Event Actions  # noqa: E501
@@ -453,59 +209,9 @@ class EventsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['deleted']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_event_actions" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-        if 'deleted' in params:
-            query_params.append(('deleted', params['deleted']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/event_actions', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='ListEventActionResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'list_event_actions',
+            (), kwargs)
 
     def retrieve_event_action(self, action_id, **kwargs):  # noqa: E501
         """Retrieve Event Action  # noqa: E501
@@ -523,11 +229,7 @@ class EventsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.retrieve_event_action_with_http_info(action_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.retrieve_event_action_with_http_info(action_id, **kwargs)  # noqa: E501
-            return data
+        return self.retrieve_event_action_with_http_info(action_id, **kwargs)  # noqa: E501
 
     def retrieve_event_action_with_http_info(self, action_id, **kwargs):  # noqa: E501
         """Retrieve Event Action  # noqa: E501
@@ -544,63 +246,9 @@ class EventsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['action_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method retrieve_event_action" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'action_id' is set
-        if ('action_id' not in params or
-                params['action_id'] is None):
-            raise ValueError("Missing the required parameter `action_id` when calling `retrieve_event_action`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'action_id' in params:
-            path_params['action_id'] = params['action_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/event_actions/{action_id}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='GetEventActionResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'retrieve_event_action',
+            (action_id,), kwargs)
 
     def retrieve_event_action_status(self, status_id, **kwargs):  # noqa: E501
         """Retrieve Event Action Status  # noqa: E501
@@ -618,11 +266,7 @@ class EventsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.retrieve_event_action_status_with_http_info(status_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.retrieve_event_action_status_with_http_info(status_id, **kwargs)  # noqa: E501
-            return data
+        return self.retrieve_event_action_status_with_http_info(status_id, **kwargs)  # noqa: E501
 
     def retrieve_event_action_status_with_http_info(self, status_id, **kwargs):  # noqa: E501
         """Retrieve Event Action Status  # noqa: E501
@@ -639,63 +283,9 @@ class EventsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['status_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method retrieve_event_action_status" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'status_id' is set
-        if ('status_id' not in params or
-                params['status_id'] is None):
-            raise ValueError("Missing the required parameter `status_id` when calling `retrieve_event_action_status`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'status_id' in params:
-            path_params['status_id'] = params['status_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/event_action_status/{status_id}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='GetEventActionStatusResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'retrieve_event_action_status',
+            (status_id,), kwargs)
 
     def update_event_action(self, action_id, **kwargs):  # noqa: E501
         """Update Event Action  # noqa: E501
@@ -715,11 +305,7 @@ class EventsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.update_event_action_with_http_info(action_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.update_event_action_with_http_info(action_id, **kwargs)  # noqa: E501
-            return data
+        return self.update_event_action_with_http_info(action_id, **kwargs)  # noqa: E501
 
     def update_event_action_with_http_info(self, action_id, **kwargs):  # noqa: E501
         """Update Event Action  # noqa: E501
@@ -738,71 +324,9 @@ class EventsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['action_id', 'body', 'active']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method update_event_action" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'action_id' is set
-        if ('action_id' not in params or
-                params['action_id'] is None):
-            raise ValueError("Missing the required parameter `action_id` when calling `update_event_action`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'action_id' in params:
-            path_params['action_id'] = params['action_id']  # noqa: E501
-
-        query_params = []
-        if 'active' in params:
-            query_params.append(('active', params['active']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/event_actions/{action_id}', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='UpdateEventActionResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'update_event_action',
+            (action_id,), kwargs)
 
     def update_event_action_status(self, status_id, **kwargs):  # noqa: E501
         """Update Event Action Status  # noqa: E501
@@ -821,11 +345,7 @@ class EventsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.update_event_action_status_with_http_info(status_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.update_event_action_status_with_http_info(status_id, **kwargs)  # noqa: E501
-            return data
+        return self.update_event_action_status_with_http_info(status_id, **kwargs)  # noqa: E501
 
     def update_event_action_status_with_http_info(self, status_id, **kwargs):  # noqa: E501
         """Update Event Action Status  # noqa: E501
@@ -843,66 +363,6 @@ class EventsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['status_id', 'body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method update_event_action_status" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'status_id' is set
-        if ('status_id' not in params or
-                params['status_id'] is None):
-            raise ValueError("Missing the required parameter `status_id` when calling `update_event_action_status`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'status_id' in params:
-            path_params['status_id'] = params['status_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/event_action_status/{status_id}', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='UpdateEventActionStatusResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'update_event_action_status',
+            (status_id,), kwargs)
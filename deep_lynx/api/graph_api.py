@@ -12,15 +12,12 @@
 
 from __future__ import absolute_import
 
-import re  # noqa: F401
-
-# python 2 and python 3 compatibility library
-import six
-
 from deep_lynx.api_client import ApiClient
+from deep_lynx.api_helpers import GraphApiHelpers
+from deep_lynx import operations
 
 
-class GraphApi(object):
+class GraphApi(GraphApiHelpers):
     """NOTE: This class is auto generated by the swagger code generator program.
 
     Do not edit the class manually.
@@ -49,11 +46,7 @@ class GraphApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.archive_edge_with_http_info(container_id, edge_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.archive_edge_with_http_info(container_id, edge_id, **kwargs)  # noqa: E501
-            return data
+        return self.archive_edge_with_http_info(container_id, edge_id, **kwargs)  # noqa: E501
 
     def archive_edge_with_http_info(self, container_id, edge_id, **kwargs):  # noqa: E501
         """Archive Edge  # noqa: E501
@@ -71,69 +64,9 @@ class GraphApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'edge_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method archive_edge" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `archive_edge`")  # noqa: E501
-        # verify the required parameter 'edge_id' is set
-        if ('edge_id' not in params or
-                params['edge_id'] is None):
-            raise ValueError("Missing the required parameter `edge_id` when calling `archive_edge`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'edge_id' in params:
-            path_params['edge_id'] = params['edge_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/edges/{edge_id}', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='Generic200Response',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'archive_edge',
+            (container_id, edge_id), kwargs)
 
     def archive_node(self, container_id, node_id, **kwargs):  # noqa: E501
         """Archive Node  # noqa: E501
@@ -152,11 +85,7 @@ class GraphApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.archive_node_with_http_info(container_id, node_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.archive_node_with_http_info(container_id, node_id, **kwargs)  # noqa: E501
-            return data
+        return self.archive_node_with_http_info(container_id, node_id, **kwargs)  # noqa: E501
 
     def archive_node_with_http_info(self, container_id, node_id, **kwargs):  # noqa: E501
         """Archive Node  # noqa: E501
@@ -174,69 +103,9 @@ class GraphApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'node_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method archive_node" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `archive_node`")  # noqa: E501
-        # verify the required parameter 'node_id' is set
-        if ('node_id' not in params or
-                params['node_id'] is None):
-            raise ValueError("Missing the required parameter `node_id` when calling `archive_node`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'node_id' in params:
-            path_params['node_id'] = params['node_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/nodes/{node_id}', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='Generic200Response',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'archive_node',
+            (container_id, node_id), kwargs)
 
     def attach_edge_file(self, container_id, file_id, edge_id, **kwargs):  # noqa: E501
         """Attach Edge File  # noqa: E501
@@ -256,11 +125,7 @@ class GraphApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.attach_edge_file_with_http_info(container_id, file_id, edge_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.attach_edge_file_with_http_info(container_id, file_id, edge_id, **kwargs)  # noqa: E501
-            return data
+        return self.attach_edge_file_with_http_info(container_id, file_id, edge_id, **kwargs)  # noqa: E501
 
     def attach_edge_file_with_http_info(self, container_id, file_id, edge_id, **kwargs):  # noqa: E501
         """Attach Edge File  # noqa: E501
@@ -279,75 +144,9 @@ class GraphApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'file_id', 'edge_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method attach_edge_file" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `attach_edge_file`")  # noqa: E501
-        # verify the required parameter 'file_id' is set
-        if ('file_id' not in params or
-                params['file_id'] is None):
-            raise ValueError("Missing the required parameter `file_id` when calling `attach_edge_file`")  # noqa: E501
-        # verify the required parameter 'edge_id' is set
-        if ('edge_id' not in params or
-                params['edge_id'] is None):
-            raise ValueError("Missing the required parameter `edge_id` when calling `attach_edge_file`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'file_id' in params:
-            path_params['file_id'] = params['file_id']  # noqa: E501
-        if 'edge_id' in params:
-            path_params['edge_id'] = params['edge_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/edges/{edge_id}/files/{file_id}', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='Generic200Response',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'attach_edge_file',
+            (container_id, file_id, edge_id), kwargs)
 
     def attach_node_file(self, container_id, node_id, file_id, **kwargs):  # noqa: E501
         """Attach Node File  # noqa: E501
@@ -367,11 +166,7 @@ class GraphApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.attach_node_file_with_http_info(container_id, node_id, file_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.attach_node_file_with_http_info(container_id, node_id, file_id, **kwargs)  # noqa: E501
-            return data
+        return self.attach_node_file_with_http_info(container_id, node_id, file_id, **kwargs)  # noqa: E501
 
     def attach_node_file_with_http_info(self, container_id, node_id, file_id, **kwargs):  # noqa: E501
         """Attach Node File  # noqa: E501
@@ -390,75 +185,9 @@ class GraphApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'node_id', 'file_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method attach_node_file" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `attach_node_file`")  # noqa: E501
-        # verify the required parameter 'node_id' is set
-        if ('node_id' not in params or
-                params['node_id'] is None):
-            raise ValueError("Missing the required parameter `node_id` when calling `attach_node_file`")  # noqa: E501
-        # verify the required parameter 'file_id' is set
-        if ('file_id' not in params or
-                params['file_id'] is None):
-            raise ValueError("Missing the required parameter `file_id` when calling `attach_node_file`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'node_id' in params:
-            path_params['node_id'] = params['node_id']  # noqa: E501
-        if 'file_id' in params:
-            path_params['file_id'] = params['file_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/nodes/{node_id}/files/{file_id}', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='Generic200Response',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'attach_node_file',
+            (container_id, node_id, file_id), kwargs)
 
     def create_or_update_edges(self, body, container_id, **kwargs):  # noqa: E501
         """Create or Update Edges  # noqa: E501
@@ -477,11 +206,7 @@ class GraphApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.create_or_update_edges_with_http_info(body, container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.create_or_update_edges_with_http_info(body, container_id, **kwargs)  # noqa: E501
-            return data
+        return self.create_or_update_edges_with_http_info(body, container_id, **kwargs)  # noqa: E501
 
     def create_or_update_edges_with_http_info(self, body, container_id, **kwargs):  # noqa: E501
         """Create or Update Edges  # noqa: E501
@@ -499,73 +224,9 @@ class GraphApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body', 'container_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method create_or_update_edges" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `create_or_update_edges`")  # noqa: E501
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `create_or_update_edges`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/edges', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='InlineResponse2006',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'create_or_update_edges',
+            (body, container_id), kwargs)
 
     def create_or_update_nodes(self, body, container_id, **kwargs):  # noqa: E501
         """Create Or Update Nodes  # noqa: E501
@@ -584,11 +245,7 @@ class GraphApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.create_or_update_nodes_with_http_info(body, container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.create_or_update_nodes_with_http_info(body, container_id, **kwargs)  # noqa: E501
-            return data
+        return self.create_or_update_nodes_with_http_info(body, container_id, **kwargs)  # noqa: E501
 
     def create_or_update_nodes_with_http_info(self, body, container_id, **kwargs):  # noqa: E501
         """Create Or Update Nodes  # noqa: E501
@@ -606,73 +263,9 @@ class GraphApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body', 'container_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method create_or_update_nodes" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `create_or_update_nodes`")  # noqa: E501
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `create_or_update_nodes`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/nodes', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='InlineResponse2003',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'create_or_update_nodes',
+            (body, container_id), kwargs)
 
     def delete_node_file(self, container_id, node_id, file_id, **kwargs):  # noqa: E501
         """Detach Node File  # noqa: E501
@@ -692,11 +285,7 @@ class GraphApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.delete_node_file_with_http_info(container_id, node_id, file_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.delete_node_file_with_http_info(container_id, node_id, file_id, **kwargs)  # noqa: E501
-            return data
+        return self.delete_node_file_with_http_info(container_id, node_id, file_id, **kwargs)  # noqa: E501
 
     def delete_node_file_with_http_info(self, container_id, node_id, file_id, **kwargs):  # noqa: E501
         """Detach Node File  # noqa: E501
@@ -715,75 +304,9 @@ class GraphApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'node_id', 'file_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_node_file" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `delete_node_file`")  # noqa: E501
-        # verify the required parameter 'node_id' is set
-        if ('node_id' not in params or
-                params['node_id'] is None):
-            raise ValueError("Missing the required parameter `node_id` when calling `delete_node_file`")  # noqa: E501
-        # verify the required parameter 'file_id' is set
-        if ('file_id' not in params or
-                params['file_id'] is None):
-            raise ValueError("Missing the required parameter `file_id` when calling `delete_node_file`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'node_id' in params:
-            path_params['node_id'] = params['node_id']  # noqa: E501
-        if 'file_id' in params:
-            path_params['file_id'] = params['file_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/nodes/{node_id}/files/{file_id}', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='Generic200Response',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'delete_node_file',
+            (container_id, node_id, file_id), kwargs)
 
     def detach_node_file(self, container_id, file_id, edge_id, **kwargs):  # noqa: E501
         """Detach Node File  # noqa: E501
@@ -803,11 +326,7 @@ class GraphApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.detach_node_file_with_http_info(container_id, file_id, edge_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.detach_node_file_with_http_info(container_id, file_id, edge_id, **kwargs)  # noqa: E501
-            return data
+        return self.detach_node_file_with_http_info(container_id, file_id, edge_id, **kwargs)  # noqa: E501
 
     def detach_node_file_with_http_info(self, container_id, file_id, edge_id, **kwargs):  # noqa: E501
         """Detach Node File  # noqa: E501
@@ -826,75 +345,9 @@ class GraphApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'file_id', 'edge_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method detach_node_file" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `detach_node_file`")  # noqa: E501
-        # verify the required parameter 'file_id' is set
-        if ('file_id' not in params or
-                params['file_id'] is None):
-            raise ValueError("Missing the required parameter `file_id` when calling `detach_node_file`")  # noqa: E501
-        # verify the required parameter 'edge_id' is set
-        if ('edge_id' not in params or
-                params['edge_id'] is None):
-            raise ValueError("Missing the required parameter `edge_id` when calling `detach_node_file`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'file_id' in params:
-            path_params['file_id'] = params['file_id']  # noqa: E501
-        if 'edge_id' in params:
-            path_params['edge_id'] = params['edge_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/edges/{edge_id}/files/{file_id}', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='Generic200Response',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'detach_node_file',
+            (container_id, file_id, edge_id), kwargs)
 
     def list_edge_files(self, container_id, edge_id, **kwargs):  # noqa: E501
         """List Edge Files  # noqa: E501
@@ -913,11 +366,7 @@ class GraphApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.list_edge_files_with_http_info(container_id, edge_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.list_edge_files_with_http_info(container_id, edge_id, **kwargs)  # noqa: E501
-            return data
+        return self.list_edge_files_with_http_info(container_id, edge_id, **kwargs)  # noqa: E501
 
     def list_edge_files_with_http_info(self, container_id, edge_id, **kwargs):  # noqa: E501
         """List Edge Files  # noqa: E501
@@ -935,69 +384,9 @@ class GraphApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'edge_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_edge_files" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `list_edge_files`")  # noqa: E501
-        # verify the required parameter 'edge_id' is set
-        if ('edge_id' not in params or
-                params['edge_id'] is None):
-            raise ValueError("Missing the required parameter `edge_id` when calling `list_edge_files`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'edge_id' in params:
-            path_params['edge_id'] = params['edge_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/edges/{edge_id}/files', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='ListEdgeFiles',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'list_edge_files',
+            (container_id, edge_id), kwargs)
 
     def list_edges(self, container_id, **kwargs):  # noqa: E501
         """List Edges  # noqa: E501
@@ -1022,11 +411,7 @@ class GraphApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.list_edges_with_http_info(container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.list_edges_with_http_info(container_id, **kwargs)  # noqa: E501
-            return data
+        return self.list_edges_with_http_info(container_id, **kwargs)  # noqa: E501
 
     def list_edges_with_http_info(self, container_id, **kwargs):  # noqa: E501
         """List Edges  # noqa: E501
@@ -1050,77 +435,9 @@ class GraphApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'limit', 'offset', 'origin_id', 'destination_id', 'relationship_pair_id', 'relationship_pair_name', 'history']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_edges" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `list_edges`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-        if 'limit' in params:
-            query_params.append(('limit', params['limit']))  # noqa: E501
-        if 'offset' in params:
-            query_params.append(('offset', params['offset']))  # noqa: E501
-        if 'origin_id' in params:
-            query_params.append(('originID', params['origin_id']))  # noqa: E501
-        if 'destination_id' in params:
-            query_params.append(('destinationID', params['destination_id']))  # noqa: E501
-        if 'relationship_pair_id' in params:
-            query_params.append(('relationshipPairID', params['relationship_pair_id']))  # noqa: E501
-        if 'relationship_pair_name' in params:
-            query_params.append(('relationshipPairName', params['relationship_pair_name']))  # noqa: E501
-        if 'history' in params:
-            query_params.append(('history', params['history']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/edges', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='ListEdgesResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'list_edges',
+            (container_id,), kwargs)
 
     def list_edges_for_node_ids(self, container_id, **kwargs):  # noqa: E501
         """List Edges for Node IDs  # noqa: E501
@@ -1139,11 +456,7 @@ class GraphApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.list_edges_for_node_ids_with_http_info(container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.list_edges_for_node_ids_with_http_info(container_id, **kwargs)  # noqa: E501
-            return data
+        return self.list_edges_for_node_ids_with_http_info(container_id, **kwargs)  # noqa: E501
 
     def list_edges_for_node_ids_with_http_info(self, container_id, **kwargs):  # noqa: E501
         """List Edges for Node IDs  # noqa: E501
@@ -1161,69 +474,9 @@ class GraphApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_edges_for_node_ids" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `list_edges_for_node_ids`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/nodes/edges', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='ListEdgesForNodeIDsResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'list_edges_for_node_ids',
+            (container_id,), kwargs)
 
     def list_node_files(self, container_id, node_id, **kwargs):  # noqa: E501
         """List Node Files  # noqa: E501
@@ -1242,11 +495,7 @@ class GraphApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.list_node_files_with_http_info(container_id, node_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.list_node_files_with_http_info(container_id, node_id, **kwargs)  # noqa: E501
-            return data
+        return self.list_node_files_with_http_info(container_id, node_id, **kwargs)  # noqa: E501
 
     def list_node_files_with_http_info(self, container_id, node_id, **kwargs):  # noqa: E501
         """List Node Files  # noqa: E501
@@ -1264,69 +513,9 @@ class GraphApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'node_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_node_files" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `list_node_files`")  # noqa: E501
-        # verify the required parameter 'node_id' is set
-        if ('node_id' not in params or
-                params['node_id'] is None):
-            raise ValueError("Missing the required parameter `node_id` when calling `list_node_files`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'node_id' in params:
-            path_params['node_id'] = params['node_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/nodes/{node_id}/files', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='ListNodeFiles',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'list_node_files',
+            (container_id, node_id), kwargs)
 
     def list_nodes(self, container_id, **kwargs):  # noqa: E501
         """List Nodes  # noqa: E501
@@ -1350,11 +539,7 @@ class GraphApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.list_nodes_with_http_info(container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.list_nodes_with_http_info(container_id, **kwargs)  # noqa: E501
-            return data
+        return self.list_nodes_with_http_info(container_id, **kwargs)  # noqa: E501
 
     def list_nodes_with_http_info(self, container_id, **kwargs):  # noqa: E501
         """List Nodes  # noqa: E501
@@ -1377,75 +562,9 @@ class GraphApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'limit', 'offset', 'transformation_id', 'metatype_id', 'data_source_id', 'history']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_nodes" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `list_nodes`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-        if 'limit' in params:
-            query_params.append(('limit', params['limit']))  # noqa: E501
-        if 'offset' in params:
-            query_params.append(('offset', params['offset']))  # noqa: E501
-        if 'transformation_id' in params:
-            query_params.append(('transformationID', params['transformation_id']))  # noqa: E501
-        if 'metatype_id' in params:
-            query_params.append(('metatypeID', params['metatype_id']))  # noqa: E501
-        if 'data_source_id' in params:
-            query_params.append(('dataSourceID', params['data_source_id']))  # noqa: E501
-        if 'history' in params:
-            query_params.append(('history', params['history']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/nodes', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='ListNodesResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'list_nodes',
+            (container_id,), kwargs)
 
     def list_nodes_by_metatype_id(self, container_id, metatype_id, **kwargs):  # noqa: E501
         """List Nodes By Metatype ID  # noqa: E501
@@ -1466,11 +585,7 @@ class GraphApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.list_nodes_by_metatype_id_with_http_info(container_id, metatype_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.list_nodes_by_metatype_id_with_http_info(container_id, metatype_id, **kwargs)  # noqa: E501
-            return data
+        return self.list_nodes_by_metatype_id_with_http_info(container_id, metatype_id, **kwargs)  # noqa: E501
 
     def list_nodes_by_metatype_id_with_http_info(self, container_id, metatype_id, **kwargs):  # noqa: E501
         """List Nodes By Metatype ID  # noqa: E501
@@ -1490,73 +605,9 @@ class GraphApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'metatype_id', 'limit', 'offset']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_nodes_by_metatype_id" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `list_nodes_by_metatype_id`")  # noqa: E501
-        # verify the required parameter 'metatype_id' is set
-        if ('metatype_id' not in params or
-                params['metatype_id'] is None):
-            raise ValueError("Missing the required parameter `metatype_id` when calling `list_nodes_by_metatype_id`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'metatype_id' in params:
-            path_params['metatype_id'] = params['metatype_id']  # noqa: E501
-
-        query_params = []
-        if 'limit' in params:
-            query_params.append(('limit', params['limit']))  # noqa: E501
-        if 'offset' in params:
-            query_params.append(('offset', params['offset']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/nodes/metatype/{metatype_id}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='ListNodesByMetatypeResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'list_nodes_by_metatype_id',
+            (container_id, metatype_id), kwargs)
 
     def retrieve_edge(self, container_id, edge_id, **kwargs):  # noqa: E501
         """Retrieve Edge  # noqa: E501
@@ -1576,11 +627,7 @@ class GraphApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.retrieve_edge_with_http_info(container_id, edge_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.retrieve_edge_with_http_info(container_id, edge_id, **kwargs)  # noqa: E501
-            return data
+        return self.retrieve_edge_with_http_info(container_id, edge_id, **kwargs)  # noqa: E501
 
     def retrieve_edge_with_http_info(self, container_id, edge_id, **kwargs):  # noqa: E501
         """Retrieve Edge  # noqa: E501
@@ -1599,71 +646,9 @@ class GraphApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'edge_id', 'history']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method retrieve_edge" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `retrieve_edge`")  # noqa: E501
-        # verify the required parameter 'edge_id' is set
-        if ('edge_id' not in params or
-                params['edge_id'] is None):
-            raise ValueError("Missing the required parameter `edge_id` when calling `retrieve_edge`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'edge_id' in params:
-            path_params['edge_id'] = params['edge_id']  # noqa: E501
-
-        query_params = []
-        if 'history' in params:
-            query_params.append(('history', params['history']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/edges/{edge_id}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='GetEdgeResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'retrieve_edge',
+            (container_id, edge_id), kwargs)
 
     def retrieve_node(self, container_id, node_id, **kwargs):  # noqa: E501
         """Retrieve Node  # noqa: E501
@@ -1683,11 +668,7 @@ class GraphApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.retrieve_node_with_http_info(container_id, node_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.retrieve_node_with_http_info(container_id, node_id, **kwargs)  # noqa: E501
-            return data
+        return self.retrieve_node_with_http_info(container_id, node_id, **kwargs)  # noqa: E501
 
     def retrieve_node_with_http_info(self, container_id, node_id, **kwargs):  # noqa: E501
         """Retrieve Node  # noqa: E501
@@ -1706,71 +687,9 @@ class GraphApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'node_id', 'history']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method retrieve_node" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `retrieve_node`")  # noqa: E501
-        # verify the required parameter 'node_id' is set
-        if ('node_id' not in params or
-                params['node_id'] is None):
-            raise ValueError("Missing the required parameter `node_id` when calling `retrieve_node`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'node_id' in params:
-            path_params['node_id'] = params['node_id']  # noqa: E501
-
-        query_params = []
-        if 'history' in params:
-            query_params.append(('history', params['history']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/nodes/{node_id}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='GetNodeResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'retrieve_node',
+            (container_id, node_id), kwargs)
 
     def retrieve_nth_nodes(self, container_id, node_id, **kwargs):  # noqa: E501
         """Nth Node Query  # noqa: E501
@@ -1790,11 +709,7 @@ class GraphApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.retrieve_nth_nodes_with_http_info(container_id, node_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.retrieve_nth_nodes_with_http_info(container_id, node_id, **kwargs)  # noqa: E501
-            return data
+        return self.retrieve_nth_nodes_with_http_info(container_id, node_id, **kwargs)  # noqa: E501
 
     def retrieve_nth_nodes_with_http_info(self, container_id, node_id, **kwargs):  # noqa: E501
         """Nth Node Query  # noqa: E501
@@ -1813,71 +728,9 @@ class GraphApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'node_id', 'depth']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method retrieve_nth_nodes" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `retrieve_nth_nodes`")  # noqa: E501
-        # verify the required parameter 'node_id' is set
-        if ('node_id' not in params or
-                params['node_id'] is None):
-            raise ValueError("Missing the required parameter `node_id` when calling `retrieve_nth_nodes`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'node_id' in params:
-            path_params['node_id'] = params['node_id']  # noqa: E501
-
-        query_params = []
-        if 'depth' in params:
-            query_params.append(('depth', params['depth']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/nodes/{node_id}/graph', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='InlineResponse2004',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'retrieve_nth_nodes',
+            (container_id, node_id), kwargs)
 
     def timeseries_data_source_query(self, body, container_id, data_source_id, **kwargs):  # noqa: E501
         """Timeseries Data Source Query  # noqa: E501
@@ -1897,11 +750,7 @@ class GraphApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.timeseries_data_source_query_with_http_info(body, container_id, data_source_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.timeseries_data_source_query_with_http_info(body, container_id, data_source_id, **kwargs)  # noqa: E501
-            return data
+        return self.timeseries_data_source_query_with_http_info(body, container_id, data_source_id, **kwargs)  # noqa: E501
 
     def timeseries_data_source_query_with_http_info(self, body, container_id, data_source_id, **kwargs):  # noqa: E501
         """Timeseries Data Source Query  # noqa: E501
@@ -1920,424 +769,9 @@ class GraphApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body', 'container_id', 'data_source_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method timeseries_data_source_query" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `timeseries_data_source_query`")  # noqa: E501
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `timeseries_data_source_query`")  # noqa: E501
-        # verify the required parameter 'data_source_id' is set
-        if ('data_source_id' not in params or
-                params['data_source_id'] is None):
-            raise ValueError("Missing the required parameter `data_source_id` when calling `timeseries_data_source_query`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'data_source_id' in params:
-            path_params['data_source_id'] = params['data_source_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json', 'text/plain', 'application/xml'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/import/datasources/{data_source_id}/data', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='InlineResponse2002',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
-
-    def timeseries_data_source_query(self, body, container_id, data_source_id, **kwargs):  # noqa: E501
-        """Timeseries Data Source Query  # noqa: E501
-
-        This is an endpoint that accepts a GraphQL query and returns the results of that query. Primarily used for working with time series data without requiring attachment to a node.  # noqa: E501
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.timeseries_data_source_query(body, container_id, data_source_id, async_req=True)
-        >>> result = thread.get()
-
-        :param async_req bool
-        :param object body: (required)
-        :param str container_id: (required)
-        :param str data_source_id: (required)
-        :return: InlineResponse2002
-                 If the method is called asynchronously,
-                 returns the request thread.
-        """
-        kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.timeseries_data_source_query_with_http_info(body, container_id, data_source_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.timeseries_data_source_query_with_http_info(body, container_id, data_source_id, **kwargs)  # noqa: E501
-            return data
-
-    def timeseries_data_source_query_with_http_info(self, body, container_id, data_source_id, **kwargs):  # noqa: E501
-        """Timeseries Data Source Query  # noqa: E501
-
-        This is an endpoint that accepts a GraphQL query and returns the results of that query. Primarily used for working with time series data without requiring attachment to a node.  # noqa: E501
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.timeseries_data_source_query_with_http_info(body, container_id, data_source_id, async_req=True)
-        >>> result = thread.get()
-
-        :param async_req bool
-        :param object body: (required)
-        :param str container_id: (required)
-        :param str data_source_id: (required)
-        :return: InlineResponse2002
-                 If the method is called asynchronously,
-                 returns the request thread.
-        """
-
-        all_params = ['body', 'container_id', 'data_source_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method timeseries_data_source_query" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `timeseries_data_source_query`")  # noqa: E501
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `timeseries_data_source_query`")  # noqa: E501
-        # verify the required parameter 'data_source_id' is set
-        if ('data_source_id' not in params or
-                params['data_source_id'] is None):
-            raise ValueError("Missing the required parameter `data_source_id` when calling `timeseries_data_source_query`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'data_source_id' in params:
-            path_params['data_source_id'] = params['data_source_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json', 'text/plain', 'application/xml'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/import/datasources/{data_source_id}/data', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='InlineResponse2002',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
-
-    def timeseries_data_source_query(self, body, container_id, data_source_id, **kwargs):  # noqa: E501
-        """Timeseries Data Source Query  # noqa: E501
-
-        This is an endpoint that accepts a GraphQL query and returns the results of that query. Primarily used for working with time series data without requiring attachment to a node.  # noqa: E501
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.timeseries_data_source_query(body, container_id, data_source_id, async_req=True)
-        >>> result = thread.get()
-
-        :param async_req bool
-        :param object body: (required)
-        :param str container_id: (required)
-        :param str data_source_id: (required)
-        :return: InlineResponse2002
-                 If the method is called asynchronously,
-                 returns the request thread.
-        """
-        kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.timeseries_data_source_query_with_http_info(body, container_id, data_source_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.timeseries_data_source_query_with_http_info(body, container_id, data_source_id, **kwargs)  # noqa: E501
-            return data
-
-    def timeseries_data_source_query_with_http_info(self, body, container_id, data_source_id, **kwargs):  # noqa: E501
-        """Timeseries Data Source Query  # noqa: E501
-
-        This is an endpoint that accepts a GraphQL query and returns the results of that query. Primarily used for working with time series data without requiring attachment to a node.  # noqa: E501
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.timeseries_data_source_query_with_http_info(body, container_id, data_source_id, async_req=True)
-        >>> result = thread.get()
-
-        :param async_req bool
-        :param object body: (required)
-        :param str container_id: (required)
-        :param str data_source_id: (required)
-        :return: InlineResponse2002
-                 If the method is called asynchronously,
-                 returns the request thread.
-        """
-
-        all_params = ['body', 'container_id', 'data_source_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method timeseries_data_source_query" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `timeseries_data_source_query`")  # noqa: E501
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `timeseries_data_source_query`")  # noqa: E501
-        # verify the required parameter 'data_source_id' is set
-        if ('data_source_id' not in params or
-                params['data_source_id'] is None):
-            raise ValueError("Missing the required parameter `data_source_id` when calling `timeseries_data_source_query`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'data_source_id' in params:
-            path_params['data_source_id'] = params['data_source_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json', 'text/plain', 'application/xml'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/import/datasources/{data_source_id}/data', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='InlineResponse2002',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
-
-    def timeseries_node_query(self, body, container_id, node_id, **kwargs):  # noqa: E501
-        """Timeseries Node Query  # noqa: E501
-
-        This is an endpoint that accepts a GraphQL query and returns the results of that query. Primarily used for working with time series data that is attached to a specific node.  # noqa: E501
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.timeseries_node_query(body, container_id, node_id, async_req=True)
-        >>> result = thread.get()
-
-        :param async_req bool
-        :param object body: (required)
-        :param str container_id: (required)
-        :param str node_id: (required)
-        :return: InlineResponse2002
-                 If the method is called asynchronously,
-                 returns the request thread.
-        """
-        kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.timeseries_node_query_with_http_info(body, container_id, node_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.timeseries_node_query_with_http_info(body, container_id, node_id, **kwargs)  # noqa: E501
-            return data
-
-    def timeseries_node_query_with_http_info(self, body, container_id, node_id, **kwargs):  # noqa: E501
-        """Timeseries Node Query  # noqa: E501
-
-        This is an endpoint that accepts a GraphQL query and returns the results of that query. Primarily used for working with time series data that is attached to a specific node.  # noqa: E501
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.timeseries_node_query_with_http_info(body, container_id, node_id, async_req=True)
-        >>> result = thread.get()
-
-        :param async_req bool
-        :param object body: (required)
-        :param str container_id: (required)
-        :param str node_id: (required)
-        :return: InlineResponse2002
-                 If the method is called asynchronously,
-                 returns the request thread.
-        """
-
-        all_params = ['body', 'container_id', 'node_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method timeseries_node_query" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `timeseries_node_query`")  # noqa: E501
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `timeseries_node_query`")  # noqa: E501
-        # verify the required parameter 'node_id' is set
-        if ('node_id' not in params or
-                params['node_id'] is None):
-            raise ValueError("Missing the required parameter `node_id` when calling `timeseries_node_query`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'node_id' in params:
-            path_params['node_id'] = params['node_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json', 'text/plain', 'application/xml'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/nodes/{node_id}/timeseries', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='InlineResponse2002',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'timeseries_data_source_query',
+            (body, container_id, data_source_id), kwargs)
 
     def timeseries_node_query(self, body, container_id, node_id, **kwargs):  # noqa: E501
         """Timeseries Node Query  # noqa: E501
@@ -2357,11 +791,7 @@ class GraphApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.timeseries_node_query_with_http_info(body, container_id, node_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.timeseries_node_query_with_http_info(body, container_id, node_id, **kwargs)  # noqa: E501
-            return data
+        return self.timeseries_node_query_with_http_info(body, container_id, node_id, **kwargs)  # noqa: E501
 
     def timeseries_node_query_with_http_info(self, body, container_id, node_id, **kwargs):  # noqa: E501
         """Timeseries Node Query  # noqa: E501
@@ -2380,191 +810,6 @@ class GraphApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body', 'container_id', 'node_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method timeseries_node_query" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `timeseries_node_query`")  # noqa: E501
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `timeseries_node_query`")  # noqa: E501
-        # verify the required parameter 'node_id' is set
-        if ('node_id' not in params or
-                params['node_id'] is None):
-            raise ValueError("Missing the required parameter `node_id` when calling `timeseries_node_query`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'node_id' in params:
-            path_params['node_id'] = params['node_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json', 'text/plain', 'application/xml'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/nodes/{node_id}/timeseries', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='InlineResponse2002',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
-
-    def timeseries_node_query(self, body, container_id, node_id, **kwargs):  # noqa: E501
-        """Timeseries Node Query  # noqa: E501
-
-        This is an endpoint that accepts a GraphQL query and returns the results of that query. Primarily used for working with time series data that is attached to a specific node.  # noqa: E501
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.timeseries_node_query(body, container_id, node_id, async_req=True)
-        >>> result = thread.get()
-
-        :param async_req bool
-        :param object body: (required)
-        :param str container_id: (required)
-        :param str node_id: (required)
-        :return: InlineResponse2002
-                 If the method is called asynchronously,
-                 returns the request thread.
-        """
-        kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.timeseries_node_query_with_http_info(body, container_id, node_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.timeseries_node_query_with_http_info(body, container_id, node_id, **kwargs)  # noqa: E501
-            return data
-
-    def timeseries_node_query_with_http_info(self, body, container_id, node_id, **kwargs):  # noqa: E501
-        """Timeseries Node Query  # noqa: E501
-
-        This is an endpoint that accepts a GraphQL query and returns the results of that query. Primarily used for working with time series data that is attached to a specific node.  # noqa: E501
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.timeseries_node_query_with_http_info(body, container_id, node_id, async_req=True)
-        >>> result = thread.get()
-
-        :param async_req bool
-        :param object body: (required)
-        :param str container_id: (required)
-        :param str node_id: (required)
-        :return: InlineResponse2002
-                 If the method is called asynchronously,
-                 returns the request thread.
-        """
-
-        all_params = ['body', 'container_id', 'node_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method timeseries_node_query" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `timeseries_node_query`")  # noqa: E501
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `timeseries_node_query`")  # noqa: E501
-        # verify the required parameter 'node_id' is set
-        if ('node_id' not in params or
-                params['node_id'] is None):
-            raise ValueError("Missing the required parameter `node_id` when calling `timeseries_node_query`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'node_id' in params:
-            path_params['node_id'] = params['node_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json', 'text/plain', 'application/xml'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/nodes/{node_id}/timeseries', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='InlineResponse2002',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'timeseries_node_query',
+            (body, container_id, node_id), kwargs)
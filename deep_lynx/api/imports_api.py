@@ -12,12 +12,8 @@
 
 from __future__ import absolute_import
 
-import re  # noqa: F401
-
-# python 2 and python 3 compatibility library
-import six
-
 from deep_lynx.api_client import ApiClient
+from deep_lynx import operations
 
 
 class ImportsApi(object):
@@ -32,127 +28,6 @@ class ImportsApi(object):
             api_client = ApiClient()
         self.api_client = api_client
 
-    def add_data_to_import(self, container_id, import_id, data_source_id, **kwargs):  # noqa: E501
-        """Add Data to Import  # noqa: E501
-
-        Adds data to an existing import. Accepts an array of JSON objects or a file in JSON or CSV format.  # noqa: E501
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.add_data_to_import(container_id, import_id, data_source_id, async_req=True)
-        >>> result = thread.get()
-
-        :param async_req bool
-        :param str container_id: (required)
-        :param str import_id: (required)
-        :param str data_source_id: (required)
-        :param list[object] body:
-        :return: AddDataToImportResponse
-                 If the method is called asynchronously,
-                 returns the request thread.
-        """
-        kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.add_data_to_import_with_http_info(container_id, import_id, data_source_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.add_data_to_import_with_http_info(container_id, import_id, data_source_id, **kwargs)  # noqa: E501
-            return data
-
-    def add_data_to_import_with_http_info(self, container_id, import_id, data_source_id, **kwargs):  # noqa: E501
-        """Add Data to Import  # noqa: E501
-
-        Adds data to an existing import. Accepts an array of JSON objects or a file in JSON or CSV format.  # noqa: E501
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.add_data_to_import_with_http_info(container_id, import_id, data_source_id, async_req=True)
-        >>> result = thread.get()
-
-        :param async_req bool
-        :param str container_id: (required)
-        :param str import_id: (required)
-        :param str data_source_id: (required)
-        :param list[object] body:
-        :return: AddDataToImportResponse
-                 If the method is called asynchronously,
-                 returns the request thread.
-        """
-
-        all_params = ['container_id', 'import_id', 'data_source_id', 'body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method add_data_to_import" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `add_data_to_import`")  # noqa: E501
-        # verify the required parameter 'import_id' is set
-        if ('import_id' not in params or
-                params['import_id'] is None):
-            raise ValueError("Missing the required parameter `import_id` when calling `add_data_to_import`")  # noqa: E501
-        # verify the required parameter 'data_source_id' is set
-        if ('data_source_id' not in params or
-                params['data_source_id'] is None):
-            raise ValueError("Missing the required parameter `data_source_id` when calling `add_data_to_import`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'import_id' in params:
-            path_params['import_id'] = params['import_id']  # noqa: E501
-        if 'data_source_id' in params:
-            path_params['data_source_id'] = params['data_source_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-        if 'file' in params:
-            local_var_files['file'] = params['file']  # noqa: E501
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json', 'multipart/form-data'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/datasources/{data_source_id}/imports/{import_id}/data', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='AddDataToImportResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
-
     def add_data_to_import(self, container_id, import_id, data_source_id, **kwargs):  # noqa: E501
         """Add Data to Import  # noqa: E501
 
@@ -172,11 +47,7 @@ class ImportsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.add_data_to_import_with_http_info(container_id, import_id, data_source_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.add_data_to_import_with_http_info(container_id, import_id, data_source_id, **kwargs)  # noqa: E501
-            return data
+        return self.add_data_to_import_with_http_info(container_id, import_id, data_source_id, **kwargs)  # noqa: E501
 
     def add_data_to_import_with_http_info(self, container_id, import_id, data_source_id, **kwargs):  # noqa: E501
         """Add Data to Import  # noqa: E501
@@ -196,83 +67,9 @@ class ImportsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'import_id', 'data_source_id', 'file']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method add_data_to_import" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `add_data_to_import`")  # noqa: E501
-        # verify the required parameter 'import_id' is set
-        if ('import_id' not in params or
-                params['import_id'] is None):
-            raise ValueError("Missing the required parameter `import_id` when calling `add_data_to_import`")  # noqa: E501
-        # verify the required parameter 'data_source_id' is set
-        if ('data_source_id' not in params or
-                params['data_source_id'] is None):
-            raise ValueError("Missing the required parameter `data_source_id` when calling `add_data_to_import`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'import_id' in params:
-            path_params['import_id'] = params['import_id']  # noqa: E501
-        if 'data_source_id' in params:
-            path_params['data_source_id'] = params['data_source_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-        if 'file' in params:
-            local_var_files['file'] = params['file']  # noqa: E501
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json', 'multipart/form-data'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/datasources/{data_source_id}/imports/{import_id}/data', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='AddDataToImportResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'add_data_to_import',
+            (container_id, import_id, data_source_id), kwargs)
 
     def create_import(self, container_id, data_source_id, **kwargs):  # noqa: E501
         """Create Import  # noqa: E501
@@ -292,11 +89,7 @@ class ImportsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.create_import_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.create_import_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
-            return data
+        return self.create_import_with_http_info(container_id, data_source_id, **kwargs)  # noqa: E501
 
     def create_import_with_http_info(self, container_id, data_source_id, **kwargs):  # noqa: E501
         """Create Import  # noqa: E501
@@ -315,75 +108,9 @@ class ImportsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'data_source_id', 'body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method create_import" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `create_import`")  # noqa: E501
-        # verify the required parameter 'data_source_id' is set
-        if ('data_source_id' not in params or
-                params['data_source_id'] is None):
-            raise ValueError("Missing the required parameter `data_source_id` when calling `create_import`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'data_source_id' in params:
-            path_params['data_source_id'] = params['data_source_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/datasources/{data_source_id}/imports', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='CreateImportResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'create_import',
+            (container_id, data_source_id), kwargs)
 
     def delete_file(self, **kwargs):  # noqa: E501
         """Delete File  # noqa: E501
@@ -400,11 +127,7 @@ class ImportsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.delete_file_with_http_info(**kwargs)  # noqa: E501
-        else:
-            (data) = self.delete_file_with_http_info(**kwargs)  # noqa: E501
-            return data
+        return self.delete_file_with_http_info(**kwargs)  # noqa: E501
 
     def delete_file_with_http_info(self, **kwargs):  # noqa: E501
         """Delete File  # noqa: E501
@@ -420,53 +143,7 @@ class ImportsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = []  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_file" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/:container_id/import/datasources/:data_source_id/files/:file_id', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(self.api_client, 'delete_file', (), kwargs)
 
     def delete_import(self, container_id, import_id, **kwargs):  # noqa: E501
         """Delete Import  # noqa: E501
@@ -485,11 +162,7 @@ class ImportsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.delete_import_with_http_info(container_id, import_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.delete_import_with_http_info(container_id, import_id, **kwargs)  # noqa: E501
-            return data
+        return self.delete_import_with_http_info(container_id, import_id, **kwargs)  # noqa: E501
 
     def delete_import_with_http_info(self, container_id, import_id, **kwargs):  # noqa: E501
         """Delete Import  # noqa: E501
@@ -507,65 +180,9 @@ class ImportsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'import_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_import" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `delete_import`")  # noqa: E501
-        # verify the required parameter 'import_id' is set
-        if ('import_id' not in params or
-                params['import_id'] is None):
-            raise ValueError("Missing the required parameter `import_id` when calling `delete_import`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'import_id' in params:
-            path_params['import_id'] = params['import_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/import/imports/{import_id}', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'delete_import',
+            (container_id, import_id), kwargs)
 
     def delete_import_data(self, container_id, import_id, data_id, **kwargs):  # noqa: E501
         """Delete Import Data  # noqa: E501
@@ -585,11 +202,7 @@ class ImportsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.delete_import_data_with_http_info(container_id, import_id, data_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.delete_import_data_with_http_info(container_id, import_id, data_id, **kwargs)  # noqa: E501
-            return data
+        return self.delete_import_data_with_http_info(container_id, import_id, data_id, **kwargs)  # noqa: E501
 
     def delete_import_data_with_http_info(self, container_id, import_id, data_id, **kwargs):  # noqa: E501
         """Delete Import Data  # noqa: E501
@@ -608,75 +221,9 @@ class ImportsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'import_id', 'data_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_import_data" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `delete_import_data`")  # noqa: E501
-        # verify the required parameter 'import_id' is set
-        if ('import_id' not in params or
-                params['import_id'] is None):
-            raise ValueError("Missing the required parameter `import_id` when calling `delete_import_data`")  # noqa: E501
-        # verify the required parameter 'data_id' is set
-        if ('data_id' not in params or
-                params['data_id'] is None):
-            raise ValueError("Missing the required parameter `data_id` when calling `delete_import_data`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'import_id' in params:
-            path_params['import_id'] = params['import_id']  # noqa: E501
-        if 'data_id' in params:
-            path_params['data_id'] = params['data_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/import/imports/{import_id}/data/{data_id}', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='Generic200Response',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'delete_import_data',
+            (container_id, import_id, data_id), kwargs)
 
     def list_imports_data(self, container_id, import_id, **kwargs):  # noqa: E501
         """List Import's Data  # noqa: E501
@@ -700,11 +247,7 @@ class ImportsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.list_imports_data_with_http_info(container_id, import_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.list_imports_data_with_http_info(container_id, import_id, **kwargs)  # noqa: E501
-            return data
+        return self.list_imports_data_with_http_info(container_id, import_id, **kwargs)  # noqa: E501
 
     def list_imports_data_with_http_info(self, container_id, import_id, **kwargs):  # noqa: E501
         """List Import's Data  # noqa: E501
@@ -727,79 +270,9 @@ class ImportsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'import_id', 'count', 'limit', 'offset', 'sort_by', 'sort_desc']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_imports_data" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `list_imports_data`")  # noqa: E501
-        # verify the required parameter 'import_id' is set
-        if ('import_id' not in params or
-                params['import_id'] is None):
-            raise ValueError("Missing the required parameter `import_id` when calling `list_imports_data`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'import_id' in params:
-            path_params['import_id'] = params['import_id']  # noqa: E501
-
-        query_params = []
-        if 'count' in params:
-            query_params.append(('count', params['count']))  # noqa: E501
-        if 'limit' in params:
-            query_params.append(('limit', params['limit']))  # noqa: E501
-        if 'offset' in params:
-            query_params.append(('offset', params['offset']))  # noqa: E501
-        if 'sort_by' in params:
-            query_params.append(('sortBy', params['sort_by']))  # noqa: E501
-        if 'sort_desc' in params:
-            query_params.append(('sortDesc', params['sort_desc']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/import/imports/{import_id}/data', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='ListImportDataResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'list_imports_data',
+            (container_id, import_id), kwargs)
 
     def put_containers_container_id_import_datasources_datasource_id_files_file_id(self, **kwargs):  # noqa: E501
         """Update files  # noqa: E501
@@ -819,11 +292,7 @@ Optionally, any metadata can be added
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.put_containers_container_id_import_datasources_datasource_id_files_file_id_with_http_info(**kwargs)  # noqa: E501
-        else:
-            (data) = self.put_containers_container_id_import_datasources_datasource_id_files_file_id_with_http_info(**kwargs)  # noqa: E501
-            return data
+        return self.put_containers_container_id_import_datasources_datasource_id_files_file_id_with_http_info(**kwargs)  # noqa: E501
 
     def put_containers_container_id_import_datasources_datasource_id_files_file_id_with_http_info(self, **kwargs):  # noqa: E501
         """Update files  # noqa: E501
@@ -842,267 +311,10 @@ Optionally, any metadata can be added
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body', 'authorization']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method put_containers_container_id_import_datasources_datasource_id_files_file_id" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-        if 'authorization' in params:
-            header_params['Authorization'] = params['authorization']  # noqa: E501
-
-        form_params = []
-        local_var_files = {}
-        if 'file' in params:
-            form_params.append(('file', params['file']))  # noqa: E501
-        if 'metadata' in params:
-            form_params.append(('metadata', params['metadata']))  # noqa: E501
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json', 'multipart/form-data', 'application/xml'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/:container_id/import/datasources/:data_source_id/files/:file_id', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
-
-    def put_containers_container_id_import_datasources_datasource_id_files_file_id(self, **kwargs):  # noqa: E501
-        """Update files  # noqa: E501
-
-        Update a file  # noqa: E501
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.put_containers_container_id_import_datasources_datasource_id_files_file_id(async_req=True)
-        >>> result = thread.get()
-
-        :param async_req bool
-        :param object file:
-        :param str metadata:
-        :param str authorization: Bearer token
-        :return: None
-                 If the method is called asynchronously,
-                 returns the request thread.
-        """
-        kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.put_containers_container_id_import_datasources_datasource_id_files_file_id_with_http_info(**kwargs)  # noqa: E501
-        else:
-            (data) = self.put_containers_container_id_import_datasources_datasource_id_files_file_id_with_http_info(**kwargs)  # noqa: E501
-            return data
-
-    def put_containers_container_id_import_datasources_datasource_id_files_file_id_with_http_info(self, **kwargs):  # noqa: E501
-        """Update files  # noqa: E501
-
-        Update a file  # noqa: E501
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.put_containers_container_id_import_datasources_datasource_id_files_file_id_with_http_info(async_req=True)
-        >>> result = thread.get()
-
-        :param async_req bool
-        :param object file:
-        :param str metadata:
-        :param str authorization: Bearer token
-        :return: None
-                 If the method is called asynchronously,
-                 returns the request thread.
-        """
-
-        all_params = ['file', 'metadata', 'authorization']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method put_containers_container_id_import_datasources_datasource_id_files_file_id" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-        if 'authorization' in params:
-            header_params['Authorization'] = params['authorization']  # noqa: E501
-
-        form_params = []
-        local_var_files = {}
-        if 'file' in params:
-            form_params.append(('file', params['file']))  # noqa: E501
-        if 'metadata' in params:
-            form_params.append(('metadata', params['metadata']))  # noqa: E501
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json', 'multipart/form-data', 'application/xml'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/:container_id/import/datasources/:data_source_id/files/:file_id', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
-
-    def put_containers_container_id_import_datasources_datasource_id_files_file_id(self, **kwargs):  # noqa: E501
-        """Update files  # noqa: E501
-
-        Update a file  # noqa: E501
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.put_containers_container_id_import_datasources_datasource_id_files_file_id(async_req=True)
-        >>> result = thread.get()
-
-        :param async_req bool
-        :param FilesFileIdBody body: Key/value pair where the key is named 'file' and the file is any file.
-Optionally, any metadata can be added
-        :param str authorization: Bearer token
-        :return: None
-                 If the method is called asynchronously,
-                 returns the request thread.
-        """
-        kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.put_containers_container_id_import_datasources_datasource_id_files_file_id_with_http_info(**kwargs)  # noqa: E501
-        else:
-            (data) = self.put_containers_container_id_import_datasources_datasource_id_files_file_id_with_http_info(**kwargs)  # noqa: E501
-            return data
-
-    def put_containers_container_id_import_datasources_datasource_id_files_file_id_with_http_info(self, **kwargs):  # noqa: E501
-        """Update files  # noqa: E501
-
-        Update a file  # noqa: E501
-        This method makes a synchronous HTTP request by default. To make an
-        asynchronous HTTP request, please pass async_req=True
-        >>> thread = api.put_containers_container_id_import_datasources_datasource_id_files_file_id_with_http_info(async_req=True)
-        >>> result = thread.get()
-
-        :param async_req bool
-        :param FilesFileIdBody body: Key/value pair where the key is named 'file' and the file is any file.
-Optionally, any metadata can be added
-        :param str authorization: Bearer token
-        :return: None
-                 If the method is called asynchronously,
-                 returns the request thread.
-        """
-
-        all_params = ['body', 'authorization']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method put_containers_container_id_import_datasources_datasource_id_files_file_id" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-        if 'authorization' in params:
-            header_params['Authorization'] = params['authorization']  # noqa: E501
-
-        form_params = []
-        local_var_files = {}
-        if 'file' in params:
-            form_params.append(('file', params['file']))  # noqa: E501
-        if 'metadata' in params:
-            form_params.append(('metadata', params['metadata']))  # noqa: E501
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json', 'multipart/form-data', 'application/xml'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/:container_id/import/datasources/:data_source_id/files/:file_id', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client,
+            'put_containers_container_id_import_datasources_datasource_id_files_file_id',  # noqa: E501
+            (), kwargs)
 
     def retrieve_import_data(self, container_id, import_id, data_id, **kwargs):  # noqa: E501
         """Retrieve Import Data  # noqa: E501
@@ -1122,11 +334,7 @@ Optionally, any metadata can be added
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.retrieve_import_data_with_http_info(container_id, import_id, data_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.retrieve_import_data_with_http_info(container_id, import_id, data_id, **kwargs)  # noqa: E501
-            return data
+        return self.retrieve_import_data_with_http_info(container_id, import_id, data_id, **kwargs)  # noqa: E501
 
     def retrieve_import_data_with_http_info(self, container_id, import_id, data_id, **kwargs):  # noqa: E501
         """Retrieve Import Data  # noqa: E501
@@ -1145,75 +353,9 @@ Optionally, any metadata can be added
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'import_id', 'data_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method retrieve_import_data" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `retrieve_import_data`")  # noqa: E501
-        # verify the required parameter 'import_id' is set
-        if ('import_id' not in params or
-                params['import_id'] is None):
-            raise ValueError("Missing the required parameter `import_id` when calling `retrieve_import_data`")  # noqa: E501
-        # verify the required parameter 'data_id' is set
-        if ('data_id' not in params or
-                params['data_id'] is None):
-            raise ValueError("Missing the required parameter `data_id` when calling `retrieve_import_data`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'import_id' in params:
-            path_params['import_id'] = params['import_id']  # noqa: E501
-        if 'data_id' in params:
-            path_params['data_id'] = params['data_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/import/imports/{import_id}/data/{data_id}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='GetImportDataResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'retrieve_import_data',
+            (container_id, import_id, data_id), kwargs)
 
     def update_import_data(self, container_id, import_id, data_id, **kwargs):  # noqa: E501
         """Update Import Data  # noqa: E501
@@ -1234,11 +376,7 @@ Optionally, any metadata can be added
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.update_import_data_with_http_info(container_id, import_id, data_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.update_import_data_with_http_info(container_id, import_id, data_id, **kwargs)  # noqa: E501
-            return data
+        return self.update_import_data_with_http_info(container_id, import_id, data_id, **kwargs)  # noqa: E501
 
     def update_import_data_with_http_info(self, container_id, import_id, data_id, **kwargs):  # noqa: E501
         """Update Import Data  # noqa: E501
@@ -1258,78 +396,6 @@ Optionally, any metadata can be added
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'import_id', 'data_id', 'body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method update_import_data" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `update_import_data`")  # noqa: E501
-        # verify the required parameter 'import_id' is set
-        if ('import_id' not in params or
-                params['import_id'] is None):
-            raise ValueError("Missing the required parameter `import_id` when calling `update_import_data`")  # noqa: E501
-        # verify the required parameter 'data_id' is set
-        if ('data_id' not in params or
-                params['data_id'] is None):
-            raise ValueError("Missing the required parameter `data_id` when calling `update_import_data`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'import_id' in params:
-            path_params['import_id'] = params['import_id']  # noqa: E501
-        if 'data_id' in params:
-            path_params['data_id'] = params['data_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/import/imports/{import_id}/data/{data_id}', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='UpdateImportDataResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'update_import_data',
+            (container_id, import_id, data_id), kwargs)
@@ -12,12 +12,8 @@
 
 from __future__ import absolute_import
 
-import re  # noqa: F401
-
-# python 2 and python 3 compatibility library
-import six
-
 from deep_lynx.api_client import ApiClient
+from deep_lynx import operations
 
 
 class MetatypeKeysApi(object):
@@ -50,11 +46,7 @@ class MetatypeKeysApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.archive_metatype_key_with_http_info(container_id, metatype_id, key_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.archive_metatype_key_with_http_info(container_id, metatype_id, key_id, **kwargs)  # noqa: E501
-            return data
+        return self.archive_metatype_key_with_http_info(container_id, metatype_id, key_id, **kwargs)  # noqa: E501
 
     def archive_metatype_key_with_http_info(self, container_id, metatype_id, key_id, **kwargs):  # noqa: E501
         """Archive Metatype Key  # noqa: E501
@@ -73,75 +65,9 @@ class MetatypeKeysApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'metatype_id', 'key_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method archive_metatype_key" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `archive_metatype_key`")  # noqa: E501
-        # verify the required parameter 'metatype_id' is set
-        if ('metatype_id' not in params or
-                params['metatype_id'] is None):
-            raise ValueError("Missing the required parameter `metatype_id` when calling `archive_metatype_key`")  # noqa: E501
-        # verify the required parameter 'key_id' is set
-        if ('key_id' not in params or
-                params['key_id'] is None):
-            raise ValueError("Missing the required parameter `key_id` when calling `archive_metatype_key`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'metatype_id' in params:
-            path_params['metatype_id'] = params['metatype_id']  # noqa: E501
-        if 'key_id' in params:
-            path_params['key_id'] = params['key_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/metatypes/{metatype_id}/keys/{key_id}', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='Generic200Response',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'archive_metatype_key',
+            (container_id, metatype_id, key_id), kwargs)
 
     def create_metatype_key(self, body, container_id, metatype_id, **kwargs):  # noqa: E501
         """Create Metatype Key  # noqa: E501
@@ -161,11 +87,7 @@ class MetatypeKeysApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.create_metatype_key_with_http_info(body, container_id, metatype_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.create_metatype_key_with_http_info(body, container_id, metatype_id, **kwargs)  # noqa: E501
-            return data
+        return self.create_metatype_key_with_http_info(body, container_id, metatype_id, **kwargs)  # noqa: E501
 
     def create_metatype_key_with_http_info(self, body, container_id, metatype_id, **kwargs):  # noqa: E501
         """Create Metatype Key  # noqa: E501
@@ -184,79 +106,9 @@ class MetatypeKeysApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body', 'container_id', 'metatype_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method create_metatype_key" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `create_metatype_key`")  # noqa: E501
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `create_metatype_key`")  # noqa: E501
-        # verify the required parameter 'metatype_id' is set
-        if ('metatype_id' not in params or
-                params['metatype_id'] is None):
-            raise ValueError("Missing the required parameter `metatype_id` when calling `create_metatype_key`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'metatype_id' in params:
-            path_params['metatype_id'] = params['metatype_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/metatypes/{metatype_id}/keys', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='CreateMetatypeKeysResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'create_metatype_key',
+            (body, container_id, metatype_id), kwargs)
 
     def list_metatypes_keys(self, container_id, metatype_id, **kwargs):  # noqa: E501
         """List Metatype's Keys  # noqa: E501
@@ -275,11 +127,7 @@ class MetatypeKeysApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.list_metatypes_keys_with_http_info(container_id, metatype_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.list_metatypes_keys_with_http_info(container_id, metatype_id, **kwargs)  # noqa: E501
-            return data
+        return self.list_metatypes_keys_with_http_info(container_id, metatype_id, **kwargs)  # noqa: E501
 
     def list_metatypes_keys_with_http_info(self, container_id, metatype_id, **kwargs):  # noqa: E501
         """List Metatype's Keys  # noqa: E501
@@ -297,69 +145,9 @@ class MetatypeKeysApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'metatype_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_metatypes_keys" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `list_metatypes_keys`")  # noqa: E501
-        # verify the required parameter 'metatype_id' is set
-        if ('metatype_id' not in params or
-                params['metatype_id'] is None):
-            raise ValueError("Missing the required parameter `metatype_id` when calling `list_metatypes_keys`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'metatype_id' in params:
-            path_params['metatype_id'] = params['metatype_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/metatypes/{metatype_id}/keys', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='ListMetatypeKeysResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'list_metatypes_keys',
+            (container_id, metatype_id), kwargs)
 
     def retrieve_metatype_key(self, container_id, metatype_id, key_id, **kwargs):  # noqa: E501
         """Retrieve Metatype Key  # noqa: E501
@@ -379,11 +167,7 @@ class MetatypeKeysApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.retrieve_metatype_key_with_http_info(container_id, metatype_id, key_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.retrieve_metatype_key_with_http_info(container_id, metatype_id, key_id, **kwargs)  # noqa: E501
-            return data
+        return self.retrieve_metatype_key_with_http_info(container_id, metatype_id, key_id, **kwargs)  # noqa: E501
 
     def retrieve_metatype_key_with_http_info(self, container_id, metatype_id, key_id, **kwargs):  # noqa: E501
         """Retrieve Metatype Key  # noqa: E501
@@ -402,75 +186,9 @@ class MetatypeKeysApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'metatype_id', 'key_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method retrieve_metatype_key" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `retrieve_metatype_key`")  # noqa: E501
-        # verify the required parameter 'metatype_id' is set
-        if ('metatype_id' not in params or
-                params['metatype_id'] is None):
-            raise ValueError("Missing the required parameter `metatype_id` when calling `retrieve_metatype_key`")  # noqa: E501
-        # verify the required parameter 'key_id' is set
-        if ('key_id' not in params or
-                params['key_id'] is None):
-            raise ValueError("Missing the required parameter `key_id` when calling `retrieve_metatype_key`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'metatype_id' in params:
-            path_params['metatype_id'] = params['metatype_id']  # noqa: E501
-        if 'key_id' in params:
-            path_params['key_id'] = params['key_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/metatypes/{metatype_id}/keys/{key_id}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='GetMetatypeKeyResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'retrieve_metatype_key',
+            (container_id, metatype_id, key_id), kwargs)
 
     def update_metatype_key(self, body, container_id, metatype_id, key_id, **kwargs):  # noqa: E501
         """Update Metatype Key  # noqa: E501
@@ -491,11 +209,7 @@ class MetatypeKeysApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.update_metatype_key_with_http_info(body, container_id, metatype_id, key_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.update_metatype_key_with_http_info(body, container_id, metatype_id, key_id, **kwargs)  # noqa: E501
-            return data
+        return self.update_metatype_key_with_http_info(body, container_id, metatype_id, key_id, **kwargs)  # noqa: E501
 
     def update_metatype_key_with_http_info(self, body, container_id, metatype_id, key_id, **kwargs):  # noqa: E501
         """Update Metatype Key  # noqa: E501
@@ -515,82 +229,6 @@ class MetatypeKeysApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body', 'container_id', 'metatype_id', 'key_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method update_metatype_key" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `update_metatype_key`")  # noqa: E501
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `update_metatype_key`")  # noqa: E501
-        # verify the required parameter 'metatype_id' is set
-        if ('metatype_id' not in params or
-                params['metatype_id'] is None):
-            raise ValueError("Missing the required parameter `metatype_id` when calling `update_metatype_key`")  # noqa: E501
-        # verify the required parameter 'key_id' is set
-        if ('key_id' not in params or
-                params['key_id'] is None):
-            raise ValueError("Missing the required parameter `key_id` when calling `update_metatype_key`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'metatype_id' in params:
-            path_params['metatype_id'] = params['metatype_id']  # noqa: E501
-        if 'key_id' in params:
-            path_params['key_id'] = params['key_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/metatypes/{metatype_id}/keys/{key_id}', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='UpdateMetatypeKeyResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'update_metatype_key',
+            (body, container_id, metatype_id, key_id), kwargs)
@@ -12,12 +12,8 @@
 
 from __future__ import absolute_import
 
-import re  # noqa: F401
-
-# python 2 and python 3 compatibility library
-import six
-
 from deep_lynx.api_client import ApiClient
+from deep_lynx import operations
 
 
 class MetatypeRelationshipPairsApi(object):
@@ -49,11 +45,7 @@ class MetatypeRelationshipPairsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.archive_metatype_relationship_pair_with_http_info(container_id, pair_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.archive_metatype_relationship_pair_with_http_info(container_id, pair_id, **kwargs)  # noqa: E501
-            return data
+        return self.archive_metatype_relationship_pair_with_http_info(container_id, pair_id, **kwargs)  # noqa: E501
 
     def archive_metatype_relationship_pair_with_http_info(self, container_id, pair_id, **kwargs):  # noqa: E501
         """Archive Metatype Relationship Pair  # noqa: E501
@@ -71,69 +63,9 @@ class MetatypeRelationshipPairsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'pair_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method archive_metatype_relationship_pair" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `archive_metatype_relationship_pair`")  # noqa: E501
-        # verify the required parameter 'pair_id' is set
-        if ('pair_id' not in params or
-                params['pair_id'] is None):
-            raise ValueError("Missing the required parameter `pair_id` when calling `archive_metatype_relationship_pair`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'pair_id' in params:
-            path_params['pair_id'] = params['pair_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/metatype_relationship_pairs/{pair_id}', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='Generic200Response',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'archive_metatype_relationship_pair',
+            (container_id, pair_id), kwargs)
 
     def create_metatype_relationship_pair(self, body, container_id, **kwargs):  # noqa: E501
         """Create Metatype Relationship Pair  # noqa: E501
@@ -152,11 +84,7 @@ class MetatypeRelationshipPairsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.create_metatype_relationship_pair_with_http_info(body, container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.create_metatype_relationship_pair_with_http_info(body, container_id, **kwargs)  # noqa: E501
-            return data
+        return self.create_metatype_relationship_pair_with_http_info(body, container_id, **kwargs)  # noqa: E501
 
     def create_metatype_relationship_pair_with_http_info(self, body, container_id, **kwargs):  # noqa: E501
         """Create Metatype Relationship Pair  # noqa: E501
@@ -174,73 +102,9 @@ class MetatypeRelationshipPairsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body', 'container_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method create_metatype_relationship_pair" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `create_metatype_relationship_pair`")  # noqa: E501
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `create_metatype_relationship_pair`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/metatype_relationship_pairs', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='CreateMetatypeRelationshipPairsResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'create_metatype_relationship_pair',
+            (body, container_id), kwargs)
 
     def list_metatype_relationship_pairs(self, container_id, **kwargs):  # noqa: E501
         """List Metatype Relationship Pairs  # noqa: E501
@@ -267,11 +131,7 @@ class MetatypeRelationshipPairsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.list_metatype_relationship_pairs_with_http_info(container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.list_metatype_relationship_pairs_with_http_info(container_id, **kwargs)  # noqa: E501
-            return data
+        return self.list_metatype_relationship_pairs_with_http_info(container_id, **kwargs)  # noqa: E501
 
     def list_metatype_relationship_pairs_with_http_info(self, container_id, **kwargs):  # noqa: E501
         """List Metatype Relationship Pairs  # noqa: E501
@@ -297,81 +157,9 @@ class MetatypeRelationshipPairsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'limit', 'offset', 'name', 'archived', 'count', 'load_relationships', 'destination_id', 'origin_id', 'metatype_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_metatype_relationship_pairs" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `list_metatype_relationship_pairs`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-        if 'limit' in params:
-            query_params.append(('limit', params['limit']))  # noqa: E501
-        if 'offset' in params:
-            query_params.append(('offset', params['offset']))  # noqa: E501
-        if 'name' in params:
-            query_params.append(('name', params['name']))  # noqa: E501
-        if 'archived' in params:
-            query_params.append(('archived', params['archived']))  # noqa: E501
-        if 'count' in params:
-            query_params.append(('count', params['count']))  # noqa: E501
-        if 'load_relationships' in params:
-            query_params.append(('loadRelationships', params['load_relationships']))  # noqa: E501
-        if 'destination_id' in params:
-            query_params.append(('destinationID', params['destination_id']))  # noqa: E501
-        if 'origin_id' in params:
-            query_params.append(('originID', params['origin_id']))  # noqa: E501
-        if 'metatype_id' in params:
-            query_params.append(('metatypeID', params['metatype_id']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/metatype_relationship_pairs', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='ListMetatypeRelationshipPairsResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'list_metatype_relationship_pairs',
+            (container_id,), kwargs)
 
     def retrieve_metatype_relationship_pair(self, container_id, pair_id, **kwargs):  # noqa: E501
         """Retrieve Metatype Relationship Pair  # noqa: E501
@@ -390,11 +178,7 @@ class MetatypeRelationshipPairsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.retrieve_metatype_relationship_pair_with_http_info(container_id, pair_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.retrieve_metatype_relationship_pair_with_http_info(container_id, pair_id, **kwargs)  # noqa: E501
-            return data
+        return self.retrieve_metatype_relationship_pair_with_http_info(container_id, pair_id, **kwargs)  # noqa: E501
 
     def retrieve_metatype_relationship_pair_with_http_info(self, container_id, pair_id, **kwargs):  # noqa: E501
         """Retrieve Metatype Relationship Pair  # noqa: E501
@@ -412,69 +196,9 @@ class MetatypeRelationshipPairsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'pair_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method retrieve_metatype_relationship_pair" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `retrieve_metatype_relationship_pair`")  # noqa: E501
-        # verify the required parameter 'pair_id' is set
-        if ('pair_id' not in params or
-                params['pair_id'] is None):
-            raise ValueError("Missing the required parameter `pair_id` when calling `retrieve_metatype_relationship_pair`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'pair_id' in params:
-            path_params['pair_id'] = params['pair_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/metatype_relationship_pairs/{pair_id}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='GetMetatypeRelationshipPairResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'retrieve_metatype_relationship_pair',
+            (container_id, pair_id), kwargs)
 
     def update_metatype_relationship_pair(self, container_id, pair_id, **kwargs):  # noqa: E501
         """Update Metaype Relationship Pair  # noqa: E501
@@ -494,11 +218,7 @@ class MetatypeRelationshipPairsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.update_metatype_relationship_pair_with_http_info(container_id, pair_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.update_metatype_relationship_pair_with_http_info(container_id, pair_id, **kwargs)  # noqa: E501
-            return data
+        return self.update_metatype_relationship_pair_with_http_info(container_id, pair_id, **kwargs)  # noqa: E501
 
     def update_metatype_relationship_pair_with_http_info(self, container_id, pair_id, **kwargs):  # noqa: E501
         """Update Metaype Relationship Pair  # noqa: E501
@@ -517,72 +237,6 @@ class MetatypeRelationshipPairsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'pair_id', 'body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method update_metatype_relationship_pair" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `update_metatype_relationship_pair`")  # noqa: E501
-        # verify the required parameter 'pair_id' is set
-        if ('pair_id' not in params or
-                params['pair_id'] is None):
-            raise ValueError("Missing the required parameter `pair_id` when calling `update_metatype_relationship_pair`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'pair_id' in params:
-            path_params['pair_id'] = params['pair_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/metatype_relationship_pairs/{pair_id}', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='UpdateMetatypeRelationshipPairResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'update_metatype_relationship_pair',
+            (container_id, pair_id), kwargs)
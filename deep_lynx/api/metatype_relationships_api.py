@@ -12,12 +12,8 @@
 
 from __future__ import absolute_import
 
-import re  # noqa: F401
-
-# python 2 and python 3 compatibility library
-import six
-
 from deep_lynx.api_client import ApiClient
+from deep_lynx import operations
 
 
 class MetatypeRelationshipsApi(object):
@@ -49,11 +45,7 @@ class MetatypeRelationshipsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.archive_metatype_relationship_with_http_info(container_id, relationship_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.archive_metatype_relationship_with_http_info(container_id, relationship_id, **kwargs)  # noqa: E501
-            return data
+        return self.archive_metatype_relationship_with_http_info(container_id, relationship_id, **kwargs)  # noqa: E501
 
     def archive_metatype_relationship_with_http_info(self, container_id, relationship_id, **kwargs):  # noqa: E501
         """Archive Metatype Relationship  # noqa: E501
@@ -71,69 +63,9 @@ class MetatypeRelationshipsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'relationship_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method archive_metatype_relationship" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `archive_metatype_relationship`")  # noqa: E501
-        # verify the required parameter 'relationship_id' is set
-        if ('relationship_id' not in params or
-                params['relationship_id'] is None):
-            raise ValueError("Missing the required parameter `relationship_id` when calling `archive_metatype_relationship`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'relationship_id' in params:
-            path_params['relationship_id'] = params['relationship_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/metatype_relationships/{relationship_id}', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='Generic200Response',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'archive_metatype_relationship',
+            (container_id, relationship_id), kwargs)
 
     def create_metatype_relationship(self, body, container_id, **kwargs):  # noqa: E501
         """Create Metatype Relationship  # noqa: E501
@@ -152,11 +84,7 @@ class MetatypeRelationshipsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.create_metatype_relationship_with_http_info(body, container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.create_metatype_relationship_with_http_info(body, container_id, **kwargs)  # noqa: E501
-            return data
+        return self.create_metatype_relationship_with_http_info(body, container_id, **kwargs)  # noqa: E501
 
     def create_metatype_relationship_with_http_info(self, body, container_id, **kwargs):  # noqa: E501
         """Create Metatype Relationship  # noqa: E501
@@ -174,73 +102,9 @@ class MetatypeRelationshipsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body', 'container_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method create_metatype_relationship" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `create_metatype_relationship`")  # noqa: E501
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `create_metatype_relationship`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/metatype_relationships', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='CreateMetatypeRelationshipsResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'create_metatype_relationship',
+            (body, container_id), kwargs)
 
     def list_metatype_relationships(self, container_id, **kwargs):  # noqa: E501
         """List Metatype Relationships  # noqa: E501
@@ -266,11 +130,7 @@ class MetatypeRelationshipsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.list_metatype_relationships_with_http_info(container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.list_metatype_relationships_with_http_info(container_id, **kwargs)  # noqa: E501
-            return data
+        return self.list_metatype_relationships_with_http_info(container_id, **kwargs)  # noqa: E501
 
     def list_metatype_relationships_with_http_info(self, container_id, **kwargs):  # noqa: E501
         """List Metatype Relationships  # noqa: E501
@@ -295,79 +155,9 @@ class MetatypeRelationshipsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'limit', 'offset', 'name', 'description', 'count', 'load_keys', 'sort_by', 'sort_desc']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_metatype_relationships" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `list_metatype_relationships`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-        if 'limit' in params:
-            query_params.append(('limit', params['limit']))  # noqa: E501
-        if 'offset' in params:
-            query_params.append(('offset', params['offset']))  # noqa: E501
-        if 'name' in params:
-            query_params.append(('name', params['name']))  # noqa: E501
-        if 'description' in params:
-            query_params.append(('description', params['description']))  # noqa: E501
-        if 'count' in params:
-            query_params.append(('count', params['count']))  # noqa: E501
-        if 'load_keys' in params:
-            query_params.append(('loadKeys', params['load_keys']))  # noqa: E501
-        if 'sort_by' in params:
-            query_params.append(('sortBy', params['sort_by']))  # noqa: E501
-        if 'sort_desc' in params:
-            query_params.append(('sortDesc', params['sort_desc']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/metatype_relationships', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='ListMetatypeRelationshipsResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'list_metatype_relationships',
+            (container_id,), kwargs)
 
     def retrieve_metatype_relationship(self, container_id, relationship_id, **kwargs):  # noqa: E501
         """Retrieve Metatype Relationship  # noqa: E501
@@ -386,11 +176,7 @@ class MetatypeRelationshipsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.retrieve_metatype_relationship_with_http_info(container_id, relationship_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.retrieve_metatype_relationship_with_http_info(container_id, relationship_id, **kwargs)  # noqa: E501
-            return data
+        return self.retrieve_metatype_relationship_with_http_info(container_id, relationship_id, **kwargs)  # noqa: E501
 
     def retrieve_metatype_relationship_with_http_info(self, container_id, relationship_id, **kwargs):  # noqa: E501
         """Retrieve Metatype Relationship  # noqa: E501
@@ -408,69 +194,9 @@ class MetatypeRelationshipsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'relationship_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method retrieve_metatype_relationship" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `retrieve_metatype_relationship`")  # noqa: E501
-        # verify the required parameter 'relationship_id' is set
-        if ('relationship_id' not in params or
-                params['relationship_id'] is None):
-            raise ValueError("Missing the required parameter `relationship_id` when calling `retrieve_metatype_relationship`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'relationship_id' in params:
-            path_params['relationship_id'] = params['relationship_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/metatype_relationships/{relationship_id}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='GetMetatypeRelationshipResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'retrieve_metatype_relationship',
+            (container_id, relationship_id), kwargs)
 
     def update_metatype_relationship(self, body, container_id, relationship_id, **kwargs):  # noqa: E501
         """Update Metatype Relationship  # noqa: E501
@@ -490,11 +216,7 @@ class MetatypeRelationshipsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.update_metatype_relationship_with_http_info(body, container_id, relationship_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.update_metatype_relationship_with_http_info(body, container_id, relationship_id, **kwargs)  # noqa: E501
-            return data
+        return self.update_metatype_relationship_with_http_info(body, container_id, relationship_id, **kwargs)  # noqa: E501
 
     def update_metatype_relationship_with_http_info(self, body, container_id, relationship_id, **kwargs):  # noqa: E501
         """Update Metatype Relationship  # noqa: E501
@@ -513,76 +235,6 @@ class MetatypeRelationshipsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body', 'container_id', 'relationship_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method update_metatype_relationship" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `update_metatype_relationship`")  # noqa: E501
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `update_metatype_relationship`")  # noqa: E501
-        # verify the required parameter 'relationship_id' is set
-        if ('relationship_id' not in params or
-                params['relationship_id'] is None):
-            raise ValueError("Missing the required parameter `relationship_id` when calling `update_metatype_relationship`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'relationship_id' in params:
-            path_params['relationship_id'] = params['relationship_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/metatype_relationships/{relationship_id}', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='UpdateMetatypeRelationshipResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'update_metatype_relationship',
+            (body, container_id, relationship_id), kwargs)
@@ -12,12 +12,8 @@
 
 from __future__ import absolute_import
 
-import re  # noqa: F401
-
-# python 2 and python 3 compatibility library
-import six
-
 from deep_lynx.api_client import ApiClient
+from deep_lynx import operations
 
 
 class MetatypesApi(object):
@@ -49,11 +45,7 @@ class MetatypesApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.archive_metatype_with_http_info(container_id, metatype_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.archive_metatype_with_http_info(container_id, metatype_id, **kwargs)  # noqa: E501
-            return data
+        return self.archive_metatype_with_http_info(container_id, metatype_id, **kwargs)  # noqa: E501
 
     def archive_metatype_with_http_info(self, container_id, metatype_id, **kwargs):  # noqa: E501
         """Archive Metatype  # noqa: E501
@@ -71,69 +63,9 @@ class MetatypesApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'metatype_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method archive_metatype" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `archive_metatype`")  # noqa: E501
-        # verify the required parameter 'metatype_id' is set
-        if ('metatype_id' not in params or
-                params['metatype_id'] is None):
-            raise ValueError("Missing the required parameter `metatype_id` when calling `archive_metatype`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'metatype_id' in params:
-            path_params['metatype_id'] = params['metatype_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/metatypes/{metatype_id}', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='Generic200Response',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'archive_metatype',
+            (container_id, metatype_id), kwargs)
 
     def create_metatype(self, body, container_id, **kwargs):  # noqa: E501
         """Create Metatype  # noqa: E501
@@ -152,11 +84,7 @@ class MetatypesApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.create_metatype_with_http_info(body, container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.create_metatype_with_http_info(body, container_id, **kwargs)  # noqa: E501
-            return data
+        return self.create_metatype_with_http_info(body, container_id, **kwargs)  # noqa: E501
 
     def create_metatype_with_http_info(self, body, container_id, **kwargs):  # noqa: E501
         """Create Metatype  # noqa: E501
@@ -174,73 +102,9 @@ class MetatypesApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body', 'container_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method create_metatype" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `create_metatype`")  # noqa: E501
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `create_metatype`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/metatypes', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='CreateMetatypesResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'create_metatype',
+            (body, container_id), kwargs)
 
     def list_metatypes(self, container_id, **kwargs):  # noqa: E501
         """List Metatypes  # noqa: E501
@@ -266,11 +130,7 @@ class MetatypesApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.list_metatypes_with_http_info(container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.list_metatypes_with_http_info(container_id, **kwargs)  # noqa: E501
-            return data
+        return self.list_metatypes_with_http_info(container_id, **kwargs)  # noqa: E501
 
     def list_metatypes_with_http_info(self, container_id, **kwargs):  # noqa: E501
         """List Metatypes  # noqa: E501
@@ -295,79 +155,9 @@ class MetatypesApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'limit', 'offset', 'name', 'description', 'count', 'load_keys', 'sort_by', 'sort_desc']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_metatypes" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `list_metatypes`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-        if 'limit' in params:
-            query_params.append(('limit', params['limit']))  # noqa: E501
-        if 'offset' in params:
-            query_params.append(('offset', params['offset']))  # noqa: E501
-        if 'name' in params:
-            query_params.append(('name', params['name']))  # noqa: E501
-        if 'description' in params:
-            query_params.append(('description', params['description']))  # noqa: E501
-        if 'count' in params:
-            query_params.append(('count', params['count']))  # noqa: E501
-        if 'load_keys' in params:
-            query_params.append(('loadKeys', params['load_keys']))  # noqa: E501
-        if 'sort_by' in params:
-            query_params.append(('sortBy', params['sort_by']))  # noqa: E501
-        if 'sort_desc' in params:
-            query_params.append(('sortDesc', params['sort_desc']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/metatypes', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='ListMetatypesResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'list_metatypes',
+            (container_id,), kwargs)
 
     def retrieve_metaype(self, container_id, metatype_id, **kwargs):  # noqa: E501
         """Retrieve Metatype  # noqa: E501
@@ -386,11 +176,7 @@ class MetatypesApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.retrieve_metaype_with_http_info(container_id, metatype_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.retrieve_metaype_with_http_info(container_id, metatype_id, **kwargs)  # noqa: E501
-            return data
+        return self.retrieve_metaype_with_http_info(container_id, metatype_id, **kwargs)  # noqa: E501
 
     def retrieve_metaype_with_http_info(self, container_id, metatype_id, **kwargs):  # noqa: E501
         """Retrieve Metatype  # noqa: E501
@@ -408,69 +194,9 @@ class MetatypesApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'metatype_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method retrieve_metaype" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `retrieve_metaype`")  # noqa: E501
-        # verify the required parameter 'metatype_id' is set
-        if ('metatype_id' not in params or
-                params['metatype_id'] is None):
-            raise ValueError("Missing the required parameter `metatype_id` when calling `retrieve_metaype`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'metatype_id' in params:
-            path_params['metatype_id'] = params['metatype_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/metatypes/{metatype_id}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='GetMetatypeResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'retrieve_metaype',
+            (container_id, metatype_id), kwargs)
 
     def update_metatype(self, body, container_id, metatype_id, **kwargs):  # noqa: E501
         """Update Metatype  # noqa: E501
@@ -490,11 +216,7 @@ class MetatypesApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.update_metatype_with_http_info(body, container_id, metatype_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.update_metatype_with_http_info(body, container_id, metatype_id, **kwargs)  # noqa: E501
-            return data
+        return self.update_metatype_with_http_info(body, container_id, metatype_id, **kwargs)  # noqa: E501
 
     def update_metatype_with_http_info(self, body, container_id, metatype_id, **kwargs):  # noqa: E501
         """Update Metatype  # noqa: E501
@@ -513,79 +235,9 @@ class MetatypesApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body', 'container_id', 'metatype_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method update_metatype" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `update_metatype`")  # noqa: E501
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `update_metatype`")  # noqa: E501
-        # verify the required parameter 'metatype_id' is set
-        if ('metatype_id' not in params or
-                params['metatype_id'] is None):
-            raise ValueError("Missing the required parameter `metatype_id` when calling `update_metatype`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'metatype_id' in params:
-            path_params['metatype_id'] = params['metatype_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/metatypes/{metatype_id}', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='UpdateMetatypeResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'update_metatype',
+            (body, container_id, metatype_id), kwargs)
 
     def validate_metatype_properties(self, container_id, metatype_id, **kwargs):  # noqa: E501
         """Validate Metatype Properties  # noqa: E501
@@ -605,11 +257,7 @@ class MetatypesApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.validate_metatype_properties_with_http_info(container_id, metatype_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.validate_metatype_properties_with_http_info(container_id, metatype_id, **kwargs)  # noqa: E501
-            return data
+        return self.validate_metatype_properties_with_http_info(container_id, metatype_id, **kwargs)  # noqa: E501
 
     def validate_metatype_properties_with_http_info(self, container_id, metatype_id, **kwargs):  # noqa: E501
         """Validate Metatype Properties  # noqa: E501
@@ -628,72 +276,6 @@ class MetatypesApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'metatype_id', 'body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method validate_metatype_properties" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `validate_metatype_properties`")  # noqa: E501
-        # verify the required parameter 'metatype_id' is set
-        if ('metatype_id' not in params or
-                params['metatype_id'] is None):
-            raise ValueError("Missing the required parameter `metatype_id` when calling `validate_metatype_properties`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'metatype_id' in params:
-            path_params['metatype_id'] = params['metatype_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/metatypes/{metatype_id}', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='ValidateMetatypePropertiesResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'validate_metatype_properties',
+            (container_id, metatype_id), kwargs)
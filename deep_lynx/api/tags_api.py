@@ -12,12 +12,8 @@
 
 from __future__ import absolute_import
 
-import re  # noqa: F401
-
-# python 2 and python 3 compatibility library
-import six
-
 from deep_lynx.api_client import ApiClient
+from deep_lynx import operations
 
 
 class TagsApi(object):
@@ -49,11 +45,7 @@ class TagsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.delete_webgl_file_with_http_info(container_id, file_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.delete_webgl_file_with_http_info(container_id, file_id, **kwargs)  # noqa: E501
-            return data
+        return self.delete_webgl_file_with_http_info(container_id, file_id, **kwargs)  # noqa: E501
 
     def delete_webgl_file_with_http_info(self, container_id, file_id, **kwargs):  # noqa: E501
         """Delete WebGL File  # noqa: E501
@@ -71,65 +63,9 @@ class TagsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'file_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_webgl_file" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `delete_webgl_file`")  # noqa: E501
-        # verify the required parameter 'file_id' is set
-        if ('file_id' not in params or
-                params['file_id'] is None):
-            raise ValueError("Missing the required parameter `file_id` when calling `delete_webgl_file`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'file_id' in params:
-            path_params['file_id'] = params['file_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/webgl/files/{file_id}', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'delete_webgl_file',
+            (container_id, file_id), kwargs)
 
     def detach_tag_from_edge(self, container_id, edge_id, tag_id, **kwargs):  # noqa: E501
         """Detach Tag From Edge  # noqa: E501
@@ -149,11 +85,7 @@ class TagsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.detach_tag_from_edge_with_http_info(container_id, edge_id, tag_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.detach_tag_from_edge_with_http_info(container_id, edge_id, tag_id, **kwargs)  # noqa: E501
-            return data
+        return self.detach_tag_from_edge_with_http_info(container_id, edge_id, tag_id, **kwargs)  # noqa: E501
 
     def detach_tag_from_edge_with_http_info(self, container_id, edge_id, tag_id, **kwargs):  # noqa: E501
         """Detach Tag From Edge  # noqa: E501
@@ -172,71 +104,9 @@ class TagsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'edge_id', 'tag_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method detach_tag_from_edge" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `detach_tag_from_edge`")  # noqa: E501
-        # verify the required parameter 'edge_id' is set
-        if ('edge_id' not in params or
-                params['edge_id'] is None):
-            raise ValueError("Missing the required parameter `edge_id` when calling `detach_tag_from_edge`")  # noqa: E501
-        # verify the required parameter 'tag_id' is set
-        if ('tag_id' not in params or
-                params['tag_id'] is None):
-            raise ValueError("Missing the required parameter `tag_id` when calling `detach_tag_from_edge`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'edge_id' in params:
-            path_params['edge_id'] = params['edge_id']  # noqa: E501
-        if 'tag_id' in params:
-            path_params['tag_id'] = params['tag_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/tags/{tag_id}/edges/{edge_id}', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'detach_tag_from_edge',
+            (container_id, edge_id, tag_id), kwargs)
 
     def detach_tag_from_file(self, container_id, file_id, tag_id, **kwargs):  # noqa: E501
         """Detach Tag From File  # noqa: E501
@@ -256,11 +126,7 @@ class TagsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.detach_tag_from_file_with_http_info(container_id, file_id, tag_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.detach_tag_from_file_with_http_info(container_id, file_id, tag_id, **kwargs)  # noqa: E501
-            return data
+        return self.detach_tag_from_file_with_http_info(container_id, file_id, tag_id, **kwargs)  # noqa: E501
 
     def detach_tag_from_file_with_http_info(self, container_id, file_id, tag_id, **kwargs):  # noqa: E501
         """Detach Tag From File  # noqa: E501
@@ -279,71 +145,9 @@ class TagsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'file_id', 'tag_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method detach_tag_from_file" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `detach_tag_from_file`")  # noqa: E501
-        # verify the required parameter 'file_id' is set
-        if ('file_id' not in params or
-                params['file_id'] is None):
-            raise ValueError("Missing the required parameter `file_id` when calling `detach_tag_from_file`")  # noqa: E501
-        # verify the required parameter 'tag_id' is set
-        if ('tag_id' not in params or
-                params['tag_id'] is None):
-            raise ValueError("Missing the required parameter `tag_id` when calling `detach_tag_from_file`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'file_id' in params:
-            path_params['file_id'] = params['file_id']  # noqa: E501
-        if 'tag_id' in params:
-            path_params['tag_id'] = params['tag_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/tags/{tag_id}/files/{file_id}', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'detach_tag_from_file',
+            (container_id, file_id, tag_id), kwargs)
 
     def detach_tag_from_node(self, container_id, node_id, tag_id, **kwargs):  # noqa: E501
         """Detach Tag From Node  # noqa: E501
@@ -363,11 +167,7 @@ class TagsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.detach_tag_from_node_with_http_info(container_id, node_id, tag_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.detach_tag_from_node_with_http_info(container_id, node_id, tag_id, **kwargs)  # noqa: E501
-            return data
+        return self.detach_tag_from_node_with_http_info(container_id, node_id, tag_id, **kwargs)  # noqa: E501
 
     def detach_tag_from_node_with_http_info(self, container_id, node_id, tag_id, **kwargs):  # noqa: E501
         """Detach Tag From Node  # noqa: E501
@@ -386,71 +186,9 @@ class TagsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'node_id', 'tag_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method detach_tag_from_node" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `detach_tag_from_node`")  # noqa: E501
-        # verify the required parameter 'node_id' is set
-        if ('node_id' not in params or
-                params['node_id'] is None):
-            raise ValueError("Missing the required parameter `node_id` when calling `detach_tag_from_node`")  # noqa: E501
-        # verify the required parameter 'tag_id' is set
-        if ('tag_id' not in params or
-                params['tag_id'] is None):
-            raise ValueError("Missing the required parameter `tag_id` when calling `detach_tag_from_node`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'node_id' in params:
-            path_params['node_id'] = params['node_id']  # noqa: E501
-        if 'tag_id' in params:
-            path_params['tag_id'] = params['tag_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/tags/{tag_id}/nodes/{node_id}', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'detach_tag_from_node',
+            (container_id, node_id, tag_id), kwargs)
 
     def get_containers_container_id_graphs_tags_edges_edge_id(self, container_id, edge_id, **kwargs):  # noqa: E501
         """List Tags for Edge  # noqa: E501
@@ -469,11 +207,7 @@ class TagsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.get_containers_container_id_graphs_tags_edges_edge_id_with_http_info(container_id, edge_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.get_containers_container_id_graphs_tags_edges_edge_id_with_http_info(container_id, edge_id, **kwargs)  # noqa: E501
-            return data
+        return self.get_containers_container_id_graphs_tags_edges_edge_id_with_http_info(container_id, edge_id, **kwargs)  # noqa: E501
 
     def get_containers_container_id_graphs_tags_edges_edge_id_with_http_info(self, container_id, edge_id, **kwargs):  # noqa: E501
         """List Tags for Edge  # noqa: E501
@@ -491,65 +225,9 @@ class TagsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'edge_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method get_containers_container_id_graphs_tags_edges_edge_id" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `get_containers_container_id_graphs_tags_edges_edge_id`")  # noqa: E501
-        # verify the required parameter 'edge_id' is set
-        if ('edge_id' not in params or
-                params['edge_id'] is None):
-            raise ValueError("Missing the required parameter `edge_id` when calling `get_containers_container_id_graphs_tags_edges_edge_id`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'edge_id' in params:
-            path_params['edge_id'] = params['edge_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/tags/edges/{edge_id}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'get_containers_container_id_graphs_tags_edges_edge_id',
+            (container_id, edge_id), kwargs)
 
     def get_containers_container_id_graphs_tags_files_file_id(self, container_id, file_id, **kwargs):  # noqa: E501
         """List Tags for File  # noqa: E501
@@ -568,11 +246,7 @@ class TagsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.get_containers_container_id_graphs_tags_files_file_id_with_http_info(container_id, file_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.get_containers_container_id_graphs_tags_files_file_id_with_http_info(container_id, file_id, **kwargs)  # noqa: E501
-            return data
+        return self.get_containers_container_id_graphs_tags_files_file_id_with_http_info(container_id, file_id, **kwargs)  # noqa: E501
 
     def get_containers_container_id_graphs_tags_files_file_id_with_http_info(self, container_id, file_id, **kwargs):  # noqa: E501
         """List Tags for File  # noqa: E501
@@ -590,65 +264,9 @@ class TagsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'file_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method get_containers_container_id_graphs_tags_files_file_id" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `get_containers_container_id_graphs_tags_files_file_id`")  # noqa: E501
-        # verify the required parameter 'file_id' is set
-        if ('file_id' not in params or
-                params['file_id'] is None):
-            raise ValueError("Missing the required parameter `file_id` when calling `get_containers_container_id_graphs_tags_files_file_id`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'file_id' in params:
-            path_params['file_id'] = params['file_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/tags/files/{file_id}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'get_containers_container_id_graphs_tags_files_file_id',
+            (container_id, file_id), kwargs)
 
     def get_containers_container_id_graphs_tags_nodes_node_id(self, container_id, node_id, **kwargs):  # noqa: E501
         """List Tags for Node  # noqa: E501
@@ -667,11 +285,7 @@ class TagsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.get_containers_container_id_graphs_tags_nodes_node_id_with_http_info(container_id, node_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.get_containers_container_id_graphs_tags_nodes_node_id_with_http_info(container_id, node_id, **kwargs)  # noqa: E501
-            return data
+        return self.get_containers_container_id_graphs_tags_nodes_node_id_with_http_info(container_id, node_id, **kwargs)  # noqa: E501
 
     def get_containers_container_id_graphs_tags_nodes_node_id_with_http_info(self, container_id, node_id, **kwargs):  # noqa: E501
         """List Tags for Node  # noqa: E501
@@ -689,65 +303,9 @@ class TagsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'node_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method get_containers_container_id_graphs_tags_nodes_node_id" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `get_containers_container_id_graphs_tags_nodes_node_id`")  # noqa: E501
-        # verify the required parameter 'node_id' is set
-        if ('node_id' not in params or
-                params['node_id'] is None):
-            raise ValueError("Missing the required parameter `node_id` when calling `get_containers_container_id_graphs_tags_nodes_node_id`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'node_id' in params:
-            path_params['node_id'] = params['node_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/tags/nodes/{node_id}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'get_containers_container_id_graphs_tags_nodes_node_id',
+            (container_id, node_id), kwargs)
 
     def get_containers_container_id_graphs_tags_nodes_tag_id(self, container_id, tag_id, **kwargs):  # noqa: E501
         """List Nodes with Tag  # noqa: E501
@@ -766,11 +324,7 @@ class TagsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.get_containers_container_id_graphs_tags_nodes_tag_id_with_http_info(container_id, tag_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.get_containers_container_id_graphs_tags_nodes_tag_id_with_http_info(container_id, tag_id, **kwargs)  # noqa: E501
-            return data
+        return self.get_containers_container_id_graphs_tags_nodes_tag_id_with_http_info(container_id, tag_id, **kwargs)  # noqa: E501
 
     def get_containers_container_id_graphs_tags_nodes_tag_id_with_http_info(self, container_id, tag_id, **kwargs):  # noqa: E501
         """List Nodes with Tag  # noqa: E501
@@ -788,65 +342,9 @@ class TagsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'tag_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method get_containers_container_id_graphs_tags_nodes_tag_id" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `get_containers_container_id_graphs_tags_nodes_tag_id`")  # noqa: E501
-        # verify the required parameter 'tag_id' is set
-        if ('tag_id' not in params or
-                params['tag_id'] is None):
-            raise ValueError("Missing the required parameter `tag_id` when calling `get_containers_container_id_graphs_tags_nodes_tag_id`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'tag_id' in params:
-            path_params['tag_id'] = params['tag_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/tags/{tag_id}/nodes', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'get_containers_container_id_graphs_tags_nodes_tag_id',
+            (container_id, tag_id), kwargs)
 
     def get_containers_container_id_graphs_tags_tag_id_edges(self, container_id, tag_id, **kwargs):  # noqa: E501
         """List Edges with Tag  # noqa: E501
@@ -865,11 +363,7 @@ class TagsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.get_containers_container_id_graphs_tags_tag_id_edges_with_http_info(container_id, tag_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.get_containers_container_id_graphs_tags_tag_id_edges_with_http_info(container_id, tag_id, **kwargs)  # noqa: E501
-            return data
+        return self.get_containers_container_id_graphs_tags_tag_id_edges_with_http_info(container_id, tag_id, **kwargs)  # noqa: E501
 
     def get_containers_container_id_graphs_tags_tag_id_edges_with_http_info(self, container_id, tag_id, **kwargs):  # noqa: E501
         """List Edges with Tag  # noqa: E501
@@ -887,65 +381,9 @@ class TagsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'tag_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method get_containers_container_id_graphs_tags_tag_id_edges" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `get_containers_container_id_graphs_tags_tag_id_edges`")  # noqa: E501
-        # verify the required parameter 'tag_id' is set
-        if ('tag_id' not in params or
-                params['tag_id'] is None):
-            raise ValueError("Missing the required parameter `tag_id` when calling `get_containers_container_id_graphs_tags_tag_id_edges`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'tag_id' in params:
-            path_params['tag_id'] = params['tag_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/tags/{tag_id}/edges', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'get_containers_container_id_graphs_tags_tag_id_edges',
+            (container_id, tag_id), kwargs)
 
     def get_containers_container_id_graphs_tags_tag_id_files(self, container_id, tag_id, **kwargs):  # noqa: E501
         """List Files with Tag  # noqa: E501
@@ -964,11 +402,7 @@ class TagsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.get_containers_container_id_graphs_tags_tag_id_files_with_http_info(container_id, tag_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.get_containers_container_id_graphs_tags_tag_id_files_with_http_info(container_id, tag_id, **kwargs)  # noqa: E501
-            return data
+        return self.get_containers_container_id_graphs_tags_tag_id_files_with_http_info(container_id, tag_id, **kwargs)  # noqa: E501
 
     def get_containers_container_id_graphs_tags_tag_id_files_with_http_info(self, container_id, tag_id, **kwargs):  # noqa: E501
         """List Files with Tag  # noqa: E501
@@ -986,65 +420,9 @@ class TagsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'tag_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method get_containers_container_id_graphs_tags_tag_id_files" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `get_containers_container_id_graphs_tags_tag_id_files`")  # noqa: E501
-        # verify the required parameter 'tag_id' is set
-        if ('tag_id' not in params or
-                params['tag_id'] is None):
-            raise ValueError("Missing the required parameter `tag_id` when calling `get_containers_container_id_graphs_tags_tag_id_files`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'tag_id' in params:
-            path_params['tag_id'] = params['tag_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/tags/{tag_id}/files', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'get_containers_container_id_graphs_tags_tag_id_files',
+            (container_id, tag_id), kwargs)
 
     def list_tags(self, container_id, **kwargs):  # noqa: E501
         """List Tags  # noqa: E501
@@ -1062,11 +440,7 @@ class TagsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.list_tags_with_http_info(container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.list_tags_with_http_info(container_id, **kwargs)  # noqa: E501
-            return data
+        return self.list_tags_with_http_info(container_id, **kwargs)  # noqa: E501
 
     def list_tags_with_http_info(self, container_id, **kwargs):  # noqa: E501
         """List Tags  # noqa: E501
@@ -1083,59 +457,9 @@ class TagsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_tags" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `list_tags`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/tags', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'list_tags',
+            (container_id,), kwargs)
 
     def list_webgl(self, container_id, **kwargs):  # noqa: E501
         """List WebGL  # noqa: E501
@@ -1153,11 +477,7 @@ class TagsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.list_webgl_with_http_info(container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.list_webgl_with_http_info(container_id, **kwargs)  # noqa: E501
-            return data
+        return self.list_webgl_with_http_info(container_id, **kwargs)  # noqa: E501
 
     def list_webgl_with_http_info(self, container_id, **kwargs):  # noqa: E501
         """List WebGL  # noqa: E501
@@ -1174,59 +494,9 @@ class TagsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_webgl" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `list_webgl`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/webgl', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'list_webgl',
+            (container_id,), kwargs)
 
     def post_tags(self, container_id, **kwargs):  # noqa: E501
         """Create Tag  # noqa: E501
@@ -1245,11 +515,7 @@ class TagsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.post_tags_with_http_info(container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.post_tags_with_http_info(container_id, **kwargs)  # noqa: E501
-            return data
+        return self.post_tags_with_http_info(container_id, **kwargs)  # noqa: E501
 
     def post_tags_with_http_info(self, container_id, **kwargs):  # noqa: E501
         """Create Tag  # noqa: E501
@@ -1267,65 +533,9 @@ class TagsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method post_tags" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `post_tags`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/tags', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'post_tags',
+            (container_id,), kwargs)
 
     def put_containers_container_id_graphs_tags_nodes_node_id(self, container_id, node_id, tag_id, **kwargs):  # noqa: E501
         """Tag Node  # noqa: E501
@@ -1345,11 +555,7 @@ class TagsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.put_containers_container_id_graphs_tags_nodes_node_id_with_http_info(container_id, node_id, tag_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.put_containers_container_id_graphs_tags_nodes_node_id_with_http_info(container_id, node_id, tag_id, **kwargs)  # noqa: E501
-            return data
+        return self.put_containers_container_id_graphs_tags_nodes_node_id_with_http_info(container_id, node_id, tag_id, **kwargs)  # noqa: E501
 
     def put_containers_container_id_graphs_tags_nodes_node_id_with_http_info(self, container_id, node_id, tag_id, **kwargs):  # noqa: E501
         """Tag Node  # noqa: E501
@@ -1368,71 +574,9 @@ class TagsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'node_id', 'tag_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method put_containers_container_id_graphs_tags_nodes_node_id" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `put_containers_container_id_graphs_tags_nodes_node_id`")  # noqa: E501
-        # verify the required parameter 'node_id' is set
-        if ('node_id' not in params or
-                params['node_id'] is None):
-            raise ValueError("Missing the required parameter `node_id` when calling `put_containers_container_id_graphs_tags_nodes_node_id`")  # noqa: E501
-        # verify the required parameter 'tag_id' is set
-        if ('tag_id' not in params or
-                params['tag_id'] is None):
-            raise ValueError("Missing the required parameter `tag_id` when calling `put_containers_container_id_graphs_tags_nodes_node_id`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'node_id' in params:
-            path_params['node_id'] = params['node_id']  # noqa: E501
-        if 'tag_id' in params:
-            path_params['tag_id'] = params['tag_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/tags/{tag_id}/nodes/{node_id}', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'put_containers_container_id_graphs_tags_nodes_node_id',
+            (container_id, node_id, tag_id), kwargs)
 
     def put_containers_container_id_graphs_tags_tag_id(self, container_id, tag_id, **kwargs):  # noqa: E501
         """Update Tag  # noqa: E501
@@ -1452,11 +596,7 @@ class TagsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.put_containers_container_id_graphs_tags_tag_id_with_http_info(container_id, tag_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.put_containers_container_id_graphs_tags_tag_id_with_http_info(container_id, tag_id, **kwargs)  # noqa: E501
-            return data
+        return self.put_containers_container_id_graphs_tags_tag_id_with_http_info(container_id, tag_id, **kwargs)  # noqa: E501
 
     def put_containers_container_id_graphs_tags_tag_id_with_http_info(self, container_id, tag_id, **kwargs):  # noqa: E501
         """Update Tag  # noqa: E501
@@ -1475,71 +615,9 @@ class TagsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'tag_id', 'body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method put_containers_container_id_graphs_tags_tag_id" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `put_containers_container_id_graphs_tags_tag_id`")  # noqa: E501
-        # verify the required parameter 'tag_id' is set
-        if ('tag_id' not in params or
-                params['tag_id'] is None):
-            raise ValueError("Missing the required parameter `tag_id` when calling `put_containers_container_id_graphs_tags_tag_id`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'tag_id' in params:
-            path_params['tag_id'] = params['tag_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/tags/{tag_id}', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'put_containers_container_id_graphs_tags_tag_id',
+            (container_id, tag_id), kwargs)
 
     def put_containers_container_id_graphs_tags_tag_id_edges_edge_id(self, container_id, edge_id, tag_id, **kwargs):  # noqa: E501
         """Tag Edge  # noqa: E501
@@ -1559,11 +637,7 @@ class TagsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.put_containers_container_id_graphs_tags_tag_id_edges_edge_id_with_http_info(container_id, edge_id, tag_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.put_containers_container_id_graphs_tags_tag_id_edges_edge_id_with_http_info(container_id, edge_id, tag_id, **kwargs)  # noqa: E501
-            return data
+        return self.put_containers_container_id_graphs_tags_tag_id_edges_edge_id_with_http_info(container_id, edge_id, tag_id, **kwargs)  # noqa: E501
 
     def put_containers_container_id_graphs_tags_tag_id_edges_edge_id_with_http_info(self, container_id, edge_id, tag_id, **kwargs):  # noqa: E501
         """Tag Edge  # noqa: E501
@@ -1582,71 +656,9 @@ class TagsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'edge_id', 'tag_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method put_containers_container_id_graphs_tags_tag_id_edges_edge_id" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `put_containers_container_id_graphs_tags_tag_id_edges_edge_id`")  # noqa: E501
-        # verify the required parameter 'edge_id' is set
-        if ('edge_id' not in params or
-                params['edge_id'] is None):
-            raise ValueError("Missing the required parameter `edge_id` when calling `put_containers_container_id_graphs_tags_tag_id_edges_edge_id`")  # noqa: E501
-        # verify the required parameter 'tag_id' is set
-        if ('tag_id' not in params or
-                params['tag_id'] is None):
-            raise ValueError("Missing the required parameter `tag_id` when calling `put_containers_container_id_graphs_tags_tag_id_edges_edge_id`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'edge_id' in params:
-            path_params['edge_id'] = params['edge_id']  # noqa: E501
-        if 'tag_id' in params:
-            path_params['tag_id'] = params['tag_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/tags/{tag_id}/edges/{edge_id}', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'put_containers_container_id_graphs_tags_tag_id_edges_edge_id',
+            (container_id, edge_id, tag_id), kwargs)
 
     def put_containers_container_id_graphs_tags_tag_id_files_file_id(self, container_id, file_id, tag_id, **kwargs):  # noqa: E501
         """Tag File  # noqa: E501
@@ -1666,11 +678,7 @@ class TagsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.put_containers_container_id_graphs_tags_tag_id_files_file_id_with_http_info(container_id, file_id, tag_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.put_containers_container_id_graphs_tags_tag_id_files_file_id_with_http_info(container_id, file_id, tag_id, **kwargs)  # noqa: E501
-            return data
+        return self.put_containers_container_id_graphs_tags_tag_id_files_file_id_with_http_info(container_id, file_id, tag_id, **kwargs)  # noqa: E501
 
     def put_containers_container_id_graphs_tags_tag_id_files_file_id_with_http_info(self, container_id, file_id, tag_id, **kwargs):  # noqa: E501
         """Tag File  # noqa: E501
@@ -1689,71 +697,9 @@ class TagsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'file_id', 'tag_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method put_containers_container_id_graphs_tags_tag_id_files_file_id" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `put_containers_container_id_graphs_tags_tag_id_files_file_id`")  # noqa: E501
-        # verify the required parameter 'file_id' is set
-        if ('file_id' not in params or
-                params['file_id'] is None):
-            raise ValueError("Missing the required parameter `file_id` when calling `put_containers_container_id_graphs_tags_tag_id_files_file_id`")  # noqa: E501
-        # verify the required parameter 'tag_id' is set
-        if ('tag_id' not in params or
-                params['tag_id'] is None):
-            raise ValueError("Missing the required parameter `tag_id` when calling `put_containers_container_id_graphs_tags_tag_id_files_file_id`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'file_id' in params:
-            path_params['file_id'] = params['file_id']  # noqa: E501
-        if 'tag_id' in params:
-            path_params['tag_id'] = params['tag_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/tags/{tag_id}/files/{file_id}', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'put_containers_container_id_graphs_tags_tag_id_files_file_id',
+            (container_id, file_id, tag_id), kwargs)
 
     def update_webgl_files(self, container_id, file_id, **kwargs):  # noqa: E501
         """Update WebGL Files  # noqa: E501
@@ -1772,11 +718,7 @@ class TagsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.update_webgl_files_with_http_info(container_id, file_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.update_webgl_files_with_http_info(container_id, file_id, **kwargs)  # noqa: E501
-            return data
+        return self.update_webgl_files_with_http_info(container_id, file_id, **kwargs)  # noqa: E501
 
     def update_webgl_files_with_http_info(self, container_id, file_id, **kwargs):  # noqa: E501
         """Update WebGL Files  # noqa: E501
@@ -1794,65 +736,9 @@ class TagsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'file_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method update_webgl_files" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `update_webgl_files`")  # noqa: E501
-        # verify the required parameter 'file_id' is set
-        if ('file_id' not in params or
-                params['file_id'] is None):
-            raise ValueError("Missing the required parameter `file_id` when calling `update_webgl_files`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'file_id' in params:
-            path_params['file_id'] = params['file_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/webgl/files/{file_id}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'update_webgl_files',
+            (container_id, file_id), kwargs)
 
     def upload_webgl(self, container_id, **kwargs):  # noqa: E501
         """Upload WebGL  # noqa: E501
@@ -1872,11 +758,7 @@ class TagsApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.upload_webgl_with_http_info(container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.upload_webgl_with_http_info(container_id, **kwargs)  # noqa: E501
-            return data
+        return self.upload_webgl_with_http_info(container_id, **kwargs)  # noqa: E501
 
     def upload_webgl_with_http_info(self, container_id, **kwargs):  # noqa: E501
         """Upload WebGL  # noqa: E501
@@ -1895,64 +777,6 @@ class TagsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'file', 'tag']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method upload_webgl" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `upload_webgl`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-        if 'tag' in params:
-            query_params.append(('tag', params['tag']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-        if 'file' in params:
-            form_params.append(('file', params['file']))  # noqa: E501
-
-        body_params = None
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['multipart/form-data'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/graphs/webgl', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'upload_webgl',
+            (container_id,), kwargs)
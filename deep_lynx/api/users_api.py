@@ -12,12 +12,8 @@
 
 from __future__ import absolute_import
 
-import re  # noqa: F401
-
-# python 2 and python 3 compatibility library
-import six
-
 from deep_lynx.api_client import ApiClient
+from deep_lynx import operations
 
 
 class UsersApi(object):
@@ -48,11 +44,7 @@ class UsersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.accept_container_invite_with_http_info(token, **kwargs)  # noqa: E501
-        else:
-            (data) = self.accept_container_invite_with_http_info(token, **kwargs)  # noqa: E501
-            return data
+        return self.accept_container_invite_with_http_info(token, **kwargs)  # noqa: E501
 
     def accept_container_invite_with_http_info(self, token, **kwargs):  # noqa: E501
         """Accept Container Invite  # noqa: E501
@@ -69,63 +61,9 @@ class UsersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['token']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method accept_container_invite" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'token' is set
-        if ('token' not in params or
-                params['token'] is None):
-            raise ValueError("Missing the required parameter `token` when calling `accept_container_invite`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-        if 'token' in params:
-            query_params.append(('token', params['token']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/users/invite', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='Generic200Response',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'accept_container_invite',
+            (token,), kwargs)
 
     def assign_user_role(self, body, container_id, **kwargs):  # noqa: E501
         """Assign User Role  # noqa: E501
@@ -144,11 +82,7 @@ class UsersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.assign_user_role_with_http_info(body, container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.assign_user_role_with_http_info(body, container_id, **kwargs)  # noqa: E501
-            return data
+        return self.assign_user_role_with_http_info(body, container_id, **kwargs)  # noqa: E501
 
     def assign_user_role_with_http_info(self, body, container_id, **kwargs):  # noqa: E501
         """Assign User Role  # noqa: E501
@@ -166,73 +100,9 @@ class UsersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body', 'container_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method assign_user_role" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `assign_user_role`")  # noqa: E501
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `assign_user_role`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/users/roles', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='Generic200Response',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'assign_user_role',
+            (body, container_id), kwargs)
 
     def create_service_user(self, container_id, **kwargs):  # noqa: E501
         """Create Service User  # noqa: E501
@@ -251,11 +121,7 @@ class UsersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.create_service_user_with_http_info(container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.create_service_user_with_http_info(container_id, **kwargs)  # noqa: E501
-            return data
+        return self.create_service_user_with_http_info(container_id, **kwargs)  # noqa: E501
 
     def create_service_user_with_http_info(self, container_id, **kwargs):  # noqa: E501
         """Create Service User  # noqa: E501
@@ -273,69 +139,9 @@ class UsersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method create_service_user" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `create_service_user`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/service-users', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='CreateServiceUserResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'create_service_user',
+            (container_id,), kwargs)
 
     def create_service_user_key_pair(self, container_id, service_user_id, **kwargs):  # noqa: E501
         """Create Service User KeyPair  # noqa: E501
@@ -354,11 +160,7 @@ class UsersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.create_service_user_key_pair_with_http_info(container_id, service_user_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.create_service_user_key_pair_with_http_info(container_id, service_user_id, **kwargs)  # noqa: E501
-            return data
+        return self.create_service_user_key_pair_with_http_info(container_id, service_user_id, **kwargs)  # noqa: E501
 
     def create_service_user_key_pair_with_http_info(self, container_id, service_user_id, **kwargs):  # noqa: E501
         """Create Service User KeyPair  # noqa: E501
@@ -376,69 +178,9 @@ class UsersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'service_user_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method create_service_user_key_pair" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `create_service_user_key_pair`")  # noqa: E501
-        # verify the required parameter 'service_user_id' is set
-        if ('service_user_id' not in params or
-                params['service_user_id'] is None):
-            raise ValueError("Missing the required parameter `service_user_id` when calling `create_service_user_key_pair`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'service_user_id' in params:
-            path_params['service_user_id'] = params['service_user_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/service-users/{service_user_id}/keys', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='InlineResponse2008',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'create_service_user_key_pair',
+            (container_id, service_user_id), kwargs)
 
     def delete_service_user(self, container_id, service_user_id, **kwargs):  # noqa: E501
         """Delete Service User  # noqa: E501
@@ -457,11 +199,7 @@ class UsersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.delete_service_user_with_http_info(container_id, service_user_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.delete_service_user_with_http_info(container_id, service_user_id, **kwargs)  # noqa: E501
-            return data
+        return self.delete_service_user_with_http_info(container_id, service_user_id, **kwargs)  # noqa: E501
 
     def delete_service_user_with_http_info(self, container_id, service_user_id, **kwargs):  # noqa: E501
         """Delete Service User  # noqa: E501
@@ -479,65 +217,9 @@ class UsersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'service_user_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_service_user" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `delete_service_user`")  # noqa: E501
-        # verify the required parameter 'service_user_id' is set
-        if ('service_user_id' not in params or
-                params['service_user_id'] is None):
-            raise ValueError("Missing the required parameter `service_user_id` when calling `delete_service_user`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'service_user_id' in params:
-            path_params['service_user_id'] = params['service_user_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/service-users/{service_user_id}', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'delete_service_user',
+            (container_id, service_user_id), kwargs)
 
     def delete_service_user_key_pair(self, container_id, service_user_id, key_id, **kwargs):  # noqa: E501
         """Delete Service User KeyPair  # noqa: E501
@@ -557,11 +239,7 @@ class UsersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.delete_service_user_key_pair_with_http_info(container_id, service_user_id, key_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.delete_service_user_key_pair_with_http_info(container_id, service_user_id, key_id, **kwargs)  # noqa: E501
-            return data
+        return self.delete_service_user_key_pair_with_http_info(container_id, service_user_id, key_id, **kwargs)  # noqa: E501
 
     def delete_service_user_key_pair_with_http_info(self, container_id, service_user_id, key_id, **kwargs):  # noqa: E501
         """Delete Service User KeyPair  # noqa: E501
@@ -580,71 +258,9 @@ class UsersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'service_user_id', 'key_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_service_user_key_pair" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `delete_service_user_key_pair`")  # noqa: E501
-        # verify the required parameter 'service_user_id' is set
-        if ('service_user_id' not in params or
-                params['service_user_id'] is None):
-            raise ValueError("Missing the required parameter `service_user_id` when calling `delete_service_user_key_pair`")  # noqa: E501
-        # verify the required parameter 'key_id' is set
-        if ('key_id' not in params or
-                params['key_id'] is None):
-            raise ValueError("Missing the required parameter `key_id` when calling `delete_service_user_key_pair`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'service_user_id' in params:
-            path_params['service_user_id'] = params['service_user_id']  # noqa: E501
-        if 'key_id' in params:
-            path_params['key_id'] = params['key_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/service-users/{service_user_id}/keys/{key_id}', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'delete_service_user_key_pair',
+            (container_id, service_user_id, key_id), kwargs)
 
     def delete_user(self, user_id, **kwargs):  # noqa: E501
         """Delete User  # noqa: E501
@@ -662,11 +278,7 @@ class UsersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.delete_user_with_http_info(user_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.delete_user_with_http_info(user_id, **kwargs)  # noqa: E501
-            return data
+        return self.delete_user_with_http_info(user_id, **kwargs)  # noqa: E501
 
     def delete_user_with_http_info(self, user_id, **kwargs):  # noqa: E501
         """Delete User  # noqa: E501
@@ -683,63 +295,9 @@ class UsersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['user_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_user" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'user_id' is set
-        if ('user_id' not in params or
-                params['user_id'] is None):
-            raise ValueError("Missing the required parameter `user_id` when calling `delete_user`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'user_id' in params:
-            path_params['user_id'] = params['user_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/users/{user_id}', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='Generic200Response',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'delete_user',
+            (user_id,), kwargs)
 
     def get_service_user_permissions(self, container_id, service_user_id, **kwargs):  # noqa: E501
         """Get Service User Permissions  # noqa: E501
@@ -758,11 +316,7 @@ class UsersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.get_service_user_permissions_with_http_info(container_id, service_user_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.get_service_user_permissions_with_http_info(container_id, service_user_id, **kwargs)  # noqa: E501
-            return data
+        return self.get_service_user_permissions_with_http_info(container_id, service_user_id, **kwargs)  # noqa: E501
 
     def get_service_user_permissions_with_http_info(self, container_id, service_user_id, **kwargs):  # noqa: E501
         """Get Service User Permissions  # noqa: E501
@@ -780,69 +334,9 @@ class UsersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'service_user_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method get_service_user_permissions" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `get_service_user_permissions`")  # noqa: E501
-        # verify the required parameter 'service_user_id' is set
-        if ('service_user_id' not in params or
-                params['service_user_id'] is None):
-            raise ValueError("Missing the required parameter `service_user_id` when calling `get_service_user_permissions`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'service_user_id' in params:
-            path_params['service_user_id'] = params['service_user_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/service-users/{service_user_id}/permissions', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='list[list[str]]',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'get_service_user_permissions',
+            (container_id, service_user_id), kwargs)
 
     def invite_user_to_container(self, container_id, **kwargs):  # noqa: E501
         """Invite User to Container  # noqa: E501
@@ -861,11 +355,7 @@ class UsersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.invite_user_to_container_with_http_info(container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.invite_user_to_container_with_http_info(container_id, **kwargs)  # noqa: E501
-            return data
+        return self.invite_user_to_container_with_http_info(container_id, **kwargs)  # noqa: E501
 
     def invite_user_to_container_with_http_info(self, container_id, **kwargs):  # noqa: E501
         """Invite User to Container  # noqa: E501
@@ -883,69 +373,9 @@ class UsersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method invite_user_to_container" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `invite_user_to_container`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/users/invite', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='Generic200Response',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'invite_user_to_container',
+            (container_id,), kwargs)
 
     def list_invited_users_for_container(self, container_id, **kwargs):  # noqa: E501
         """List Invited Users for Container  # noqa: E501
@@ -963,11 +393,7 @@ class UsersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.list_invited_users_for_container_with_http_info(container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.list_invited_users_for_container_with_http_info(container_id, **kwargs)  # noqa: E501
-            return data
+        return self.list_invited_users_for_container_with_http_info(container_id, **kwargs)  # noqa: E501
 
     def list_invited_users_for_container_with_http_info(self, container_id, **kwargs):  # noqa: E501
         """List Invited Users for Container  # noqa: E501
@@ -984,63 +410,9 @@ class UsersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_invited_users_for_container" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `list_invited_users_for_container`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/users/invite', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='ListContainerInvitesResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'list_invited_users_for_container',
+            (container_id,), kwargs)
 
     def list_outstanding_invites(self, **kwargs):  # noqa: E501
         """List Outstanding Invites  # noqa: E501
@@ -1057,11 +429,7 @@ class UsersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.list_outstanding_invites_with_http_info(**kwargs)  # noqa: E501
-        else:
-            (data) = self.list_outstanding_invites_with_http_info(**kwargs)  # noqa: E501
-            return data
+        return self.list_outstanding_invites_with_http_info(**kwargs)  # noqa: E501
 
     def list_outstanding_invites_with_http_info(self, **kwargs):  # noqa: E501
         """List Outstanding Invites  # noqa: E501
@@ -1077,57 +445,9 @@ class UsersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = []  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_outstanding_invites" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/users/invites', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='ListUserInvitesResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'list_outstanding_invites',
+            (), kwargs)
 
     def list_service_keys_for_container(self, container_id, **kwargs):  # noqa: E501
         """List Service User Keys for Container  # noqa: E501
@@ -1146,11 +466,7 @@ class UsersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.list_service_keys_for_container_with_http_info(container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.list_service_keys_for_container_with_http_info(container_id, **kwargs)  # noqa: E501
-            return data
+        return self.list_service_keys_for_container_with_http_info(container_id, **kwargs)  # noqa: E501
 
     def list_service_keys_for_container_with_http_info(self, container_id, **kwargs):  # noqa: E501
         """List Service User Keys for Container  # noqa: E501
@@ -1168,65 +484,9 @@ class UsersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'note']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_service_keys_for_container" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `list_service_keys_for_container`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-        if 'note' in params:
-            query_params.append(('note', params['note']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/service-users/keys', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='InlineResponse20011',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'list_service_keys_for_container',
+            (container_id,), kwargs)
 
     def list_service_user_key_pairs(self, container_id, service_user_id, **kwargs):  # noqa: E501
         """List Service User KeyPairs  # noqa: E501
@@ -1246,11 +506,7 @@ class UsersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.list_service_user_key_pairs_with_http_info(container_id, service_user_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.list_service_user_key_pairs_with_http_info(container_id, service_user_id, **kwargs)  # noqa: E501
-            return data
+        return self.list_service_user_key_pairs_with_http_info(container_id, service_user_id, **kwargs)  # noqa: E501
 
     def list_service_user_key_pairs_with_http_info(self, container_id, service_user_id, **kwargs):  # noqa: E501
         """List Service User KeyPairs  # noqa: E501
@@ -1269,67 +525,9 @@ class UsersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'service_user_id', 'note']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_service_user_key_pairs" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `list_service_user_key_pairs`")  # noqa: E501
-        # verify the required parameter 'service_user_id' is set
-        if ('service_user_id' not in params or
-                params['service_user_id'] is None):
-            raise ValueError("Missing the required parameter `service_user_id` when calling `list_service_user_key_pairs`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'service_user_id' in params:
-            path_params['service_user_id'] = params['service_user_id']  # noqa: E501
-
-        query_params = []
-        if 'note' in params:
-            query_params.append(('note', params['note']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/service-users/{service_user_id}/keys', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'list_service_user_key_pairs',
+            (container_id, service_user_id), kwargs)
 
     def list_service_users(self, container_id, **kwargs):  # noqa: E501
         """List Service Users  # noqa: E501
@@ -1347,11 +545,7 @@ class UsersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.list_service_users_with_http_info(container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.list_service_users_with_http_info(container_id, **kwargs)  # noqa: E501
-            return data
+        return self.list_service_users_with_http_info(container_id, **kwargs)  # noqa: E501
 
     def list_service_users_with_http_info(self, container_id, **kwargs):  # noqa: E501
         """List Service Users  # noqa: E501
@@ -1368,63 +562,9 @@ class UsersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_service_users" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `list_service_users`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/service-users', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='ListServiceUserResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'list_service_users',
+            (container_id,), kwargs)
 
     def list_user_permissions(self, **kwargs):  # noqa: E501
         """List User Permissions  # noqa: E501
@@ -1441,11 +581,7 @@ class UsersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.list_user_permissions_with_http_info(**kwargs)  # noqa: E501
-        else:
-            (data) = self.list_user_permissions_with_http_info(**kwargs)  # noqa: E501
-            return data
+        return self.list_user_permissions_with_http_info(**kwargs)  # noqa: E501
 
     def list_user_permissions_with_http_info(self, **kwargs):  # noqa: E501
         """List User Permissions  # noqa: E501
@@ -1461,57 +597,9 @@ class UsersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = []  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_user_permissions" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/users/permissions', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='ListUserPermissionsResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'list_user_permissions',
+            (), kwargs)
 
     def list_users(self, **kwargs):  # noqa: E501
         """List Users  # noqa: E501
@@ -1534,11 +622,7 @@ class UsersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.list_users_with_http_info(**kwargs)  # noqa: E501
-        else:
-            (data) = self.list_users_with_http_info(**kwargs)  # noqa: E501
-            return data
+        return self.list_users_with_http_info(**kwargs)  # noqa: E501
 
     def list_users_with_http_info(self, **kwargs):  # noqa: E501
         """List Users  # noqa: E501
@@ -1560,69 +644,7 @@ class UsersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['count', 'load_keys', 'limit', 'offset', 'sort_by', 'sort_desc']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_users" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-        if 'count' in params:
-            query_params.append(('count', params['count']))  # noqa: E501
-        if 'load_keys' in params:
-            query_params.append(('loadKeys', params['load_keys']))  # noqa: E501
-        if 'limit' in params:
-            query_params.append(('limit', params['limit']))  # noqa: E501
-        if 'offset' in params:
-            query_params.append(('offset', params['offset']))  # noqa: E501
-        if 'sort_by' in params:
-            query_params.append(('sortBy', params['sort_by']))  # noqa: E501
-        if 'sort_desc' in params:
-            query_params.append(('sortDesc', params['sort_desc']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/users', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='ListUsersResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(self.api_client, 'list_users', (), kwargs)
 
     def list_users_for_container(self, container_id, **kwargs):  # noqa: E501
         """List Users for Container  # noqa: E501
@@ -1642,11 +664,7 @@ class UsersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.list_users_for_container_with_http_info(container_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.list_users_for_container_with_http_info(container_id, **kwargs)  # noqa: E501
-            return data
+        return self.list_users_for_container_with_http_info(container_id, **kwargs)  # noqa: E501
 
     def list_users_for_container_with_http_info(self, container_id, **kwargs):  # noqa: E501
         """List Users for Container  # noqa: E501
@@ -1665,67 +683,9 @@ class UsersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'limit', 'offset']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_users_for_container" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `list_users_for_container`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-
-        query_params = []
-        if 'limit' in params:
-            query_params.append(('limit', params['limit']))  # noqa: E501
-        if 'offset' in params:
-            query_params.append(('offset', params['offset']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/users', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='ListUsersForContainerResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'list_users_for_container',
+            (container_id,), kwargs)
 
     def list_users_roles(self, container_id, user_id, **kwargs):  # noqa: E501
         """List User's Roles  # noqa: E501
@@ -1744,11 +704,7 @@ class UsersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.list_users_roles_with_http_info(container_id, user_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.list_users_roles_with_http_info(container_id, user_id, **kwargs)  # noqa: E501
-            return data
+        return self.list_users_roles_with_http_info(container_id, user_id, **kwargs)  # noqa: E501
 
     def list_users_roles_with_http_info(self, container_id, user_id, **kwargs):  # noqa: E501
         """List User's Roles  # noqa: E501
@@ -1766,69 +722,9 @@ class UsersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'user_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_users_roles" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `list_users_roles`")  # noqa: E501
-        # verify the required parameter 'user_id' is set
-        if ('user_id' not in params or
-                params['user_id'] is None):
-            raise ValueError("Missing the required parameter `user_id` when calling `list_users_roles`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'user_id' in params:
-            path_params['user_id'] = params['user_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/users/{user_id}/roles', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='ListUserRoles',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'list_users_roles',
+            (container_id, user_id), kwargs)
 
     def retrieve_user(self, container_id, user_id, **kwargs):  # noqa: E501
         """Retrieve User  # noqa: E501
@@ -1847,11 +743,7 @@ class UsersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.retrieve_user_with_http_info(container_id, user_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.retrieve_user_with_http_info(container_id, user_id, **kwargs)  # noqa: E501
-            return data
+        return self.retrieve_user_with_http_info(container_id, user_id, **kwargs)  # noqa: E501
 
     def retrieve_user_with_http_info(self, container_id, user_id, **kwargs):  # noqa: E501
         """Retrieve User  # noqa: E501
@@ -1869,69 +761,9 @@ class UsersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'user_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method retrieve_user" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `retrieve_user`")  # noqa: E501
-        # verify the required parameter 'user_id' is set
-        if ('user_id' not in params or
-                params['user_id'] is None):
-            raise ValueError("Missing the required parameter `user_id` when calling `retrieve_user`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'user_id' in params:
-            path_params['user_id'] = params['user_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/users/{user_id}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='GetUserResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'retrieve_user',
+            (container_id, user_id), kwargs)
 
     def set_service_user_permissions(self, container_id, service_user_id, **kwargs):  # noqa: E501
         """Set Service User Permissions  # noqa: E501
@@ -1951,11 +783,7 @@ class UsersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.set_service_user_permissions_with_http_info(container_id, service_user_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.set_service_user_permissions_with_http_info(container_id, service_user_id, **kwargs)  # noqa: E501
-            return data
+        return self.set_service_user_permissions_with_http_info(container_id, service_user_id, **kwargs)  # noqa: E501
 
     def set_service_user_permissions_with_http_info(self, container_id, service_user_id, **kwargs):  # noqa: E501
         """Set Service User Permissions  # noqa: E501
@@ -1974,75 +802,9 @@ class UsersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['container_id', 'service_user_id', 'body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method set_service_user_permissions" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'container_id' is set
-        if ('container_id' not in params or
-                params['container_id'] is None):
-            raise ValueError("Missing the required parameter `container_id` when calling `set_service_user_permissions`")  # noqa: E501
-        # verify the required parameter 'service_user_id' is set
-        if ('service_user_id' not in params or
-                params['service_user_id'] is None):
-            raise ValueError("Missing the required parameter `service_user_id` when calling `set_service_user_permissions`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'container_id' in params:
-            path_params['container_id'] = params['container_id']  # noqa: E501
-        if 'service_user_id' in params:
-            path_params['service_user_id'] = params['service_user_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/containers/{container_id}/service-users/{service_user_id}/permissions', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='InlineResponse2007',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'set_service_user_permissions',
+            (container_id, service_user_id), kwargs)
 
     def update_user(self, user_id, **kwargs):  # noqa: E501
         """Update User  # noqa: E501
@@ -2061,11 +823,7 @@ class UsersApi(object):
                  returns the request thread.
         """
         kwargs['_return_http_data_only'] = True
-        if kwargs.get('async_req'):
-            return self.update_user_with_http_info(user_id, **kwargs)  # noqa: E501
-        else:
-            (data) = self.update_user_with_http_info(user_id, **kwargs)  # noqa: E501
-            return data
+        return self.update_user_with_http_info(user_id, **kwargs)  # noqa: E501
 
     def update_user_with_http_info(self, user_id, **kwargs):  # noqa: E501
         """Update User  # noqa: E501
@@ -2083,66 +841,6 @@ class UsersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['user_id', 'body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method update_user" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'user_id' is set
-        if ('user_id' not in params or
-                params['user_id'] is None):
-            raise ValueError("Missing the required parameter `user_id` when calling `update_user`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'user_id' in params:
-            path_params['user_id'] = params['user_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerAuth']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/users/{user_id}', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='Generic200Response',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return operations.call(
+            self.api_client, 'update_user',
+            (user_id,), kwargs)
@@ -11,20 +11,29 @@
 from __future__ import absolute_import
 
 import datetime
-import json
-import mimetypes
-from multiprocessing.pool import ThreadPool
-import os
-import re
-import tempfile
+import logging
+import threading
+import time
 
 # python 2 and python 3 compatibility library
 import six
 from six.moves.urllib.parse import quote
 
 from deep_lynx.configuration import Configuration
-import deep_lynx.models
+from deep_lynx import cache
+from deep_lynx import circuit
+from deep_lynx import deserializer
+from deep_lynx import download
+from deep_lynx import executor
+from deep_lynx import forksafe
+from deep_lynx import limiter
+from deep_lynx import metrics
+from deep_lynx import multipart
 from deep_lynx import rest
+from deep_lynx import serializer
+
+
+logger = logging.getLogger(__name__)
 
 
 class ApiClient(object):
@@ -58,6 +67,9 @@ class ApiClient(object):
         'datetime': datetime.datetime,
         'object': object,
     }
+    RESPONSE_MODES = ('model', 'compact', 'dict', 'raw_bytes')
+    # sends the requests; subclasses swap in another transport
+    rest_client_class = rest.RESTClientObject
 
     def __init__(self, configuration=None, header_name=None, header_value=None,
                  cookie=None):
@@ -65,18 +77,52 @@ class ApiClient(object):
             configuration = Configuration()
         self.configuration = configuration
 
-        self.pool = ThreadPool()
-        self.rest_client = rest.RESTClientObject(configuration)
+        self.rest_client = self.rest_client_class(configuration)
         self.default_headers = {}
         if header_name is not None:
             self.default_headers[header_name] = header_value
         self.cookie = cookie
+        # request hooks, see `add_hook`
+        self.hooks = []
+        # per thread state, see `last_response`
+        self._local = threading.local()
         # Set default User-Agent.
         self.user_agent = 'Swagger-Codegen/0.1.8/python'
 
-    def __del__(self):
-        self.pool.close()
-        self.pool.join()
+    def __reduce__(self):
+        # the connections and locks of a client stay in this process, the
+        # copy is built from its spec
+        return forksafe.ClientSpec.build, (self.spec(),)
+
+    def spec(self):
+        """Returns a picklable `forksafe.ClientSpec` that builds an
+        equivalent client in another process."""
+        return forksafe.ClientSpec.of(self)
+
+    @property
+    def last_response(self):
+        """Response of the last request the current thread sent through
+        this client, None before the first one.
+
+        Each thread sees its own, so concurrent requests and
+        `async_req=True` calls, which run on the executor threads, do not
+        overwrite each other's. `*_with_http_info` methods return the
+        status and headers along with the data of their own request.
+        """
+        return getattr(self._local, 'response', None)
+
+    @last_response.setter
+    def last_response(self, response):
+        self._local.response = response
+
+    @property
+    def pool(self):
+        """Executor running `async_req=True` requests.
+
+        It is shared by every client in the process and only started on the
+        first asynchronous request.
+        """
+        return executor.get_executor(self.configuration.executor_max_workers)
 
     @property
     def user_agent(self):
@@ -90,13 +136,331 @@ class ApiClient(object):
     def set_default_header(self, header_name, header_value):
         self.default_headers[header_name] = header_value
 
+    def add_hook(self, hook):
+        """Registers a request hook, see `deep_lynx.metrics`.
+
+        :param hook: object with any of the `on_request`, `on_response`
+            and `on_error` methods, e.g. a `metrics.MetricsCollector`.
+        """
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook):
+        """Unregisters a hook added with `add_hook`."""
+        self.hooks.remove(hook)
+
+    def start_request(self, method, resource_path, url, queued_at=None):
+        """Returns the `metrics.RequestInfo` of a request about to be sent,
+        after passing it to the `on_request` hooks, or None without hooks.
+
+        :param queued_at: `time.monotonic()` when the request was handed to
+            the shared executor, if it was.
+        """
+        if not self.hooks:
+            return None
+        now = time.monotonic()
+        info = metrics.RequestInfo(
+            method + ' ' + resource_path, method, url,
+            now - queued_at if queued_at is not None else 0.0)
+        self._call_hooks('on_request', info)
+        info.started = time.monotonic()
+        return info
+
+    def request_done(self, info, response):
+        """Completes `info` from `response` for the `on_response` hooks."""
+        if info is None:
+            return
+        info.elapsed = time.monotonic() - info.started
+        self._read_response(info, response)
+        self._call_hooks('on_response', info)
+
+    def request_failed(self, info, error):
+        """Completes `info` from `error` for the `on_error` hooks."""
+        if info is None:
+            return
+        info.elapsed = time.monotonic() - info.started
+        info.error = error
+        info.retries += getattr(error, 'retries', 0) or 0
+        if isinstance(error, rest.ApiException):
+            info.status = error.status or None
+            if isinstance(error.body, (bytes, str)):
+                info.response_bytes = len(error.body)
+        self._call_hooks('on_error', info)
+
+    @staticmethod
+    def _read_response(info, response):
+        info.status = response.status
+        info.request_bytes = getattr(response, 'request_bytes', None)
+        info.retries += getattr(response, 'retries', 0) or 0
+        # only preloaded bodies: `data` of a raw urllib3 response is a
+        # property that reads the whole stream
+        data = vars(response).get('data')
+        if isinstance(data, (bytes, str)):
+            info.response_bytes = len(data)
+        else:
+            # raw urllib3 and aiohttp responses expose `headers`
+            headers = getattr(response, 'headers', None)
+            length = (headers.get('Content-Length') if headers is not None
+                      else response.getheader('Content-Length'))
+            if length and length.isdigit():
+                info.response_bytes = int(length)
+
+    def _call_hooks(self, event, info):
+        for hook in list(self.hooks):
+            callback = getattr(hook, event, None)
+            if callback is None:
+                continue
+            try:
+                callback(info)
+            except Exception:
+                # instrumentation must never break a request
+                logger.exception("%s hook %r failed", event, hook)
+
     def __call_api(
             self, resource_path, method, path_params=None,
             query_params=None, header_params=None, body=None, post_params=None,
             files=None, response_type=None, auth_settings=None,
             _return_http_data_only=None, collection_formats=None,
-            _preload_content=True, _request_timeout=None):
+            _preload_content=True, _request_timeout=None,
+            _response_mode=None, _download_path=None, _queued_at=None):
+
+        method, url, query_params, header_params, post_params, body = \
+            self.prepare_request(resource_path, method, path_params,
+                                 query_params, header_params, body,
+                                 post_params, files, auth_settings,
+                                 collection_formats)
+
+        # files are streamed to disk instead of being buffered in memory
+        stream_file = (response_type == 'file' and _preload_content and
+                       method == 'GET' and (_response_mode or
+                                            self.configuration.response_mode)
+                       != 'raw_bytes')
+
+        key = self.flight_key(method, resource_path, url, query_params,
+                              header_params, _preload_content and
+                              not stream_file,
+                              (response_type, _return_http_data_only,
+                               _response_mode))
+        if key is not None:
+            return self.configuration.single_flight.do(key, lambda: (
+                self.__send(resource_path, method, url, query_params,
+                            header_params, body, post_params, files,
+                            response_type, _return_http_data_only,
+                            _preload_content, _request_timeout,
+                            _response_mode, _download_path, _queued_at,
+                            stream_file)))
+        return self.__send(resource_path, method, url, query_params,
+                           header_params, body, post_params, files,
+                           response_type, _return_http_data_only,
+                           _preload_content, _request_timeout, _response_mode,
+                           _download_path, _queued_at, stream_file)
+
+    def __send(self, resource_path, method, url, query_params, header_params,
+               body, post_params, files, response_type,
+               _return_http_data_only, _preload_content, _request_timeout,
+               _response_mode, _download_path, _queued_at, stream_file):
+        stale = None
+        ticket = self.cache_ticket(method, resource_path, url, query_params,
+                                   header_params,
+                                   _preload_content and not stream_file)
+        if ticket is not None:
+            cached = self.configuration.response_cache.get(ticket)
+            if cached is not None:
+                return self.handle_response(cached, response_type,
+                                            _return_http_data_only,
+                                            _preload_content, _response_mode)
+            stale = self.configuration.response_cache.stale(ticket)
+            if stale is not None:
+                # ask the server whether the expired response changed
+                header_params = dict(header_params,
+                                     **stale.conditional_headers())
+
+        breaker = self.circuit_breaker(method, resource_path, url)
+        permit = None
+        if breaker is not None:
+            permit = self.enter_circuit(breaker, method, resource_path,
+                                        url, _queued_at)
+        limit = self.limiter(method, resource_path, files)
+        slot = limit.acquire() if limit is not None else None
+        info = self.start_request(method, resource_path, url, _queued_at)
+        sent = time.monotonic()
+        try:
+            # perform request and return response
+            try:
+                response_data = self.request(
+                    method, url, query_params=query_params,
+                    headers=header_params, post_params=post_params, body=body,
+                    _preload_content=_preload_content and not stream_file,
+                    _request_timeout=_request_timeout,
+                    _retry_policy=self.retry_policy(method, resource_path))
+            except rest.ApiException as e:
+                if stale is None or e.status != 304:
+                    raise
+                response_data = cache.NotModified(e)
+            latency = time.monotonic() - sent
+
+            if stream_file:
+                response_data = download.FileDownloader(
+                    self.rest_client, self.configuration, url, query_params,
+                    header_params, _request_timeout).save(response_data,
+                                                          _download_path)
+        except BaseException as e:
+            if limit is not None:
+                limit.release(slot, time.monotonic() - sent,
+                              limiter.overloaded(e))
+            self.leave_circuit(breaker, permit, e)
+            self.update_cache(method, url)
+            if isinstance(e, Exception):
+                self.request_failed(info, e)
+            raise
+        if limit is not None:
+            limit.release(slot, latency)
+        self.leave_circuit(breaker, permit)
+        entry = self.update_cache(method, url, ticket, response_data, stale)
+        self.request_done(info, response_data)
+        if entry is not None:
+            return self.handle_cached_response(entry, response_type,
+                                               _return_http_data_only,
+                                               _response_mode)
+
+        return self.handle_response(response_data, response_type,
+                                    _return_http_data_only, _preload_content,
+                                    _response_mode)
+
+    def retry_policy(self, method, resource_path):
+        """Returns the `retry.RetryPolicy` overriding
+        `Configuration.retry_policy` for an operation, None if there is
+        none."""
+        overrides = self.configuration.retry_overrides
+        if not overrides:
+            return None
+        return overrides.get(method + ' ' + resource_path)
+
+    def flight_key(self, method, resource_path, url, query_params,
+                   header_params, preload_content=True, shape=None):
+        """Returns the key of a request that identical concurrent requests
+        may share through `Configuration.single_flight`, None if they may
+        not."""
+        flights = self.configuration.single_flight
+        if flights is None or method != 'GET' or not preload_content:
+            return None
+        return flights.key(method + ' ' + resource_path, url, query_params,
+                           header_params, shape)
+
+    def cache_ticket(self, method, resource_path, url, query_params,
+                     header_params, preload_content=True):
+        """Returns the `cache.Ticket` of a request whose response may come
+        from `Configuration.response_cache`, None if it may not."""
+        responses = self.configuration.response_cache
+        if responses is None or method != 'GET' or not preload_content:
+            return None
+        return responses.ticket(method + ' ' + resource_path, url,
+                                query_params, header_params)
+
+    def update_cache(self, method, url, ticket=None, response=None,
+                     stale=None):
+        """Caches the response of a request with a `cache_ticket`, or
+        invalidates the responses a write may have changed.
+
+        :param stale: the expired `cache.Entry` the request revalidated.
+        :return: `stale` if `response` says it did not change, in which
+            case it should be served with `handle_cached_response`.
+        """
+        responses = self.configuration.response_cache
+        if responses is None:
+            return None
+        if ticket is not None:
+            if response is not None:
+                return responses.put(ticket, response, stale)
+        elif method in ('POST', 'PUT', 'PATCH', 'DELETE'):
+            responses.invalidate(url)
+        return None
+
+    def handle_cached_response(self, entry, response_type=None,
+                               _return_http_data_only=None,
+                               _response_mode=None):
+        """Like `handle_response` for a revalidated `cache.Entry`, whose
+        body is only deserialized the first time it is served in a given
+        response mode."""
+        response_mode = _response_mode or self.configuration.response_mode
+        key = (response_type, response_mode)
+        try:
+            return_data = entry.values[key]
+        except KeyError:
+            return_data = entry.values[key] = self.handle_response(
+                entry.response, response_type, True, True, response_mode)
+        self.last_response = entry.response
+        if _return_http_data_only:
+            return (return_data)
+        else:
+            return (return_data, entry.response.status,
+                    entry.response.getheaders())
+
+    def circuit_breaker(self, method, resource_path, url):
+        """Returns the `circuit.CircuitBreaker` of a request, None without
+        `Configuration.circuit_breakers`."""
+        breakers = self.configuration.circuit_breakers
+        if breakers is None:
+            return None
+        if self.configuration.request_timeout is None:
+            breakers.warn_untimed()
+        return breakers.get(method + ' ' + resource_path, url)
 
+    def enter_circuit(self, breaker, method, resource_path, url,
+                      queued_at=None):
+        """Lets a request through `breaker`, or raises
+        `circuit.CircuitOpenError` after reporting it to the hooks.
+
+        :return: the `circuit.Permit` of the request.
+        """
+        try:
+            permit = breaker.before()
+        except circuit.CircuitOpenError as e:
+            self.request_failed(
+                self.start_request(method, resource_path, url, queued_at), e)
+            raise
+        if permit.changed:
+            self._call_hooks('on_circuit', breaker)
+        return permit
+
+    def leave_circuit(self, breaker, permit, error=None):
+        """Records the outcome of a request let through by
+        `enter_circuit` with `permit`."""
+        if breaker is None:
+            return
+        if error is None:
+            changed = breaker.success(permit)
+        elif isinstance(error, Exception) and limiter.overloaded(error):
+            changed = breaker.failure(permit)
+        else:
+            # cancelled, interrupted, or an error that is not the server's
+            breaker.cancel(permit)
+            return
+        if changed:
+            self._call_hooks('on_circuit', breaker)
+
+    def limiter(self, method, resource_path, files=None):
+        """Returns the `limiter.Limiter` of an operation from
+        `Configuration.limiters`, None if it is not limited."""
+        limiters = self.configuration.limiters
+        if not limiters:
+            return None
+        limit = limiters.get(method + ' ' + resource_path)
+        if limit is None:
+            limit = limiters.get(limiter.operation_group(method, files))
+        return limit
+
+    def prepare_request(self, resource_path, method, path_params=None,
+                        query_params=None, header_params=None, body=None,
+                        post_params=None, files=None, auth_settings=None,
+                        collection_formats=None):
+        """Builds the url, headers, params and body for a request.
+
+        Shared by the blocking client and `AsyncApiClient`, so both send
+        exactly the same request for the same call.
+
+        :return: tuple of (method, url, query_params, header_params,
+            post_params, body).
+        """
         config = self.configuration
 
         # header parameters
@@ -144,22 +508,46 @@ class ApiClient(object):
         # request url
         url = self.configuration.host + resource_path
 
-        # perform request and return response
-        response_data = self.request(
-            method, url, query_params=query_params, headers=header_params,
-            post_params=post_params, body=body,
-            _preload_content=_preload_content,
-            _request_timeout=_request_timeout)
-
+        return method, url, query_params, header_params, post_params, body
+
+    def handle_response(self, response_data, response_type=None,
+                        _return_http_data_only=None, _preload_content=True,
+                        _response_mode=None):
+        """Deserializes a response and shapes the value returned to callers.
+
+        :param response_data: RESTResponse object, or the raw transport
+            response when `_preload_content` is False.
+        :param response_type: class literal or string of class name.
+        :param _return_http_data_only: response data without head status
+            code and headers.
+        :param _preload_content: if False, the raw response is returned
+            without deserializing it.
+        :param _response_mode: `model` builds swagger models, `compact` the
+            slot-based models of `deep_lynx.compact`, `dict` returns the
+            decoded JSON untouched and `raw_bytes` the undecoded body.
+            Defaults to `Configuration.response_mode`.
+        """
         self.last_response = response_data
 
+        response_mode = _response_mode or self.configuration.response_mode
+        if response_mode not in self.RESPONSE_MODES:
+            raise ValueError(
+                "Invalid response mode `{0}`, must be one of {1}".format(
+                    response_mode, ', '.join(self.RESPONSE_MODES)))
+
         return_data = response_data
         if _preload_content:
             # deserialize response data
-            if response_type:
-                return_data = self.deserialize(response_data, response_type)
-            else:
+            if response_mode == 'raw_bytes':
+                return_data = response_data.data
+            elif not response_type:
                 return_data = None
+            elif response_mode == 'dict' and response_type != 'file':
+                return_data = self.decode(response_data)
+            else:
+                return_data = self.deserialize(
+                    response_data, response_type,
+                    compact=response_mode == 'compact')
 
         if _return_http_data_only:
             return (return_data)
@@ -177,44 +565,23 @@ class ApiClient(object):
         If obj is list, sanitize each element in the list.
         If obj is dict, return the dict.
         If obj is swagger model, return the properties dict.
+        Any other object is returned as is for the JSON codec to encode.
+
+        Uses the compiled encoders from `deep_lynx.serializer`; lists and
+        dicts that need no conversion are returned as they are.
 
         :param obj: The data to serialize.
         :return: The serialized form of data.
         """
-        if obj is None:
-            return None
-        elif isinstance(obj, self.PRIMITIVE_TYPES):
-            return obj
-        elif isinstance(obj, list):
-            return [self.sanitize_for_serialization(sub_obj)
-                    for sub_obj in obj]
-        elif isinstance(obj, tuple):
-            return tuple(self.sanitize_for_serialization(sub_obj)
-                         for sub_obj in obj)
-        elif isinstance(obj, (datetime.datetime, datetime.date)):
-            return obj.isoformat()
-
-        if isinstance(obj, dict):
-            obj_dict = obj
-        else:
-            # Convert model obj to dict except
-            # attributes `swagger_types`, `attribute_map`
-            # and attributes which value is not None.
-            # Convert attribute name to json key in
-            # model definition for request.
-            obj_dict = {obj.attribute_map[attr]: getattr(obj, attr)
-                        for attr, _ in six.iteritems(obj.swagger_types)
-                        if getattr(obj, attr) is not None}
-
-        return {key: self.sanitize_for_serialization(val)
-                for key, val in six.iteritems(obj_dict)}
-
-    def deserialize(self, response, response_type):
+        return serializer.serialize(obj)
+
+    def deserialize(self, response, response_type, compact=False):
         """Deserializes response into an object.
 
         :param response: RESTResponse object to be deserialized.
         :param response_type: class literal for
             deserialized object, or string of class name.
+        :param compact: build `deep_lynx.compact` models.
 
         :return: deserialized object.
         """
@@ -223,59 +590,40 @@ class ApiClient(object):
         if response_type == "file":
             return self.__deserialize_file(response)
 
-        # fetch data from response object
+        return self.__deserialize(self.decode(response), response_type,
+                                  compact)
+
+    def decode(self, response):
+        """Decodes the JSON body of a response without building models.
+
+        :param response: RESTResponse object.
+        :return: the decoded JSON, or the raw body if it is not JSON.
+        """
         try:
-            data = json.loads(response.data)
+            return self.configuration.json_codec.loads(response.data)
         except ValueError:
-            data = response.data
+            return response.data
 
-        return self.__deserialize(data, response_type)
-
-    def __deserialize(self, data, klass):
+    def __deserialize(self, data, klass, compact=False):
         """Deserializes dict, list, str into an object.
 
+        Uses the compiled, cached plans from `deep_lynx.deserializer`.
+
         :param data: dict, list or str.
         :param klass: class literal, or string of class name.
+        :param compact: build `deep_lynx.compact` models.
 
         :return: object.
         """
-        if data is None:
-            return None
-
-        if type(klass) == str:
-            if klass.startswith('list['):
-                sub_kls = re.match(r'list\[(.*)\]', klass).group(1)
-                return [self.__deserialize(sub_data, sub_kls)
-                        for sub_data in data]
-
-            if klass.startswith('dict('):
-                sub_kls = re.match(r'dict\(([^,]*), (.*)\)', klass).group(2)
-                return {k: self.__deserialize(v, sub_kls)
-                        for k, v in six.iteritems(data)}
-
-            # convert str to class
-            if klass in self.NATIVE_TYPES_MAPPING:
-                klass = self.NATIVE_TYPES_MAPPING[klass]
-            else:
-                klass = getattr(deep_lynx.models, klass)
-
-        if klass in self.PRIMITIVE_TYPES:
-            return self.__deserialize_primitive(data, klass)
-        elif klass == object:
-            return self.__deserialize_object(data)
-        elif klass == datetime.date:
-            return self.__deserialize_date(data)
-        elif klass == datetime.datetime:
-            return self.__deserialize_datatime(data)
-        else:
-            return self.__deserialize_model(data, klass)
+        return deserializer.deserialize(data, klass, compact)
 
     def call_api(self, resource_path, method,
                  path_params=None, query_params=None, header_params=None,
                  body=None, post_params=None, files=None,
                  response_type=None, auth_settings=None, async_req=None,
                  _return_http_data_only=None, collection_formats=None,
-                 _preload_content=True, _request_timeout=None):
+                 _preload_content=True, _request_timeout=None,
+                 _response_mode=None, _download_path=None):
         """Makes the HTTP request (synchronous) and returns deserialized data.
 
         To make an async request, set the async_req parameter.
@@ -305,10 +653,14 @@ class ApiClient(object):
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :param _response_mode: one of `RESPONSE_MODES`, overriding
+                               `Configuration.response_mode` for this call.
+        :param _download_path: file or directory to save file responses
+                               to, see `deep_lynx.download`.
         :return:
             If async_req parameter is True,
-            the request will be called asynchronously.
-            The method will return the request thread.
+            the request will be called asynchronously on the shared
+            executor. The method will return an `executor.ApiFuture`.
             If parameter async_req is False or missing,
             then the method will return the response directly.
         """
@@ -318,33 +670,40 @@ class ApiClient(object):
                                    body, post_params, files,
                                    response_type, auth_settings,
                                    _return_http_data_only, collection_formats,
-                                   _preload_content, _request_timeout)
+                                   _preload_content, _request_timeout,
+                                   _response_mode, _download_path)
         else:
-            thread = self.pool.apply_async(self.__call_api, (resource_path,
-                                           method, path_params, query_params,
-                                           header_params, body,
-                                           post_params, files,
-                                           response_type, auth_settings,
-                                           _return_http_data_only,
-                                           collection_formats,
-                                           _preload_content, _request_timeout))
+            thread = executor.submit(self.__call_api, resource_path,
+                                     method, path_params, query_params,
+                                     header_params, body,
+                                     post_params, files,
+                                     response_type, auth_settings,
+                                     _return_http_data_only,
+                                     collection_formats,
+                                     _preload_content, _request_timeout,
+                                     _response_mode, _download_path,
+                                     time.monotonic(),
+                                     max_workers=(self.configuration
+                                                  .executor_max_workers))
         return thread
 
     def request(self, method, url, query_params=None, headers=None,
                 post_params=None, body=None, _preload_content=True,
-                _request_timeout=None):
+                _request_timeout=None, _retry_policy=None):
         """Makes the HTTP request using RESTClient."""
         if method == "GET":
             return self.rest_client.GET(url,
                                         query_params=query_params,
                                         _preload_content=_preload_content,
                                         _request_timeout=_request_timeout,
+                                        _retry_policy=_retry_policy,
                                         headers=headers)
         elif method == "HEAD":
             return self.rest_client.HEAD(url,
                                          query_params=query_params,
                                          _preload_content=_preload_content,
                                          _request_timeout=_request_timeout,
+                                         _retry_policy=_retry_policy,
                                          headers=headers)
         elif method == "OPTIONS":
             return self.rest_client.OPTIONS(url,
@@ -353,6 +712,7 @@ class ApiClient(object):
                                             post_params=post_params,
                                             _preload_content=_preload_content,
                                             _request_timeout=_request_timeout,
+                                            _retry_policy=_retry_policy,
                                             body=body)
         elif method == "POST":
             return self.rest_client.POST(url,
@@ -361,6 +721,7 @@ class ApiClient(object):
                                          post_params=post_params,
                                          _preload_content=_preload_content,
                                          _request_timeout=_request_timeout,
+                                         _retry_policy=_retry_policy,
                                          body=body)
         elif method == "PUT":
             return self.rest_client.PUT(url,
@@ -369,6 +730,7 @@ class ApiClient(object):
                                         post_params=post_params,
                                         _preload_content=_preload_content,
                                         _request_timeout=_request_timeout,
+                                        _retry_policy=_retry_policy,
                                         body=body)
         elif method == "PATCH":
             return self.rest_client.PATCH(url,
@@ -377,6 +739,7 @@ class ApiClient(object):
                                           post_params=post_params,
                                           _preload_content=_preload_content,
                                           _request_timeout=_request_timeout,
+                                          _retry_policy=_retry_policy,
                                           body=body)
         elif method == "DELETE":
             return self.rest_client.DELETE(url,
@@ -384,6 +747,7 @@ class ApiClient(object):
                                            headers=headers,
                                            _preload_content=_preload_content,
                                            _request_timeout=_request_timeout,
+                                           _retry_policy=_retry_policy,
                                            body=body)
         else:
             raise ValueError(
@@ -424,8 +788,13 @@ class ApiClient(object):
     def prepare_post_parameters(self, post_params=None, files=None):
         """Builds form parameters.
 
+        Files are not read here: they are wrapped in
+        `multipart.UploadFile` and streamed in chunks when the request is
+        sent.
+
         :param post_params: Normal form parameters.
-        :param files: File parameters.
+        :param files: File parameters, file paths or
+            `multipart.UploadFile` instances.
         :return: Form parameters with files.
         """
         params = []
@@ -439,13 +808,10 @@ class ApiClient(object):
                     continue
                 file_names = v if type(v) is list else [v]
                 for n in file_names:
-                    with open(n, 'rb') as f:
-                        filename = os.path.basename(f.name)
-                        filedata = f.read()
-                        mimetype = (mimetypes.guess_type(filename)[0] or
-                                    'application/octet-stream')
-                        params.append(
-                            tuple([k, tuple([filename, filedata, mimetype])]))
+                    if not isinstance(n, multipart.UploadFile):
+                        n = multipart.UploadFile(n)
+                    params.append(
+                        tuple([k, tuple([n.filename, n, n.mimetype])]))
 
         return params
 
@@ -510,123 +876,11 @@ class ApiClient(object):
 
         Saves response body into a file in a temporary folder,
         using the filename from the `Content-Disposition` header if provided.
+        Streamed downloads are already on disk.
 
         :param response:  RESTResponse.
         :return: file path.
         """
-        fd, path = tempfile.mkstemp(dir=self.configuration.temp_folder_path)
-        os.close(fd)
-        os.remove(path)
-
-        content_disposition = response.getheader("Content-Disposition")
-        if content_disposition:
-            filename = re.search(r'filename=[\'"]?([^\'"\s]+)[\'"]?',
-                                 content_disposition).group(1)
-            path = os.path.join(os.path.dirname(path), filename)
-            response_data = response.data
-            with open(path, "wb") as f:
-                if isinstance(response_data, str):
-                    # change str to bytes so we can write it
-                    response_data = response_data.encode('utf-8')
-                    f.write(response_data)
-                else:
-                    f.write(response_data)
-        return path
-
-    def __deserialize_primitive(self, data, klass):
-        """Deserializes string to primitive type.
-
-        :param data: str.
-        :param klass: class literal.
-
-        :return: int, long, float, str, bool.
-        """
-        try:
-            return klass(data)
-        except UnicodeEncodeError:
-            return six.text_type(data)
-        except TypeError:
-            return data
-
-    def __deserialize_object(self, value):
-        """Return a original value.
-
-        :return: object.
-        """
-        return value
-
-    def __deserialize_date(self, string):
-        """Deserializes string to date.
-
-        :param string: str.
-        :return: date.
-        """
-        try:
-            from dateutil.parser import parse
-            return parse(string).date()
-        except ImportError:
-            return string
-        except ValueError:
-            raise rest.ApiException(
-                status=0,
-                reason="Failed to parse `{0}` as date object".format(string)
-            )
-
-    def __deserialize_datatime(self, string):
-        """Deserializes string to datetime.
-
-        The string should be in iso8601 datetime format.
-
-        :param string: str.
-        :return: datetime.
-        """
-        try:
-            from dateutil.parser import parse
-            return parse(string)
-        except ImportError:
-            return string
-        except ValueError:
-            raise rest.ApiException(
-                status=0,
-                reason=(
-                    "Failed to parse `{0}` as datetime object"
-                    .format(string)
-                )
-            )
-
-    def __hasattr(self, object, name):
-            return name in object.__class__.__dict__
-
-    def __deserialize_model(self, data, klass):
-        """Deserializes list or dict to model.
-
-        :param data: dict, list.
-        :param klass: class literal.
-        :return: model object.
-        """
-
-        if not klass.swagger_types and not self.__hasattr(klass, 'get_real_child_model'):
-            return data
-
-        kwargs = {}
-        if klass.swagger_types is not None:
-            for attr, attr_type in six.iteritems(klass.swagger_types):
-                if (data is not None and
-                        klass.attribute_map[attr] in data and
-                        isinstance(data, (list, dict))):
-                    value = data[klass.attribute_map[attr]]
-                    kwargs[attr] = self.__deserialize(value, attr_type)
-
-        instance = klass(**kwargs)
-
-        if (isinstance(instance, dict) and
-                klass.swagger_types is not None and
-                isinstance(data, dict)):
-            for key, value in data.items():
-                if key not in klass.swagger_types:
-                    instance[key] = value
-        if self.__hasattr(instance, 'get_real_child_model'):
-            klass_name = instance.get_real_child_model(data)
-            if klass_name:
-                instance = self.__deserialize(data, klass_name)
-        return instance
+        if isinstance(response, download.DownloadedResponse):
+            return response.path
+        return download.write_body(response, self.configuration)
@@ -0,0 +1,237 @@
+# coding: utf-8
+"""
+    DeepLynx
+
+    Hand-written methods of the generated API classes.
+
+    The modules of `deep_lynx.api` follow the swagger-codegen output: one
+    thin wrapper around `operations.call` per operation. Methods that
+    combine operations, such as iterating over a listing or upserting in
+    bulk, live here instead and reach the API classes as base classes::
+
+        class GraphApi(api_helpers.GraphApiHelpers):
+            ...
+
+    so the generated modules stay free of code that regenerating them
+    would lose, see the "Regenerating the client" section of the README.
+"""
+from __future__ import absolute_import
+
+import functools
+
+from deep_lynx import bulk
+from deep_lynx import keyset
+from deep_lynx import pagination
+from deep_lynx import scan
+
+
+class DataSourcesApiHelpers(object):
+    """Methods of `DataSourcesApi` built on its operations."""
+
+    def iter_imports_for_data_source(
+            self, container_id, data_source_id,
+            page_size=pagination.DEFAULT_PAGE_SIZE,
+            prefetch=pagination.DEFAULT_PREFETCH, **kwargs):
+        """Iterates over the imports of `list_imports_for_data_source`,
+        page by page.
+
+        The next `prefetch` pages are fetched while the current one is
+        read, see `deep_lynx.pagination`. Use ``async for`` with an
+        `AsyncApiClient`.
+        >>> for data_import in api.iter_imports_for_data_source(
+        ...         container_id, data_source_id):
+        ...     pass
+
+        :param str container_id: (required)
+        :param str data_source_id: (required)
+        :param int page_size: imports requested per page
+        :param int prefetch: pages requested ahead of the current one
+        :return: pagination.Pages
+        """
+        return pagination.Pages(
+            functools.partial(self.list_imports_for_data_source,
+                              container_id, data_source_id, **kwargs),
+            page_size, prefetch)
+
+
+class GraphApiHelpers(object):
+    """Methods of `GraphApi` built on its operations."""
+
+    def bulk_upsert_edges(self, container_id, records, index=None,
+                          resolve=True, origin=None, destination=None,
+                          chunk_records=bulk.DEFAULT_CHUNK_RECORDS,
+                          chunk_bytes=bulk.DEFAULT_CHUNK_BYTES,
+                          workers=bulk.DEFAULT_WORKERS):
+        """Creates or updates any number of edges through
+        `create_or_update_edges`, in concurrent chunks.
+
+        With an `index`, the origin and destination ids of the edges are
+        read from it, see `deep_lynx.node_index`; edges with an unknown
+        endpoint fail without being sent. Chunks the server rejects are
+        split until the failing edges are isolated, see `deep_lynx.bulk`.
+        Needs a blocking `ApiClient`.
+        >>> result = api.bulk_upsert_edges(container_id, records,
+        ...                                index=index)
+        >>> result.failed()
+
+        :param str container_id: (required)
+        :param records: iterable of edge dicts or
+            `CreateOrUpdateEdgesRequest` (required)
+        :param node_index.NodeIndex index: node ids of the endpoints
+        :param bool resolve: look up endpoints missing from `index` on the
+            server
+        :param origin: returns the index key of the origin of an edge
+        :param destination: returns the index key of the destination
+        :param int chunk_records: most edges per request
+        :param int chunk_bytes: most bytes of JSON per request
+        :param int workers: requests in flight at a time
+        :return: bulk.BulkResult
+        """
+        if index is not None:
+            records = index.edges(self.api_client, container_id, records,
+                                  origin, destination, resolve,
+                                  chunk_records)
+        return bulk.upsert(
+            self.api_client,
+            lambda chunk: self.create_or_update_edges(
+                chunk, container_id, _response_mode='dict'),
+            records, chunk_records, chunk_bytes, workers)
+
+    def bulk_upsert_nodes(self, container_id, records, index=None,
+                          chunk_records=bulk.DEFAULT_CHUNK_RECORDS,
+                          chunk_bytes=bulk.DEFAULT_CHUNK_BYTES,
+                          workers=bulk.DEFAULT_WORKERS):
+        """Creates or updates any number of nodes through
+        `create_or_update_nodes`, in concurrent chunks.
+
+        Chunks the server rejects are split until the failing nodes are
+        isolated, see `deep_lynx.bulk`. Needs a blocking `ApiClient`.
+        >>> result = api.bulk_upsert_nodes(container_id, records)
+        >>> result.failed()
+
+        :param str container_id: (required)
+        :param records: iterable of node dicts or
+            `CreateOrUpdateNodesRequest` (required)
+        :param node_index.NodeIndex index: adds the nodes written to it
+        :param int chunk_records: most nodes per request
+        :param int chunk_bytes: most bytes of JSON per request
+        :param int workers: requests in flight at a time
+        :return: bulk.BulkResult
+        """
+        return bulk.upsert(
+            self.api_client,
+            lambda chunk: self.create_or_update_nodes(
+                chunk, container_id, _response_mode='dict'),
+            records, chunk_records, chunk_bytes, workers,
+            index.add_node if index is not None else None)
+
+    def iter_edges(self, container_id, page_size=pagination.DEFAULT_PAGE_SIZE,
+                   prefetch=pagination.DEFAULT_PREFETCH, **kwargs):
+        """Iterates over the edges of `list_edges`, page by page.
+
+        The next `prefetch` pages are fetched while the current one is
+        read, see `deep_lynx.pagination`. Use ``async for`` with an
+        `AsyncApiClient`.
+        >>> for edge in api.iter_edges(container_id):
+        ...     pass
+
+        :param str container_id: (required)
+        :param str origin_id: Return only edges from this node
+        :param str destination_id: Return only edges to this node
+        :param str relationship_pair_id:
+        :param str relationship_pair_name:
+        :param bool history: Return historical data for all selected edges
+        :param int page_size: edges requested per page
+        :param int prefetch: pages requested ahead of the current one
+        :return: pagination.Pages
+        """
+        return pagination.Pages(
+            functools.partial(self.list_edges, container_id, **kwargs),
+            page_size, prefetch)
+
+    def iter_nodes(self, container_id, page_size=pagination.DEFAULT_PAGE_SIZE,
+                   prefetch=pagination.DEFAULT_PREFETCH, strategy='offset',
+                   **kwargs):
+        """Iterates over the nodes of `list_nodes`, page by page.
+
+        The next `prefetch` pages are fetched while the current one is
+        read, see `deep_lynx.pagination`. With a `metatype_id` and
+        ``strategy='auto'``, pages are read by id through GraphQL rather
+        than by offset, in nodes without some of their fields, see
+        `deep_lynx.keyset`. Use ``async for`` with an `AsyncApiClient`.
+        >>> for node in api.iter_nodes(container_id):
+        ...     pass
+
+        :param str container_id: (required)
+        :param str transformation_id: Return only nodes for the selected type transformation
+        :param str metatype_id: Return only nodes for the selected metatype
+        :param str data_source_id: Return only nodes for the selected datasource
+        :param bool history: Return historical data for all selected nodes
+        :param int page_size: nodes requested per page
+        :param int prefetch: offset pages requested ahead of the current one
+        :param str strategy: ``offset`` (default), ``auto`` or ``keyset``
+        :return: pagination.Pages or pagination.KeysetPages
+        """
+        return keyset.node_pages(
+            self.api_client, container_id,
+            pagination.Pages(
+                functools.partial(self.list_nodes, container_id, **kwargs),
+                page_size, prefetch),
+            strategy, **kwargs)
+
+    def iter_nodes_by_metatype_id(
+            self, container_id, metatype_id,
+            page_size=pagination.DEFAULT_PAGE_SIZE,
+            prefetch=pagination.DEFAULT_PREFETCH, strategy='offset',
+            **kwargs):
+        """Iterates over the nodes of `list_nodes_by_metatype_id`, page by
+        page.
+
+        The next `prefetch` pages are fetched while the current one is
+        read, see `deep_lynx.pagination`. With ``strategy='auto'``, pages
+        are read by id through GraphQL rather than by offset when the
+        server allows it, in nodes without some of their fields, see
+        `deep_lynx.keyset`. Use ``async for`` with an `AsyncApiClient`.
+        >>> for node in api.iter_nodes_by_metatype_id(container_id,
+        ...                                           metatype_id):
+        ...     pass
+
+        :param str container_id: (required)
+        :param str metatype_id: (required)
+        :param int page_size: nodes requested per page
+        :param int prefetch: offset pages requested ahead of the current one
+        :param str strategy: ``offset`` (default), ``auto`` or ``keyset``
+        :return: pagination.Pages or pagination.KeysetPages
+        """
+        return keyset.node_pages(
+            self.api_client, container_id,
+            pagination.Pages(
+                functools.partial(self.list_nodes_by_metatype_id,
+                                  container_id, metatype_id, **kwargs),
+                page_size, prefetch),
+            strategy, metatype_id=metatype_id, **kwargs)
+
+    def scan_nodes(self, container_id, by=('metatype',),
+                   workers=scan.DEFAULT_WORKERS, **kwargs):
+        """Reads the nodes of a container with concurrent workers, one
+        shard per metatype and/or data source.
+
+        Nodes come in no particular order, see `deep_lynx.scan`. Needs a
+        blocking `ApiClient`.
+        >>> nodes = api.scan_nodes(container_id, workers=16)
+        >>> for node in nodes:
+        ...     pass
+        >>> nodes.progress()
+
+        :param str container_id: (required)
+        :param tuple by: shard keys, ``'metatype'`` and/or ``'data_source'``
+        :param int workers: requests in flight at a time
+        :param int page_size: nodes requested per page
+        :param list shards: `list_nodes` filters of the shards to scan
+        :param on_progress: called with each `scan.Shard` after each of its
+            pages
+        :param bool history: Return historical data for all selected nodes
+        :return: scan.ParallelScan
+        """
+        return scan.ParallelScan(self.api_client, container_id, by=by,
+                                 workers=workers, **kwargs)
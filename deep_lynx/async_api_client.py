@@ -0,0 +1,194 @@
+# coding: utf-8
+"""
+    DeepLynx
+
+    asyncio flavour of `ApiClient`.
+"""
+from __future__ import absolute_import
+
+import time
+
+from deep_lynx.api_client import ApiClient
+from deep_lynx import async_rest
+from deep_lynx import cache
+from deep_lynx import download
+from deep_lynx import limiter
+from deep_lynx import rest
+
+
+class AsyncApiClient(ApiClient):
+    """API client whose calls are coroutines.
+
+    Every generated operation hands its request to `call_api`, so passing an
+    `AsyncApiClient` to any generated `*Api` class turns each of its methods
+    into an awaitable twin without any other change::
+
+        async with AsyncApiClient(configuration) as client:
+            nodes = await GraphApi(client).list_nodes(container_id)
+
+    Requests go through a single aiohttp session, so one event loop can keep
+    as many requests in flight as `Configuration.connection_pool_maxsize`
+    allows without a thread per request. `async_req` is accepted for
+    signature compatibility and ignored.
+
+    :param configuration: .Configuration object for this client
+    :param header_name: a header to pass when making calls to the API.
+    :param header_value: a header value to pass when making calls to
+        the API.
+    :param cookie: a cookie to include in the header when making calls
+        to the API
+    """
+
+    rest_client_class = async_rest.RESTClientObject
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Closes the HTTP session and releases pooled connections."""
+        await self.rest_client.close()
+
+    async def __call_api(
+            self, resource_path, method, path_params=None,
+            query_params=None, header_params=None, body=None, post_params=None,
+            files=None, response_type=None, auth_settings=None,
+            _return_http_data_only=None, collection_formats=None,
+            _preload_content=True, _request_timeout=None,
+            _response_mode=None, _download_path=None):
+
+        method, url, query_params, header_params, post_params, body = \
+            self.prepare_request(resource_path, method, path_params,
+                                 query_params, header_params, body,
+                                 post_params, files, auth_settings,
+                                 collection_formats)
+
+        key = self.flight_key(method, resource_path, url, query_params,
+                              header_params, _preload_content,
+                              (response_type, _return_http_data_only,
+                               _response_mode))
+        if key is not None:
+            return await self.configuration.single_flight.do_async(
+                key, lambda: self.__send(
+                    resource_path, method, url, query_params, header_params,
+                    body, post_params, files, response_type,
+                    _return_http_data_only, _preload_content,
+                    _request_timeout, _response_mode, _download_path))
+        return await self.__send(resource_path, method, url, query_params,
+                                 header_params, body, post_params, files,
+                                 response_type, _return_http_data_only,
+                                 _preload_content, _request_timeout,
+                                 _response_mode, _download_path)
+
+    async def __send(self, resource_path, method, url, query_params,
+                     header_params, body, post_params, files, response_type,
+                     _return_http_data_only, _preload_content,
+                     _request_timeout, _response_mode, _download_path):
+        stale = None
+        ticket = self.cache_ticket(method, resource_path, url, query_params,
+                                   header_params, _preload_content)
+        if ticket is not None:
+            cached = self.configuration.response_cache.get(ticket)
+            if cached is not None:
+                return self.handle_response(cached, response_type,
+                                            _return_http_data_only,
+                                            _preload_content, _response_mode)
+            stale = self.configuration.response_cache.stale(ticket)
+            if stale is not None:
+                # ask the server whether the expired response changed
+                header_params = dict(header_params,
+                                     **stale.conditional_headers())
+
+        breaker = self.circuit_breaker(method, resource_path, url)
+        permit = None
+        if breaker is not None:
+            permit = self.enter_circuit(breaker, method, resource_path, url)
+        limit = self.limiter(method, resource_path, files)
+        slot = await limit.acquire_async() if limit is not None else None
+        info = self.start_request(method, resource_path, url)
+        sent = time.monotonic()
+        try:
+            # perform request and return response
+            try:
+                response_data = await self.request(
+                    method, url, query_params=query_params,
+                    headers=header_params, post_params=post_params, body=body,
+                    _preload_content=_preload_content,
+                    _request_timeout=_request_timeout,
+                    _retry_policy=self.retry_policy(method, resource_path))
+            except rest.ApiException as e:
+                if stale is None or e.status != 304:
+                    raise
+                response_data = cache.NotModified(e)
+        except BaseException as e:
+            # cancelled requests give their slot back too
+            if limit is not None:
+                limit.release(slot, time.monotonic() - sent,
+                              limiter.overloaded(e))
+            self.leave_circuit(breaker, permit, e)
+            self.update_cache(method, url)
+            if isinstance(e, Exception):
+                self.request_failed(info, e)
+            raise
+        if limit is not None:
+            limit.release(slot, time.monotonic() - sent)
+        self.leave_circuit(breaker, permit)
+        entry = self.update_cache(method, url, ticket, response_data, stale)
+        self.request_done(info, response_data)
+        if entry is not None:
+            return self.handle_cached_response(entry, response_type,
+                                               _return_http_data_only,
+                                               _response_mode)
+
+        if (response_type == 'file' and _preload_content and
+                (_response_mode or self.configuration.response_mode)
+                != 'raw_bytes'):
+            response_data = download.DownloadedResponse(
+                response_data, download.write_body(
+                    response_data, self.configuration, _download_path))
+
+        return self.handle_response(response_data, response_type,
+                                    _return_http_data_only, _preload_content,
+                                    _response_mode)
+
+    def call_api(self, resource_path, method,
+                 path_params=None, query_params=None, header_params=None,
+                 body=None, post_params=None, files=None,
+                 response_type=None, auth_settings=None, async_req=None,
+                 _return_http_data_only=None, collection_formats=None,
+                 _preload_content=True, _request_timeout=None,
+                 _response_mode=None, _download_path=None):
+        """Makes the HTTP request and returns a coroutine.
+
+        Takes the same parameters as `ApiClient.call_api`; awaiting the
+        returned coroutine yields what the blocking client would return.
+        """
+        return self.__call_api(resource_path, method,
+                               path_params, query_params, header_params,
+                               body, post_params, files,
+                               response_type, auth_settings,
+                               _return_http_data_only, collection_formats,
+                               _preload_content, _request_timeout,
+                               _response_mode, _download_path)
+
+    async def request(self, method, url, query_params=None, headers=None,
+                      post_params=None, body=None, _preload_content=True,
+                      _request_timeout=None, _retry_policy=None):
+        """Makes the HTTP request using the asyncio RESTClient."""
+        if method not in ("GET", "HEAD", "OPTIONS", "POST", "PUT", "PATCH",
+                          "DELETE"):
+            raise ValueError(
+                "http method must be `GET`, `HEAD`, `OPTIONS`,"
+                " `POST`, `PATCH`, `PUT` or `DELETE`."
+            )
+        return await self.rest_client.request(
+            method, url,
+            query_params=query_params,
+            headers=headers,
+            post_params=post_params,
+            body=body,
+            _preload_content=_preload_content,
+            _request_timeout=_request_timeout,
+            _retry_policy=_retry_policy)
@@ -0,0 +1,376 @@
+# coding: utf-8
+
+"""
+    DeepLynx
+
+    Non-blocking REST transport used by `AsyncApiClient`. It mirrors
+    `deep_lynx.rest.RESTClientObject` request for request, but sends
+    everything through a shared aiohttp session so a single event loop can
+    keep many requests in flight.
+"""
+
+from __future__ import absolute_import
+
+import asyncio
+import io
+import logging
+import re
+import ssl
+
+import certifi
+from six.moves.urllib.parse import urlencode
+
+from deep_lynx import forksafe
+from deep_lynx import multipart
+from deep_lynx import retry
+from deep_lynx.rest import ApiException
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - exercised only without aiohttp
+    aiohttp = None
+
+
+logger = logging.getLogger(__name__)
+
+
+class RESTResponse(io.IOBase):
+
+    def __init__(self, resp, data):
+        self.aiohttp_response = resp
+        self.status = resp.status
+        self.reason = resp.reason
+        self.data = data
+        # size of the encoded request body, when known
+        self.request_bytes = None
+        # retries before this response, see `deep_lynx.retry`
+        self.retries = 0
+
+    def getheaders(self):
+        """Returns a dictionary of the response headers."""
+        return self.aiohttp_response.headers
+
+    def getheader(self, name, default=None):
+        """Returns a given response header."""
+        return self.aiohttp_response.headers.get(name, default)
+
+
+class RESTClientObject(object):
+
+    def __init__(self, configuration, pools_size=4, maxsize=None):
+        if aiohttp is None:
+            raise ImportError(
+                'AsyncApiClient requires aiohttp, install it with '
+                '`pip install aiohttp`.')
+
+        # maxsize is the number of requests to host that are allowed in
+        # parallel; unlike urllib3, aiohttp queues callers beyond it instead
+        # of opening throwaway connections.
+        if maxsize is None:
+            if configuration.connection_pool_maxsize is not None:
+                maxsize = configuration.connection_pool_maxsize
+            else:
+                maxsize = 4
+        self.maxsize = maxsize
+        self.configuration = configuration
+
+        # ca_certs
+        if configuration.ssl_ca_cert:
+            ca_certs = configuration.ssl_ca_cert
+        else:
+            # if not set certificate file, use Mozilla's root certificates.
+            ca_certs = certifi.where()
+
+        ssl_context = ssl.create_default_context(cafile=ca_certs)
+        if configuration.cert_file:
+            ssl_context.load_cert_chain(
+                configuration.cert_file, keyfile=configuration.key_file
+            )
+        if not configuration.verify_ssl:
+            ssl_context.check_hostname = False
+            ssl_context.verify_mode = ssl.CERT_NONE
+        elif configuration.assert_hostname is False:
+            ssl_context.check_hostname = False
+        self.ssl_context = ssl_context
+
+        self.proxy = configuration.proxy
+        self._session = None
+        # a forked child must not share the parent's connections
+        forksafe.register(self)
+
+    def _after_fork(self):
+        # the session belongs to an event loop of the parent; the next
+        # request opens another one
+        if self._session is not None:
+            self._session.detach()
+        self._session = None
+
+    @property
+    def pool_manager(self):
+        """The aiohttp session, created on first use.
+
+        aiohttp sessions bind to the running event loop, so the session
+        cannot be built in `__init__`, which may run outside of any loop.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.maxsize,
+                                             ssl=self.ssl_context)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def close(self):
+        """Closes the underlying session and its pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def request(self, method, url, query_params=None, headers=None,
+                      body=None, post_params=None, _preload_content=True,
+                      _request_timeout=None, _retry_policy=None):
+        """Execute request
+
+        :param method: http request method
+        :param url: http request url
+        :param query_params: query parameters in the url
+        :param headers: http request headers
+        :param body: request json body, for `application/json`
+        :param post_params: request post parameters,
+                            `application/x-www-form-urlencoded`
+                            and `multipart/form-data`
+        :param _preload_content: if False, the aiohttp.ClientResponse object
+                                 will be returned without reading/decoding
+                                 response data. Default is True.
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :param _retry_policy: `retry.RetryPolicy` of this request, defaults
+                              to `Configuration.retry_policy`; None there
+                              disables retries.
+        """
+        method = method.upper()
+        assert method in ['GET', 'HEAD', 'DELETE', 'POST', 'PUT',
+                          'PATCH', 'OPTIONS']
+
+        if post_params and body:
+            raise ValueError(
+                "body parameter cannot be used with post_params parameter."
+            )
+
+        post_params = post_params or {}
+        headers = headers or {}
+
+        if _request_timeout is None:
+            _request_timeout = self.configuration.request_timeout
+        timeout = None
+        if _request_timeout:
+            if isinstance(_request_timeout, (int, float)):
+                timeout = aiohttp.ClientTimeout(total=_request_timeout)
+            elif (isinstance(_request_timeout, tuple) and
+                  len(_request_timeout) == 2):
+                timeout = aiohttp.ClientTimeout(
+                    sock_connect=_request_timeout[0],
+                    sock_read=_request_timeout[1])
+
+        if 'Content-Type' not in headers:
+            headers['Content-Type'] = 'application/json'
+
+        # query parameters are encoded exactly like the blocking client does
+        if query_params:
+            url += '?' + urlencode(query_params)
+
+        policy = _retry_policy or self.configuration.retry_policy
+        attempts = (policy or retry.RetryPolicy(total=0)).start(method)
+        while True:
+            attempt_timeout = timeout
+            remaining = attempts.remaining()
+            if attempt_timeout is None and remaining is not None:
+                attempt_timeout = aiohttp.ClientTimeout(total=remaining)
+            # form data cannot be sent twice, so the body is built again for
+            # every attempt
+            args, request_bytes = self._request_args(
+                method, url, dict(headers), body, post_params,
+                attempt_timeout)
+            try:
+                r = await self.pool_manager.request(**args)
+            except aiohttp.ClientSSLError as e:
+                msg = "{0}\n{1}".format(type(e).__name__, str(e))
+                raise ApiException(status=0, reason=msg)
+            except (aiohttp.ClientConnectionError,
+                    asyncio.TimeoutError) as e:
+                delay = attempts.retry_error(connected=not isinstance(
+                    e, aiohttp.ClientConnectorError))
+                if delay is None:
+                    e.retries = attempts.retries
+                    raise
+                logger.debug("retrying %s %s in %.2fs after %s", method, url,
+                             delay, e)
+            else:
+                delay = attempts.retry_response(r.status, r.headers)
+                if delay is None:
+                    break
+                r.release()
+                logger.debug("retrying %s %s in %.2fs after status %d",
+                             method, url, delay, r.status)
+            await asyncio.sleep(delay)
+
+        if _preload_content or not 200 <= r.status <= 299:
+            try:
+                data = await r.read()
+            finally:
+                r.release()
+            r = RESTResponse(r, data)
+            r.request_bytes = request_bytes
+            r.retries = attempts.retries
+
+            # log response body
+            logger.debug("response body: %s", r.data)
+
+        if not 200 <= r.status <= 299:
+            error = ApiException(http_resp=r)
+            error.retries = attempts.retries
+            raise error
+
+        return r
+
+    def _request_args(self, method, url, headers, body, post_params,
+                      timeout):
+        """Builds the arguments of one attempt of `request`.
+
+        :return: tuple of the keyword arguments of
+            `aiohttp.ClientSession.request` and the size of the encoded
+            request body, None when unknown.
+        """
+        args = {
+            "method": method,
+            "url": url,
+            "headers": headers,
+            "proxy": self.proxy,
+        }
+        if timeout is not None:
+            args["timeout"] = timeout
+
+        request_bytes = None
+        # For `POST`, `PUT`, `PATCH`, `OPTIONS`, `DELETE`
+        if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
+            if re.search('json', headers['Content-Type'], re.IGNORECASE):
+                request_body = b'{}'
+                if body is not None:
+                    request_body = self.configuration.json_codec.dumps(body)
+                args["data"] = request_body
+                request_bytes = len(request_body)
+            elif headers['Content-Type'] == 'application/x-www-form-urlencoded':  # noqa: E501
+                args["data"] = aiohttp.FormData(post_params)
+            elif headers['Content-Type'] == 'multipart/form-data':
+                # must del headers['Content-Type'], or the correct
+                # Content-Type which generated by aiohttp will be
+                # overwritten.
+                del headers['Content-Type']
+                data = aiohttp.FormData()
+                for param in post_params:
+                    k, v = param
+                    if isinstance(v, tuple) and len(v) == 3:
+                        value = v[1]
+                        if isinstance(value, multipart.UploadFile):
+                            # aiohttp streams file objects in chunks
+                            value = value.open()
+                        data.add_field(k,
+                                       value=value,
+                                       filename=v[0],
+                                       content_type=v[2])
+                    else:
+                        data.add_field(k, v)
+                args["data"] = data
+            # Pass a `bytes` or `string` parameter directly in the body to
+            # support other content types than Json when `body` argument is
+            # provided in serialized form
+            elif isinstance(body, (str, bytes)):
+                args["data"] = body
+                request_bytes = len(body if isinstance(body, bytes)
+                                    else body.encode('utf-8'))
+            else:
+                # Cannot generate the request from given parameters
+                msg = """Cannot prepare a request message for provided
+                         arguments. Please check that your arguments match
+                         declared content type."""
+                raise ApiException(status=0, reason=msg)
+        return args, request_bytes
+
+    async def GET(self, url, headers=None, query_params=None,
+                  _preload_content=True, _request_timeout=None,
+                  _retry_policy=None):
+        return (await self.request("GET", url,
+                                   headers=headers,
+                                   _preload_content=_preload_content,
+                                   _request_timeout=_request_timeout,
+                                   _retry_policy=_retry_policy,
+                                   query_params=query_params))
+
+    async def HEAD(self, url, headers=None, query_params=None,
+                   _preload_content=True, _request_timeout=None,
+                   _retry_policy=None):
+        return (await self.request("HEAD", url,
+                                   headers=headers,
+                                   _preload_content=_preload_content,
+                                   _request_timeout=_request_timeout,
+                                   _retry_policy=_retry_policy,
+                                   query_params=query_params))
+
+    async def OPTIONS(self, url, headers=None, query_params=None,
+                      post_params=None, body=None, _preload_content=True,
+                      _request_timeout=None, _retry_policy=None):
+        return (await self.request("OPTIONS", url,
+                                   headers=headers,
+                                   query_params=query_params,
+                                   post_params=post_params,
+                                   _preload_content=_preload_content,
+                                   _request_timeout=_request_timeout,
+                                   _retry_policy=_retry_policy,
+                                   body=body))
+
+    async def DELETE(self, url, headers=None, query_params=None, body=None,
+                     _preload_content=True, _request_timeout=None,
+                     _retry_policy=None):
+        return (await self.request("DELETE", url,
+                                   headers=headers,
+                                   query_params=query_params,
+                                   _preload_content=_preload_content,
+                                   _request_timeout=_request_timeout,
+                                   _retry_policy=_retry_policy,
+                                   body=body))
+
+    async def POST(self, url, headers=None, query_params=None,
+                   post_params=None, body=None, _preload_content=True,
+                   _request_timeout=None, _retry_policy=None):
+        return (await self.request("POST", url,
+                                   headers=headers,
+                                   query_params=query_params,
+                                   post_params=post_params,
+                                   _preload_content=_preload_content,
+                                   _request_timeout=_request_timeout,
+                                   _retry_policy=_retry_policy,
+                                   body=body))
+
+    async def PUT(self, url, headers=None, query_params=None,
+                  post_params=None, body=None, _preload_content=True,
+                  _request_timeout=None, _retry_policy=None):
+        return (await self.request("PUT", url,
+                                   headers=headers,
+                                   query_params=query_params,
+                                   post_params=post_params,
+                                   _preload_content=_preload_content,
+                                   _request_timeout=_request_timeout,
+                                   _retry_policy=_retry_policy,
+                                   body=body))
+
+    async def PATCH(self, url, headers=None, query_params=None,
+                    post_params=None, body=None, _preload_content=True,
+                    _request_timeout=None, _retry_policy=None):
+        return (await self.request("PATCH", url,
+                                   headers=headers,
+                                   query_params=query_params,
+                                   post_params=post_params,
+                                   _preload_content=_preload_content,
+                                   _request_timeout=_request_timeout,
+                                   _retry_policy=_retry_policy,
+                                   body=body))
@@ -0,0 +1,359 @@
+# coding: utf-8
+"""
+    DeepLynx
+
+    OAuth token management.
+
+    DeepLynx hands out bearer tokens for an API key and secret, valid for
+    the expiry requested with ``x-api-expiry``. A `TokenManager` set as
+    `Configuration.refresh_api_key_hook` fetches the token on the first
+    request, sends it as the ``Authorization`` header of every operation
+    and replaces it before it lapses::
+
+        config.refresh_api_key_hook = TokenManager.shared(key, secret)
+
+    A daemon thread refreshes the token `refresh_margin` seconds before it
+    expires, so requests never wait for it after the first one. If that
+    refresh fails it is tried again until the token expires; only then do
+    requests fetch a token themselves. With ``background=False`` the
+    request that finds the token about to expire refreshes it instead. A
+    forked child keeps the token and starts a refresh thread of its own.
+
+    `TokenManager.shared` returns one manager per API key and expiry, so
+    every client of the process uses the same token. With `cache_path`
+    the token is also kept in a file, locked while it is read or
+    refreshed, so that short command line runs and worker processes reuse
+    a token fetched by another process instead of authenticating again.
+    The file is only readable by its owner. Locking relies on `fcntl` and
+    is skipped where it is not available.
+
+    The expiry of a token is read from its ``exp`` claim when it is a JWT,
+    and derived from the expiry requested otherwise.
+"""
+from __future__ import absolute_import
+
+import base64
+import copy
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+from deep_lynx import forksafe
+from deep_lynx.api.authentication_api import AuthenticationApi
+from deep_lynx.api_client import ApiClient
+
+logger = logging.getLogger(__name__)
+
+# name of the security scheme of the generated operations
+AUTH_SETTING = 'BearerAuth'
+
+_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+_DURATION = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*([smhdw]?)\s*$')
+
+
+def parse_expiry(expiry):
+    """Returns the seconds of an ``x-api-expiry`` such as '1h' or '30m',
+    None if it cannot be parsed."""
+    match = _DURATION.match(str(expiry or ''))
+    if match is None:
+        return None
+    return float(match.group(1)) * _UNITS[match.group(2) or 's']
+
+
+def jwt_expiry(token):
+    """Returns the ``exp`` claim of a JWT, None if `token` is not one."""
+    parts = token.split('.') if isinstance(token, str) else ()
+    if len(parts) != 3:
+        return None
+    payload = parts[1] + '=' * (-len(parts[1]) % 4)
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        return float(claims['exp'])
+    except (ValueError, TypeError, KeyError):
+        return None
+
+
+class Token(object):
+    """A bearer token and the epoch time it expires at."""
+
+    __slots__ = ('value', 'expires')
+
+    def __init__(self, value, expires):
+        self.value = value
+        self.expires = expires
+
+    def valid(self, margin=0.0, now=None):
+        """Returns whether the token is still valid `margin` seconds from
+        now."""
+        return (now or time.time()) + margin < self.expires
+
+
+class TokenManager(object):
+    """Fetches, shares and refreshes the bearer token of an API key.
+
+    Pass it as `Configuration.refresh_api_key_hook`; it is called with the
+    configuration of every request and sets its ``BearerAuth`` API key.
+
+    :param api_key: the DeepLynx API key.
+    :param api_secret: its secret.
+    :param expiry: lifetime requested for each token, as ``x-api-expiry``.
+    :param refresh_margin: seconds before expiry a token is replaced, at
+        most half its lifetime.
+    :param cache_path: file tokens are shared through between processes,
+        None keeps them in memory.
+    :param background: refresh tokens from a daemon thread.
+    :param fetch: callable taking a configuration and returning a new
+        token, by default `AuthenticationApi.retrieve_o_auth_token`.
+    """
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, api_key, api_secret, expiry='1h', refresh_margin=300.0,
+                 cache_path=None, background=True, fetch=None):
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.expiry = expiry
+        lifetime = parse_expiry(expiry)
+        # short lived tokens are replaced half way through
+        self.refresh_margin = (min(refresh_margin, lifetime / 2.0)
+                               if lifetime else refresh_margin)
+        self.cache_path = (os.path.expanduser(cache_path) if cache_path
+                           else None)
+        self.background = background
+        self._fetch = fetch or self._retrieve
+        self._token = None
+        self._configuration = None
+        self._client = None
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._thread = None
+        self.refreshes = 0
+        forksafe.register(self)
+
+    def __reduce__(self):
+        # a copy in another process shares the token through `cache_path`
+        fetch = self._fetch if self._fetch != self._retrieve else None
+        return _shared, (self.api_key, self.api_secret, self.expiry, {
+            'refresh_margin': self.refresh_margin,
+            'cache_path': self.cache_path, 'background': self.background,
+            'fetch': fetch})
+
+    def _after_fork(self):
+        # the refresh thread of the parent does not exist in the child, the
+        # next request starts another one
+        closed = self.closed
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        if closed:
+            self._closed.set()
+        self._thread = None
+
+    @classmethod
+    def shared(cls, api_key, api_secret, expiry='1h', **kwargs):
+        """Returns the manager of `api_key` and `expiry` in this process,
+        creating it with `kwargs` on first use."""
+        key = (api_key, expiry)
+        with cls._shared_lock:
+            manager = cls._shared.get(key)
+            if manager is None or manager.closed:
+                manager = cls._shared[key] = cls(api_key, api_secret, expiry,
+                                                 **kwargs)
+            return manager
+
+    @property
+    def closed(self):
+        return self._closed.is_set()
+
+    def __call__(self, configuration):
+        value = self.token(configuration)
+        if configuration.api_key.get(AUTH_SETTING) != value:
+            # the dicts may be shared with copies of the default
+            # configuration
+            configuration.api_key = dict(configuration.api_key,
+                                         **{AUTH_SETTING: value})
+            configuration.api_key_prefix = dict(
+                configuration.api_key_prefix, **{AUTH_SETTING: 'Bearer'})
+
+    def token(self, configuration=None):
+        """Returns a valid token, fetching one if needed.
+
+        :param configuration: configuration of the server to authenticate
+            with; the first one given is used for background refreshes.
+        """
+        if self._configuration is None and configuration is not None:
+            self._configuration = configuration
+        token = self._token
+        margin = 0.0 if self.background else self.refresh_margin
+        if token is None or not token.valid(margin):
+            with self._lock:
+                token = self._token
+                if token is None or not token.valid(margin):
+                    token = self._refresh()
+        if self.background and self._thread is None and not self.closed:
+            self._start()
+        return token.value
+
+    def invalidate(self):
+        """Drops the current token, e.g. after the server rejected it."""
+        with self._lock:
+            self._token = None
+
+    def close(self):
+        """Stops background refreshes."""
+        self._closed.set()
+
+    def _refresh(self):
+        if self.cache_path is None:
+            token = self._new_token()
+        else:
+            with self._file_lock():
+                # another process may have refreshed it already
+                token = self._read_cache()
+                if token is None or not token.valid(self.refresh_margin):
+                    token = self._new_token()
+                    self._write_cache(token)
+        self._token = token
+        return token
+
+    def _new_token(self):
+        if self._configuration is None:
+            raise ValueError("No configuration to authenticate with")
+        now = time.time()
+        value = self._fetch(self._configuration)
+        expires = jwt_expiry(value)
+        if expires is None:
+            expires = now + (parse_expiry(self.expiry) or 3600.0)
+        self.refreshes += 1
+        return Token(value, expires)
+
+    def _retrieve(self, configuration):
+        if self._client is None:
+            configuration = copy.copy(configuration)
+            # the token request must not wait for a token itself
+            configuration.refresh_api_key_hook = None
+            configuration.api_key = {}
+            configuration.api_key_prefix = {}
+            configuration.response_cache = None
+            configuration.single_flight = None
+            self._client = ApiClient(configuration)
+        return AuthenticationApi(self._client).retrieve_o_auth_token(
+            self.api_key, self.api_secret, x_api_expiry=self.expiry)
+
+    def _start(self):
+        with self._lock:
+            if self._thread is not None or self.closed:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name='deep-lynx-token-refresh')
+            self._thread.daemon = True
+            self._thread.start()
+
+    def _run(self):
+        delay = None
+        while True:
+            token = self._token
+            if delay is None:
+                delay = (token.expires - self.refresh_margin - time.time()
+                         if token is not None else 0.0)
+            if self._closed.wait(max(delay, 0.0)):
+                return
+            try:
+                with self._lock:
+                    self._refresh()
+                delay = None
+            except Exception:
+                token = self._token
+                remaining = (token.expires - time.time()
+                             if token is not None else 0.0)
+                # try again a few times before the token lapses
+                delay = min(max(remaining / 4.0, 1.0), 60.0)
+                logger.warning("Token refresh failed, retrying in %.0fs",
+                               delay, exc_info=True)
+
+    def _cache_key(self):
+        host = (self._configuration.host
+                if self._configuration is not None else '')
+        return hashlib.sha256('\n'.join(
+            [host, self.api_key or '', str(self.expiry)]).encode(
+                'utf-8')).hexdigest()
+
+    def _file_lock(self):
+        return _FileLock(self.cache_path + '.lock')
+
+    def _read_cache(self):
+        try:
+            with open(self.cache_path) as f:
+                entry = json.load(f).get(self._cache_key())
+        except (IOError, OSError, ValueError, AttributeError):
+            return None
+        if not isinstance(entry, dict):
+            return None
+        try:
+            return Token(entry['token'], float(entry['expires']))
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def _write_cache(self, token):
+        try:
+            with open(self.cache_path) as f:
+                entries = json.load(f)
+            if not isinstance(entries, dict):
+                entries = {}
+        except (IOError, OSError, ValueError):
+            entries = {}
+        now = time.time()
+        entries = {key: entry for key, entry in entries.items()
+                   if isinstance(entry, dict) and
+                   entry.get('expires', 0) > now}
+        entries[self._cache_key()] = {'token': token.value,
+                                      'expires': token.expires}
+        directory = os.path.dirname(os.path.abspath(self.cache_path))
+        fd, path = tempfile.mkstemp(dir=directory, prefix='.deep_lynx_token')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entries, f)
+            os.chmod(path, 0o600)
+            os.replace(path, self.cache_path)
+        except BaseException:
+            os.unlink(path)
+            raise
+
+
+def _shared(api_key, api_secret, expiry, kwargs):
+    return TokenManager.shared(api_key, api_secret, expiry, **kwargs)
+
+
+@forksafe.at_fork
+def _after_fork():
+    TokenManager._shared_lock = threading.Lock()
+
+
+class _FileLock(object):
+    """Exclusive lock on a file, held across processes."""
+
+    def __init__(self, path):
+        self.path = path
+        self._fd = None
+
+    def __enter__(self):
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        os.close(self._fd)
+        self._fd = None
@@ -0,0 +1,272 @@
+# coding: utf-8
+"""
+    DeepLynx
+
+    Chunked, concurrent bulk upserts.
+
+    `GraphApi.create_or_update_nodes` sends one body, and a single invalid
+    node fails the whole request without saying which. `upsert` streams
+    any iterable of records instead::
+
+        result = GraphApi(client).bulk_upsert_nodes(container_id, records)
+        for index, node_id, error in result.table():
+            ...
+
+    Records are read one at a time and grouped into chunks of at most
+    `chunk_records` records and `chunk_bytes` bytes of JSON; a record
+    larger than `chunk_bytes` goes alone. Up to `workers` chunks are sent
+    at a time on the shared executor, and no more records are read while
+    that many are in flight, so memory stays bounded however long the
+    iterable.
+
+    When the server rejects a chunk, the chunk is split in two and each
+    half sent again, until the records that fail are isolated; the others
+    are still written. Errors that do not depend on the records, such as
+    authentication, rate limiting, an overloaded gateway, an open circuit
+    or a connection error, fail the whole chunk without splitting it.
+
+    The ids of the upserted objects are matched to the records by
+    ``(metatype_id, original_data_id)`` when every record of the chunk has
+    both, since the server may reorder or merge records with the same key.
+    Other records are matched by position, which needs as many objects as
+    records; a response of another length fails the chunk.
+
+    The result keeps, per input index, the id assigned or a short error
+    message; records stay with the caller. An `on_upsert` callback sees
+    every record written with its id, to fill a
+    `deep_lynx.node_index.NodeIndex` for instance. A `Rejected` record in
+    the iterable is reported as failed without being sent.
+"""
+from __future__ import absolute_import
+
+import asyncio
+import concurrent.futures
+
+from deep_lynx import executor
+from deep_lynx.rest import ApiException
+
+DEFAULT_CHUNK_RECORDS = 1000
+DEFAULT_CHUNK_BYTES = 4 * 1024 * 1024
+DEFAULT_WORKERS = 4
+
+# statuses that say nothing about the records of a chunk; splitting an
+# overloaded server's chunk would only multiply the requests it gets, and
+# an open circuit (`circuit.CircuitOpenError`) has status 0
+_NOT_SPLIT = frozenset([0, 401, 403, 404, 407, 408, 429, 502, 503, 504])
+
+# longest error message kept per record
+_MESSAGE_SIZE = 500
+
+# fields that identify the object upserted from a record
+_KEY_FIELDS = ('metatype_id', 'original_data_id')
+
+
+class BulkResult(object):
+    """Outcome of a bulk upsert by input index.
+
+    :ivar ids: id assigned to the record at each index, None when it
+        failed.
+    :ivar errors: error message by index of the records that failed.
+    """
+
+    __slots__ = ('ids', 'errors')
+
+    def __init__(self):
+        self.ids = []
+        self.errors = {}
+
+    def __repr__(self):
+        return "BulkResult({0} records, {1} failed)".format(
+            len(self.ids), len(self.errors))
+
+    def __len__(self):
+        return len(self.ids)
+
+    @property
+    def ok(self):
+        """Whether every record was upserted."""
+        return not self.errors
+
+    def failed(self):
+        """Returns the indexes of the records that failed, in order."""
+        return sorted(self.errors)
+
+    def table(self):
+        """Returns ``(index, id, error)`` for every record."""
+        return [(index, object_id, self.errors.get(index))
+                for index, object_id in enumerate(self.ids)]
+
+
+class Rejected(object):
+    """Placeholder for a record that cannot be sent, failing its index
+    with `message`."""
+
+    __slots__ = ('message',)
+
+    def __init__(self, message):
+        self.message = message
+
+    def __repr__(self):
+        return "Rejected({0!r})".format(self.message)
+
+
+def describe(error):
+    """Returns the message recorded for a failed record."""
+    if isinstance(error, ApiException):
+        message = "({0}) {1}".format(error.status, error.reason)
+        body = error.body
+        if isinstance(body, bytes):
+            body = body.decode('utf-8', 'replace')
+        if body:
+            message += ": " + body
+    else:
+        message = "{0}: {1}".format(type(error).__name__, error)
+    return message[:_MESSAGE_SIZE]
+
+
+def chunks(api_client, records, result, chunk_records=DEFAULT_CHUNK_RECORDS,
+           chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """Yields ``(indexes, records)`` for chunks of the records, their
+    records serialized; adds every record to `result`, failing the
+    `Rejected` ones.
+
+    :param api_client: client whose serialization and JSON codec are used.
+    """
+    codec = api_client.configuration.json_codec
+    indexes, chunk, size = [], [], 2
+    for index, record in enumerate(records):
+        result.ids.append(None)
+        if isinstance(record, Rejected):
+            result.errors[index] = record.message[:_MESSAGE_SIZE]
+            continue
+        record = api_client.sanitize_for_serialization(record)
+        # and the comma before it
+        record_size = len(codec.dumps(record)) + 1
+        if chunk and (len(chunk) >= chunk_records or
+                      size + record_size > chunk_bytes):
+            yield indexes, chunk
+            indexes, chunk, size = [], [], 2
+        indexes.append(index)
+        chunk.append(record)
+        size += record_size
+    if chunk:
+        yield indexes, chunk
+
+
+def upsert(api_client, send, records, chunk_records=DEFAULT_CHUNK_RECORDS,
+           chunk_bytes=DEFAULT_CHUNK_BYTES, workers=DEFAULT_WORKERS,
+           on_upsert=None):
+    """Upserts records in chunks, see the module documentation.
+
+    :param api_client: blocking `ApiClient` the records are sent with.
+    :param send: callable taking a list of records and returning the
+        decoded JSON response of the upsert.
+    :param records: iterable of records, dicts or models.
+    :param chunk_records: most records per request.
+    :param chunk_bytes: most bytes of JSON per request.
+    :param workers: requests in flight at a time.
+    :param on_upsert: called with every record written, serialized, and
+        its id, from the worker threads.
+    :return: BulkResult
+    """
+    if chunk_records < 1 or chunk_bytes < 1 or workers < 1:
+        raise ValueError("chunk_records, chunk_bytes and workers must be "
+                         "positive")
+    result = BulkResult()
+    pending = set()
+    try:
+        for indexes, chunk in chunks(api_client, records, result,
+                                     chunk_records, chunk_bytes):
+            while len(pending) >= workers:
+                done, pending = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                _raise(done)
+            pending.add(executor.submit(_upsert, send, result, indexes,
+                                        chunk, on_upsert))
+    finally:
+        # chunks already sent are finished either way
+        done = concurrent.futures.wait(pending).done
+    _raise(done)
+    return result
+
+
+def _raise(futures):
+    # record errors are in the result; anything else is the caller's
+    for future in futures:
+        future.result()
+
+
+def _send(send, chunk):
+    response = send(chunk)
+    if asyncio.iscoroutine(response):
+        response.close()
+        raise TypeError("Bulk upserts need a blocking ApiClient")
+    return response
+
+
+def _upsert(send, result, indexes, chunk, on_upsert):
+    try:
+        response = _send(send, chunk)
+        if isinstance(response, dict) and response.get('isError'):
+            raise ValueError(response.get('error') or "isError")
+    except (ApiException, ValueError) as e:
+        if len(chunk) > 1 and getattr(e, 'status', None) not in _NOT_SPLIT:
+            middle = len(chunk) // 2
+            _upsert(send, result, indexes[:middle], chunk[:middle],
+                    on_upsert)
+            _upsert(send, result, indexes[middle:], chunk[middle:],
+                    on_upsert)
+            return
+        _fail(result, indexes, e)
+        return
+    except TypeError:
+        raise
+    except Exception as e:
+        _fail(result, indexes, e)
+        return
+    objects = (response or {}).get('value') or []
+    ids = _match(chunk, objects)
+    if ids is None:
+        _fail(result, indexes, ValueError(
+            "{0} objects returned for {1} records".format(len(objects),
+                                                         len(chunk))))
+        return
+    for offset, index in enumerate(indexes):
+        if ids[offset] is not None:
+            result.ids[index] = ids[offset]
+            if on_upsert is not None:
+                on_upsert(chunk[offset], result.ids[index])
+        else:
+            result.errors[index] = "No object returned"
+
+
+def _key(record):
+    if not isinstance(record, dict):
+        return None
+    key = tuple(record.get(field) for field in _KEY_FIELDS)
+    if None in key:
+        return None
+    return tuple(str(part) for part in key)
+
+
+def _match(chunk, objects):
+    # the id upserted for every record of a chunk, None when the objects
+    # cannot be told apart
+    keys = [_key(record) for record in chunk]
+    if None not in keys:
+        ids = {}
+        for upserted in objects:
+            key = _key(upserted)
+            if key is not None and upserted.get('id') is not None:
+                ids[key] = upserted['id']
+        return [ids.get(key) for key in keys]
+    if len(objects) != len(chunk):
+        return None
+    return [upserted.get('id') if isinstance(upserted, dict) else None
+            for upserted in objects]
+
+
+def _fail(result, indexes, error):
+    message = describe(error)
+    for index in indexes:
+        result.errors[index] = message
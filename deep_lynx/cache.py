@@ -0,0 +1,343 @@
+# coding: utf-8
+"""
+    DeepLynx
+
+    Response cache for read-mostly endpoints.
+
+    Ontologies (metatypes, their keys, relationships and relationship
+    pairs) and containers are read over and over by pipelines but rarely
+    change. With `Configuration.response_cache` set to a `ResponseCache`,
+    `ApiClient` serves repeated GETs of the selected operations from memory
+    instead of asking the server again::
+
+        config.response_cache = ResponseCache(ONTOLOGY_OPERATIONS, ttl=300)
+
+    Responses are kept for `ttl` seconds, and at most `maxsize` of them,
+    evicting the least recently used first. They are keyed on the url,
+    query string and request headers, so clients authenticated as
+    different users never share entries. Headers are only kept as a hash.
+
+    Any POST, PUT, PATCH or DELETE sent through the client drops the
+    cached responses of the container it writes to, e.g. updating a
+    metatype of container 7 invalidates everything cached under
+    ``/containers/7``. Writes to a container itself also invalidate the
+    container listing. Writes made by other clients or processes are only
+    seen once entries expire.
+
+    Cached responses are deserialized again on every hit, so callers can
+    modify the models they get without affecting the cache. `stats`
+    reports hits and misses.
+
+    Expired responses are revalidated rather than fetched again: the
+    request carries ``If-None-Match`` and ``If-Modified-Since`` built from
+    the ``ETag`` and ``Last-Modified`` headers of the cached response. On
+    a ``304 Not Modified`` the entry is refreshed and the value decoded
+    from it the first time it was revalidated is returned again, without
+    decoding the body. Responses without validators are compared by a
+    hash of their body instead, which saves decoding but not the
+    transfer. Values served this way are shared between callers, so treat
+    them as read-only. ``ttl=0`` revalidates on every read, which suits
+    large listings such as `MAPPING_OPERATIONS`.
+"""
+from __future__ import absolute_import
+
+import collections
+import hashlib
+import re
+import threading
+import time
+
+from six.moves.urllib.parse import urlencode
+
+from deep_lynx import forksafe
+
+# the read endpoints of ontologies and containers
+ONTOLOGY_OPERATIONS = frozenset([
+    'GET /containers',
+    'GET /containers/{container_id}',
+    'GET /containers/{container_id}/metatypes',
+    'GET /containers/{container_id}/metatypes/{metatype_id}',
+    'GET /containers/{container_id}/metatypes/{metatype_id}/keys',
+    'GET /containers/{container_id}/metatypes/{metatype_id}/keys/{key_id}',
+    'GET /containers/{container_id}/metatype_relationships',
+    'GET /containers/{container_id}/metatype_relationships/'
+    '{relationship_id}',
+    'GET /containers/{container_id}/metatype_relationships/'
+    '{relationship_id}/keys',
+    'GET /containers/{container_id}/metatype_relationships/'
+    '{relationship_id}/keys/{key_id}',
+    'GET /containers/{container_id}/metatype_relationship_pairs',
+    'GET /containers/{container_id}/metatype_relationship_pairs/{pair_id}',
+])
+
+# data type mappings and their transformations, large and slow to list
+MAPPING_OPERATIONS = frozenset([
+    'GET /containers/{container_id}/import/datasources/{data_source_id}/'
+    'mappings',
+    'GET /containers/{container_id}/import/datasources/{data_source_id}/'
+    'mappings/{mapping_id}',
+    'GET /containers/{container_id}/import/datasources/{data_source_id}/'
+    'mappings/{mapping_id}/transformations',
+])
+
+# scope of a url: the container it belongs to, or the container listing
+_CONTAINER = re.compile(r'^(.*?/containers)(/[^/?]+)?')
+
+
+def _scope(url):
+    """Returns the scope of `url` and whether `url` is that scope itself."""
+    path = url.split('?', 1)[0]
+    match = _CONTAINER.match(path)
+    if match is None:
+        return path, True
+    scope = match.group(0)
+    return scope, path.rstrip('/') == scope
+
+
+class Ticket(object):
+    """Cache key of a request, see `ResponseCache.ticket`."""
+
+    __slots__ = ('key', 'scope', 'generation')
+
+    def __init__(self, key, scope, generation):
+        self.key = key
+        self.scope = scope
+        self.generation = generation
+
+
+class Entry(object):
+    """A cached response and what is needed to revalidate it.
+
+    :ivar response: the cached `rest.RESTResponse`.
+    :ivar etag: its ``ETag`` header, if any.
+    :ivar last_modified: its ``Last-Modified`` header, if any.
+    :ivar digest: hash of its body.
+    :ivar values: values decoded from it after revalidations, keyed by
+        response type and mode.
+    """
+
+    __slots__ = ('expires', 'scope', 'response', 'etag', 'last_modified',
+                 'digest', 'values')
+
+    def __init__(self, expires, scope, response):
+        self.expires = expires
+        self.scope = scope
+        self.response = response
+        self.etag = response.getheader('ETag')
+        self.last_modified = response.getheader('Last-Modified')
+        self.digest = _digest(response.data)
+        self.values = {}
+
+    def conditional_headers(self):
+        """Returns the headers asking the server to answer 304 if the
+        response did not change."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class NotModified(object):
+    """Stands in for the `rest.RESTResponse` of a 304 answer, which the
+    REST clients raise as an `rest.ApiException`."""
+
+    def __init__(self, error):
+        self.status = error.status
+        self.reason = error.reason
+        self.data = b''
+        self.headers = error.headers or {}
+        self.retries = getattr(error, 'retries', 0)
+
+    def getheaders(self):
+        """Returns a dictionary of the response headers."""
+        return self.headers
+
+    def getheader(self, name, default=None):
+        """Returns a given response header."""
+        return self.headers.get(name, default)
+
+
+def _digest(data):
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.sha256(data or b'').digest()
+
+
+class ResponseCache(object):
+    """TTL and LRU bounded cache of GET responses.
+
+    Safe to share between clients and threads.
+
+    :param operations: operations to cache, named like
+        `metrics.RequestInfo.operation`, e.g. `ONTOLOGY_OPERATIONS`.
+    :param ttl: seconds a response is served from the cache.
+    :param maxsize: most responses kept, expired ones included.
+    :param revalidate: keep expired responses to revalidate them instead
+        of dropping them.
+    """
+
+    def __init__(self, operations, ttl=60.0, maxsize=1024, revalidate=True):
+        self.operations = frozenset(operations)
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.revalidate = revalidate
+        # key -> Entry, least recently used first
+        self._entries = collections.OrderedDict()
+        self._scopes = {}
+        # bumped on every write, so that responses read before a write
+        # completed are not stored after it
+        self._generations = {}
+        self._lock = threading.Lock()
+        forksafe.register(self)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.revalidations = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getstate__(self):
+        # a copy in another process starts empty
+        return {'operations': self.operations, 'ttl': self.ttl,
+                'maxsize': self.maxsize, 'revalidate': self.revalidate}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def _after_fork(self):
+        # the responses cached so far stay valid in the child
+        self._lock = threading.Lock()
+
+    def ticket(self, operation, url, query_params=None, headers=None):
+        """Returns the `Ticket` of a GET request, None if its operation is
+        not cached."""
+        if operation not in self.operations:
+            return None
+        if query_params:
+            url = url + '?' + urlencode(query_params)
+        digest = hashlib.sha256(repr(sorted(
+            (headers or {}).items())).encode('utf-8')).hexdigest()
+        scope, _ = _scope(url)
+        return Ticket((url, digest), scope, self._generations.get(scope, 0))
+
+    def get(self, ticket):
+        """Returns the cached response of `ticket`, None on a miss."""
+        with self._lock:
+            entry = self._entries.get(ticket.key)
+            if entry is not None:
+                if entry.expires > time.monotonic():
+                    self._entries.move_to_end(ticket.key)
+                    self.hits += 1
+                    return entry.response
+                if not self.revalidate:
+                    self._remove(ticket.key)
+            self.misses += 1
+            return None
+
+    def stale(self, ticket):
+        """Returns the expired `Entry` of `ticket` to revalidate, None if
+        there is none."""
+        if not self.revalidate:
+            return None
+        with self._lock:
+            entry = self._entries.get(ticket.key)
+            if entry is None or entry.expires > time.monotonic():
+                return None
+            return entry
+
+    def put(self, ticket, response, stale=None):
+        """Caches `response`, unless a write to its scope completed since
+        `ticket` was issued.
+
+        :param stale: the `Entry` the request revalidated, if any.
+        :return: `stale` if `response` says it is still current, a 304 or
+            a body with the same hash; None otherwise.
+        """
+        if stale is not None and (response.status == 304 or
+                                  _digest(response.data) == stale.digest):
+            self._refresh(ticket, stale, response)
+            return stale
+        if response.status == 304:
+            return None
+        with self._lock:
+            if self._generations.get(ticket.scope, 0) != ticket.generation:
+                return None
+            if ticket.key in self._entries:
+                self._remove(ticket.key)
+            self._entries[ticket.key] = Entry(time.monotonic() + self.ttl,
+                                              ticket.scope, response)
+            self._scopes.setdefault(ticket.scope, set()).add(ticket.key)
+            while len(self._entries) > self.maxsize:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+        return None
+
+    def _refresh(self, ticket, entry, response):
+        with self._lock:
+            self.revalidations += 1
+            if (self._generations.get(ticket.scope, 0) != ticket.generation or
+                    self._entries.get(ticket.key) is not entry):
+                # invalidated meanwhile
+                return
+            entry.expires = time.monotonic() + self.ttl
+            # a 304 may carry updated validators
+            etag = response.getheader('ETag')
+            if etag:
+                entry.etag = etag
+            last_modified = response.getheader('Last-Modified')
+            if last_modified:
+                entry.last_modified = last_modified
+            self._entries.move_to_end(ticket.key)
+
+    def invalidate(self, url):
+        """Drops the responses of the container `url` writes to."""
+        scope, itself = _scope(url)
+        scopes = [scope]
+        if itself:
+            # renaming or deleting a container changes the listing too
+            root = _CONTAINER.match(scope)
+            if root is not None and root.group(2):
+                scopes.append(root.group(1))
+        with self._lock:
+            for scope in scopes:
+                self._generations[scope] = self._generations.get(scope,
+                                                                 0) + 1
+                for key in list(self._scopes.get(scope, ())):
+                    self._remove(key)
+                    self.invalidations += 1
+
+    def clear(self):
+        """Drops every cached response."""
+        with self._lock:
+            for scope in self._scopes:
+                self._generations[scope] = self._generations.get(scope,
+                                                                 0) + 1
+            self._entries.clear()
+            self._scopes.clear()
+
+    def stats(self):
+        """Returns hit, miss and revalidation counts, the hit ratio and the
+        size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'revalidations': self.revalidations,
+                'size': len(self._entries),
+            }
+
+    def _remove(self, key):
+        scope = self._entries.pop(key).scope
+        keys = self._scopes.get(scope)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._scopes[scope]
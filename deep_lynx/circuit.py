@@ -0,0 +1,255 @@
+# coding: utf-8
+"""
+    DeepLynx
+
+    Circuit breakers.
+
+    When a DeepLynx node is degraded, every request sent to it waits for a
+    timeout before failing. With `Configuration.circuit_breakers` set to a
+    `CircuitBreakers`, `ApiClient` keeps a `CircuitBreaker` per operation or
+    per host instead:
+
+    - *closed*: requests go through; `failure_threshold` failures in a row
+      open the circuit;
+    - *open*: requests fail at once with `CircuitOpenError`, without
+      reaching the server, for `recovery_timeout` seconds;
+    - *half-open*: up to `half_open_requests` trial requests go through;
+      a success closes the circuit again, a failure opens it for another
+      `recovery_timeout`.
+
+    `CircuitBreaker.before` hands every request it lets through a `Permit`
+    naming the state it was let through in, and outcomes are recorded
+    against it: those of requests sent before the last state change are
+    ignored, so requests still in flight when the circuit opened cannot
+    close it again, and only half-open trials close an open circuit.
+
+    Only signs of an unhealthy server count as failures: 429 and 5xx
+    responses, connection errors and timeouts (see `limiter.overloaded`).
+    Other errors, such as 4xx responses, count neither way.
+    Breakers only see timeouts that happen, so set
+    `Configuration.request_timeout` as well; the first request through
+    breakers without one logs a warning.
+
+    State changes are passed to the ``on_circuit(breaker)`` method of the
+    request hooks; `metrics.MetricsCollector` exports them as the
+    ``circuit_state`` gauge.
+"""
+from __future__ import absolute_import
+
+import logging
+import threading
+import time
+
+from six.moves.urllib.parse import urlparse
+
+from deep_lynx import forksafe
+from deep_lynx.rest import ApiException
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+STATES = (CLOSED, HALF_OPEN, OPEN)
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(ApiException):
+    """Raised instead of sending a request while its circuit is open.
+
+    :ivar circuit: name of the open circuit.
+    :ivar retry_in: seconds until the circuit lets a trial request through.
+    """
+
+    def __init__(self, circuit, retry_in):
+        super(CircuitOpenError, self).__init__(
+            status=0, reason="Circuit {0} is open, retry in {1:.1f}s".format(
+                circuit, retry_in))
+        self.circuit = circuit
+        self.retry_in = retry_in
+
+
+class Permit(object):
+    """A request let through by `CircuitBreaker.before`.
+
+    :ivar generation: state change of the breaker the request was let
+        through after.
+    :ivar changed: True if letting it through changed the state, from
+        open to half-open.
+    """
+
+    __slots__ = ('generation', 'changed')
+
+    def __init__(self, generation, changed):
+        self.generation = generation
+        self.changed = changed
+
+    def __repr__(self):
+        return "Permit({0!r}, changed={1!r})".format(self.generation,
+                                                     self.changed)
+
+
+class CircuitBreaker(object):
+    """Closed, open and half-open states of one circuit.
+
+    :param name: operation or host the breaker guards.
+    :param failure_threshold: failures in a row that open the circuit.
+    :param recovery_timeout: seconds the circuit stays open.
+    :param half_open_requests: trial requests let through while half-open.
+    """
+
+    def __init__(self, name, failure_threshold=5, recovery_timeout=30.0,
+                 half_open_requests=1):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_requests = half_open_requests
+        self.state = CLOSED
+        self.failures = 0
+        self._opened_at = None
+        self._trials = 0
+        # counts the state changes
+        self._generation = 0
+        self._lock = threading.Lock()
+        forksafe.register(self)
+
+    def __getstate__(self):
+        # a copy in another process starts closed
+        return {'name': self.name,
+                'failure_threshold': self.failure_threshold,
+                'recovery_timeout': self.recovery_timeout,
+                'half_open_requests': self.half_open_requests}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def _after_fork(self):
+        # trial requests in flight are the parent's
+        self._trials = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return "CircuitBreaker({0!r}, state={1!r})".format(self.name,
+                                                           self.state)
+
+    def _change(self, state):
+        self.state = state
+        self._generation += 1
+
+    def before(self):
+        """Lets a request through or raises `CircuitOpenError`.
+
+        :return: the `Permit` of the request.
+        """
+        with self._lock:
+            changed = False
+            if self.state == OPEN:
+                retry_in = (self._opened_at + self.recovery_timeout -
+                            time.monotonic())
+                if retry_in > 0:
+                    raise CircuitOpenError(self.name, retry_in)
+                self._change(HALF_OPEN)
+                self._trials = 0
+                changed = True
+            if self.state == HALF_OPEN:
+                if self._trials >= self.half_open_requests:
+                    raise CircuitOpenError(self.name, 0.0)
+                self._trials += 1
+            return Permit(self._generation, changed)
+
+    def success(self, permit):
+        """Records a request that reached a healthy server.
+
+        :return: True if the state changed.
+        """
+        with self._lock:
+            if permit.generation != self._generation:
+                return False
+            self.failures = 0
+            if self.state == CLOSED:
+                return False
+            # a half-open trial
+            self._change(CLOSED)
+            return True
+
+    def failure(self, permit):
+        """Records a request that failed because of the server.
+
+        :return: True if the state changed.
+        """
+        with self._lock:
+            if permit.generation != self._generation:
+                return False
+            self.failures += 1
+            if (self.state == HALF_OPEN or
+                    self.failures >= self.failure_threshold):
+                self._change(OPEN)
+                self._opened_at = time.monotonic()
+                return True
+            return False
+
+    def cancel(self, permit):
+        """Records a request that was given up on, or whose error says
+        nothing about the server, so that it does not hold a half-open
+        trial forever."""
+        with self._lock:
+            if (permit.generation == self._generation and
+                    self.state == HALF_OPEN and self._trials):
+                self._trials -= 1
+
+
+class CircuitBreakers(object):
+    """`CircuitBreaker` factory keyed by operation or host.
+
+    :param key: 'operation' for a breaker per operation, such as
+        ``GET /containers/{container_id}``, or 'host' for a breaker per
+        server.
+    :param kwargs: arguments of the `CircuitBreaker` created for each key.
+    """
+
+    KEYS = ('operation', 'host')
+
+    def __init__(self, key='operation', **kwargs):
+        if key not in self.KEYS:
+            raise ValueError("key must be one of {0}".format(
+                ', '.join(self.KEYS)))
+        self.key = key
+        self.kwargs = kwargs
+        self._breakers = {}
+        self._lock = threading.Lock()
+        self._warned = False
+        forksafe.register(self)
+
+    def __getstate__(self):
+        return dict(self.kwargs, key=self.key)
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def _after_fork(self):
+        self._lock = threading.Lock()
+
+    def get(self, operation, url):
+        """Returns the breaker of a request, creating it on first use."""
+        name = operation if self.key == 'operation' else urlparse(url).netloc
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(name)
+                if breaker is None:
+                    breaker = self._breakers[name] = CircuitBreaker(
+                        name, **self.kwargs)
+        return breaker
+
+    def warn_untimed(self):
+        """Logs, once, that requests have no default timeout: a hung
+        request never fails, so it never counts against its breaker."""
+        if not self._warned:
+            self._warned = True
+            logger.warning("circuit breakers are set without "
+                           "Configuration.request_timeout; requests that "
+                           "hang are never counted as failures")
+
+    def states(self):
+        """Returns the state of every circuit, keyed by name."""
+        return {name: breaker.state
+                for name, breaker in list(self._breakers.items())}
@@ -0,0 +1,159 @@
+# coding: utf-8
+"""
+    DeepLynx
+
+    Coalescing of identical concurrent GET requests.
+
+    Workers that resolve the same metatype, data source or node at the same
+    moment each send a request and decode a response of their own. With
+    `Configuration.single_flight` set to a `SingleFlight`, `ApiClient` lets
+    only the first of them through; the others wait for it and receive the
+    same result, or the same exception::
+
+        config.single_flight = SingleFlight()
+
+    Requests are identical when they share the url, query string, request
+    headers and the shape of the value returned (response type, response
+    mode, with or without status and headers). Only requests in flight at
+    the same time are coalesced; use `cache.ResponseCache` to reuse
+    responses afterwards.
+
+    Threads, including those of the `async_req` executor, are coalesced
+    with each other, and so are the coroutines of `AsyncApiClient` running
+    on the same event loop. A cancelled coroutine does not cancel the
+    request the others wait for.
+
+    The value returned is shared between callers, so treat it as
+    read-only. `stats` reports how many requests were sent and how many
+    were served by another caller's request.
+"""
+from __future__ import absolute_import
+
+import asyncio
+import hashlib
+import threading
+
+from six.moves.urllib.parse import urlencode
+
+from deep_lynx import forksafe
+
+
+class _Call(object):
+    """A request in flight and the callers waiting for it."""
+
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """Shares one in-flight GET between identical concurrent callers.
+
+    Safe to share between clients and threads.
+
+    :param operations: operations to coalesce, named like
+        `metrics.RequestInfo.operation`. None coalesces every GET.
+    """
+
+    def __init__(self, operations=None):
+        self.operations = (frozenset(operations) if operations is not None
+                           else None)
+        self._calls = {}
+        self._tasks = {}
+        self._lock = threading.Lock()
+        forksafe.register(self)
+        self.flights = 0
+        self.shared = 0
+
+    def __getstate__(self):
+        return {'operations': self.operations}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def _after_fork(self):
+        # the requests in flight are the parent's, nothing in the child
+        # would ever complete them
+        self._calls = {}
+        self._tasks = {}
+        self._lock = threading.Lock()
+
+    def key(self, operation, url, query_params=None, headers=None,
+            shape=None):
+        """Returns the key identical requests share, None if `operation`
+        is not coalesced.
+
+        :param shape: hashable description of the value returned.
+        """
+        if self.operations is not None and operation not in self.operations:
+            return None
+        if query_params:
+            url = url + '?' + urlencode(query_params)
+        digest = hashlib.sha256(repr(sorted(
+            (headers or {}).items())).encode('utf-8')).hexdigest()
+        return url, digest, shape
+
+    def do(self, key, function):
+        """Returns ``function()``, or the result of the call with the same
+        `key` already in flight."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.flights += 1
+            else:
+                self.shared += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = function()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    async def do_async(self, key, function):
+        """Awaits ``function()``, or the call with the same `key` already in
+        flight on the running event loop.
+
+        :param function: returns the coroutine to run.
+        """
+        loop = asyncio.get_running_loop()
+        key = (id(loop), key)
+        with self._lock:
+            task = self._tasks.get(key)
+            if task is None:
+                task = self._tasks[key] = loop.create_task(function())
+                task.add_done_callback(lambda _: self._forget(key, task))
+                self.flights += 1
+            else:
+                self.shared += 1
+        # callers cancelled while waiting leave the request running for
+        # the others
+        return await asyncio.shield(task)
+
+    def _forget(self, key, task):
+        with self._lock:
+            if self._tasks.get(key) is task:
+                del self._tasks[key]
+
+    def stats(self):
+        """Returns the requests sent and the requests served by another
+        caller's request."""
+        with self._lock:
+            return {
+                'flights': self.flights,
+                'shared': self.shared,
+                'in_flight': len(self._calls) + len(self._tasks),
+            }
@@ -0,0 +1,186 @@
+# coding: utf-8
+"""
+    DeepLynx
+
+    JSON codecs used to encode request bodies and decode responses.
+
+    `Configuration.json_codec` holds the codec a client uses. By default it
+    is the fastest backend installed (orjson, then ujson, then the standard
+    library). Every codec encodes straight to UTF-8 bytes, understands numpy
+    scalars and arrays, dates and datetimes, and applies the same NaN policy:
+
+    - ``'null'`` (default): NaN and +/-Infinity are sent as ``null``, since
+      the DeepLynx server rejects the non-standard ``NaN`` token.
+    - ``'raise'``: encoding a NaN or Infinity raises ValueError.
+    - ``'allow'``: emit ``NaN``/``Infinity`` literals, as `json.dumps` does.
+"""
+from __future__ import absolute_import
+
+import datetime
+import json
+import math
+import sys
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+NAN_POLICIES = ('null', 'raise', 'allow')
+
+
+def _default(obj):
+    """Converts values the JSON backends do not know natively."""
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    # numpy values can only exist once the caller imported numpy, which
+    # is too slow to import up front
+    numpy = sys.modules.get('numpy')
+    if numpy is not None:
+        if isinstance(obj, numpy.ndarray):
+            return obj.tolist()
+        if isinstance(obj, numpy.generic):
+            return obj.item()
+    raise TypeError(
+        "Object of type {0} is not JSON serializable".format(
+            type(obj).__name__))
+
+
+def _replace_non_finite(obj):
+    """Returns `obj` with NaN and +/-Infinity floats replaced by None."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _replace_non_finite(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_replace_non_finite(v) for v in obj]
+    if isinstance(obj, (str, int, bool)) or obj is None:
+        return obj
+    try:
+        converted = _default(obj)
+    except TypeError:
+        return obj
+    return _replace_non_finite(converted)
+
+
+class JSONCodec(object):
+    """Interface of a JSON codec.
+
+    :param nan: NaN policy, one of `NAN_POLICIES`.
+    """
+
+    name = None
+    nan_policies = NAN_POLICIES
+
+    def __init__(self, nan='null'):
+        if nan not in self.nan_policies:
+            raise ValueError(
+                "{0} codec supports the NaN policies {1}, got `{2}`".format(
+                    self.name, ', '.join(self.nan_policies), nan))
+        self.nan = nan
+
+    def dumps(self, obj):
+        """Encodes `obj` to UTF-8 JSON bytes."""
+        raise NotImplementedError()
+
+    def loads(self, data):
+        """Decodes JSON from bytes or str.
+
+        :raises ValueError: if `data` is not valid JSON.
+        """
+        raise NotImplementedError()
+
+    def __repr__(self):
+        return "{0}(nan={1!r})".format(type(self).__name__, self.nan)
+
+
+class StdlibJSONCodec(JSONCodec):
+    """Codec built on the standard library `json` module."""
+
+    name = 'json'
+
+    def _encode(self, obj, allow_nan):
+        return json.dumps(obj, default=_default, allow_nan=allow_nan,
+                          ensure_ascii=False, separators=(',', ':'))
+
+    def dumps(self, obj):
+        if self.nan == 'allow':
+            return self._encode(obj, True).encode('utf-8')
+        try:
+            return self._encode(obj, False).encode('utf-8')
+        except ValueError:
+            # only pay for the extra walk when a NaN is actually present
+            if self.nan == 'raise':
+                raise
+            return self._encode(_replace_non_finite(obj),
+                                False).encode('utf-8')
+
+    def loads(self, data):
+        return json.loads(data)
+
+
+class UjsonCodec(StdlibJSONCodec):
+    """Codec built on `ujson`."""
+
+    name = 'ujson'
+
+    def _encode(self, obj, allow_nan):
+        try:
+            return ujson.dumps(obj, default=_default, allow_nan=allow_nan,
+                               ensure_ascii=False,
+                               escape_forward_slashes=False)
+        except OverflowError as e:
+            # ujson reports non-finite floats as OverflowError
+            raise ValueError(str(e))
+
+    def loads(self, data):
+        return ujson.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """Codec built on `orjson`.
+
+    orjson always writes NaN and Infinity as ``null``, so it only supports
+    the ``'null'`` policy.
+    """
+
+    name = 'orjson'
+    nan_policies = ('null',)
+
+    def __init__(self, nan='null'):
+        super(OrjsonCodec, self).__init__(nan)
+        self._options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj):
+        return orjson.dumps(obj, default=_default, option=self._options)
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+
+def available_codecs():
+    """Returns the codec classes usable here, fastest first."""
+    codecs = []
+    if orjson is not None:
+        codecs.append(OrjsonCodec)
+    if ujson is not None:
+        codecs.append(UjsonCodec)
+    codecs.append(StdlibJSONCodec)
+    return codecs
+
+
+def get_default_codec(nan='null'):
+    """Returns the fastest installed codec that supports the NaN policy.
+
+    :param nan: NaN policy, one of `NAN_POLICIES`.
+    """
+    for codec_class in available_codecs():
+        if nan in codec_class.nan_policies:
+            return codec_class(nan)
+    raise ValueError("Unknown NaN policy `{0}`".format(nan))
@@ -0,0 +1,210 @@
+# coding: utf-8
+"""
+    DeepLynx
+
+    Compact, slot-based variants of the swagger models.
+
+    Every generated model keeps its attributes in an instance `__dict__`,
+    which is the bulk of the memory held by large `list_nodes`/`list_edges`
+    results. `compact_class` derives a class with `__slots__` from a model
+    instead: it exposes the same properties, `to_dict` and required-field
+    checks, but stores its values in fixed slots. Nested models, lists,
+    dicts and dates are kept as the decoded JSON and only turned into
+    (compact) models the first time they are read.
+
+    Compact models are what `ApiClient` returns in the ``compact`` response
+    mode. They compare equal to other compact models only; use `to_model`
+    to get the regular generated model back.
+"""
+from __future__ import absolute_import
+
+import pprint
+import threading
+
+import six
+
+from deep_lynx import deserializer
+
+_classes = {}
+_lock = threading.Lock()
+# guards the decoding of lazy attributes and the `_lazy` bits
+_lazy_lock = threading.RLock()
+
+
+class CompactModel(object):
+    """Base class of the classes built by `compact_class`."""
+    __slots__ = ('_lazy',)
+
+    # the generated model this class mirrors
+    model_class = None
+    swagger_types = {}
+    attribute_map = {}
+    discriminator = None
+    # lazily decoded attribute -> bit in `_lazy`
+    _lazy_fields = {}
+    # attributes that must not be None; a dunder name, since slots are
+    # named after the attributes of the model
+    __required_fields__ = frozenset()
+
+    def __init__(self, **kwargs):
+        required = self.__required_fields__
+        for attr in kwargs:
+            if attr not in self.swagger_types:
+                raise TypeError(
+                    "Got an unexpected keyword argument '%s'"
+                    " to %s" % (attr, type(self).__name__)
+                )
+        self._lazy = 0
+        for attr in self.swagger_types:
+            object.__setattr__(self, '_' + attr, None)
+        for attr in self.swagger_types:
+            if attr in kwargs or attr in required:
+                setattr(self, attr, kwargs.get(attr))
+
+    def to_model(self):
+        """Returns the equivalent generated model, nested values included"""
+        return self.model_class(**{
+            attr: _to_model(getattr(self, attr))
+            for attr in self.swagger_types})
+
+    def to_dict(self):
+        """Returns the model properties as a dict"""
+        result = {}
+
+        for attr, _ in six.iteritems(self.swagger_types):
+            value = getattr(self, attr)
+            if isinstance(value, list):
+                result[attr] = list(map(
+                    lambda x: x.to_dict() if hasattr(x, "to_dict") else x,
+                    value
+                ))
+            elif hasattr(value, "to_dict"):
+                result[attr] = value.to_dict()
+            elif isinstance(value, dict):
+                result[attr] = dict(map(
+                    lambda item: (item[0], item[1].to_dict())
+                    if hasattr(item[1], "to_dict") else item,
+                    value.items()
+                ))
+            else:
+                result[attr] = value
+
+        return result
+
+    def to_str(self):
+        """Returns the string representation of the model"""
+        return pprint.pformat(self.to_dict())
+
+    def __repr__(self):
+        """For `print` and `pprint`"""
+        return self.to_str()
+
+    def __eq__(self, other):
+        """Returns true if both objects are equal"""
+        if type(other) is not type(self):
+            return False
+
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in self.swagger_types)
+
+    def __ne__(self, other):
+        """Returns true if both objects are not equal"""
+        return not self == other
+
+    __hash__ = None
+
+    def __reduce__(self):
+        # generated classes cannot be looked up by name, rebuild them from
+        # the model they mirror
+        return (_restore, (self.model_class, self._lazy, tuple(
+            getattr(self, '_' + attr) for attr in self.swagger_types)))
+
+
+def _to_model(value):
+    if isinstance(value, CompactModel):
+        return value.to_model()
+    if isinstance(value, list):
+        return [_to_model(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _to_model(v) for k, v in six.iteritems(value)}
+    return value
+
+
+def _restore(model_class, lazy, values):
+    klass = compact_class(model_class)
+    instance = klass.__new__(klass)
+    instance._lazy = lazy
+    for attr, value in zip(klass.swagger_types, values):
+        object.__setattr__(instance, '_' + attr, value)
+    return instance
+
+
+def compact_class(model_class):
+    """Returns the compact class mirroring `model_class`, creating it on
+    first use.
+
+    :param model_class: a generated swagger model class.
+    :return: a `CompactModel` subclass named ``Compact<Model>``.
+    """
+    klass = _classes.get(model_class)
+    if klass is None:
+        with _lock:
+            klass = _classes.get(model_class)
+            if klass is None:
+                klass = _classes[model_class] = _build(model_class)
+    return klass
+
+
+def _build(model_class):
+    required = deserializer.probe_setters(model_class) or []
+    namespace = {
+        '__slots__': tuple('_' + attr for attr in model_class.swagger_types),
+        '__doc__': "Compact variant of `%s`." % model_class.__name__,
+        '__module__': __name__,
+        'model_class': model_class,
+        'swagger_types': model_class.swagger_types,
+        'attribute_map': model_class.attribute_map,
+        '__required_fields__': frozenset(required),
+    }
+    lazy_fields = {}
+    for attr, attr_type in six.iteritems(model_class.swagger_types):
+        bit = 0
+        if deserializer.is_lazy_type(attr_type):
+            bit = lazy_fields[attr] = 1 << len(lazy_fields)
+        namespace[attr] = _property(attr, attr_type, bit, attr in required)
+    namespace['_lazy_fields'] = lazy_fields
+    return type('Compact' + model_class.__name__, (CompactModel,), namespace)
+
+
+def _property(attr, attr_type, bit, required):
+    private = '_' + attr
+    store = object.__setattr__
+
+    if bit:
+        def getter(self):
+            if self._lazy & bit:
+                # `_lazy` is shared by every lazy attribute, so clearing a
+                # bit must not race with another thread clearing its own
+                with _lazy_lock:
+                    if self._lazy & bit:
+                        store(self, private, deserializer.deserialize(
+                            getattr(self, private), attr_type, compact=True))
+                        self._lazy &= ~bit
+            return getattr(self, private)
+    else:
+        def getter(self):
+            return getattr(self, private)
+
+    def setter(self, value):
+        if required and value is None:
+            raise ValueError(
+                "Invalid value for `%s`, must not be `None`" % attr)
+        if bit:
+            with _lazy_lock:
+                store(self, private, value)
+                self._lazy &= ~bit
+        else:
+            store(self, private, value)
+
+    return property(getter, setter,
+                    doc="Gets or sets the %s, a `%s`." % (attr, attr_type))
@@ -21,6 +21,11 @@ import urllib3
 import six
 from six.moves import http_client as httplib
 
+from deep_lynx import codec
+from deep_lynx import download
+from deep_lynx import multipart
+from deep_lynx import retry
+
 
 class TypeWithDefault(type):
     def __init__(cls, name, bases, dct):
@@ -55,7 +60,8 @@ class Configuration(six.with_metaclass(TypeWithDefault, object)):
         self.api_key = {}
         # dict to store API prefix (e.g. Bearer)
         self.api_key_prefix = {}
-        # function to refresh API key if expired
+        # function to refresh API key if expired, e.g. a
+        # `deep_lynx.auth.TokenManager` keeping the `BearerAuth` key current
         self.refresh_api_key_hook = None
         # Username for HTTP basic authentication
         self.username = ""
@@ -95,11 +101,58 @@ class Configuration(six.with_metaclass(TypeWithDefault, object)):
         # requests to the same host, which is often the case here.
         # cpu_count * 5 is used as default value to increase performance.
         self.connection_pool_maxsize = multiprocessing.cpu_count() * 5
+        # Size of the process-wide executor used for `async_req=True`
+        # requests. It is shared by all clients and started lazily, so only
+        # the configuration of the first asynchronous request applies.
+        # None uses cpu_count * 5, matching the connection pool.
+        self.executor_max_workers = None
 
         # Proxy URL
         self.proxy = None
         # Safe chars for path_param
         self.safe_chars_for_path_param = ''
+        # JSON codec encoding request bodies and decoding responses, see
+        # `deep_lynx.codec`. Defaults to the fastest installed backend.
+        self.json_codec = codec.get_default_codec()
+        # What API methods return for JSON responses: 'model' (swagger
+        # models), 'compact' (slot-based models with lazily decoded nested
+        # values, see `deep_lynx.compact`), 'dict' (the decoded JSON,
+        # untouched) or 'raw_bytes' (the response body). Can be overridden
+        # per call with `_response_mode`.
+        self.response_mode = 'model'
+        # Largest number of bytes read from a file at once while streaming
+        # a multipart upload, see `deep_lynx.multipart`.
+        self.upload_chunk_size = multipart.DEFAULT_CHUNK_SIZE
+        # Streamed file downloads, see `deep_lynx.download`: bytes written
+        # at once, attempts to resume a dropped connection with a Range
+        # request, and parallel byte ranges for files larger than
+        # `download_part_size` (1 downloads sequentially).
+        self.download_chunk_size = download.DEFAULT_CHUNK_SIZE
+        self.download_retries = 5
+        self.download_workers = 1
+        self.download_part_size = download.DEFAULT_PART_SIZE
+        # Retries of failed requests, see `deep_lynx.retry`. None disables
+        # them. `retry_overrides` maps operations such as
+        # 'GET /containers/{container_id}' to their own `RetryPolicy`.
+        self.retry_policy = retry.RetryPolicy()
+        self.retry_overrides = {}
+        # Client-side rate and concurrency limits, see `deep_lynx.limiter`:
+        # maps the 'read', 'write' and 'upload' operation groups, or single
+        # operations, to a `limiter.Limiter`. Empty for no limits.
+        self.limiters = {}
+        # Timeout of requests made without `_request_timeout`, in the same
+        # form: seconds, or a (connect, read) tuple. None waits forever.
+        self.request_timeout = None
+        # Circuit breakers failing requests fast while the server is
+        # unhealthy, a `deep_lynx.circuit.CircuitBreakers`. None disables
+        # them.
+        self.circuit_breakers = None
+        # Cache of GET responses, a `deep_lynx.cache.ResponseCache` listing
+        # the operations it applies to. None disables it.
+        self.response_cache = None
+        # Coalescing of identical concurrent GETs, a
+        # `deep_lynx.coalesce.SingleFlight`. None disables it.
+        self.single_flight = None
 
     @property
     def logger_file(self):
@@ -232,6 +285,13 @@ class Configuration(six.with_metaclass(TypeWithDefault, object)):
         :return: The Auth Settings information dict.
         """
         return {
+            'BearerAuth':
+                {
+                    'type': 'api_key',
+                    'in': 'header',
+                    'key': 'Authorization',
+                    'value': self.get_api_key_with_prefix('BearerAuth')
+                },
         }
 
     def to_debug_report(self):
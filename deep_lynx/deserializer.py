@@ -0,0 +1,363 @@
+# coding: utf-8
+"""
+    DeepLynx
+
+    Compiled deserialization plans for swagger models.
+
+    `ApiClient.deserialize` used to re-parse type strings such as
+    ``list[Node]`` and walk `swagger_types`/`attribute_map` for every value
+    it decoded. Here each type is compiled once into a decoder function
+    (resolved classes, json key maps, nested decoders) which is cached for
+    the life of the process. Decoding a model then costs roughly one dict
+    lookup per field, and the results are identical to the generic path:
+    same classes, same values, same `ValueError` for missing required
+    fields.
+
+    With ``compact=True`` models are decoded into the slot-based classes of
+    `deep_lynx.compact`, which keep nested models undecoded until they are
+    first read.
+"""
+from __future__ import absolute_import
+
+import datetime
+import re
+import threading
+
+import six
+
+import deep_lynx.models
+from deep_lynx import rest
+
+
+PRIMITIVE_TYPES = (float, bool, bytes, six.text_type) + six.integer_types
+NATIVE_TYPES_MAPPING = {
+    'int': int,
+    'long': int if six.PY3 else long,  # noqa: F821
+    'float': float,
+    'str': str,
+    'bool': bool,
+    'date': datetime.date,
+    'datetime': datetime.datetime,
+    'object': object,
+}
+
+# (type string or class, compact) -> decoder(data); decoders are never
+# given None
+_decoders = {}
+# plans being compiled; they are published to `_decoders` once complete so
+# other threads never pick up a half-built plan
+_compiling = {}
+_lock = threading.RLock()
+_depth = [0]
+
+_probe = object()
+# distinct string values kept per field of a compact model, see
+# `_generate_decoder`
+SHARED_STRINGS = 4096
+
+
+def deserialize(data, klass, compact=False):
+    """Deserializes dict, list, str into an object.
+
+    :param data: dict, list or str.
+    :param klass: class literal, or string of class name.
+    :param compact: build `deep_lynx.compact` models instead of the
+        generated ones.
+
+    :return: object.
+    """
+    if data is None:
+        return None
+    try:
+        decoder = _decoders[(klass, compact)]
+    except KeyError:
+        decoder = get_decoder(klass, compact)
+    return decoder(data)
+
+
+def get_decoder(klass, compact=False):
+    """Returns the compiled decoder for `klass`, compiling it if needed.
+
+    :param klass: class literal, or string of class name.
+    :param compact: decode models into `deep_lynx.compact` models.
+    """
+    key = (klass, compact)
+    decoder = _decoders.get(key)
+    if decoder is None:
+        with _lock:
+            decoder = _decoders.get(key) or _compiling.get(key)
+            if decoder is None:
+                _depth[0] += 1
+                try:
+                    decoder = _compile(klass, compact)
+                finally:
+                    _depth[0] -= 1
+                    if not _depth[0]:
+                        _decoders.update(_compiling)
+                        _compiling.clear()
+    return decoder
+
+
+def clear_cache():
+    """Drops every compiled plan, e.g. after models were reloaded."""
+    with _lock:
+        _decoders.clear()
+
+
+def _compile(klass, compact):
+    if type(klass) == str:
+        if klass.startswith('list['):
+            sub_decoder = get_decoder(
+                re.match(r'list\[(.*)\]', klass).group(1), compact)
+
+            def decode_list(data):
+                return [None if sub_data is None else sub_decoder(sub_data)
+                        for sub_data in data]
+            return _register(klass, compact, decode_list)
+
+        if klass.startswith('dict('):
+            sub_decoder = get_decoder(
+                re.match(r'dict\(([^,]*), (.*)\)', klass).group(2), compact)
+
+            def decode_dict(data):
+                return {k: None if v is None else sub_decoder(v)
+                        for k, v in six.iteritems(data)}
+            return _register(klass, compact, decode_dict)
+
+        # convert str to class
+        if klass in NATIVE_TYPES_MAPPING:
+            target = NATIVE_TYPES_MAPPING[klass]
+        else:
+            target = getattr(deep_lynx.models, klass)
+        return _register(klass, compact, get_decoder(target, compact))
+
+    if klass in PRIMITIVE_TYPES:
+        return _register(klass, compact, _primitive_decoder(klass))
+    elif klass == object:
+        return _register(klass, compact, _identity)
+    elif klass == datetime.date:
+        return _register(klass, compact, _decode_date)
+    elif klass == datetime.datetime:
+        return _register(klass, compact, _decode_datetime)
+    else:
+        return _compile_model(klass, compact)
+
+
+def _register(klass, compact, decoder):
+    _compiling[(klass, compact)] = decoder
+    return decoder
+
+
+def _identity(data):
+    return data
+
+
+def _primitive_decoder(klass):
+    def decode(data):
+        try:
+            return klass(data)
+        except UnicodeEncodeError:
+            return six.text_type(data)
+        except TypeError:
+            return data
+    return decode
+
+
+def _decode_date(string):
+    try:
+        from dateutil.parser import parse
+        return parse(string).date()
+    except ImportError:
+        return string
+    except ValueError:
+        raise rest.ApiException(
+            status=0,
+            reason="Failed to parse `{0}` as date object".format(string)
+        )
+
+
+def _decode_datetime(string):
+    try:
+        from dateutil.parser import parse
+        return parse(string)
+    except ImportError:
+        return string
+    except ValueError:
+        raise rest.ApiException(
+            status=0,
+            reason=(
+                "Failed to parse `{0}` as datetime object"
+                .format(string)
+            )
+        )
+
+
+def is_lazy_type(attr_type):
+    """Whether values of `attr_type` need more than a primitive conversion,
+    i.e. hold models, lists, dicts or dates."""
+    if attr_type in NATIVE_TYPES_MAPPING:
+        return NATIVE_TYPES_MAPPING[attr_type] not in PRIMITIVE_TYPES + (
+            object,)
+    return True
+
+
+def _field(attr, attr_type, klass, compact):
+    """Compiles a model field into (attr, private name, json key, decoder,
+    exact type). Values whose type is exactly `exact type` are already
+    decoded, and a None decoder keeps values as they are."""
+    decoder = get_decoder(attr_type, compact)
+    exact_type = None
+    if attr_type in NATIVE_TYPES_MAPPING:
+        exact_type = NATIVE_TYPES_MAPPING[attr_type]
+        if exact_type is object:
+            decoder = None
+        elif exact_type not in PRIMITIVE_TYPES:
+            exact_type = None
+    return (attr, '_' + attr, klass.attribute_map[attr], decoder, exact_type)
+
+
+def probe_setters(klass):
+    """Checks that every property setter only stores `_<attr>`, optionally
+    rejecting None, which is what the swagger templates generate.
+
+    :return: list of required attribute names, or None when a setter does
+        something else and the model must be built through its constructor.
+    """
+    required = []
+    instance = klass.__new__(klass)
+    for attr in klass.swagger_types:
+        prop = getattr(klass, attr, None)
+        if not isinstance(prop, property) or prop.fset is None:
+            return None
+        try:
+            prop.fset(instance, _probe)
+        except Exception:
+            return None
+        if instance.__dict__.get('_' + attr) is not _probe:
+            return None
+        try:
+            prop.fset(instance, None)
+        except ValueError:
+            required.append(attr)
+        except Exception:
+            return None
+    return required
+
+
+def _compile_model(klass, compact):
+    if not klass.swagger_types and not hasattr(klass,
+                                               'get_real_child_model'):
+        return _register(klass, compact, _identity)
+
+    required = probe_setters(klass)
+    if (required is None or issubclass(klass, dict) or
+            hasattr(klass, 'get_real_child_model')):
+        # uncommon shapes go through the model's own constructor
+        fields = []
+
+        def decode_model(data):
+            return _decode_model_generic(klass, fields, data)
+        _register(klass, compact, decode_model)
+        fields.extend(_field(attr, attr_type, klass, compact)
+                      for attr, attr_type in six.iteritems(klass.swagger_types))
+        return decode_model
+
+    # fields are compiled after a trampoline is registered, so that models
+    # referring back to themselves resolve to this plan
+    plan = []
+
+    def trampoline(data):
+        return plan[0](data)
+    _register(klass, compact, trampoline)
+    fields = [_field(attr, attr_type, klass, compact)
+              for attr, attr_type in six.iteritems(klass.swagger_types)]
+
+    target = klass
+    if compact:
+        from deep_lynx import compact as compact_models
+        target = compact_models.compact_class(klass)
+    plan.append(_generate_decoder(klass, target, fields, required))
+    return _register(klass, compact, plan[0])
+
+
+def _generate_decoder(klass, target, fields, required):
+    """Generates a decoder specialised for one model, much like
+    `collections.namedtuple` generates its classes.
+
+    Attributes are assigned in the constructor's order so that instances
+    keep sharing the keys of their `__dict__`. For compact targets, fields
+    listed in `_lazy_fields` are stored undecoded and flagged in `_lazy`,
+    and string values are shared through a bounded table per field, so the
+    ids, names and users repeated across a listing are held once.
+    """
+    lazy_fields = getattr(target, '_lazy_fields', None)
+    namespace = {'new': target.__new__, 'K': target, 'model': klass,
+                 'model_new': klass.__new__, 'fields': fields,
+                 'generic': _decode_model_generic}
+    lines = ['def decode_model(data):',
+             '    if not isinstance(data, dict):',
+             '        return generic(model, fields, data)',
+             '    get = data.get',
+             '    inst = new(K)']
+    if lazy_fields is not None:
+        lines.append('    lazy = 0')
+    for i, (attr, private, key, decoder, exact_type) in enumerate(fields):
+        lines.append('    v = get(%r)' % key)
+        if lazy_fields is not None and attr in lazy_fields:
+            lines.append('    if v is not None:')
+            lines.append('        lazy |= %d' % lazy_fields[attr])
+        elif decoder is not None:
+            namespace['D%d' % i] = decoder
+            namespace['T%d' % i] = exact_type
+            if exact_type is not None:
+                lines.append('    if v is not None and type(v) is not T%d:' % i)
+            else:
+                lines.append('    if v is not None:')
+            lines.append('        v = D%d(v)' % i)
+            if lazy_fields is not None and exact_type is str:
+                namespace['S%d' % i] = {}
+                lines.append('    if type(v) is str:')
+                lines.append('        s = S%d.get(v)' % i)
+                lines.append('        if s is not None:')
+                lines.append('            v = s')
+                lines.append('        elif len(S%d) < %d:' % (i, SHARED_STRINGS))
+                lines.append('            S%d[v] = v' % i)
+        lines.append('    inst.%s = v' % private)
+    if lazy_fields is not None:
+        lines.append('    inst._lazy = lazy')
+    else:
+        lines.append('    inst.discriminator = None')
+    for attr in required:
+        # raises the same ValueError as the constructor
+        namespace['R_' + attr] = getattr(klass, attr).fset
+        lines.append('    if inst._%s is None:' % attr)
+        lines.append('        R_%s(model_new(model), None)' % attr)
+    lines.append('    return inst')
+
+    exec('\n'.join(lines), namespace)
+    return namespace['decode_model']
+
+
+def _decode_model_generic(klass, fields, data):
+    """Mirror of the original `ApiClient.__deserialize_model`."""
+    kwargs = {}
+    if isinstance(data, (list, dict)):
+        for attr, _, key, decoder, exact_type in fields:
+            if key in data:
+                value = data[key]
+                if (decoder is not None and value is not None and
+                        type(value) is not exact_type):
+                    value = decoder(value)
+                kwargs[attr] = value
+
+    instance = klass(**kwargs)
+
+    if isinstance(instance, dict) and isinstance(data, dict):
+        for key, value in data.items():
+            if key not in klass.swagger_types:
+                instance[key] = value
+    if hasattr(instance, 'get_real_child_model'):
+        klass_name = instance.get_real_child_model(data)
+        if klass_name:
+            instance = deserialize(data, klass_name)
+    return instance
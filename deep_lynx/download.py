@@ -0,0 +1,257 @@
+# coding: utf-8
+"""
+    DeepLynx
+
+    Streamed, resumable file downloads.
+
+    `ApiClient.__deserialize_file` used to write a download to disk only
+    after urllib3 had buffered the whole body in memory. File responses
+    (`DataSourcesApi.download_file`) are now requested with
+    ``_preload_content=False`` and copied to disk in chunks of
+    `Configuration.download_chunk_size`. When the connection drops, the
+    download resumes where it stopped with an HTTP Range request, up to
+    `Configuration.download_retries` times in a row. Data is written to
+    ``<path>.part``, which is renamed once the download is complete.
+
+    With `Configuration.download_workers` above 1, files larger than
+    `Configuration.download_part_size` are fetched as parallel byte ranges
+    when the server supports them (``Accept-Ranges: bytes``).
+
+    API methods returning files accept ``_download_path``: the file is
+    written to that path, or into it when it is a directory, instead of
+    `Configuration.temp_folder_path`.
+"""
+from __future__ import absolute_import
+
+import concurrent.futures
+import os
+import re
+import tempfile
+
+import urllib3
+
+from deep_lynx.rest import ApiException
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+DEFAULT_PART_SIZE = 64 * 1024 * 1024
+
+# errors after which a download is resumed rather than failed
+_DROPPED = (urllib3.exceptions.ProtocolError,
+            urllib3.exceptions.ReadTimeoutError,
+            urllib3.exceptions.IncompleteRead)
+
+
+class DownloadedResponse(object):
+    """A file response saved to disk.
+
+    Stands in for `rest.RESTResponse`, except that the body is in the file
+    at `path` instead of in `data`.
+    """
+
+    def __init__(self, response, path):
+        self.response = response
+        self.status = response.status
+        self.reason = response.reason
+        self.path = path
+
+    def getheaders(self):
+        """Returns a dictionary of the response headers."""
+        return self.response.getheaders()
+
+    def getheader(self, name, default=None):
+        """Returns a given response header."""
+        return self.response.getheader(name, default)
+
+
+def target_path(configuration, response, path=None):
+    """Returns where to save the body of a file response.
+
+    :param configuration: `Configuration` of the client.
+    :param response: the response, for its `Content-Disposition` header.
+    :param path: file or directory requested by the caller, if any.
+    """
+    filename = None
+    content_disposition = response.getheader('Content-Disposition')
+    if content_disposition:
+        match = re.search(r'filename=[\'"]?([^\'"\s]+)[\'"]?',
+                          content_disposition)
+        if match:
+            # never let the server pick a directory
+            filename = os.path.basename(match.group(1))
+
+    if path is not None and not os.path.isdir(path):
+        return path
+    directory = path if path is not None else configuration.temp_folder_path
+    if filename:
+        return os.path.join(directory or tempfile.gettempdir(), filename)
+    fd, temp = tempfile.mkstemp(dir=directory)
+    os.close(fd)
+    return temp
+
+
+def write_body(response, configuration, path=None):
+    """Saves the body of a preloaded file response and returns its path."""
+    path = target_path(configuration, response, path)
+    response_data = response.data
+    if isinstance(response_data, str):
+        # change str to bytes so we can write it
+        response_data = response_data.encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(response_data)
+    return path
+
+
+def _content_length(response):
+    """Length of the file, or None if unknown or the body is encoded."""
+    if response.getheader('Content-Encoding', 'identity') != 'identity':
+        return None
+    length = response.getheader('Content-Length')
+    return int(length) if length and length.isdigit() else None
+
+
+class FileDownloader(object):
+    """Streams a file response to disk, resuming dropped connections.
+
+    :param rest_client: `rest.RESTClientObject` used for Range requests.
+    :param configuration: `Configuration` of the client.
+    :param url: url of the file.
+    :param query_params: query parameters of the original request.
+    :param headers: headers of the original request.
+    :param request_timeout: `_request_timeout` of the original request.
+    """
+
+    def __init__(self, rest_client, configuration, url, query_params=None,
+                 headers=None, request_timeout=None):
+        self.rest_client = rest_client
+        self.configuration = configuration
+        self.url = url
+        self.query_params = query_params
+        self.headers = headers or {}
+        self.request_timeout = request_timeout
+        self._validator = None
+        self._ranges = False
+
+    def save(self, response, path=None):
+        """Saves the body of `response`, a GET response opened with
+        ``_preload_content=False``.
+
+        :param path: file or directory to save to, see `target_path`.
+        :return: `DownloadedResponse`.
+        """
+        config = self.configuration
+        path = target_path(config, response, path)
+        part = path + '.part'
+        total = _content_length(response)
+        etag = response.getheader('ETag')
+        # weak ETags cannot be used in If-Range
+        self._validator = (etag if etag and not etag.startswith('W/')
+                           else response.getheader('Last-Modified'))
+        self._ranges = response.getheader(
+            'Content-Encoding', 'identity') == 'identity'
+
+        open(part, 'wb').close()
+        try:
+            if (total is not None and config.download_workers > 1 and
+                    total > config.download_part_size and
+                    response.getheader('Accept-Ranges') == 'bytes'):
+                # the parts are fetched with their own requests
+                response.close()
+                response.release_conn()
+                self._fetch_parts(part, total)
+            else:
+                self._fetch(part, 0, total, response, whole=True)
+            os.replace(part, path)
+        except BaseException:
+            os.remove(part)
+            raise
+        return DownloadedResponse(response, path)
+
+    def _fetch_parts(self, part, total):
+        config = self.configuration
+        with open(part, 'r+b') as f:
+            f.truncate(total)
+        ranges = [(start, min(start + config.download_part_size, total))
+                  for start in range(0, total, config.download_part_size)]
+        with concurrent.futures.ThreadPoolExecutor(
+                config.download_workers) as pool:
+            futures = [pool.submit(self._fetch, part, start, end)
+                       for start, end in ranges]
+            for future in futures:
+                future.result()
+
+    def _request(self, position, end, whole):
+        headers = dict(self.headers)
+        if self._ranges and (position or not whole):
+            headers['Range'] = 'bytes=%d-%s' % (
+                position, '' if end is None else end - 1)
+            if self._validator:
+                # the server sends the whole file if it has changed
+                headers['If-Range'] = self._validator
+        return self.rest_client.GET(self.url, headers=headers,
+                                    query_params=self.query_params,
+                                    _preload_content=False,
+                                    _request_timeout=self.request_timeout)
+
+    def _fetch(self, part, start, end, response=None, whole=False):
+        """Writes bytes [start, end) of the file at their offset in `part`.
+
+        `end` is None when the length is unknown. With `whole`, the fetch
+        covers the entire file and may start over when the server ignores
+        a Range request.
+        """
+        config = self.configuration
+        position = start
+        attempts = 0
+        with open(part, 'r+b') as f:
+            f.seek(start)
+            while True:
+                if response is None:
+                    response = self._request(position, end, whole)
+                    content_range = response.getheader('Content-Range', '')
+                    match = re.match(r'bytes (\d+)-', content_range)
+                    if (response.status != 206 or not match or
+                            int(match.group(1)) != position):
+                        if not whole:
+                            response.close()
+                            raise ApiException(
+                                status=response.status,
+                                reason="Server did not return bytes %d-%s "
+                                       "of the file" % (position, end))
+                        # start over with the full body
+                        position = 0
+                        f.seek(0)
+                        f.truncate()
+                        end = _content_length(response)
+
+                error = None
+                exhausted = False
+                received = position
+                try:
+                    for chunk in response.stream(config.download_chunk_size):
+                        if end is not None and position + len(chunk) > end:
+                            f.write(chunk[:end - position])
+                            position = end
+                            break
+                        f.write(chunk)
+                        position += len(chunk)
+                    else:
+                        exhausted = True
+                except _DROPPED as e:
+                    error = e
+                if not exhausted:
+                    # unread data would corrupt the next response sent over
+                    # this connection
+                    response.close()
+                response.release_conn()
+
+                if error is None and (end is None or position >= end):
+                    return
+                # only failures without any progress in between count
+                # towards the limit
+                attempts = 1 if position > received else attempts + 1
+                if attempts > config.download_retries:
+                    if error is not None:
+                        raise error
+                    raise urllib3.exceptions.IncompleteRead(
+                        position, end - position)
+                response = None
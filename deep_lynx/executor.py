@@ -0,0 +1,118 @@
+# coding: utf-8
+"""
+    DeepLynx
+
+    Process-wide worker pool behind `async_req=True`.
+
+    Every `ApiClient` shares one bounded `ThreadPoolExecutor` that is only
+    started when the first asynchronous request is submitted, so building a
+    client never spawns threads. A forked child starts a pool of its own,
+    since the worker threads of the parent's do not exist in it.
+"""
+from __future__ import absolute_import
+
+import concurrent.futures
+import multiprocessing
+import threading
+
+from deep_lynx import forksafe
+
+
+_lock = threading.Lock()
+_executor = None
+
+
+class ApiFuture(concurrent.futures.Future):
+    """Future returned by `async_req=True` calls.
+
+    A regular `concurrent.futures.Future` (cancellation, timeouts,
+    callbacks, `concurrent.futures.wait`) that also keeps the
+    `multiprocessing.pool.AsyncResult` methods the generated docstrings
+    advertise, so ``api.list_nodes(..., async_req=True).get()`` still works.
+    """
+
+    def get(self, timeout=None):
+        """Returns the result, waiting up to `timeout` seconds for it."""
+        return self.result(timeout)
+
+    def wait(self, timeout=None):
+        """Waits up to `timeout` seconds for the request to finish."""
+        concurrent.futures.wait([self], timeout)
+
+    def ready(self):
+        """Returns whether the request has finished."""
+        return self.done()
+
+    def successful(self):
+        """Returns whether the request finished without raising.
+
+        :raises ValueError: if the request has not finished yet.
+        """
+        if not self.done():
+            raise ValueError("{0!r} not ready".format(self))
+        return not self.cancelled() and self.exception() is None
+
+
+def default_max_workers():
+    """Default pool size, matching `Configuration.connection_pool_maxsize`
+    so that workers never queue on the connection pool."""
+    return multiprocessing.cpu_count() * 5
+
+
+def get_executor(max_workers=None):
+    """Returns the shared executor, starting it on first use.
+
+    :param max_workers: size of the pool if it has to be started; ignored
+        once the pool is running. Defaults to `default_max_workers()`.
+    """
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=max_workers or default_max_workers(),
+                    thread_name_prefix='deep_lynx')
+    return _executor
+
+
+def submit(fn, *args, **kwargs):
+    """Schedules `fn(*args, **kwargs)` on the shared executor.
+
+    :param max_workers: keyword-only, forwarded to `get_executor`.
+    :return: ApiFuture
+    """
+    max_workers = kwargs.pop('max_workers', None)
+    future = ApiFuture()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+
+    get_executor(max_workers).submit(run)
+    return future
+
+
+def shutdown(wait=True):
+    """Stops the shared executor; the next submission starts a new one.
+
+    :param wait: block until running requests have finished.
+    """
+    global _executor
+    with _lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
+
+@forksafe.at_fork
+def _after_fork():
+    global _executor, _lock
+    # requests queued in the parent are the parent's to run
+    _executor = None
+    _lock = threading.Lock()
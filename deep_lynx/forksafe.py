@@ -0,0 +1,149 @@
+# coding: utf-8
+"""
+    DeepLynx
+
+    Fork safety and clients for worker processes.
+
+    A forked child inherits the parent's connection pools, whose sockets
+    are still in use by the parent, and locks that threads of the parent
+    may have held at the time of the fork, which then stay locked forever
+    since those threads do not exist in the child. Objects holding such
+    state `register` themselves, and their ``_after_fork`` method runs in
+    the child right after `os.fork`, before anything else uses them:
+    connection pools are dropped and rebuilt on the next request, locks
+    replaced, and requests the parent had in flight forgotten. Module
+    level state, such as the shared executor, resets itself through
+    `at_fork`. Clients therefore keep working in processes forked by
+    `multiprocessing` or `concurrent.futures.ProcessPoolExecutor`.
+
+    Processes that are spawned rather than forked need a client of their
+    own. `ApiClient.spec` returns a `ClientSpec`, a picklable description
+    of a client, its configuration and its hooks, that builds an
+    equivalent client in the worker::
+
+        spec = api_client.spec()
+        with ProcessPoolExecutor() as pool:
+            pool.map(load, [(spec, chunk) for chunk in chunks])
+
+        def load(args):
+            spec, chunk = args
+            GraphApi(spec.client()).create_or_update_nodes(...)
+
+    `ClientSpec.client` builds the client once per process and spec, so
+    every task a worker runs reuses its connections. Pickling an
+    `ApiClient` itself pickles its spec. Caches, limiters, circuit
+    breakers, coalescing and metrics are per process: the copy a worker
+    gets has the same settings but starts empty, and a `TokenManager` is
+    rebuilt with `TokenManager.shared`, so sharing tokens between
+    processes takes its `cache_path`.
+"""
+from __future__ import absolute_import
+
+import logging
+import os
+import threading
+import uuid
+import weakref
+
+logger = logging.getLogger(__name__)
+
+_objects = weakref.WeakSet()
+
+
+def register(obj):
+    """Calls ``obj._after_fork()`` in the child of every later fork, for
+    as long as `obj` is alive."""
+    _objects.add(obj)
+
+
+def at_fork(fn):
+    """Calls `fn` in the child of every later fork; returns `fn`, so it
+    can decorate module level functions."""
+    if hasattr(os, 'register_at_fork'):
+        os.register_at_fork(after_in_child=fn)
+    return fn
+
+
+@at_fork
+def _after_fork():
+    for obj in list(_objects):
+        try:
+            obj._after_fork()
+        except Exception:
+            logger.exception("Resetting %r after fork failed", obj)
+
+
+# settings that are rebuilt rather than copied: the handlers follow from
+# `logger_file` and `logger_format`, and loggers are per process
+_NOT_COPIED = frozenset(['logger', 'logger_stream_handler',
+                         'logger_file_handler', 'logger_formatter'])
+# properties of the configuration, kept in private attributes
+_PROPERTIES = ('logger_format', 'logger_file', 'debug')
+
+
+class ClientSpec(object):
+    """Picklable description of an `ApiClient`, see the module
+    documentation.
+
+    :param client_class: `ApiClient` or a subclass of it.
+    :param settings: configuration attributes, by name.
+    :param default_headers: headers sent with every request.
+    :param cookie: cookie sent with every request.
+    :param hooks: request hooks, see `ApiClient.add_hook`.
+    """
+
+    _lock = threading.Lock()
+    _clients = {}
+
+    def __init__(self, client_class, settings, default_headers=None,
+                 cookie=None, hooks=()):
+        self.client_class = client_class
+        self.settings = dict(settings)
+        self.default_headers = dict(default_headers or {})
+        self.cookie = cookie
+        self.hooks = list(hooks)
+        # identifies the spec in the processes it is sent to
+        self.key = uuid.uuid4().hex
+
+    @classmethod
+    def of(cls, api_client):
+        """Returns the spec of `api_client`."""
+        configuration = api_client.configuration
+        settings = {}
+        for name in list(vars(configuration)) + list(_PROPERTIES):
+            if not name.startswith('_') and name not in _NOT_COPIED:
+                settings[name] = getattr(configuration, name)
+        return cls(type(api_client), settings, api_client.default_headers,
+                   api_client.cookie, api_client.hooks)
+
+    def build(self):
+        """Returns a new client built from the spec."""
+        from deep_lynx.configuration import Configuration
+
+        configuration = Configuration()
+        for name, value in self.settings.items():
+            # setting the logger file again would add another handler
+            if value != getattr(configuration, name, None):
+                setattr(configuration, name, value)
+        client = self.client_class(configuration)
+        client.default_headers.update(self.default_headers)
+        client.cookie = self.cookie
+        for hook in self.hooks:
+            client.add_hook(hook)
+        return client
+
+    def client(self):
+        """Returns the client built from the spec in this process,
+        building it on first use."""
+        client = self._clients.get(self.key)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(self.key)
+                if client is None:
+                    client = self._clients[self.key] = self.build()
+        return client
+
+
+@at_fork
+def _reset_specs():
+    ClientSpec._lock = threading.Lock()
@@ -0,0 +1,248 @@
+# coding: utf-8
+"""
+    DeepLynx
+
+    Keyset pagination of nodes through GraphQL.
+
+    `list_nodes` pages by offset, and every page of a deep offset costs
+    the server a scan of all the nodes before it, so reading a container
+    page by page takes time quadratic in its size. The GraphQL endpoint of
+    `DataQueryApi.data_query` filters on the fields of `_record` instead,
+    so a `NodeQuery` asks for the nodes of a metatype whose id is greater
+    than the last one read, sorted by id::
+
+        {
+          metatypes {
+            Asset(_record: {limit: 1000, sortBy: "id",
+                            id: {operator: ">", value: "4122"}}) {
+              _record { id data_source_id ... }
+              serial_number
+            }
+          }
+        }
+
+    The metatype and its keys are read once, before the first page, to
+    name the GraphQL type and the property fields. Records are turned back
+    into the nodes `list_nodes` returns, in the response mode of the call.
+    Ids are unique and never reused, unlike `created_at`, so they make the
+    key.
+
+    `_record` does not carry every field of a node, so the nodes read by
+    keyset are not quite those `list_nodes` returns: `deleted_at`,
+    `data_staging_id`, `type_mapping_transformation_id` and the nested
+    `metatype` are None, and `properties` only holds the keys of the
+    metatype that are not archived. Keysets are therefore opt-in:
+    `GraphApi.iter_nodes` reads offset pages unless given
+    ``strategy='auto'`` or ``strategy='keyset'``.
+
+    Keysets need a `metatype_id`, optionally a `data_source_id`, and no
+    other filter. In the ``auto`` strategy, `iter_nodes` reads offset pages
+    when the filters need more, when the client is an `AsyncApiClient`, or
+    when the server rejects the first query.
+"""
+from __future__ import absolute_import
+
+import asyncio
+import json
+import re
+
+from deep_lynx import deserializer
+from deep_lynx import pagination
+from deep_lynx import scan
+from deep_lynx.rest import ApiException
+
+STRATEGIES = ('auto', 'keyset', 'offset')
+
+# fields of `_record` and the attributes of `Node` they fill
+RECORD_FIELDS = (
+    ('id', 'id'),
+    ('metatype_id', 'metatype_id'),
+    ('metatype_name', 'metatype_name'),
+    ('data_source_id', 'data_source_id'),
+    ('import_id', 'import_data_id'),
+    ('original_id', 'original_data_id'),
+    ('metadata', 'metadata'),
+    ('created_at', 'created_at'),
+    ('created_by', 'created_by'),
+    ('modified_at', 'modified_at'),
+    ('modified_by', 'modified_by'),
+)
+
+# status codes of a server without the `_record` filters
+_REJECTED = frozenset([400, 404])
+
+
+def graphql_name(name):
+    """Returns the GraphQL name DeepLynx gives a metatype or key name."""
+    name = re.sub(r'[^a-zA-Z0-9_]', '', name.replace(' ', '_'))
+    if name[:1].isdigit():
+        name = '_' + name
+    return name
+
+
+def literal(value):
+    """Returns `value` as a GraphQL string."""
+    # JSON strings are GraphQL strings
+    return json.dumps(str(value))
+
+
+def metatype_type_name(api_client, container_id, metatype_id):
+    """Returns the GraphQL type of a metatype, reading its name.
+
+    :raises pagination.KeysetUnavailable: with an `AsyncApiClient`, or
+        when the name makes no GraphQL type.
+    """
+    from deep_lynx.api.metatypes_api import MetatypesApi
+
+    metatype = MetatypesApi(api_client).retrieve_metaype(
+        container_id, metatype_id, _response_mode='dict')
+    if asyncio.iscoroutine(metatype):
+        metatype.close()
+        raise pagination.KeysetUnavailable(
+            "GraphQL queries are sent with a blocking ApiClient")
+    type_name = graphql_name((metatype.get('value') or {}).get('name') or '')
+    if not type_name:
+        raise pagination.KeysetUnavailable(
+            "Metatype {0} has no GraphQL type".format(metatype_id))
+    return type_name
+
+
+def query_records(api_client, container_id, type_name, query):
+    """Sends a GraphQL `query` and returns the records of `type_name`.
+
+    :raises pagination.KeysetUnavailable: when the server rejects the
+        query.
+    """
+    from deep_lynx.api.data_query_api import DataQueryApi
+
+    try:
+        response = DataQueryApi(api_client).data_query(
+            {'query': query}, container_id, _response_mode='dict')
+    except ApiException as e:
+        if e.status in _REJECTED:
+            raise pagination.KeysetUnavailable(str(e))
+        raise
+    if response.get('errors'):
+        raise pagination.KeysetUnavailable(
+            "; ".join(error.get('message', str(error))
+                      for error in response['errors']))
+    records = ((response.get('data') or {}).get('metatypes') or {}).get(
+        type_name)
+    if records is None:
+        raise pagination.KeysetUnavailable(
+            "No GraphQL type {0}".format(type_name))
+    return records
+
+
+class NodeQuery(object):
+    """Reads pages of the nodes of one metatype by id, see the module
+    documentation.
+
+    :param api_client: blocking `ApiClient` to send the queries with.
+    :param container_id: container of the nodes.
+    :param metatype_id: metatype of the nodes.
+    :param data_source_id: only nodes of this data source.
+    :param response_mode: response mode of the nodes returned, defaults to
+        `Configuration.response_mode`.
+    """
+
+    def __init__(self, api_client, container_id, metatype_id,
+                 data_source_id=None, response_mode=None):
+        self.api_client = api_client
+        self.container_id = container_id
+        self.metatype_id = metatype_id
+        self.data_source_id = data_source_id
+        self.response_mode = (response_mode or
+                              api_client.configuration.response_mode)
+        if self.response_mode == 'raw_bytes':
+            raise ValueError("Pages cannot be read in the `raw_bytes` "
+                             "response mode")
+        self.type_name = None
+        # GraphQL field of every key and its property name
+        self.properties = None
+
+    def __repr__(self):
+        return "NodeQuery({0!r}, {1!r})".format(self.container_id,
+                                                self.metatype_id)
+
+    def __call__(self, after, limit):
+        if self.type_name is None:
+            self._load_metatype()
+        records = query_records(self.api_client, self.container_id,
+                                self.type_name, self.query(after, limit))
+        nodes = [self.node(record) for record in records]
+        if self.response_mode == 'dict':
+            return nodes
+        return [deserializer.deserialize(
+            node, 'Node', compact=self.response_mode == 'compact')
+            for node in nodes]
+
+    def query(self, after, limit):
+        """Returns the GraphQL query of the `limit` nodes after id
+        `after`."""
+        arguments = ['limit: %d' % limit, 'sortBy: "id"']
+        if after is not None:
+            arguments.append('id: {operator: ">", value: %s}' %
+                             literal(after))
+        if self.data_source_id is not None:
+            arguments.append('data_source_id: {operator: "eq", value: %s}' %
+                             literal(self.data_source_id))
+        return '{ metatypes { %s(_record: {%s}) { _record { %s } %s } } }' % (
+            self.type_name, ', '.join(arguments),
+            ' '.join(field for field, _ in RECORD_FIELDS),
+            ' '.join(self.properties))
+
+    def node(self, record):
+        """Returns the `list_nodes` JSON of a GraphQL record."""
+        fields = record.get('_record') or {}
+        node = {'container_id': self.container_id}
+        for field, attribute in RECORD_FIELDS:
+            node[attribute] = fields.get(field)
+        node['properties'] = dict(
+            (name, record[field])
+            for field, name in self.properties.items() if field in record)
+        return node
+
+    def _load_metatype(self):
+        from deep_lynx.api.metatype_keys_api import MetatypeKeysApi
+
+        type_name = metatype_type_name(self.api_client, self.container_id,
+                                       self.metatype_id)
+        keys = MetatypeKeysApi(self.api_client).list_metatypes_keys(
+            self.container_id, self.metatype_id, _response_mode='dict')
+        self.properties = dict(
+            (graphql_name(key['property_name']), key['property_name'])
+            for key in keys.get('value') or []
+            if key.get('property_name') and not key.get('archived'))
+        self.type_name = type_name
+
+
+def node_pages(api_client, container_id, offsets, strategy='offset',
+               metatype_id=None, data_source_id=None, _response_mode=None,
+               **filters):
+    """Returns the nodes of a `list_nodes` listing, read by keyset when
+    the filters allow it.
+
+    :param offsets: offset `Pages` over the same nodes.
+    :param strategy: ``offset``, the default, always reads `offsets`;
+        ``auto`` reads by keyset when it can and by offset otherwise, and
+        ``keyset`` raises ValueError rather than falling back. Nodes read
+        by keyset lack some fields, see the module documentation.
+    :param filters: other `list_nodes` filters; any set to a true value
+        needs offsets.
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError("Invalid strategy `{0}`, must be one of {1}".format(
+            strategy, ', '.join(STRATEGIES)))
+    if strategy == 'offset':
+        return offsets
+    if metatype_id is None or any(filters.values()):
+        if strategy == 'keyset':
+            raise ValueError("Keyset pages need a metatype_id and no other "
+                             "filter than data_source_id")
+        return offsets
+    return pagination.KeysetPages(
+        NodeQuery(api_client, container_id, metatype_id, data_source_id,
+                  _response_mode),
+        scan.item_id, offsets.page_size,
+        fallback=offsets if strategy == 'auto' else None)
@@ -0,0 +1,71 @@
+# coding: utf-8
+"""
+    DeepLynx
+
+    Lazy loading of package attributes.
+
+    The generated packages expose a couple of hundred models and a score of
+    APIs, and importing every one of their modules dominated the start-up
+    of short-lived jobs. `deep_lynx`, `deep_lynx.api` and
+    `deep_lynx.models` declare which module defines each of their names
+    instead, and `attach` gives them a module ``__getattr__`` (PEP 562)
+    that imports a module the first time one of its names is used::
+
+        __getattr__, __dir__, __all__ = lazy.attach(__name__, {
+            'MetatypesApi': 'deep_lynx.api.metatypes_api',
+        })
+
+    ``from deep_lynx import MetatypesApi``, ``deep_lynx.MetatypesApi`` and
+    submodules such as ``deep_lynx.models`` work as before; only the
+    modules actually used get imported. Set the
+    ``DEEP_LYNX_EAGER_IMPORT`` environment variable to import everything
+    up front instead, e.g. to pay the cost before forking workers.
+"""
+from __future__ import absolute_import
+
+import importlib
+import os
+import sys
+
+
+def attach(package, names):
+    """Returns the ``__getattr__``, ``__dir__`` and ``__all__`` of a
+    package whose `names` are imported on first use.
+
+    :param package: ``__name__`` of the package.
+    :param names: dict from attribute name to the module defining it.
+    """
+    def __getattr__(name):
+        module = names.get(name)
+        if module is not None:
+            value = getattr(importlib.import_module(module), name)
+        elif not name.startswith('__'):
+            # submodules were attributes as soon as the package had
+            # imported them, e.g. `deep_lynx.models` or `deep_lynx.rest`
+            value = _submodule(package, name)
+        else:
+            value = None
+        if value is None:
+            raise AttributeError("module {0!r} has no attribute {1!r}".format(
+                package, name))
+        # later lookups find it without going through __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package])) | set(names))
+
+    if os.environ.get('DEEP_LYNX_EAGER_IMPORT'):
+        for name in names:
+            __getattr__(name)
+    return __getattr__, __dir__, sorted(names)
+
+
+def _submodule(package, name):
+    """Returns submodule `name` of `package`, None if there is none."""
+    try:
+        return importlib.import_module(package + '.' + name)
+    except ImportError as e:
+        if getattr(e, 'name', None) != package + '.' + name:
+            raise
+        return None
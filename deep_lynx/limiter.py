@@ -0,0 +1,331 @@
+# coding: utf-8
+"""
+    DeepLynx
+
+    Client-side rate and concurrency limits.
+
+    Fanning a large job out with ``async_req=True`` or `AsyncApiClient` is
+    only bounded by the connection pool, which is sized for throughput
+    rather than for what the server can take. `Configuration.limiters`
+    maps operation groups to a `Limiter` that every request of the group
+    goes through:
+
+    - ``'read'``: GET, HEAD and OPTIONS requests,
+    - ``'write'``: POST, PUT, PATCH and DELETE requests without files,
+    - ``'upload'``: requests sending files.
+
+    A single operation, named like `metrics.RequestInfo.operation`, can
+    also be given a limiter of its own::
+
+        config.limiters = {
+            'write': Limiter(rate=50, concurrency=AdaptiveConcurrency(
+                initial=4, maximum=32)),
+            'upload': Limiter(concurrency=2),
+        }
+
+    `TokenBucket` spaces requests to a steady rate with bursts of up to
+    `burst` requests. `AdaptiveConcurrency` bounds the requests in flight
+    with additive increase, multiplicative decrease: the limit grows by
+    about one per round trip while latency stays within `tolerance` times
+    its baseline, and is cut by `backoff` when requests fail with 429, 5xx
+    or transport errors, or their latency spikes.
+"""
+from __future__ import absolute_import
+
+import asyncio
+import collections
+import socket
+import sys
+import threading
+import time
+
+import urllib3
+
+from deep_lynx import forksafe
+from deep_lynx.rest import ApiException
+
+# transport errors only: other OSErrors, such as a missing upload or a
+# full disk, are local and say nothing about the server
+_CONNECTION_ERRORS = (urllib3.exceptions.HTTPError, ConnectionError,
+                      socket.timeout, asyncio.TimeoutError)
+
+# latencies above this many times the baseline are taken for overload
+DEFAULT_TOLERANCE = 2.0
+
+
+class TokenBucket(object):
+    """Spaces requests to `rate` per second, allowing bursts of `burst`.
+
+    Callers reserve a token and wait until it is due, so waiters are served
+    in order and the bucket works the same for threads and coroutines.
+
+    :param rate: requests per second.
+    :param burst: largest number of requests sent back to back, defaults
+        to one second worth of requests.
+    """
+
+    def __init__(self, rate, burst=None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(rate, 1))
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        forksafe.register(self)
+
+    def __getstate__(self):
+        # a copy in another process starts with a full bucket
+        return {'rate': self.rate, 'burst': self.burst}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def _after_fork(self):
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Takes a token and returns the seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens +
+                               (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class _Slot(object):
+    __slots__ = ('generation', 'saturated')
+
+    def __init__(self, generation, saturated):
+        self.generation = generation
+        self.saturated = saturated
+
+
+class AdaptiveConcurrency(object):
+    """Bounds requests in flight with an AIMD controlled limit.
+
+    :param initial: limit to start from.
+    :param minimum: lowest limit.
+    :param maximum: highest limit; equal to `minimum` for a fixed limit.
+    :param backoff: factor applied to the limit on failures.
+    :param tolerance: latencies above `tolerance` times the baseline count
+        as failures.
+    :param smoothing: weight of each new latency in the baseline.
+    """
+
+    def __init__(self, initial=4, minimum=1, maximum=64, backoff=0.5,
+                 tolerance=DEFAULT_TOLERANCE, smoothing=0.05):
+        if not minimum <= initial <= maximum:
+            raise ValueError("initial must be between minimum and maximum")
+        self.minimum = minimum
+        self.maximum = maximum
+        self.backoff = backoff
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self._limit = float(initial)
+        self._in_flight = 0
+        self._baseline = None
+        # the limit is only cut once for requests sent under the same limit
+        self._generation = 0
+        self._waiters = collections.deque()
+        self._lock = threading.Lock()
+        forksafe.register(self)
+
+    def __getstate__(self):
+        # a copy in another process starts from the limit learned so far
+        return {'initial': self.limit, 'minimum': self.minimum,
+                'maximum': self.maximum, 'backoff': self.backoff,
+                'tolerance': self.tolerance, 'smoothing': self.smoothing}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def _after_fork(self):
+        # the requests in flight and the waiters are the parent's
+        self._in_flight = 0
+        self._waiters = collections.deque()
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self):
+        """Current number of requests allowed in flight."""
+        return max(int(self._limit), self.minimum)
+
+    @property
+    def in_flight(self):
+        return self._in_flight
+
+    @property
+    def baseline(self):
+        """Smoothed latency of successful requests, None until the first."""
+        return self._baseline
+
+    def _take(self):
+        self._in_flight += 1
+        return _Slot(self._generation, self._in_flight * 2 >= self.limit)
+
+    def acquire(self):
+        """Waits for room for one more request and returns its slot."""
+        with self._lock:
+            if self._in_flight < self.limit and not self._waiters:
+                return self._take()
+            ready = threading.Event()
+            waiter = [ready.set, None]
+            self._waiters.append(waiter)
+        try:
+            ready.wait()
+        except BaseException:
+            # e.g. KeyboardInterrupt: leave the queue, or give back the
+            # slot handed over meanwhile, so no slot is lost
+            with self._lock:
+                queued = waiter in self._waiters
+                if queued:
+                    self._waiters.remove(waiter)
+            if not queued:
+                self._give_back(waiter[1])
+            raise
+        return waiter[1]
+
+    async def acquire_async(self):
+        """Coroutine version of `acquire`."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._in_flight < self.limit and not self._waiters:
+                return self._take()
+            future = loop.create_future()
+            waiter = [lambda: loop.call_soon_threadsafe(
+                self._hand_over, future, waiter), None]
+            self._waiters.append(waiter)
+        return await future
+
+    def _hand_over(self, future, waiter):
+        if future.cancelled():
+            # the coroutine gave up after being handed a slot
+            self._give_back(waiter[1])
+        else:
+            future.set_result(waiter[1])
+
+    def release(self, slot, latency=None, failed=False):
+        """Frees the slot of a finished request and adapts the limit.
+
+        :param latency: seconds the request took, None if unknown.
+        :param failed: True if the request hit an overloaded server.
+        """
+        with self._lock:
+            spike = (latency is not None and self._baseline is not None and
+                     latency > self._baseline * self.tolerance)
+            if latency is not None and not failed:
+                # spikes move the baseline too, so that a server that got
+                # slower for good is not backed off from forever
+                if self._baseline is None:
+                    self._baseline = latency
+                else:
+                    self._baseline += self.smoothing * (latency -
+                                                        self._baseline)
+            if failed or spike:
+                if slot.generation == self._generation:
+                    self._limit = max(self._limit * self.backoff,
+                                      float(self.minimum))
+                    self._generation += 1
+            elif latency is not None:
+                if slot.saturated:
+                    # about one more request per round trip
+                    self._limit = min(self._limit + 1.0 / self._limit,
+                                      float(self.maximum))
+            wake = self._free()
+        for callback in wake:
+            callback()
+
+    def _give_back(self, slot):
+        with self._lock:
+            wake = self._free()
+        for callback in wake:
+            callback()
+
+    def _free(self):
+        self._in_flight -= 1
+        wake = []
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            waiter[1] = self._take()
+            wake.append(waiter[0])
+        return wake
+
+
+class Limiter(object):
+    """Rate and concurrency limits of a group of operations.
+
+    :param rate: requests per second, None for no rate limit.
+    :param burst: see `TokenBucket`.
+    :param concurrency: `AdaptiveConcurrency`, or a number for a fixed
+        limit; None for no concurrency limit.
+    """
+
+    def __init__(self, rate=None, burst=None, concurrency=None):
+        self.bucket = TokenBucket(rate, burst) if rate else None
+        if isinstance(concurrency, int):
+            concurrency = AdaptiveConcurrency(concurrency, concurrency,
+                                              concurrency)
+        self.concurrency = concurrency
+
+    def acquire(self):
+        """Waits until a request may be sent; returns the slot to pass to
+        `release`."""
+        slot = None
+        if self.concurrency is not None:
+            slot = self.concurrency.acquire()
+        if self.bucket is not None:
+            delay = self.bucket.reserve()
+            if delay:
+                try:
+                    time.sleep(delay)
+                except BaseException:
+                    self.release(slot)
+                    raise
+        return slot
+
+    async def acquire_async(self):
+        """Coroutine version of `acquire`."""
+        slot = None
+        if self.concurrency is not None:
+            slot = await self.concurrency.acquire_async()
+        if self.bucket is not None:
+            delay = self.bucket.reserve()
+            if delay:
+                try:
+                    await asyncio.sleep(delay)
+                except BaseException:
+                    self.release(slot)
+                    raise
+        return slot
+
+    def release(self, slot, latency=None, failed=False):
+        """Reports a finished request, see `AdaptiveConcurrency.release`."""
+        if slot is not None:
+            self.concurrency.release(slot, latency, failed)
+
+
+def operation_group(method, files=None):
+    """Returns the group of limiters a request belongs to."""
+    if files and any(v is not None for v in files.values()):
+        return 'upload'
+    if method in ('GET', 'HEAD', 'OPTIONS'):
+        return 'read'
+    return 'write'
+
+
+def overloaded(error):
+    """True if `error` says the server is overloaded: 429 and 5xx responses,
+    connection errors and timeouts. Local errors, such as a missing file to
+    upload, are not."""
+    if isinstance(error, ApiException):
+        return error.status == 429 or (error.status or 0) >= 500
+    if isinstance(error, _CONNECTION_ERRORS):
+        return True
+    # aiohttp is only imported by the async client, and slow to import
+    aiohttp = sys.modules.get('aiohttp')
+    return aiohttp is not None and isinstance(error, aiohttp.ClientError)
@@ -0,0 +1,312 @@
+# coding: utf-8
+"""
+    DeepLynx
+
+    Request instrumentation.
+
+    `ApiClient` calls the hooks registered with `ApiClient.add_hook` around
+    every request. A hook is any object with some of these methods, each
+    receiving the `RequestInfo` of the request:
+
+    - ``on_request(info)`` before the request is sent,
+    - ``on_response(info)`` once a 2xx response has been received,
+    - ``on_error(info)`` when the request failed; `info.error` holds the
+      exception, and `info.status` the status of error responses;
+    - ``on_circuit(breaker)`` when a `circuit.CircuitBreaker` changes
+      state.
+
+    `MetricsCollector` is a hook keeping per-operation latency histograms,
+    status counts, payload sizes, retries and the time requests waited for
+    a worker of the shared executor, along with the state of circuit
+    breakers. It exports them as a dict or in the
+    Prometheus text format, e.g. for the node exporter's textfile
+    collector::
+
+        collector = MetricsCollector()
+        api_client.add_hook(collector)
+        ...
+        collector.write_prometheus('/var/lib/node_exporter/deep_lynx.prom')
+
+    Operations are named after the method and path template of the
+    endpoint, such as ``GET /containers/{container_id}/graphs/nodes``, so
+    the number of series stays bounded whatever ids are requested.
+"""
+from __future__ import absolute_import
+
+import bisect
+import os
+import tempfile
+import threading
+
+import six
+
+from deep_lynx import circuit
+from deep_lynx import forksafe
+
+# seconds, as the Prometheus client libraries use by default
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75,
+                   1.0, 2.5, 5.0, 7.5, 10.0, 30.0, 60.0)
+
+
+class RequestInfo(object):
+    """One request, as seen by the hooks.
+
+    :ivar operation: method and path template, e.g.
+        ``GET /containers/{container_id}/graphs/nodes``.
+    :ivar method: HTTP method.
+    :ivar url: full url, without the query string.
+    :ivar pool_wait: seconds spent waiting for a worker of the shared
+        executor (`async_req=True` requests only, 0 otherwise).
+    :ivar elapsed: seconds from sending the request to having read the
+        response, None until then.
+    :ivar status: HTTP status, None if no response was received.
+    :ivar request_bytes: size of the encoded request body, when known.
+    :ivar response_bytes: size of the response body, when known.
+    :ivar retries: number of times the request was retried.
+    :ivar error: the exception the request failed with, if any.
+    """
+
+    __slots__ = ('operation', 'method', 'url', 'pool_wait', 'started',
+                 'elapsed', 'status', 'request_bytes', 'response_bytes',
+                 'retries', 'error')
+
+    def __init__(self, operation, method, url, pool_wait=0.0):
+        self.operation = operation
+        self.method = method
+        self.url = url
+        self.pool_wait = pool_wait
+        self.started = None
+        self.elapsed = None
+        self.status = None
+        self.request_bytes = None
+        self.response_bytes = None
+        self.retries = 0
+        self.error = None
+
+    def __repr__(self):
+        return "RequestInfo({0!r}, status={1!r}, elapsed={2!r})".format(
+            self.operation, self.status, self.elapsed)
+
+
+class Histogram(object):
+    """Cumulative histogram with fixed upper bounds, as in Prometheus.
+
+    :param buckets: sorted upper bounds; +Inf is implied.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the `q` quantile, or None when
+        it falls past the last bucket or nothing was observed."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return None
+
+    def to_dict(self):
+        cumulative = []
+        seen = 0
+        for count in self.counts:
+            seen += count
+            cumulative.append(seen)
+        bounds = [repr(float(b)) for b in self.buckets] + ['+Inf']
+        return {'buckets': dict(zip(bounds, cumulative)),
+                'count': self.count, 'sum': self.sum}
+
+
+class _Operation(object):
+
+    def __init__(self, buckets):
+        self.latency = Histogram(buckets)
+        self.pool_wait = Histogram(buckets)
+        self.statuses = {}
+        self.errors = {}
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.retries = 0
+
+    def to_dict(self):
+        return {
+            'requests': self.latency.count,
+            'latency_seconds': self.latency.to_dict(),
+            'pool_wait_seconds': self.pool_wait.to_dict(),
+            'statuses': dict(self.statuses),
+            'errors': dict(self.errors),
+            'request_bytes': self.request_bytes,
+            'response_bytes': self.response_bytes,
+            'retries': self.retries,
+        }
+
+
+class MetricsCollector(object):
+    """In-memory metrics, fed as an `ApiClient` hook.
+
+    Safe to share between clients and threads.
+
+    :param buckets: latency histogram bounds in seconds.
+    :param prefix: prefix of the exported Prometheus metric names.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, prefix='deep_lynx'):
+        self.buckets = tuple(buckets)
+        self.prefix = prefix
+        self._operations = {}
+        self._circuits = {}
+        self._lock = threading.Lock()
+        forksafe.register(self)
+
+    def __getstate__(self):
+        # a copy in another process counts its own requests
+        return {'buckets': self.buckets, 'prefix': self.prefix}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def _after_fork(self):
+        self._lock = threading.Lock()
+
+    def on_request(self, info):
+        pass
+
+    def on_response(self, info):
+        self._record(info)
+
+    def on_error(self, info):
+        self._record(info)
+
+    def on_circuit(self, breaker):
+        with self._lock:
+            self._circuits[breaker.name] = breaker.state
+
+    def _record(self, info):
+        with self._lock:
+            operation = self._operations.get(info.operation)
+            if operation is None:
+                operation = self._operations[info.operation] = _Operation(
+                    self.buckets)
+            if info.elapsed is not None:
+                operation.latency.observe(info.elapsed)
+            operation.pool_wait.observe(info.pool_wait)
+            status = str(info.status) if info.status is not None else 'none'
+            operation.statuses[status] = operation.statuses.get(status, 0) + 1
+            if info.error is not None:
+                name = type(info.error).__name__
+                operation.errors[name] = operation.errors.get(name, 0) + 1
+            operation.request_bytes += info.request_bytes or 0
+            operation.response_bytes += info.response_bytes or 0
+            operation.retries += info.retries
+
+    def reset(self):
+        """Forgets everything recorded so far."""
+        with self._lock:
+            self._operations.clear()
+            self._circuits.clear()
+
+    def to_dict(self):
+        """Returns the metrics of every operation, keyed by operation."""
+        with self._lock:
+            return {name: operation.to_dict()
+                    for name, operation in six.iteritems(self._operations)}
+
+    def circuits(self):
+        """Returns the last known state of every circuit breaker that
+        changed state, keyed by circuit."""
+        with self._lock:
+            return dict(self._circuits)
+
+    def to_prometheus(self):
+        """Returns the metrics in the Prometheus text exposition format."""
+        p = self.prefix
+        families = [
+            ('request_duration_seconds', 'histogram',
+             'Time from sending a request to reading its response.'),
+            ('pool_wait_seconds', 'histogram',
+             'Time async_req requests waited for an executor worker.'),
+            ('requests_total', 'counter', 'Requests by response status.'),
+            ('request_errors_total', 'counter', 'Failed requests by error.'),
+            ('request_bytes_total', 'counter', 'Bytes of request bodies.'),
+            ('response_bytes_total', 'counter', 'Bytes of response bodies.'),
+            ('retries_total', 'counter', 'Retried attempts.'),
+            ('circuit_state', 'gauge',
+             '1 for the current state of each circuit breaker.'),
+        ]
+        lines = {name: ['# HELP %s_%s %s' % (p, name, doc),
+                        '# TYPE %s_%s %s' % (p, name, kind)]
+                 for name, kind, doc in families}
+        with self._lock:
+            for name in sorted(self._operations):
+                operation = self._operations[name]
+                labels = 'operation="%s"' % _escape(name)
+                _histogram_lines(lines['request_duration_seconds'],
+                                 '%s_request_duration_seconds' % p, labels,
+                                 operation.latency)
+                _histogram_lines(lines['pool_wait_seconds'],
+                                 '%s_pool_wait_seconds' % p, labels,
+                                 operation.pool_wait)
+                for status in sorted(operation.statuses):
+                    lines['requests_total'].append(
+                        '%s_requests_total{%s,status="%s"} %d' % (
+                            p, labels, status, operation.statuses[status]))
+                for error in sorted(operation.errors):
+                    lines['request_errors_total'].append(
+                        '%s_request_errors_total{%s,error="%s"} %d' % (
+                            p, labels, _escape(error),
+                            operation.errors[error]))
+                for name_, value in (
+                        ('request_bytes_total', operation.request_bytes),
+                        ('response_bytes_total', operation.response_bytes),
+                        ('retries_total', operation.retries)):
+                    lines[name_].append('%s_%s{%s} %d' % (p, name_, labels,
+                                                          value))
+            for name in sorted(self._circuits):
+                for state in circuit.STATES:
+                    lines['circuit_state'].append(
+                        '%s_circuit_state{circuit="%s",state="%s"} %d' % (
+                            p, _escape(name), state,
+                            self._circuits[name] == state))
+        return ''.join('\n'.join(lines[name]) + '\n'
+                       for name, _, _ in families)
+
+    def write_prometheus(self, path):
+        """Writes `to_prometheus` to `path` atomically, so that a
+        textfile collector never reads a partial file."""
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, temp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(self.to_prometheus())
+            os.replace(temp, path)
+        except BaseException:
+            os.remove(temp)
+            raise
+
+
+def _escape(value):
+    return (value.replace('\\', '\\\\').replace('"', '\\"')
+            .replace('\n', '\\n'))
+
+
+def _histogram_lines(lines, name, labels, histogram):
+    seen = 0
+    for bound, count in zip(histogram.buckets + (float('inf'),),
+                            histogram.counts):
+        seen += count
+        le = '+Inf' if bound == float('inf') else repr(float(bound))
+        lines.append('%s_bucket{%s,le="%s"} %d' % (name, labels, le, seen))
+    lines.append('%s_sum{%s} %r' % (name, labels, histogram.sum))
+    lines.append('%s_count{%s} %d' % (name, labels, histogram.count))
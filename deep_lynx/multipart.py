@@ -0,0 +1,206 @@
+# coding: utf-8
+"""
+    DeepLynx
+
+    Streaming multipart/form-data bodies for file uploads.
+
+    `ApiClient.prepare_post_parameters` used to read every uploaded file
+    into memory, and urllib3 then built the whole multipart body in memory
+    a second time. Files are now wrapped in `UploadFile` and
+    `MultipartEncoder` produces the body in chunks of
+    `Configuration.upload_chunk_size` as it is sent, so memory stays bounded
+    whatever the size of the files. The body is byte for byte what
+    `urllib3.encode_multipart_formdata` would build, and its Content-Length
+    is computed up front when the file sizes are known; otherwise it is sent
+    with chunked transfer encoding.
+
+    Wherever an API method takes a file path (`DataSourcesApi.upload_file`,
+    `ContainersApi.import_container`, `TagsApi.upload_webgl`, ...) an
+    `UploadFile` can be passed instead, to upload an open file object or to
+    follow the progress of the upload::
+
+        def progress(sent, total):
+            print('%d of %s bytes sent' % (sent, total))
+
+        api.upload_file(container_id, data_source_id,
+                        file=UploadFile('scan.e57', progress=progress))
+"""
+from __future__ import absolute_import
+
+import io
+import mimetypes
+import os
+
+import six
+from urllib3.fields import RequestField
+from urllib3.filepost import choose_boundary
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+class UploadFile(object):
+    """A file sent in a multipart upload, read in chunks while it is sent.
+
+    :param file: path of the file, or a binary file object. File objects
+        are read from their current position and are not closed.
+    :param filename: name sent to the server, defaults to the base name of
+        the file.
+    :param mimetype: content type of the file, guessed from the file name
+        by default.
+    :param progress: optional callable invoked as ``progress(sent, total)``
+        after each chunk read from the file, `total` being None when the
+        size of the file is unknown.
+    """
+
+    def __init__(self, file, filename=None, mimetype=None, progress=None):
+        self.file = file
+        if filename is None:
+            name = file if isinstance(file, six.string_types) else getattr(
+                file, 'name', None)
+            filename = os.path.basename(name) if isinstance(
+                name, six.string_types) else 'file'
+        self.filename = filename
+        self.mimetype = (mimetype or mimetypes.guess_type(filename)[0] or
+                         'application/octet-stream')
+        self.progress = progress
+        self._start = None
+        if not isinstance(file, six.string_types):
+            try:
+                self._start = file.tell()
+            except (AttributeError, OSError, io.UnsupportedOperation):
+                pass
+
+    @property
+    def size(self):
+        """Number of bytes that will be sent, or None if unknown."""
+        if isinstance(self.file, six.string_types):
+            return os.path.getsize(self.file)
+        if self._start is None:
+            return None
+        try:
+            return os.fstat(self.file.fileno()).st_size - self._start
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            pass
+        try:
+            position = self.file.tell()
+            end = self.file.seek(0, os.SEEK_END)
+            self.file.seek(position)
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            return None
+        return end - self._start
+
+    def open(self):
+        """Returns a binary reader over the file contents that reports
+        progress. Closing it only closes files opened from a path."""
+        if isinstance(self.file, six.string_types):
+            return _ProgressReader(open(self.file, 'rb'), True, self)
+        if self._start is not None:
+            # rewind, so that a retried request sends the file again
+            self.file.seek(self._start)
+        return _ProgressReader(self.file, False, self)
+
+    def chunks(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Yields the file contents in chunks of at most `chunk_size`."""
+        with self.open() as reader:
+            while True:
+                chunk = reader.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+
+    def __repr__(self):
+        return "UploadFile({0!r}, filename={1!r}, mimetype={2!r})".format(
+            self.file, self.filename, self.mimetype)
+
+
+class _ProgressReader(io.RawIOBase):
+    """Reads an `UploadFile`, calling its progress callback."""
+
+    def __init__(self, raw, owned, upload):
+        super(_ProgressReader, self).__init__()
+        self._raw = raw
+        self._owned = owned
+        self._progress = upload.progress
+        self._total = upload.size if upload.progress else None
+        self._sent = 0
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        data = self._raw.read(size)
+        if data and self._progress is not None:
+            self._sent += len(data)
+            self._progress(self._sent, self._total)
+        return data
+
+    def readinto(self, buffer):
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def close(self):
+        if not self.closed and self._owned:
+            self._raw.close()
+        super(_ProgressReader, self).close()
+
+
+class MultipartEncoder(object):
+    """Iterable multipart/form-data body.
+
+    Iterating over the encoder yields the body in chunks; every iteration
+    starts over, so the body can be sent again when a request is retried.
+
+    :param fields: list of (name, value) pairs, as built by
+        `ApiClient.prepare_post_parameters`. Values are plain values or
+        (filename, data, mimetype) tuples, where data is bytes, str or an
+        `UploadFile`.
+    :param boundary: multipart boundary, random by default.
+    :param chunk_size: largest number of bytes read from a file at once.
+    """
+
+    def __init__(self, fields, boundary=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        self.boundary = boundary or choose_boundary()
+        self.chunk_size = chunk_size
+        self.content_type = 'multipart/form-data; boundary=%s' % self.boundary
+        self._parts = []
+        delimiter = ('--%s\r\n' % self.boundary).encode('latin-1')
+        for name, value in (six.iteritems(fields)
+                            if isinstance(fields, dict) else fields):
+            if isinstance(value, tuple) and isinstance(value[1], UploadFile):
+                field = RequestField(name, b'', filename=value[0])
+                field.make_multipart(content_type=(
+                    value[2] if len(value) > 2 else value[1].mimetype))
+                data = value[1]
+            else:
+                field = RequestField.from_tuples(name, value)
+                data = field.data
+                if isinstance(data, six.integer_types):
+                    data = str(data)
+                if isinstance(data, six.text_type):
+                    data = data.encode('utf-8')
+            self._parts.append(
+                (delimiter + field.render_headers().encode('utf-8'), data))
+        self._end = ('--%s--\r\n' % self.boundary).encode('latin-1')
+
+    @property
+    def content_length(self):
+        """Length of the body in bytes, or None if a file size is unknown."""
+        length = len(self._end)
+        for header, data in self._parts:
+            size = data.size if isinstance(data, UploadFile) else len(data)
+            if size is None:
+                return None
+            length += len(header) + size + 2
+        return length
+
+    def __iter__(self):
+        for header, data in self._parts:
+            if isinstance(data, UploadFile):
+                yield header
+                for chunk in data.chunks(self.chunk_size):
+                    yield chunk
+                yield b'\r\n'
+            else:
+                yield header + data + b'\r\n'
+        yield self._end
@@ -0,0 +1,325 @@
+# coding: utf-8
+"""
+    DeepLynx
+
+    Local index of node ids, to resolve the endpoints of edges.
+
+    Edges name their origin and destination by node id, while loaders
+    usually know a node by its metatype and original id, or by a key of
+    their own. A `NodeIndex` maps such keys to node ids so endpoints are
+    resolved locally instead of with a request per endpoint. It is filled
+    from the nodes a bulk upsert writes, or from one scan of the
+    container::
+
+        index = NodeIndex('nodes.db')     # or NodeIndex() in memory
+        graph.bulk_upsert_nodes(container_id, nodes, index=index)
+        index.scan(client, container_id)  # nodes written earlier
+        graph.bulk_upsert_edges(container_id, edges, index=index)
+
+    The default key of a node is ``(metatype_id, original_data_id)``, and
+    that of an edge endpoint ``(origin_metatype_id, origin_original_id)``
+    or ``(destination_metatype_id, destination_original_id)``; other keys
+    are given as functions of the records. Edges that already carry an
+    `origin_id` or `destination_id` keep it.
+
+    Default keys missing from the index are looked up on the server, a
+    batch of edges at a time, with one GraphQL query per metatype
+    selecting the original ids of the batch; `list_edges_for_node_ids`
+    needs node ids, so it cannot resolve them. Keys given by `origin` or
+    `destination` functions are only resolved locally. Edges with an endpoint that is still unknown fail without
+    being sent, and so do those of a metatype whose lookup the server
+    rejects; the rejection says why.
+
+    With a `path`, the index is kept in an SQLite database on disk, so it
+    outlives the process and may exceed memory. SQLite ships with Python,
+    unlike the `dbm` backends that scale, and the fallback `dbm.dumb`
+    keeps its whole key index in memory.
+"""
+from __future__ import absolute_import
+
+import logging
+import sqlite3
+import threading
+
+from deep_lynx import bulk
+from deep_lynx import forksafe
+from deep_lynx import keyset
+from deep_lynx import pagination
+from deep_lynx import scan
+from deep_lynx.rest import ApiException
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RESOLVE_BATCH = 500
+
+# joins the parts of tuple keys
+SEPARATOR = '\x1f'
+
+# writes to a disk-backed index committed at a time
+_COMMIT_EVERY = 1000
+
+
+def _field(record, name):
+    if isinstance(record, dict):
+        return record.get(name)
+    return getattr(record, name, None)
+
+
+def node_key(node):
+    """Returns the ``(metatype_id, original_data_id)`` key of a node or
+    node upsert record, None without an original id."""
+    metatype_id = _field(node, 'metatype_id')
+    original_id = _field(node, 'original_data_id')
+    if metatype_id is None or original_id is None:
+        return None
+    return str(metatype_id), str(original_id)
+
+
+def endpoint_key(end):
+    """Returns a function giving the default key of the `end` endpoint,
+    ``'origin'`` or ``'destination'``, of an edge record."""
+    def key(edge):
+        metatype_id = _field(edge, end + '_metatype_id')
+        original_id = _field(edge, end + '_original_id')
+        if metatype_id is None or original_id is None:
+            return None
+        return str(metatype_id), str(original_id)
+    return key
+
+
+class _Database(object):
+    """Node ids by encoded key in an SQLite file, with the part of the
+    mapping interface `NodeIndex` uses; callers hold its lock."""
+
+    def __init__(self, path):
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.execute('CREATE TABLE IF NOT EXISTS nodes '
+                                 '(key TEXT PRIMARY KEY, id TEXT NOT NULL)')
+        self._connection.commit()
+        self._pending = 0
+
+    def __len__(self):
+        return self._connection.execute(
+            'SELECT COUNT(*) FROM nodes').fetchone()[0]
+
+    def get(self, key):
+        row = self._connection.execute(
+            'SELECT id FROM nodes WHERE key = ?', (key,)).fetchone()
+        return row[0] if row is not None else None
+
+    def __setitem__(self, key, node_id):
+        self._connection.execute(
+            'INSERT OR REPLACE INTO nodes (key, id) VALUES (?, ?)',
+            (key, node_id))
+        self._pending += 1
+        if self._pending >= _COMMIT_EVERY:
+            self._connection.commit()
+            self._pending = 0
+
+    def close(self):
+        self._connection.commit()
+        self._connection.close()
+
+
+class NodeIndex(object):
+    """Node ids by key, see the module documentation.
+
+    :param path: file of an SQLite database to keep the index in, None
+        keeps it in memory.
+    :param key: returns the key of a node.
+    """
+
+    def __init__(self, path=None, key=node_key):
+        self.path = path
+        self.key = key
+        self._ids = _Database(path) if path else {}
+        self._lock = threading.Lock()
+        # GraphQL type of every metatype resolved
+        self._types = {}
+        forksafe.register(self)
+
+    def __repr__(self):
+        return "NodeIndex({0!r}, {1} nodes)".format(self.path, len(self))
+
+    def _after_fork(self):
+        self._lock = threading.Lock()
+        if self.path:
+            # SQLite connections must not cross a fork
+            self._ids = _Database(self.path)
+
+    @staticmethod
+    def _encode(key):
+        if isinstance(key, tuple):
+            return SEPARATOR.join(str(part) for part in key)
+        return str(key)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._ids)
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def get(self, key, default=None):
+        """Returns the node id of `key`, `default` when it is unknown."""
+        with self._lock:
+            node_id = self._ids.get(self._encode(key))
+        return default if node_id is None else node_id
+
+    def add(self, key, node_id):
+        """Records `node_id` as the id of the node with `key`."""
+        with self._lock:
+            self._ids[self._encode(key)] = str(node_id)
+
+    def add_node(self, node, node_id=None):
+        """Records a node under its key; `node_id` defaults to its id."""
+        key = self.key(node)
+        node_id = node_id if node_id is not None else scan.item_id(node)
+        if key is not None and node_id is not None:
+            self.add(key, node_id)
+
+    def close(self):
+        """Closes the database of a disk-backed index."""
+        if self.path:
+            with self._lock:
+                self._ids.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def scan(self, api_client, container_id, **kwargs):
+        """Adds every node of a container, read with a
+        `scan.ParallelScan` taking `kwargs`; returns the number read."""
+        count = 0
+        for node in scan.ParallelScan(api_client, container_id, **kwargs):
+            self.add_node(node)
+            count += 1
+        return count
+
+    def resolve(self, api_client, container_id, keys,
+                batch_size=DEFAULT_RESOLVE_BATCH):
+        """Looks up on the server the ``(metatype_id, original_data_id)``
+        keys missing from the index, and adds those found.
+
+        A metatype whose metatype or GraphQL query the server rejects is
+        logged and skipped, so its keys stay missing.
+
+        :return: the keys still missing.
+        """
+        self._resolve(api_client, container_id, keys, batch_size)
+        return [key for key in keys if key not in self]
+
+    def _resolve(self, api_client, container_id, keys, batch_size):
+        # returns the error of every metatype whose lookup failed
+        missing = {}
+        for key in keys:
+            if isinstance(key, tuple) and len(key) == 2 and key not in self:
+                missing.setdefault(key[0], set()).add(key[1])
+        errors = {}
+        for metatype_id, original_ids in missing.items():
+            try:
+                self._resolve_metatype(api_client, container_id, metatype_id,
+                                       sorted(original_ids), batch_size)
+            except (pagination.KeysetUnavailable, ApiException) as e:
+                logger.warning("could not look up the nodes of metatype %s: "
+                               "%s", metatype_id, bulk.describe(e))
+                errors[metatype_id] = e
+        return errors
+
+    def _resolve_metatype(self, api_client, container_id, metatype_id,
+                          original_ids, batch_size):
+        type_name = self._types.get(metatype_id)
+        if type_name is None:
+            type_name = self._types[metatype_id] = \
+                keyset.metatype_type_name(api_client, container_id,
+                                          metatype_id)
+        # `in` takes a comma separated list
+        listed = [value for value in original_ids if ',' not in value]
+        for start in range(0, len(listed), batch_size):
+            self._lookup(api_client, container_id, metatype_id, type_name,
+                         'in', ','.join(listed[start:start + batch_size]))
+        for value in original_ids:
+            if ',' in value:
+                self._lookup(api_client, container_id, metatype_id,
+                             type_name, 'eq', value)
+
+    def _lookup(self, api_client, container_id, metatype_id, type_name,
+                operator, value):
+        query = ('{ metatypes { %s(_record: {original_id: {operator: %s, '
+                 'value: %s}}) { _record { id original_id } } } }' % (
+                     type_name, keyset.literal(operator),
+                     keyset.literal(value)))
+        for record in keyset.query_records(api_client, container_id,
+                                           type_name, query):
+            fields = record.get('_record') or {}
+            if fields.get('id') is not None and \
+                    fields.get('original_id') is not None:
+                self.add((metatype_id, str(fields['original_id'])),
+                         fields['id'])
+
+    def edges(self, api_client, container_id, records, origin=None,
+              destination=None, resolve=True,
+              batch_size=DEFAULT_RESOLVE_BATCH):
+        """Yields edge records with their `origin_id` and `destination_id`
+        filled from the index, and `bulk.Rejected` for those with an
+        endpoint it does not know, or whose lookup failed.
+
+        :param api_client: blocking `ApiClient` serializing the records
+            and resolving keys.
+        :param origin: returns the key of the origin of an edge record;
+            keys it returns are only resolved locally.
+        :param destination: returns the key of the destination, likewise.
+        :param resolve: look up the default keys missing from the index on
+            the server.
+        :param batch_size: records resolved at a time, and most original
+            ids per GraphQL query.
+        """
+        # (key function, field, whether the server can resolve its keys)
+        ends = ((origin or endpoint_key('origin'), 'origin_id',
+                 resolve and origin is None),
+                (destination or endpoint_key('destination'),
+                 'destination_id', resolve and destination is None))
+        batch = []
+        for record in records:
+            batch.append(record)
+            if len(batch) >= batch_size:
+                for edge in self._edges(api_client, container_id, batch,
+                                        ends, batch_size):
+                    yield edge
+                batch = []
+        for edge in self._edges(api_client, container_id, batch, ends,
+                                batch_size):
+            yield edge
+
+    def _edges(self, api_client, container_id, batch, ends, batch_size):
+        keys = [[None if _field(record, field) else key(record)
+                 for key, field, _ in ends] for record in batch]
+        errors = {}
+        remote = [key for pair in keys
+                  for key, (_, _, server) in zip(pair, ends)
+                  if server and key is not None]
+        if remote:
+            errors = self._resolve(api_client, container_id, remote,
+                                   batch_size)
+        for record, pair in zip(batch, keys):
+            edge = dict(api_client.sanitize_for_serialization(record))
+            unknown = []
+            for (_, field, server), key in zip(ends, pair):
+                if edge.get(field):
+                    continue
+                node_id = self.get(key) if key is not None else None
+                if node_id is not None:
+                    edge[field] = node_id
+                    continue
+                end = "{0} {1!r}".format(field[:-3], key)
+                error = errors.get(key[0]) if server and key else None
+                if error is not None:
+                    end += " (lookup failed: {0})".format(bulk.describe(error))
+                unknown.append(end)
+            yield (bulk.Rejected("Unknown " + ", ".join(unknown))
+                   if unknown else edge)
@@ -0,0 +1,1470 @@
+# coding: utf-8
+"""
+    DeepLynx
+
+    Registry of the API operations and their dispatcher.
+
+    Every method of the `deep_lynx.api` classes is a thin wrapper around
+    `call`, which looks the operation up in `OPERATIONS` and turns the
+    arguments into the path, query, header, form and body parameters of
+    `ApiClient.call_api`. An `Operation` declares its HTTP method, path
+    template, response type and parameters; each parameter is named as in
+    Python, or as a ``(wire_name, name)`` pair when the API spells it
+    differently::
+
+        'list_nodes': Operation(
+            'GET', '/containers/{container_id}/graphs/nodes',
+            response_type='ListNodesResponse',
+            params=('container_id',),
+            optional=('limit', ...),
+            path_params=('container_id',),
+            query=('limit', ...)),
+
+    `Operation` precomputes what does not change between calls. On first
+    use it selects its ``Accept`` and ``Content-Type`` headers and
+    generates a dispatcher specialised to its parameters, so a call only
+    looks at the arguments the operation can take. Operations shared by
+    several API classes, such as the time series queries, are declared
+    once.
+"""
+from __future__ import absolute_import
+
+# keyword arguments every operation accepts
+OPTIONS = ('async_req', '_return_http_data_only', '_preload_content',
+           '_request_timeout', '_response_mode')
+
+JSON = ('application/json',)
+
+
+def _pairs(params):
+    return tuple((param, param) if isinstance(param, str) else tuple(param)
+                 for param in params)
+
+
+class Operation(object):
+    """An API operation, see the module documentation.
+
+    :param method: HTTP method.
+    :param path: path template, e.g. ``/containers/{container_id}``.
+    :param response_type: type the response is deserialized into.
+    :param params: required parameters, in the order of the positional
+        arguments of the API method.
+    :param optional: optional parameters, passed as keyword arguments.
+    :param path_params: parameters substituted into `path`.
+    :param query: query parameters.
+    :param headers: header parameters.
+    :param form: form fields.
+    :param files: file fields.
+    :param body: the parameter sent as the request body.
+    :param accepts: media types of the ``Accept`` header.
+    :param content_types: media types of the ``Content-Type`` header.
+    :param auth: authentication settings.
+    :param options: keyword arguments accepted besides `OPTIONS`.
+    """
+
+    __slots__ = ('name', 'method', 'path', 'response_type', 'params',
+                 'optional', 'path_params', 'query', 'headers', 'form',
+                 'files', 'body', 'accepts', 'content_types', 'auth',
+                 'options', 'allowed', '_static_headers', '_dispatch')
+
+    def __init__(self, method, path, response_type=None, params=(),
+                 optional=(), path_params=(), query=(), headers=(), form=(),
+                 files=(), body=None, accepts=JSON, content_types=None,
+                 auth=('BearerAuth',), options=()):
+        self.name = None
+        self.method = method
+        self.path = path
+        self.response_type = response_type
+        self.params = tuple(params)
+        self.optional = tuple(optional)
+        self.path_params = _pairs(path_params)
+        self.query = _pairs(query)
+        self.headers = _pairs(headers)
+        self.form = _pairs(form)
+        self.files = _pairs(files)
+        self.body = body
+        self.accepts = accepts
+        self.content_types = content_types
+        self.auth = list(auth)
+        self.options = tuple(options)
+        self.allowed = frozenset(self.params + self.optional + OPTIONS +
+                                 self.options)
+        self._static_headers = None
+        self._dispatch = None
+
+    def __repr__(self):
+        return "Operation({0!r}, {1!r})".format(self.method, self.path)
+
+    def static_headers(self, api_client):
+        """Returns the ``Accept`` and ``Content-Type`` headers, selected by
+        the first client that sends the operation."""
+        headers = self._static_headers
+        if headers is None:
+            headers = []
+            if self.accepts:
+                headers.append(('Accept', api_client.select_header_accept(
+                    list(self.accepts))))
+            if self.content_types:
+                headers.append((
+                    'Content-Type', api_client.select_header_content_type(
+                        list(self.content_types))))
+            self._static_headers = headers = tuple(headers)
+        return headers
+
+    def call(self, api_client, args, kwargs):
+        """Sends the operation through `api_client`.
+
+        :param args: values of `params`.
+        :param kwargs: optional parameters and `OPTIONS`.
+        :return: what `ApiClient.call_api` returns.
+        """
+        dispatch = self._dispatch
+        if dispatch is None:
+            dispatch = self._dispatch = self._compile(api_client)
+        return dispatch(api_client, args, kwargs)
+
+    def unexpected(self, kwargs):
+        """Raises the TypeError for the first keyword argument not
+        accepted."""
+        for key in kwargs:
+            if key not in self.allowed:
+                raise TypeError(
+                    "Got an unexpected keyword argument '%s'"
+                    " to method %s" % (key, self.name)
+                )
+
+    def _compile(self, api_client):
+        """Generates the dispatcher of this operation: a function that
+        checks the arguments and calls `ApiClient.call_api`, with the loops
+        over the parameter tables unrolled. Its own names start with an
+        underscore so that they cannot shadow the parameters."""
+        required = set(self.params)
+        namespace = {'OPERATION': self, 'ALLOWED': self.allowed,
+                     'HEADERS': self.static_headers(api_client)}
+        lines = ['def dispatch(_client, _args, _kwargs):',
+                 '    if not ALLOWED.issuperset(_kwargs):',
+                 '        OPERATION.unexpected(_kwargs)']
+        if self.params:
+            lines.append('    %s, = _args' % ', '.join(self.params))
+        for param in self.params:
+            lines.append('    if %s is None:' % param)
+            lines.append('        raise ValueError("Missing the required '
+                         'parameter `%s` when calling `%s`")'
+                         % (param, self.name))
+        lines.append('    _get = _kwargs.get')
+
+        def value(param):
+            return param if param in required else '_kwargs[%r]' % param
+
+        def collect(name, table, pairs):
+            lines.append('    %s = %s' % (name, '[]' if pairs else '{}'))
+            for wire, param in table:
+                add = ('%s.append((%r, %s))' % (name, wire, value(param))
+                       if pairs else
+                       '%s[%r] = %s' % (name, wire, value(param)))
+                if param in required:
+                    lines.append('    ' + add)
+                else:
+                    lines.append('    if %r in _kwargs:' % param)
+                    lines.append('        ' + add)
+
+        collect('_path', self.path_params, False)
+        collect('_query', self.query, True)
+        collect('_headers', self.headers, False)
+        lines.append('    _headers.update(HEADERS)')
+        collect('_form', self.form, True)
+        collect('_files', self.files, False)
+        body = (self.body if self.body in required else
+                '_get(%r)' % self.body if self.body else 'None')
+        options = ''.join('%r: _get(%r), ' % (option, option)
+                          for option in self.options)
+        lines.append(
+            '    return _client.call_api(%r, %r, _path, _query, _headers, '
+            'body=%s, post_params=_form, files=_files, '
+            'response_type=%r, auth_settings=OPERATION.auth, '
+            'async_req=_get("async_req"), '
+            '_return_http_data_only=_get("_return_http_data_only"), '
+            '_preload_content=_get("_preload_content", True), '
+            '_request_timeout=_get("_request_timeout"), '
+            '_response_mode=_get("_response_mode"), '
+            'collection_formats={}, **{%s})'
+            % (self.path, self.method, body, self.response_type, options))
+
+        exec('\n'.join(lines), namespace)
+        return namespace['dispatch']
+
+
+def call(api_client, name, args, kwargs):
+    """Sends operation `name` of `OPERATIONS`, see `Operation.call`."""
+    return OPERATIONS[name].call(api_client, args, kwargs)
+
+
+OPERATIONS = {
+    # AuthenticationApi
+    'exchange_o_auth_token': Operation(
+        'POST', '/oauth/exchange',
+        response_type='str',
+        optional=('body',),
+        body='body',
+        content_types=('application/json',)),
+    'list_service_keys_for_container': Operation(
+        'GET', '/containers/{container_id}/service-users/keys',
+        response_type='InlineResponse20011',
+        params=('container_id',),
+        optional=('note',),
+        path_params=('container_id',),
+        query=('note',)),
+    'retrieve_o_auth_token': Operation(
+        'GET', '/oauth/token',
+        response_type='str',
+        params=('x_api_key', 'x_api_secret'),
+        optional=('x_api_expiry',),
+        headers=(('x-api-key', 'x_api_key'), ('x-api-secret', 'x_api_secret'),
+                 ('x-api-expiry', 'x_api_expiry')),
+        accepts=('application/json', 'text/plain')),
+    'rsa_cancel': Operation(
+        'POST', '/rsa/cancel',
+        response_type='RSAResponse',
+        optional=('body',),
+        body='body',
+        content_types=('application/json',)),
+    'rsa_initialize': Operation(
+        'POST', '/rsa/initialize',
+        response_type='RSAResponse',
+        optional=('body',),
+        body='body',
+        content_types=('application/json',)),
+    'rsa_status': Operation(
+        'POST', '/rsa/status',
+        response_type='RSAStatusResponse',
+        optional=('body',),
+        body='body',
+        content_types=('application/json',)),
+    'rsa_verify': Operation(
+        'POST', '/rsa/verify',
+        response_type='RSAResponse',
+        optional=('body',),
+        body='body',
+        content_types=('application/json',)),
+    # ContainersApi
+    'acknowledge_container_alert': Operation(
+        'POST', '/containers/{container_id}/alerts/{alert_id}',
+        params=('container_id', 'alert_id'),
+        path_params=('container_id', 'alert_id'),
+        accepts=None),
+    'approve_ontology_version': Operation(
+        'PUT',
+        '/containers/{container_id}/ontology/versions/{ontology_version_id}/'
+        'approve',
+        params=('container_id', 'ontology_version_id'),
+        path_params=('container_id', 'ontology_version_id'),
+        accepts=None),
+    'archive_container': Operation(
+        'DELETE', '/containers/{container_id}',
+        response_type='Generic200Response',
+        params=('container_id',),
+        optional=('permanent',),
+        path_params=('container_id',),
+        query=('permanent',)),
+    'container_batch_update': Operation(
+        'PUT', '/containers',
+        response_type='BatchUpdateContainerResponse',
+        params=('body',),
+        body='body',
+        content_types=('application/json',)),
+    'create_container': Operation(
+        'POST', '/containers',
+        response_type='CreateContainerResponse',
+        params=('body',),
+        body='body',
+        content_types=('application/json',)),
+    'delete_data_template': Operation(
+        'DELETE',
+        '/containers/{container_id}/data_source_templates/{template_id}',
+        response_type='Generic200Response',
+        params=('template_id', 'container_id'),
+        path_params=('template_id', 'container_id')),
+    'import_container': Operation(
+        'POST', '/containers/{container_id}/import',
+        response_type='ContainerImportResponse',
+        params=('export_file', 'container_id'),
+        optional=('dryrun', 'import_ontology', 'import_data_sources',
+                  'import_type_mappings'),
+        path_params=('container_id',),
+        query=('dryrun', ('importOntology', 'import_ontology'),
+               ('importDataSources', 'import_data_sources'),
+               ('importTypeMappings', 'import_type_mappings')),
+        files=('export_file',),
+        content_types=('multipart/form-data',)),
+    'list_container_alerts': Operation(
+        'GET', '/containers/{container_id}/alerts',
+        params=('container_id',),
+        path_params=('container_id',),
+        accepts=None),
+    'list_containers': Operation(
+        'GET', '/containers',
+        response_type='ListContainerResponse'),
+    'list_data_templates': Operation(
+        'GET', '/containers/{container_id}/data_source_templates',
+        response_type='InlineResponse200',
+        params=('container_id',),
+        path_params=('container_id',)),
+    'list_ontology_versions': Operation(
+        'GET', '/containers/{container_id}/ontology/versions',
+        response_type='InlineResponse2009',
+        params=('container_id',),
+        path_params=('container_id',)),
+    'publish_ontology_version': Operation(
+        'POST',
+        '/containers/{container_id}/ontology/versions/{ontology_version_id}/'
+        'publish',
+        params=('container_id', 'ontology_version_id'),
+        path_params=('container_id', 'ontology_version_id'),
+        accepts=None),
+    'reject_ontology_version_approval': Operation(
+        'DELETE',
+        '/containers/{container_id}/ontology/versions/{ontology_version_id}/'
+        'approve',
+        params=('container_id', 'ontology_version_id'),
+        path_params=('container_id', 'ontology_version_id'),
+        accepts=None),
+    'repair_container_permissions': Operation(
+        'POST', '/containers/{container_id}/permissions',
+        response_type='Generic200Response',
+        params=('container_id',),
+        path_params=('container_id',)),
+    'retrieve_container': Operation(
+        'GET', '/containers/{container_id}',
+        response_type='GetContainerResponse',
+        params=('container_id',),
+        path_params=('container_id',)),
+    'retrieve_ontology_version': Operation(
+        'GET', '/containers/{container_id}/ontology/versions/{version_id}',
+        response_type='InlineResponse20010',
+        params=('container_id', 'version_id'),
+        path_params=('container_id', 'version_id')),
+    'rollback_ontology_version': Operation(
+        'POST',
+        '/containers/{container_id}/ontology/versions/{version_id}/rollback',
+        params=('container_id', 'version_id'),
+        path_params=('container_id', 'version_id'),
+        accepts=None),
+    'send_ontology_version_for_approval': Operation(
+        'POST',
+        '/containers/{container_id}/ontology/versions/{ontology_version_id}/'
+        'approve',
+        params=('container_id', 'ontology_version_id'),
+        path_params=('container_id', 'ontology_version_id'),
+        accepts=None),
+    'set_container_active': Operation(
+        'POST', '/containers/{container_id}/active',
+        response_type='Generic200Response',
+        params=('container_id',),
+        path_params=('container_id',)),
+    'update_container': Operation(
+        'PUT', '/containers/{container_id}',
+        response_type='UpdateContainerResponse',
+        params=('body', 'container_id'),
+        path_params=('container_id',),
+        body='body',
+        content_types=('application/json',)),
+    'update_container_import': Operation(
+        'PUT', '/containers/import/{container_id}',
+        response_type='ContainerImportUpdateResponse',
+        params=('export_file', 'container_id'),
+        path_params=('container_id',),
+        files=('export_file',),
+        content_types=('multipart/form-data',)),
+    # DataExportApi
+    'create_data_export': Operation(
+        'POST', '/containers/{container_id}/data/export',
+        response_type='Generic200Response',
+        params=('body', 'container_id'),
+        path_params=('container_id',),
+        body='body',
+        content_types=('application/json',)),
+    'delete_data_export': Operation(
+        'DELETE', '/containers/{container_id}/data/export/{export_id}',
+        response_type='Generic200Response',
+        params=('container_id', 'export_id'),
+        path_params=('container_id', 'export_id')),
+    'list_data_exports': Operation(
+        'GET', '/containers/{container_id}/data/export',
+        response_type='ListDataExportsResponse',
+        params=('container_id',),
+        optional=('count', 'limit', 'offset', 'sort_by', 'sort_desc'),
+        path_params=('container_id',),
+        query=('count', 'limit', 'offset', ('sortBy', 'sort_by'),
+               ('sortDesc', 'sort_desc'))),
+    'retrieve_data_export': Operation(
+        'GET', '/containers/{container_id}/data/export/{export_id}',
+        response_type='GetDataExportResponse',
+        params=('container_id', 'export_id'),
+        path_params=('container_id', 'export_id')),
+    'start_data_export': Operation(
+        'POST', '/containers/{container_id}/data/export/{export_id}',
+        response_type='Generic200Response',
+        params=('container_id', 'export_id'),
+        path_params=('container_id', 'export_id')),
+    'stop_data_export': Operation(
+        'PUT', '/containers/{container_id}/data/export/{export_id}',
+        response_type='Generic200Response',
+        params=('container_id', 'export_id'),
+        path_params=('container_id', 'export_id')),
+    # DataQueryApi
+    'data_query': Operation(
+        'POST', '/containers/{container_id}/data',
+        response_type='InlineResponse2002',
+        params=('body', 'container_id'),
+        optional=('raw_metadata_enabled', 'point_in_time'),
+        path_params=('container_id',),
+        query=(('rawMetadataEnabled', 'raw_metadata_enabled'),
+               ('pointInTime', 'point_in_time')),
+        body='body',
+        content_types=('application/json', 'text/plain', 'application/xml')),
+    'query_graph': Operation(
+        'POST', '/containers/{container_id}/query',
+        response_type='InlineResponse2002',
+        params=('body', 'container_id'),
+        path_params=('container_id',),
+        body='body',
+        content_types=('application/json', 'text/plain')),
+    # DataSourcesApi
+    'archive_data_source': Operation(
+        'DELETE',
+        '/containers/{container_id}/import/datasources/{data_source_id}',
+        response_type='Generic200Response',
+        params=('container_id', 'data_source_id'),
+        optional=('archive', 'force_delete', 'remove_data'),
+        path_params=('container_id', 'data_source_id'),
+        query=('archive', ('forceDelete', 'force_delete'),
+               ('removeData', 'remove_data'))),
+    'create_data_source': Operation(
+        'POST', '/containers/{container_id}/import/datasources',
+        response_type='CreateDataSourcesResponse',
+        params=('body', 'container_id'),
+        path_params=('container_id',),
+        body='body',
+        content_types=('application/json',)),
+    'create_manual_import': Operation(
+        'POST',
+        '/containers/{container_id}/import/datasources/{data_source_id}/'
+        'imports',
+        response_type='dict(str, object)',
+        params=('container_id', 'data_source_id'),
+        optional=('body',),
+        path_params=('container_id', 'data_source_id'),
+        body='body',
+        content_types=('application/json',)),
+    'create_manual_import_from_path': Operation(
+        'POST',
+        '/containers/{container_id}/import/datasources/{data_source_id}/'
+        'imports',
+        response_type='object',
+        params=('container_id', 'data_source_id'),
+        optional=('import_path', 'fast_load'),
+        path_params=('container_id', 'data_source_id'),
+        query=(('fastLoad', 'fast_load'),),
+        files=('import_path',),
+        content_types=('multipart/form-data',)),
+    'download_data_source': Operation(
+        'GET',
+        '/containers/{container_id}/import/datasources/{data_source_id}/'
+        'download',
+        response_type='GetDataSourceResponse',
+        params=('container_id', 'data_source_id'),
+        path_params=('container_id', 'data_source_id')),
+    'download_file': Operation(
+        'GET', '/containers/{container_id}/files/{file_id}/download',
+        response_type='file',
+        params=('container_id', 'file_id'),
+        path_params=('container_id', 'file_id'),
+        accepts=('application/octet-stream',),
+        options=('_download_path',)),
+    'list_data_sources': Operation(
+        'GET', '/containers/{container_id}/import/datasources',
+        response_type='ListDataSourcesResponse',
+        params=('container_id',),
+        optional=('decrypted', 'timeseries', 'count', 'archived'),
+        path_params=('container_id',),
+        query=('decrypted', 'timeseries', 'count', 'archived')),
+    'list_imports_for_data_source': Operation(
+        'GET',
+        '/containers/{container_id}/import/datasources/{data_source_id}/'
+        'imports',
+        response_type='ListDataSourceImportsResponse',
+        params=('container_id', 'data_source_id'),
+        optional=('limit', 'offset'),
+        path_params=('container_id', 'data_source_id'),
+        query=('limit', 'offset')),
+    'retrieve_data_source': Operation(
+        'GET',
+        '/containers/{container_id}/import/datasources/{data_source_id}',
+        response_type='GetDataSourceResponse',
+        params=('container_id', 'data_source_id'),
+        path_params=('container_id', 'data_source_id')),
+    'retrieve_file': Operation(
+        'GET', '/containers/{container_id}/files/{file_id}',
+        response_type='GetFileInfoResponse',
+        params=('container_id', 'file_id'),
+        path_params=('container_id', 'file_id')),
+    'set_data_source_active': Operation(
+        'POST',
+        '/containers/{container_id}/import/datasources/{data_source_id}/'
+        'active',
+        response_type='Generic200Response',
+        params=('container_id', 'data_source_id'),
+        path_params=('container_id', 'data_source_id')),
+    'set_data_source_configuration': Operation(
+        'PUT',
+        '/containers/{container_id}/import/datasources/{data_source_id}',
+        response_type='UpdateDataSourceResponse',
+        params=('body', 'container_id', 'data_source_id'),
+        path_params=('container_id', 'data_source_id'),
+        body='body',
+        content_types=('application/json',)),
+    'set_data_source_inactive': Operation(
+        'DELETE',
+        '/containers/{container_id}/import/datasources/{data_source_id}/'
+        'active',
+        response_type='Generic200Response',
+        params=('container_id', 'data_source_id'),
+        path_params=('container_id', 'data_source_id')),
+    'upload_file': Operation(
+        'POST',
+        '/containers/{container_id}/import/datasources/{data_source_id}/'
+        'files',
+        response_type='UploadFileResponse',
+        params=('container_id', 'data_source_id'),
+        optional=('file', 'metadata', 'import_id'),
+        path_params=('container_id', 'data_source_id'),
+        query=(('importID', 'import_id'),),
+        files=('file', 'metadata'),
+        content_types=('multipart/form-data',)),
+    # DataTargetsApi
+    'archive_data_target': Operation(
+        'DELETE',
+        '/containers/{container_id}/export/datatargets/{data_target_id}',
+        response_type='Generic200Response',
+        params=('container_id', 'data_target_id'),
+        optional=('archive', 'force_delete'),
+        path_params=('container_id', 'data_target_id'),
+        query=('archive', ('forceDelete', 'force_delete'))),
+    'create_data_target': Operation(
+        'POST', '/containers/{container_id}/export/datatargets',
+        response_type='CreateDataTargetsResponse',
+        params=('container_id',),
+        optional=('body',),
+        path_params=('container_id',),
+        body='body',
+        content_types=('application/json',)),
+    'list_dat_targets': Operation(
+        'GET', '/containers/{container_id}/export/datatargets',
+        response_type='ListDataTargetsResponse',
+        params=('container_id',),
+        path_params=('container_id',)),
+    'retrieve_data_target': Operation(
+        'GET',
+        '/containers/{container_id}/export/datatargets/{data_target_id}',
+        response_type='GetDataTargetResponse',
+        params=('container_id', 'data_target_id'),
+        path_params=('container_id', 'data_target_id')),
+    'set_data_target_active': Operation(
+        'POST',
+        '/containers/{container_id}/export/datatargets/{data_target_id}/'
+        'active',
+        response_type='Generic200Response',
+        params=('container_id', 'data_target_id'),
+        path_params=('container_id', 'data_target_id')),
+    'set_data_target_configuration': Operation(
+        'PUT',
+        '/containers/{container_id}/export/datatargets/{data_target_id}',
+        response_type='UpdateDataTargetResponse',
+        params=('body', 'container_id', 'data_target_id'),
+        path_params=('container_id', 'data_target_id'),
+        body='body',
+        content_types=('application/json',)),
+    'set_data_target_inactive': Operation(
+        'DELETE',
+        '/containers/{container_id}/export/datatargets/{data_target_id}/'
+        'active',
+        response_type='Generic200Response',
+        params=('container_id', 'data_target_id'),
+        path_params=('container_id', 'data_target_id')),
+    # DataTypeMappingsApi
+    'copy_transformations': Operation(
+        'POST',
+        '/containers/{container_id}/import/datasources/{sourceID}/mappings/'
+        '{mappingID}/copy/{originalMappingID}',
+        params=('container_id', 'source_id', 'mapping_id',
+                'original_mapping_id'),
+        path_params=('container_id', ('sourceID', 'source_id'),
+                     ('mappingID', 'mapping_id'),
+                     ('originalMappingID', 'original_mapping_id')),
+        accepts=None),
+    'create_transformation': Operation(
+        'POST',
+        '/containers/{container_id}/import/datasources/{data_source_id}/'
+        'mappings/{mapping_id}/transformations',
+        response_type='CreateTransformationResponse',
+        params=('body', 'container_id', 'data_source_id', 'mapping_id'),
+        path_params=('container_id', 'data_source_id', 'mapping_id'),
+        body='body',
+        content_types=('application/json',)),
+    'delete_data_type_mapping': Operation(
+        'DELETE',
+        '/containers/{container_id}/import/datasources/{data_source_id}/'
+        'mappings/{mapping_id}',
+        response_type='Generic200Response',
+        params=('container_id', 'data_source_id', 'mapping_id'),
+        path_params=('container_id', 'data_source_id', 'mapping_id')),
+    'delete_transformation': Operation(
+        'DELETE',
+        '/containers/{container_id}/import/datasources/{data_source_id}/'
+        'mappings/{mapping_id}/transformations/{transformation_id}',
+        response_type='Generic200Response',
+        params=('container_id', 'data_source_id', 'mapping_id',
+                'transformation_id'),
+        path_params=('container_id', 'data_source_id', 'mapping_id',
+                     'transformation_id')),
+    'export_type_mappings': Operation(
+        'POST',
+        '/containers/{container_id}/import/datasources/{data_source_id}/'
+        'mappings/export',
+        response_type='list[TypeMapping]',
+        params=('container_id', 'data_source_id'),
+        optional=('body',),
+        path_params=('container_id', 'data_source_id'),
+        body='body',
+        content_types=('application/json',)),
+    'import_data_type_mappings': Operation(
+        'POST',
+        '/containers/{container_id}/import/datasources/{data_source_id}/'
+        'mappings/import',
+        response_type='ImportDataTypeMappingResponse',
+        params=('container_id', 'data_source_id'),
+        optional=('body', 'is_enabled'),
+        path_params=('container_id', 'data_source_id'),
+        query=(('isEnabled', 'is_enabled'),),
+        body='body',
+        content_types=('application/json',)),
+    'list_data_type_mappings': Operation(
+        'GET',
+        '/containers/{container_id}/import/datasources/{data_source_id}/'
+        'mappings',
+        response_type='ListDataTypeMappingResponse',
+        params=('container_id', 'data_source_id'),
+        optional=('limit', 'offset', 'needs_transformations', 'count',
+                  'sort_by', 'sort_desc', 'resulting_metatype_name',
+                  'resulting_metatype_relationship_name'),
+        path_params=('container_id', 'data_source_id'),
+        query=('limit', 'offset',
+               ('needsTransformations', 'needs_transformations'), 'count',
+               ('sortBy', 'sort_by'), ('sortDesc', 'sort_desc'),
+               ('resultingMetatypeName', 'resulting_metatype_name'),
+               ('resultingMetatypeRelationshipName',
+                'resulting_metatype_relationship_name'))),
+    'list_transformations': Operation(
+        'GET',
+        '/containers/{container_id}/import/datasources/{data_source_id}/'
+        'mappings/{mapping_id}/transformations',
+        response_type='ListTransformationResponse',
+        params=('container_id', 'data_source_id', 'mapping_id'),
+        path_params=('container_id', 'data_source_id', 'mapping_id')),
+    'retrieve_data_type_mapping': Operation(
+        'GET',
+        '/containers/{container_id}/import/datasources/{data_source_id}/'
+        'mappings/{mapping_id}',
+        response_type='GetDataTypeMappingResponse',
+        params=('container_id', 'data_source_id', 'mapping_id'),
+        path_params=('container_id', 'data_source_id', 'mapping_id')),
+    'update_data_type_mapping': Operation(
+        'PUT',
+        '/containers/{container_id}/import/datasources/{data_source_id}/'
+        'mappings/{mapping_id}',
+        response_type='UpdateDataTypeMappingResponse',
+        params=('container_id', 'data_source_id', 'mapping_id'),
+        optional=('body',),
+        path_params=('container_id', 'data_source_id', 'mapping_id'),
+        body='body',
+        content_types=('application/json',)),
+    'update_transformation': Operation(
+        'PUT',
+        '/containers/{container_id}/import/datasources/{data_source_id}/'
+        'mappings/{mapping_id}/transformations/{transformation_id}',
+        response_type='UpdateTransformationResponse',
+        params=('body', 'container_id', 'data_source_id', 'mapping_id',
+                'transformation_id'),
+        path_params=('container_id', 'data_source_id', 'mapping_id',
+                     'transformation_id'),
+        body='body',
+        content_types=('application/json',)),
+    # DefaultApi
+    'delete_containers_container_id_graphs_tags_tag_id_edges': Operation(
+        'DELETE', '/containers/{container_id}/graphs/tags/{tag_id}/edges',
+        params=('container_id', 'tag_id'),
+        path_params=('container_id', 'tag_id'),
+        accepts=None),
+    'delete_containers_container_id_graphs_tags_tag_id_nodes': Operation(
+        'DELETE', '/containers/{container_id}/graphs/tags/{tag_id}/nodes',
+        params=('container_id', 'tag_id'),
+        path_params=('container_id', 'tag_id'),
+        accepts=None),
+    'list_ts_for_node': Operation(
+        'GET', '/containers/{container_id}/graphs/nodes/{node_id}/timeseries',
+        response_type='InlineResponse2005',
+        params=('container_id', 'node_id'),
+        path_params=('container_id', 'node_id')),
+    'post_containers_container_id_data_source_templates': Operation(
+        'POST', '/containers/{container_id}/data_source_templates',
+        response_type='InlineResponse2001',
+        params=('container_id',),
+        optional=('body',),
+        path_params=('container_id',),
+        body='body',
+        content_types=('application/json',)),
+    'put_containers_container_id_graphs_tags_tag_id_edges': Operation(
+        'PUT', '/containers/{container_id}/graphs/tags/{tag_id}/edges',
+        params=('container_id', 'tag_id'),
+        optional=('body',),
+        path_params=('container_id', 'tag_id'),
+        body='body',
+        accepts=None,
+        content_types=('application/json',)),
+    'put_containers_container_id_graphs_tags_tag_id_nodes': Operation(
+        'PUT', '/containers/{container_id}/graphs/tags/{tag_id}/nodes',
+        params=('container_id', 'tag_id'),
+        optional=('body',),
+        path_params=('container_id', 'tag_id'),
+        body='body',
+        accepts=None,
+        content_types=('application/json',)),
+    # EventsApi
+    'create_event': Operation(
+        'POST', '/events',
+        response_type='CreateEventResponse',
+        params=('body',),
+        body='body',
+        content_types=('application/json',)),
+    'create_event_action': Operation(
+        'POST', '/event_actions',
+        response_type='CreateEventActionResponse',
+        params=('body',),
+        body='body',
+        content_types=('application/json',)),
+    'delete_event_action': Operation(
+        'DELETE', '/event_actions/{action_id}',
+        response_type='Generic200Response',
+        params=('action_id',),
+        path_params=('action_id',)),
+    'list_event_action_statuses': Operation(
+        'GET', '/event_action_status',
+        response_type='ListEventActionStatusResponse',
+        optional=('event_id',),
+        query=(('eventID', 'event_id'),)),
+    'list_event_actions': Operation(
+        'GET', '/event_actions',
+        response_type='ListEventActionResponse',
+        optional=('deleted',),
+        query=('deleted',)),
+    'retrieve_event_action': Operation(
+        'GET', '/event_actions/{action_id}',
+        response_type='GetEventActionResponse',
+        params=('action_id',),
+        path_params=('action_id',)),
+    'retrieve_event_action_status': Operation(
+        'GET', '/event_action_status/{status_id}',
+        response_type='GetEventActionStatusResponse',
+        params=('status_id',),
+        path_params=('status_id',)),
+    'update_event_action': Operation(
+        'PUT', '/event_actions/{action_id}',
+        response_type='UpdateEventActionResponse',
+        params=('action_id',),
+        optional=('body', 'active'),
+        path_params=('action_id',),
+        query=('active',),
+        body='body',
+        content_types=('application/json',)),
+    'update_event_action_status': Operation(
+        'PUT', '/event_action_status/{status_id}',
+        response_type='UpdateEventActionStatusResponse',
+        params=('status_id',),
+        optional=('body',),
+        path_params=('status_id',),
+        body='body',
+        content_types=('application/json',)),
+    # GraphApi
+    'archive_edge': Operation(
+        'DELETE', '/containers/{container_id}/graphs/edges/{edge_id}',
+        response_type='Generic200Response',
+        params=('container_id', 'edge_id'),
+        path_params=('container_id', 'edge_id')),
+    'archive_node': Operation(
+        'DELETE', '/containers/{container_id}/graphs/nodes/{node_id}',
+        response_type='Generic200Response',
+        params=('container_id', 'node_id'),
+        path_params=('container_id', 'node_id')),
+    'attach_edge_file': Operation(
+        'PUT',
+        '/containers/{container_id}/graphs/edges/{edge_id}/files/{file_id}',
+        response_type='Generic200Response',
+        params=('container_id', 'file_id', 'edge_id'),
+        path_params=('container_id', 'file_id', 'edge_id')),
+    'attach_node_file': Operation(
+        'PUT',
+        '/containers/{container_id}/graphs/nodes/{node_id}/files/{file_id}',
+        response_type='Generic200Response',
+        params=('container_id', 'node_id', 'file_id'),
+        path_params=('container_id', 'node_id', 'file_id')),
+    'create_or_update_edges': Operation(
+        'POST', '/containers/{container_id}/graphs/edges',
+        response_type='InlineResponse2006',
+        params=('body', 'container_id'),
+        path_params=('container_id',),
+        body='body',
+        content_types=('application/json',)),
+    'create_or_update_nodes': Operation(
+        'POST', '/containers/{container_id}/graphs/nodes',
+        response_type='InlineResponse2003',
+        params=('body', 'container_id'),
+        path_params=('container_id',),
+        body='body',
+        content_types=('application/json',)),
+    'delete_node_file': Operation(
+        'DELETE',
+        '/containers/{container_id}/graphs/nodes/{node_id}/files/{file_id}',
+        response_type='Generic200Response',
+        params=('container_id', 'node_id', 'file_id'),
+        path_params=('container_id', 'node_id', 'file_id')),
+    'detach_node_file': Operation(
+        'DELETE',
+        '/containers/{container_id}/graphs/edges/{edge_id}/files/{file_id}',
+        response_type='Generic200Response',
+        params=('container_id', 'file_id', 'edge_id'),
+        path_params=('container_id', 'file_id', 'edge_id')),
+    'list_edge_files': Operation(
+        'GET', '/containers/{container_id}/graphs/edges/{edge_id}/files',
+        response_type='ListEdgeFiles',
+        params=('container_id', 'edge_id'),
+        path_params=('container_id', 'edge_id')),
+    'list_edges': Operation(
+        'GET', '/containers/{container_id}/graphs/edges',
+        response_type='ListEdgesResponse',
+        params=('container_id',),
+        optional=('limit', 'offset', 'origin_id', 'destination_id',
+                  'relationship_pair_id', 'relationship_pair_name', 'history'),
+        path_params=('container_id',),
+        query=('limit', 'offset', ('originID', 'origin_id'),
+               ('destinationID', 'destination_id'),
+               ('relationshipPairID', 'relationship_pair_id'),
+               ('relationshipPairName', 'relationship_pair_name'), 'history')),
+    'list_edges_for_node_ids': Operation(
+        'POST', '/containers/{container_id}/graphs/nodes/edges',
+        response_type='ListEdgesForNodeIDsResponse',
+        params=('container_id',),
+        optional=('body',),
+        path_params=('container_id',),
+        body='body',
+        content_types=('application/json',)),
+    'list_node_files': Operation(
+        'GET', '/containers/{container_id}/graphs/nodes/{node_id}/files',
+        response_type='ListNodeFiles',
+        params=('container_id', 'node_id'),
+        path_params=('container_id', 'node_id')),
+    'list_nodes': Operation(
+        'GET', '/containers/{container_id}/graphs/nodes',
+        response_type='ListNodesResponse',
+        params=('container_id',),
+        optional=('limit', 'offset', 'transformation_id', 'metatype_id',
+                  'data_source_id', 'history'),
+        path_params=('container_id',),
+        query=('limit', 'offset', ('transformationID', 'transformation_id'),
+               ('metatypeID', 'metatype_id'),
+               ('dataSourceID', 'data_source_id'), 'history')),
+    'list_nodes_by_metatype_id': Operation(
+        'GET',
+        '/containers/{container_id}/graphs/nodes/metatype/{metatype_id}',
+        response_type='ListNodesByMetatypeResponse',
+        params=('container_id', 'metatype_id'),
+        optional=('limit', 'offset'),
+        path_params=('container_id', 'metatype_id'),
+        query=('limit', 'offset')),
+    'retrieve_edge': Operation(
+        'GET', '/containers/{container_id}/graphs/edges/{edge_id}',
+        response_type='GetEdgeResponse',
+        params=('container_id', 'edge_id'),
+        optional=('history',),
+        path_params=('container_id', 'edge_id'),
+        query=('history',)),
+    'retrieve_node': Operation(
+        'GET', '/containers/{container_id}/graphs/nodes/{node_id}',
+        response_type='GetNodeResponse',
+        params=('container_id', 'node_id'),
+        optional=('history',),
+        path_params=('container_id', 'node_id'),
+        query=('history',)),
+    'retrieve_nth_nodes': Operation(
+        'GET', '/containers/{container_id}/graphs/nodes/{node_id}/graph',
+        response_type='InlineResponse2004',
+        params=('container_id', 'node_id'),
+        optional=('depth',),
+        path_params=('container_id', 'node_id'),
+        query=('depth',)),
+    'timeseries_data_source_query': Operation(
+        'POST',
+        '/containers/{container_id}/import/datasources/{data_source_id}/data',
+        response_type='InlineResponse2002',
+        params=('body', 'container_id', 'data_source_id'),
+        path_params=('container_id', 'data_source_id'),
+        body='body',
+        content_types=('application/json', 'text/plain', 'application/xml')),
+    'timeseries_node_query': Operation(
+        'POST', '/containers/{container_id}/graphs/nodes/{node_id}/timeseries',
+        response_type='InlineResponse2002',
+        params=('body', 'container_id', 'node_id'),
+        path_params=('container_id', 'node_id'),
+        body='body',
+        content_types=('application/json', 'text/plain', 'application/xml')),
+    # ImportsApi
+    'add_data_to_import': Operation(
+        'POST',
+        '/containers/{container_id}/datasources/{data_source_id}/imports/'
+        '{import_id}/data',
+        response_type='AddDataToImportResponse',
+        params=('container_id', 'import_id', 'data_source_id'),
+        optional=('file',),
+        path_params=('container_id', 'import_id', 'data_source_id'),
+        files=('file',),
+        body='body',
+        content_types=('application/json', 'multipart/form-data')),
+    'create_import': Operation(
+        'POST',
+        '/containers/{container_id}/datasources/{data_source_id}/imports',
+        response_type='CreateImportResponse',
+        params=('container_id', 'data_source_id'),
+        optional=('body',),
+        path_params=('container_id', 'data_source_id'),
+        body='body',
+        content_types=('application/json',)),
+    'delete_file': Operation(
+        'DELETE',
+        '/containers/:container_id/import/datasources/:data_source_id/files/'
+        ':file_id',
+        accepts=None),
+    'delete_import': Operation(
+        'DELETE', '/containers/{container_id}/import/imports/{import_id}',
+        params=('container_id', 'import_id'),
+        path_params=('container_id', 'import_id'),
+        accepts=None),
+    'delete_import_data': Operation(
+        'DELETE',
+        '/containers/{container_id}/import/imports/{import_id}/data/'
+        '{data_id}',
+        response_type='Generic200Response',
+        params=('container_id', 'import_id', 'data_id'),
+        path_params=('container_id', 'import_id', 'data_id')),
+    'list_imports_data': Operation(
+        'GET', '/containers/{container_id}/import/imports/{import_id}/data',
+        response_type='ListImportDataResponse',
+        params=('container_id', 'import_id'),
+        optional=('count', 'limit', 'offset', 'sort_by', 'sort_desc'),
+        path_params=('container_id', 'import_id'),
+        query=('count', 'limit', 'offset', ('sortBy', 'sort_by'),
+               ('sortDesc', 'sort_desc'))),
+    'put_containers_container_id_import_datasources_datasource_id_files_file_id': Operation(  # noqa: E501
+        'PUT',
+        '/containers/:container_id/import/datasources/:data_source_id/files/'
+        ':file_id',
+        optional=('body', 'authorization'),
+        headers=(('Authorization', 'authorization'),),
+        body='body',
+        accepts=None,
+        content_types=('application/json', 'multipart/form-data',
+                       'application/xml')),
+    'retrieve_import_data': Operation(
+        'GET',
+        '/containers/{container_id}/import/imports/{import_id}/data/'
+        '{data_id}',
+        response_type='GetImportDataResponse',
+        params=('container_id', 'import_id', 'data_id'),
+        path_params=('container_id', 'import_id', 'data_id')),
+    'update_import_data': Operation(
+        'PUT',
+        '/containers/{container_id}/import/imports/{import_id}/data/'
+        '{data_id}',
+        response_type='UpdateImportDataResponse',
+        params=('container_id', 'import_id', 'data_id'),
+        optional=('body',),
+        path_params=('container_id', 'import_id', 'data_id'),
+        body='body',
+        content_types=('application/json',)),
+    # MetatypeKeysApi
+    'archive_metatype_key': Operation(
+        'DELETE',
+        '/containers/{container_id}/metatypes/{metatype_id}/keys/{key_id}',
+        response_type='Generic200Response',
+        params=('container_id', 'metatype_id', 'key_id'),
+        path_params=('container_id', 'metatype_id', 'key_id')),
+    'create_metatype_key': Operation(
+        'POST', '/containers/{container_id}/metatypes/{metatype_id}/keys',
+        response_type='CreateMetatypeKeysResponse',
+        params=('body', 'container_id', 'metatype_id'),
+        path_params=('container_id', 'metatype_id'),
+        body='body',
+        content_types=('application/json',)),
+    'list_metatypes_keys': Operation(
+        'GET', '/containers/{container_id}/metatypes/{metatype_id}/keys',
+        response_type='ListMetatypeKeysResponse',
+        params=('container_id', 'metatype_id'),
+        path_params=('container_id', 'metatype_id')),
+    'retrieve_metatype_key': Operation(
+        'GET',
+        '/containers/{container_id}/metatypes/{metatype_id}/keys/{key_id}',
+        response_type='GetMetatypeKeyResponse',
+        params=('container_id', 'metatype_id', 'key_id'),
+        path_params=('container_id', 'metatype_id', 'key_id')),
+    'update_metatype_key': Operation(
+        'PUT',
+        '/containers/{container_id}/metatypes/{metatype_id}/keys/{key_id}',
+        response_type='UpdateMetatypeKeyResponse',
+        params=('body', 'container_id', 'metatype_id', 'key_id'),
+        path_params=('container_id', 'metatype_id', 'key_id'),
+        body='body',
+        content_types=('application/json',)),
+    # MetatypeRelationshipKeysApi
+    'archive_metatype_relationship_key': Operation(
+        'DELETE',
+        '/containers/{container_id}/metatype_relationships/{relationship_id}/'
+        'keys/{key_id}',
+        response_type='Generic200Response',
+        params=('container_id', 'relationship_id', 'key_id'),
+        path_params=('container_id', 'relationship_id', 'key_id')),
+    'create_metatype_relationship_key': Operation(
+        'POST',
+        '/containers/{container_id}/metatype_relationships/{relationship_id}/'
+        'keys',
+        response_type='CreateMetatypeRelationshipKeysResponse',
+        params=('body', 'container_id', 'relationship_id'),
+        path_params=('container_id', 'relationship_id'),
+        body='body',
+        content_types=('application/json',)),
+    'list_metatype_relationship_keys': Operation(
+        'GET',
+        '/containers/{container_id}/metatype_relationships/{relationship_id}/'
+        'keys',
+        response_type='ListMetatypeRelationshipKeysResponse',
+        params=('container_id', 'relationship_id'),
+        path_params=('container_id', 'relationship_id')),
+    'retrieve_metatype_relationship_key': Operation(
+        'GET',
+        '/containers/{container_id}/metatype_relationships/{relationship_id}/'
+        'keys/{key_id}',
+        response_type='GetMetatypeRelationshipKeyResponse',
+        params=('container_id', 'relationship_id', 'key_id'),
+        path_params=('container_id', 'relationship_id', 'key_id')),
+    'update_metatype_relationship_key': Operation(
+        'PUT',
+        '/containers/{container_id}/metatype_relationships/{relationship_id}/'
+        'keys/{key_id}',
+        response_type='UpdateMetatypeRelationshipKeyResponse',
+        params=('body', 'container_id', 'relationship_id', 'key_id'),
+        path_params=('container_id', 'relationship_id', 'key_id'),
+        body='body',
+        content_types=('application/json',)),
+    # MetatypeRelationshipPairsApi
+    'archive_metatype_relationship_pair': Operation(
+        'DELETE',
+        '/containers/{container_id}/metatype_relationship_pairs/{pair_id}',
+        response_type='Generic200Response',
+        params=('container_id', 'pair_id'),
+        path_params=('container_id', 'pair_id')),
+    'create_metatype_relationship_pair': Operation(
+        'POST', '/containers/{container_id}/metatype_relationship_pairs',
+        response_type='CreateMetatypeRelationshipPairsResponse',
+        params=('body', 'container_id'),
+        path_params=('container_id',),
+        body='body',
+        content_types=('application/json',)),
+    'list_metatype_relationship_pairs': Operation(
+        'GET', '/containers/{container_id}/metatype_relationship_pairs',
+        response_type='ListMetatypeRelationshipPairsResponse',
+        params=('container_id',),
+        optional=('limit', 'offset', 'name', 'archived', 'count',
+                  'load_relationships', 'destination_id', 'origin_id',
+                  'metatype_id'),
+        path_params=('container_id',),
+        query=('limit', 'offset', 'name', 'archived', 'count',
+               ('loadRelationships', 'load_relationships'),
+               ('destinationID', 'destination_id'), ('originID', 'origin_id'),
+               ('metatypeID', 'metatype_id'))),
+    'retrieve_metatype_relationship_pair': Operation(
+        'GET',
+        '/containers/{container_id}/metatype_relationship_pairs/{pair_id}',
+        response_type='GetMetatypeRelationshipPairResponse',
+        params=('container_id', 'pair_id'),
+        path_params=('container_id', 'pair_id')),
+    'update_metatype_relationship_pair': Operation(
+        'PUT',
+        '/containers/{container_id}/metatype_relationship_pairs/{pair_id}',
+        response_type='UpdateMetatypeRelationshipPairResponse',
+        params=('container_id', 'pair_id'),
+        optional=('body',),
+        path_params=('container_id', 'pair_id'),
+        body='body',
+        content_types=('application/json',)),
+    # MetatypeRelationshipsApi
+    'archive_metatype_relationship': Operation(
+        'DELETE',
+        '/containers/{container_id}/metatype_relationships/{relationship_id}',
+        response_type='Generic200Response',
+        params=('container_id', 'relationship_id'),
+        path_params=('container_id', 'relationship_id')),
+    'create_metatype_relationship': Operation(
+        'POST', '/containers/{container_id}/metatype_relationships',
+        response_type='CreateMetatypeRelationshipsResponse',
+        params=('body', 'container_id'),
+        path_params=('container_id',),
+        body='body',
+        content_types=('application/json',)),
+    'list_metatype_relationships': Operation(
+        'GET', '/containers/{container_id}/metatype_relationships',
+        response_type='ListMetatypeRelationshipsResponse',
+        params=('container_id',),
+        optional=('limit', 'offset', 'name', 'description', 'count',
+                  'load_keys', 'sort_by', 'sort_desc'),
+        path_params=('container_id',),
+        query=('limit', 'offset', 'name', 'description', 'count',
+               ('loadKeys', 'load_keys'), ('sortBy', 'sort_by'),
+               ('sortDesc', 'sort_desc'))),
+    'retrieve_metatype_relationship': Operation(
+        'GET',
+        '/containers/{container_id}/metatype_relationships/{relationship_id}',
+        response_type='GetMetatypeRelationshipResponse',
+        params=('container_id', 'relationship_id'),
+        path_params=('container_id', 'relationship_id')),
+    'update_metatype_relationship': Operation(
+        'PUT',
+        '/containers/{container_id}/metatype_relationships/{relationship_id}',
+        response_type='UpdateMetatypeRelationshipResponse',
+        params=('body', 'container_id', 'relationship_id'),
+        path_params=('container_id', 'relationship_id'),
+        body='body',
+        content_types=('application/json',)),
+    # MetatypesApi
+    'archive_metatype': Operation(
+        'DELETE', '/containers/{container_id}/metatypes/{metatype_id}',
+        response_type='Generic200Response',
+        params=('container_id', 'metatype_id'),
+        path_params=('container_id', 'metatype_id')),
+    'create_metatype': Operation(
+        'POST', '/containers/{container_id}/metatypes',
+        response_type='CreateMetatypesResponse',
+        params=('body', 'container_id'),
+        path_params=('container_id',),
+        body='body',
+        content_types=('application/json',)),
+    'list_metatypes': Operation(
+        'GET', '/containers/{container_id}/metatypes',
+        response_type='ListMetatypesResponse',
+        params=('container_id',),
+        optional=('limit', 'offset', 'name', 'description', 'count',
+                  'load_keys', 'sort_by', 'sort_desc'),
+        path_params=('container_id',),
+        query=('limit', 'offset', 'name', 'description', 'count',
+               ('loadKeys', 'load_keys'), ('sortBy', 'sort_by'),
+               ('sortDesc', 'sort_desc'))),
+    'retrieve_metaype': Operation(
+        'GET', '/containers/{container_id}/metatypes/{metatype_id}',
+        response_type='GetMetatypeResponse',
+        params=('container_id', 'metatype_id'),
+        path_params=('container_id', 'metatype_id')),
+    'update_metatype': Operation(
+        'PUT', '/containers/{container_id}/metatypes/{metatype_id}',
+        response_type='UpdateMetatypeResponse',
+        params=('body', 'container_id', 'metatype_id'),
+        path_params=('container_id', 'metatype_id'),
+        body='body',
+        content_types=('application/json',)),
+    'validate_metatype_properties': Operation(
+        'POST', '/containers/{container_id}/metatypes/{metatype_id}',
+        response_type='ValidateMetatypePropertiesResponse',
+        params=('container_id', 'metatype_id'),
+        optional=('body',),
+        path_params=('container_id', 'metatype_id'),
+        body='body',
+        content_types=('application/json',)),
+    # MiscApi
+    'health': Operation(
+        'GET', '/health',
+        response_type='str',
+        accepts=('text/plain',)),
+    # TagsApi
+    'delete_webgl_file': Operation(
+        'DELETE', '/containers/{container_id}/graphs/webgl/files/{file_id}',
+        params=('container_id', 'file_id'),
+        path_params=('container_id', 'file_id'),
+        accepts=None),
+    'detach_tag_from_edge': Operation(
+        'DELETE',
+        '/containers/{container_id}/graphs/tags/{tag_id}/edges/{edge_id}',
+        params=('container_id', 'edge_id', 'tag_id'),
+        path_params=('container_id', 'edge_id', 'tag_id'),
+        accepts=None),
+    'detach_tag_from_file': Operation(
+        'DELETE',
+        '/containers/{container_id}/graphs/tags/{tag_id}/files/{file_id}',
+        params=('container_id', 'file_id', 'tag_id'),
+        path_params=('container_id', 'file_id', 'tag_id'),
+        accepts=None),
+    'detach_tag_from_node': Operation(
+        'DELETE',
+        '/containers/{container_id}/graphs/tags/{tag_id}/nodes/{node_id}',
+        params=('container_id', 'node_id', 'tag_id'),
+        path_params=('container_id', 'node_id', 'tag_id'),
+        accepts=None),
+    'get_containers_container_id_graphs_tags_edges_edge_id': Operation(
+        'GET', '/containers/{container_id}/graphs/tags/edges/{edge_id}',
+        params=('container_id', 'edge_id'),
+        path_params=('container_id', 'edge_id'),
+        accepts=None),
+    'get_containers_container_id_graphs_tags_files_file_id': Operation(
+        'GET', '/containers/{container_id}/graphs/tags/files/{file_id}',
+        params=('container_id', 'file_id'),
+        path_params=('container_id', 'file_id'),
+        accepts=None),
+    'get_containers_container_id_graphs_tags_nodes_node_id': Operation(
+        'GET', '/containers/{container_id}/graphs/tags/nodes/{node_id}',
+        params=('container_id', 'node_id'),
+        path_params=('container_id', 'node_id'),
+        accepts=None),
+    'get_containers_container_id_graphs_tags_nodes_tag_id': Operation(
+        'GET', '/containers/{container_id}/graphs/tags/{tag_id}/nodes',
+        params=('container_id', 'tag_id'),
+        path_params=('container_id', 'tag_id'),
+        accepts=None),
+    'get_containers_container_id_graphs_tags_tag_id_edges': Operation(
+        'GET', '/containers/{container_id}/graphs/tags/{tag_id}/edges',
+        params=('container_id', 'tag_id'),
+        path_params=('container_id', 'tag_id'),
+        accepts=None),
+    'get_containers_container_id_graphs_tags_tag_id_files': Operation(
+        'GET', '/containers/{container_id}/graphs/tags/{tag_id}/files',
+        params=('container_id', 'tag_id'),
+        path_params=('container_id', 'tag_id'),
+        accepts=None),
+    'list_tags': Operation(
+        'GET', '/containers/{container_id}/graphs/tags',
+        params=('container_id',),
+        path_params=('container_id',),
+        accepts=None),
+    'list_webgl': Operation(
+        'GET', '/containers/{container_id}/graphs/webgl',
+        params=('container_id',),
+        path_params=('container_id',),
+        accepts=None),
+    'post_tags': Operation(
+        'POST', '/containers/{container_id}/graphs/tags',
+        params=('container_id',),
+        optional=('body',),
+        path_params=('container_id',),
+        body='body',
+        accepts=None,
+        content_types=('application/json',)),
+    'put_containers_container_id_graphs_tags_nodes_node_id': Operation(
+        'PUT',
+        '/containers/{container_id}/graphs/tags/{tag_id}/nodes/{node_id}',
+        params=('container_id', 'node_id', 'tag_id'),
+        path_params=('container_id', 'node_id', 'tag_id'),
+        accepts=None),
+    'put_containers_container_id_graphs_tags_tag_id': Operation(
+        'PUT', '/containers/{container_id}/graphs/tags/{tag_id}',
+        params=('container_id', 'tag_id'),
+        optional=('body',),
+        path_params=('container_id', 'tag_id'),
+        body='body',
+        accepts=None,
+        content_types=('application/json',)),
+    'put_containers_container_id_graphs_tags_tag_id_edges_edge_id': Operation(
+        'PUT',
+        '/containers/{container_id}/graphs/tags/{tag_id}/edges/{edge_id}',
+        params=('container_id', 'edge_id', 'tag_id'),
+        path_params=('container_id', 'edge_id', 'tag_id'),
+        accepts=None),
+    'put_containers_container_id_graphs_tags_tag_id_files_file_id': Operation(
+        'PUT',
+        '/containers/{container_id}/graphs/tags/{tag_id}/files/{file_id}',
+        params=('container_id', 'file_id', 'tag_id'),
+        path_params=('container_id', 'file_id', 'tag_id'),
+        accepts=None),
+    'update_webgl_files': Operation(
+        'GET', '/containers/{container_id}/graphs/webgl/files/{file_id}',
+        params=('container_id', 'file_id'),
+        path_params=('container_id', 'file_id'),
+        accepts=None),
+    'upload_webgl': Operation(
+        'POST', '/containers/{container_id}/graphs/webgl',
+        params=('container_id',),
+        optional=('file', 'tag'),
+        path_params=('container_id',),
+        query=('tag',),
+        form=('file',),
+        accepts=None,
+        content_types=('multipart/form-data',)),
+    # TasksApi
+    'create_task': Operation(
+        'POST', '/containers/{container_id}/task',
+        response_type='CreateTaskResponse',
+        params=('container_id',),
+        optional=('body',),
+        path_params=('container_id',),
+        body='body',
+        content_types=('application/json',)),
+    'get_task': Operation(
+        'GET', '/containers/{container_id}/task/{task_id}',
+        response_type='GetTaskResponse',
+        params=('container_id', 'task_id'),
+        path_params=('container_id', 'task_id')),
+    'list_tasks': Operation(
+        'GET', '/containers/{container_id}/task',
+        response_type='ListTasksResponse',
+        params=('container_id',),
+        path_params=('container_id',)),
+    'update_task': Operation(
+        'PUT', '/containers/{container_id}/task/{task_id}',
+        response_type='UpdateTaskResponse',
+        params=('container_id', 'task_id'),
+        optional=('body',),
+        path_params=('container_id', 'task_id'),
+        body='body',
+        content_types=('application/json',)),
+    # UsersApi
+    'accept_container_invite': Operation(
+        'GET', '/users/invite',
+        response_type='Generic200Response',
+        params=('token',),
+        query=('token',)),
+    'assign_user_role': Operation(
+        'POST', '/containers/{container_id}/users/roles',
+        response_type='Generic200Response',
+        params=('body', 'container_id'),
+        path_params=('container_id',),
+        body='body',
+        content_types=('application/json',)),
+    'create_service_user': Operation(
+        'POST', '/containers/{container_id}/service-users',
+        response_type='CreateServiceUserResponse',
+        params=('container_id',),
+        optional=('body',),
+        path_params=('container_id',),
+        body='body',
+        content_types=('application/json',)),
+    'create_service_user_key_pair': Operation(
+        'POST',
+        '/containers/{container_id}/service-users/{service_user_id}/keys',
+        response_type='InlineResponse2008',
+        params=('container_id', 'service_user_id'),
+        path_params=('container_id', 'service_user_id')),
+    'delete_service_user': Operation(
+        'DELETE', '/containers/{container_id}/service-users/{service_user_id}',
+        params=('container_id', 'service_user_id'),
+        path_params=('container_id', 'service_user_id'),
+        accepts=None),
+    'delete_service_user_key_pair': Operation(
+        'DELETE',
+        '/containers/{container_id}/service-users/{service_user_id}/keys/'
+        '{key_id}',
+        params=('container_id', 'service_user_id', 'key_id'),
+        path_params=('container_id', 'service_user_id', 'key_id'),
+        accepts=None),
+    'delete_user': Operation(
+        'DELETE', '/users/{user_id}',
+        response_type='Generic200Response',
+        params=('user_id',),
+        path_params=('user_id',)),
+    'get_service_user_permissions': Operation(
+        'GET',
+        '/containers/{container_id}/service-users/{service_user_id}/'
+        'permissions',
+        response_type='list[list[str]]',
+        params=('container_id', 'service_user_id'),
+        path_params=('container_id', 'service_user_id')),
+    'invite_user_to_container': Operation(
+        'POST', '/containers/{container_id}/users/invite',
+        response_type='Generic200Response',
+        params=('container_id',),
+        optional=('body',),
+        path_params=('container_id',),
+        body='body',
+        content_types=('application/json',)),
+    'list_invited_users_for_container': Operation(
+        'GET', '/containers/{container_id}/users/invite',
+        response_type='ListContainerInvitesResponse',
+        params=('container_id',),
+        path_params=('container_id',)),
+    'list_outstanding_invites': Operation(
+        'GET', '/users/invites',
+        response_type='ListUserInvitesResponse'),
+    'list_service_user_key_pairs': Operation(
+        'GET',
+        '/containers/{container_id}/service-users/{service_user_id}/keys',
+        params=('container_id', 'service_user_id'),
+        optional=('note',),
+        path_params=('container_id', 'service_user_id'),
+        query=('note',),
+        accepts=None),
+    'list_service_users': Operation(
+        'GET', '/containers/{container_id}/service-users',
+        response_type='ListServiceUserResponse',
+        params=('container_id',),
+        path_params=('container_id',)),
+    'list_user_permissions': Operation(
+        'GET', '/users/permissions',
+        response_type='ListUserPermissionsResponse'),
+    'list_users': Operation(
+        'GET', '/users',
+        response_type='ListUsersResponse',
+        optional=('count', 'load_keys', 'limit', 'offset', 'sort_by',
+                  'sort_desc'),
+        query=('count', ('loadKeys', 'load_keys'), 'limit', 'offset',
+               ('sortBy', 'sort_by'), ('sortDesc', 'sort_desc'))),
+    'list_users_for_container': Operation(
+        'GET', '/containers/{container_id}/users',
+        response_type='ListUsersForContainerResponse',
+        params=('container_id',),
+        optional=('limit', 'offset'),
+        path_params=('container_id',),
+        query=('limit', 'offset')),
+    'list_users_roles': Operation(
+        'GET', '/containers/{container_id}/users/{user_id}/roles',
+        response_type='ListUserRoles',
+        params=('container_id', 'user_id'),
+        path_params=('container_id', 'user_id')),
+    'retrieve_user': Operation(
+        'GET', '/containers/{container_id}/users/{user_id}',
+        response_type='GetUserResponse',
+        params=('container_id', 'user_id'),
+        path_params=('container_id', 'user_id')),
+    'set_service_user_permissions': Operation(
+        'PUT',
+        '/containers/{container_id}/service-users/{service_user_id}/'
+        'permissions',
+        response_type='InlineResponse2007',
+        params=('container_id', 'service_user_id'),
+        optional=('body',),
+        path_params=('container_id', 'service_user_id'),
+        body='body',
+        content_types=('application/json',)),
+    'update_user': Operation(
+        'PUT', '/users/{user_id}',
+        response_type='Generic200Response',
+        params=('user_id',),
+        optional=('body',),
+        path_params=('user_id',),
+        body='body',
+        content_types=('application/json',)),
+}
+
+for _name, _operation in OPERATIONS.items():
+    _operation.name = _name
+del _name, _operation
@@ -0,0 +1,210 @@
+# coding: utf-8
+"""
+    DeepLynx
+
+    Iterators over paginated listings.
+
+    The listing operations take a `limit` and an `offset`, so reading a
+    whole listing means asking for one page after the other. A `Pages`
+    iterator does that and yields the items of every page, while it
+    fetches the next `prefetch` pages in the background so that the caller
+    rarely waits for one::
+
+        for node in GraphApi(client).iter_nodes(container_id,
+                                                metatype_id=metatype_id,
+                                                page_size=1000):
+            ...
+
+    With `AsyncApiClient`, iterate with ``async for`` instead; the pages
+    are then fetched by concurrent tasks of the running event loop. The
+    blocking client fetches them through `async_req=True`.
+
+    At most `prefetch` pages are requested ahead of the one being read, so
+    memory stays bounded however long the listing. The listing ends with
+    the first page holding fewer than `page_size` items; the requests
+    already sent for pages after it are cancelled or their results
+    dropped. The first page is fetched alone, so short listings cost a
+    single request. An error fetching a page is raised when the iteration
+    gets to that page.
+
+    Offsets get slower the deeper they go, since the server skips every
+    item before the offset for each page. `KeysetPages` walks a listing by
+    key instead: each page asks for the items after the key of the last
+    one read, so every page costs the same. Keys depend on the previous
+    page, so only the next page is fetched ahead. When the first page
+    raises `KeysetUnavailable`, the iterator reads its `fallback`, usually
+    offset `Pages` over the same items, so callers get the same items
+    either way. See `deep_lynx.keyset` for the node queries.
+"""
+from __future__ import absolute_import
+
+import asyncio
+import collections
+
+from deep_lynx import executor
+
+DEFAULT_PAGE_SIZE = 1000
+DEFAULT_PREFETCH = 2
+
+
+class KeysetUnavailable(Exception):
+    """Raised by the fetch of `KeysetPages` when the server cannot select
+    items by key."""
+
+
+def page_items(page):
+    """Returns the items of a listing response, in any response mode
+    except ``raw_bytes``."""
+    if isinstance(page, dict):
+        return page.get('value') or []
+    if isinstance(page, (bytes, str)):
+        raise ValueError("Pages cannot be read in the `raw_bytes` response "
+                         "mode")
+    return getattr(page, 'value', None) or []
+
+
+class Pages(object):
+    """Items of a paginated listing, see the module documentation.
+
+    :param fetch: callable taking the `offset`, `limit` and `async_req`
+        keyword arguments of a listing operation, such as
+        ``functools.partial(api.list_nodes, container_id)``.
+    :param page_size: items requested per page.
+    :param prefetch: pages requested ahead of the one being read; 0 reads
+        one page after the other.
+    :param offset: offset of the first item.
+    """
+
+    def __init__(self, fetch, page_size=DEFAULT_PAGE_SIZE,
+                 prefetch=DEFAULT_PREFETCH, offset=0):
+        if page_size < 1:
+            raise ValueError("page_size must be positive")
+        if prefetch < 0:
+            raise ValueError("prefetch cannot be negative")
+        self.fetch = fetch
+        self.page_size = page_size
+        self.prefetch = prefetch
+        self.offset = offset
+
+    def __repr__(self):
+        return "Pages(page_size={0!r}, prefetch={1!r})".format(
+            self.page_size, self.prefetch)
+
+    def _request(self, offset, async_req):
+        return self.fetch(offset=offset, limit=self.page_size,
+                          async_req=async_req)
+
+    def __iter__(self):
+        pending = collections.deque()
+        offset = self.offset
+        first = self._request(offset, True)
+        if asyncio.iscoroutine(first):
+            first.close()
+            raise TypeError("Pages of an AsyncApiClient are iterated with "
+                            "`async for`")
+        pending.append(first)
+        try:
+            while True:
+                items = page_items(pending.popleft().result())
+                last = len(items) < self.page_size
+                if not last:
+                    # the next pages load while the caller reads this one
+                    while len(pending) < self.prefetch:
+                        offset += self.page_size
+                        pending.append(self._request(offset, True))
+                for item in items:
+                    yield item
+                if last:
+                    return
+                if not pending:
+                    offset += self.page_size
+                    pending.append(self._request(offset, True))
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def __aiter__(self):
+        pending = collections.deque()
+        offset = self.offset
+        try:
+            pending.append(asyncio.ensure_future(
+                self._request(offset, False)))
+            while True:
+                items = page_items(await pending.popleft())
+                last = len(items) < self.page_size
+                if not last:
+                    while len(pending) < self.prefetch:
+                        offset += self.page_size
+                        pending.append(asyncio.ensure_future(
+                            self._request(offset, False)))
+                for item in items:
+                    yield item
+                if last:
+                    return
+                if not pending:
+                    offset += self.page_size
+                    pending.append(asyncio.ensure_future(
+                        self._request(offset, False)))
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+class KeysetPages(object):
+    """Items of a listing read by key, see the module documentation.
+
+    :param fetch: callable taking `after`, the key of the last item read
+        or None for the first page, and `limit`; returns the items of the
+        page.
+    :param key: returns the key of an item.
+    :param page_size: items requested per page.
+    :param fallback: items to read instead when the first page raises
+        `KeysetUnavailable`.
+    """
+
+    def __init__(self, fetch, key, page_size=DEFAULT_PAGE_SIZE,
+                 fallback=None):
+        if page_size < 1:
+            raise ValueError("page_size must be positive")
+        self.fetch = fetch
+        self.key = key
+        self.page_size = page_size
+        self.fallback = fallback
+
+    def __repr__(self):
+        return "KeysetPages(page_size={0!r})".format(self.page_size)
+
+    def __iter__(self):
+        try:
+            items = self.fetch(after=None, limit=self.page_size)
+        except KeysetUnavailable:
+            if self.fallback is None:
+                raise
+            for item in self.fallback:
+                yield item
+            return
+        pending = None
+        try:
+            while True:
+                last = len(items) < self.page_size
+                if not last:
+                    # the next page loads while the caller reads this one
+                    pending = executor.submit(
+                        self.fetch, after=self.key(items[-1]),
+                        limit=self.page_size)
+                for item in items:
+                    yield item
+                if last:
+                    return
+                items, pending = pending.result(), None
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    async def __aiter__(self):
+        # keys are read with blocking requests; async clients read the
+        # fallback
+        if self.fallback is None:
+            raise TypeError("KeysetPages are iterated with `for`")
+        async for item in self.fallback:
+            yield item
@@ -13,10 +13,10 @@
 from __future__ import absolute_import
 
 import io
-import json
 import logging
 import re
 import ssl
+import time
 
 import certifi
 # python 2 and python 3 compatibility library
@@ -28,6 +28,10 @@ try:
 except ImportError:
     raise ImportError('Swagger python client requires urllib3.')
 
+from deep_lynx import forksafe
+from deep_lynx import multipart
+from deep_lynx import retry
+
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +43,10 @@ class RESTResponse(io.IOBase):
         self.status = resp.status
         self.reason = resp.reason
         self.data = resp.data
+        # size of the encoded request body, when known
+        self.request_bytes = None
+        # retries before this response, see `deep_lynx.retry`
+        self.retries = 0
 
     def getheaders(self):
         """Returns a dictionary of the response headers."""
@@ -49,9 +57,37 @@ class RESTResponse(io.IOBase):
         return self.urllib3_response.headers.get(name, default)
 
 
+# urllib3 still follows redirects, but leaves every other retry to
+# `deep_lynx.retry` and raises the first error it runs into
+_REDIRECTS_ONLY = urllib3.Retry(total=None, connect=0, read=0, status=0,
+                                other=0, redirect=3)
+
+# errors raised before the request could reach the server
+_NOT_CONNECTED = (urllib3.exceptions.ConnectTimeoutError,
+                  urllib3.exceptions.NewConnectionError)
+# errors after which the request may have been processed
+_DROPPED = (urllib3.exceptions.ProtocolError,
+            urllib3.exceptions.ReadTimeoutError)
+
+
 class RESTClientObject(object):
 
     def __init__(self, configuration, pools_size=4, maxsize=None):
+        self.configuration = configuration
+        self.pools_size = pools_size
+        self.maxsize = maxsize
+        self.pool_manager = self._new_pool_manager()
+        # a forked child must not share the parent's connections
+        forksafe.register(self)
+
+    def _after_fork(self):
+        self.pool_manager = self._new_pool_manager()
+
+    def _new_pool_manager(self):
+        configuration = self.configuration
+        pools_size = self.pools_size
+        maxsize = self.maxsize
+
         # urllib3.PoolManager will pass all kw parameters to connectionpool
         # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/poolmanager.py#L75  # noqa: E501
         # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/connectionpool.py#L680  # noqa: E501
@@ -83,7 +119,7 @@ class RESTClientObject(object):
 
         # https pool manager
         if configuration.proxy:
-            self.pool_manager = urllib3.ProxyManager(
+            return urllib3.ProxyManager(
                 num_pools=pools_size,
                 maxsize=maxsize,
                 cert_reqs=cert_reqs,
@@ -94,7 +130,7 @@ class RESTClientObject(object):
                 **addition_pool_args
             )
         else:
-            self.pool_manager = urllib3.PoolManager(
+            return urllib3.PoolManager(
                 num_pools=pools_size,
                 maxsize=maxsize,
                 cert_reqs=cert_reqs,
@@ -106,7 +142,7 @@ class RESTClientObject(object):
 
     def request(self, method, url, query_params=None, headers=None,
                 body=None, post_params=None, _preload_content=True,
-                _request_timeout=None):
+                _request_timeout=None, _retry_policy=None):
         """Perform requests.
 
         :param method: http request method
@@ -124,6 +160,9 @@ class RESTClientObject(object):
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :param _retry_policy: `retry.RetryPolicy` of this request, defaults
+                              to `Configuration.retry_policy`; None there
+                              disables retries.
         """
         method = method.upper()
         assert method in ['GET', 'HEAD', 'DELETE', 'POST', 'PUT',
@@ -137,9 +176,11 @@ class RESTClientObject(object):
         post_params = post_params or {}
         headers = headers or {}
 
+        if _request_timeout is None:
+            _request_timeout = self.configuration.request_timeout
         timeout = None
         if _request_timeout:
-            if isinstance(_request_timeout, (int, ) if six.PY3 else (int, long)):  # noqa: E501,F821
+            if isinstance(_request_timeout, (int, float) if six.PY3 else (int, long, float)):  # noqa: E501,F821
                 timeout = urllib3.Timeout(total=_request_timeout)
             elif (isinstance(_request_timeout, tuple) and
                   len(_request_timeout) == 2):
@@ -149,51 +190,124 @@ class RESTClientObject(object):
         if 'Content-Type' not in headers:
             headers['Content-Type'] = 'application/json'
 
+        policy = _retry_policy or self.configuration.retry_policy
+        attempts = (policy or retry.RetryPolicy(total=0)).start(method)
+        while True:
+            attempt_timeout = timeout
+            remaining = attempts.remaining()
+            if attempt_timeout is None and remaining is not None:
+                attempt_timeout = urllib3.Timeout(total=remaining)
+            try:
+                # the body is built again for every attempt, the multipart
+                # encoder rewrites the headers
+                r, request_bytes = self._send(
+                    method, url, query_params, dict(headers), body,
+                    post_params, _preload_content, attempt_timeout)
+            except urllib3.exceptions.HTTPError as e:
+                error = (e.reason if isinstance(
+                    e, urllib3.exceptions.MaxRetryError) else e)
+                delay = None
+                if isinstance(error, _NOT_CONNECTED + _DROPPED):
+                    delay = attempts.retry_error(
+                        connected=not isinstance(error, _NOT_CONNECTED))
+                if delay is None:
+                    e.retries = attempts.retries
+                    raise
+                logger.debug("retrying %s %s in %.2fs after %s", method, url,
+                             delay, error)
+            else:
+                delay = attempts.retry_response(r.status, r.headers)
+                if delay is None:
+                    break
+                if not _preload_content:
+                    # put the connection back in the pool
+                    r.drain_conn()
+                    r.release_conn()
+                logger.debug("retrying %s %s in %.2fs after status %d",
+                             method, url, delay, r.status)
+            time.sleep(delay)
+
+        if _preload_content:
+            r = RESTResponse(r)
+            r.request_bytes = request_bytes
+            r.retries = attempts.retries
+
+            # log response body
+            logger.debug("response body: %s", r.data)
+
+        if not 200 <= r.status <= 299:
+            error = ApiException(http_resp=r)
+            error.retries = attempts.retries
+            raise error
+
+        return r
+
+    def _send(self, method, url, query_params, headers, body, post_params,
+              preload_content, timeout):
+        """Sends one attempt of `request`.
+
+        :return: tuple of the urllib3 response and the size of the encoded
+            request body, None when unknown.
+        """
+        request_bytes = None
         try:
             # For `POST`, `PUT`, `PATCH`, `OPTIONS`, `DELETE`
             if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
                 if query_params:
                     url += '?' + urlencode(query_params)
                 if re.search('json', headers['Content-Type'], re.IGNORECASE):
-                    request_body = '{}'
+                    request_body = b'{}'
                     if body is not None:
-                        request_body = json.dumps(body)
+                        request_body = self.configuration.json_codec.dumps(
+                            body)
+                    request_bytes = len(request_body)
                     r = self.pool_manager.request(
                         method, url,
                         body=request_body,
-                        preload_content=_preload_content,
+                        preload_content=preload_content,
                         timeout=timeout,
+                        retries=_REDIRECTS_ONLY,
                         headers=headers)
                 elif headers['Content-Type'] == 'application/x-www-form-urlencoded':  # noqa: E501
                     r = self.pool_manager.request(
                         method, url,
                         fields=post_params,
                         encode_multipart=False,
-                        preload_content=_preload_content,
+                        preload_content=preload_content,
                         timeout=timeout,
+                        retries=_REDIRECTS_ONLY,
                         headers=headers)
                 elif headers['Content-Type'] == 'multipart/form-data':
-                    # must del headers['Content-Type'], or the correct
-                    # Content-Type which generated by urllib3 will be
-                    # overwritten.
-                    del headers['Content-Type']
+                    # the body is streamed, so files are read in chunks
+                    # instead of being loaded into memory
+                    encoder = multipart.MultipartEncoder(
+                        post_params,
+                        chunk_size=self.configuration.upload_chunk_size)
+                    headers['Content-Type'] = encoder.content_type
+                    content_length = encoder.content_length
+                    request_bytes = content_length
+                    if content_length is not None:
+                        headers['Content-Length'] = str(content_length)
                     r = self.pool_manager.request(
                         method, url,
-                        fields=post_params,
-                        encode_multipart=True,
-                        preload_content=_preload_content,
+                        body=encoder,
+                        preload_content=preload_content,
                         timeout=timeout,
+                        retries=_REDIRECTS_ONLY,
                         headers=headers)
                 # Pass a `string` parameter directly in the body to support
                 # other content types than Json when `body` argument is
                 # provided in serialized form
-                elif isinstance(body, str):
+                elif isinstance(body, (str, bytes)):
                     request_body = body
+                    request_bytes = len(body if isinstance(body, bytes)
+                                        else body.encode('utf-8'))
                     r = self.pool_manager.request(
                         method, url,
                         body=request_body,
-                        preload_content=_preload_content,
+                        preload_content=preload_content,
                         timeout=timeout,
+                        retries=_REDIRECTS_ONLY,
                         headers=headers)
                 else:
                     # Cannot generate the request from given parameters
@@ -205,87 +319,96 @@ class RESTClientObject(object):
             else:
                 r = self.pool_manager.request(method, url,
                                               fields=query_params,
-                                              preload_content=_preload_content,
+                                              preload_content=preload_content,
                                               timeout=timeout,
+                                              retries=_REDIRECTS_ONLY,
                                               headers=headers)
         except urllib3.exceptions.SSLError as e:
             msg = "{0}\n{1}".format(type(e).__name__, str(e))
             raise ApiException(status=0, reason=msg)
-
-        if _preload_content:
-            r = RESTResponse(r)
-
-            # log response body
-            logger.debug("response body: %s", r.data)
-
-        if not 200 <= r.status <= 299:
-            raise ApiException(http_resp=r)
-
-        return r
+        except urllib3.exceptions.MaxRetryError as e:
+            if isinstance(e.reason, urllib3.exceptions.SSLError):
+                msg = "{0}\n{1}".format(type(e.reason).__name__,
+                                         str(e.reason))
+                raise ApiException(status=0, reason=msg)
+            raise
+        return r, request_bytes
 
     def GET(self, url, headers=None, query_params=None, _preload_content=True,
-            _request_timeout=None):
+            _request_timeout=None, _retry_policy=None):
         return self.request("GET", url,
                             headers=headers,
                             _preload_content=_preload_content,
                             _request_timeout=_request_timeout,
+                            _retry_policy=_retry_policy,
                             query_params=query_params)
 
     def HEAD(self, url, headers=None, query_params=None, _preload_content=True,
-             _request_timeout=None):
+             _request_timeout=None, _retry_policy=None):
         return self.request("HEAD", url,
                             headers=headers,
                             _preload_content=_preload_content,
                             _request_timeout=_request_timeout,
+                            _retry_policy=_retry_policy,
                             query_params=query_params)
 
     def OPTIONS(self, url, headers=None, query_params=None, post_params=None,
-                body=None, _preload_content=True, _request_timeout=None):
+                body=None, _preload_content=True, _request_timeout=None,
+                _retry_policy=None):
         return self.request("OPTIONS", url,
                             headers=headers,
                             query_params=query_params,
                             post_params=post_params,
                             _preload_content=_preload_content,
                             _request_timeout=_request_timeout,
+                            _retry_policy=_retry_policy,
                             body=body)
 
     def DELETE(self, url, headers=None, query_params=None, body=None,
-               _preload_content=True, _request_timeout=None):
+               _preload_content=True, _request_timeout=None,
+               _retry_policy=None):
         return self.request("DELETE", url,
                             headers=headers,
                             query_params=query_params,
                             _preload_content=_preload_content,
                             _request_timeout=_request_timeout,
+                            _retry_policy=_retry_policy,
                             body=body)
 
     def POST(self, url, headers=None, query_params=None, post_params=None,
-             body=None, _preload_content=True, _request_timeout=None):
+             body=None, _preload_content=True, _request_timeout=None,
+             _retry_policy=None):
         return self.request("POST", url,
                             headers=headers,
                             query_params=query_params,
                             post_params=post_params,
                             _preload_content=_preload_content,
                             _request_timeout=_request_timeout,
+                            _retry_policy=_retry_policy,
                             body=body)
 
     def PUT(self, url, headers=None, query_params=None, post_params=None,
-            body=None, _preload_content=True, _request_timeout=None):
+            body=None, _preload_content=True, _request_timeout=None,
+            _retry_policy=None):
         return self.request("PUT", url,
                             headers=headers,
                             query_params=query_params,
                             post_params=post_params,
                             _preload_content=_preload_content,
                             _request_timeout=_request_timeout,
+                            _retry_policy=_retry_policy,
                             body=body)
 
     def PATCH(self, url, headers=None, query_params=None, post_params=None,
-              body=None, _preload_content=True, _request_timeout=None):
+              body=None, _preload_content=True, _request_timeout=None,
+              _retry_policy=None):
         return self.request("PATCH", url,
                             headers=headers,
                             query_params=query_params,
                             post_params=post_params,
                             _preload_content=_preload_content,
                             _request_timeout=_request_timeout,
+                            _retry_policy=_retry_policy,
                             body=body)
 
 
@@ -302,6 +425,8 @@ class ApiException(Exception):
             self.reason = reason
             self.body = None
             self.headers = None
+        # retries before the error, see `deep_lynx.retry`
+        self.retries = 0
 
     def __str__(self):
         """Custom error messages for exception"""
@@ -0,0 +1,170 @@
+# coding: utf-8
+"""
+    DeepLynx
+
+    Retries of failed requests.
+
+    `rest.RESTClientObject` and `async_rest.RESTClientObject` retry
+    requests according to a `RetryPolicy`:
+
+    - requests that could not connect are always retried, since the server
+      never saw them;
+    - responses with a status in `RetryPolicy.statuses` and dropped or
+      timed out connections are retried for the methods in
+      `RetryPolicy.methods` only, which leaves out POST and PATCH unless a
+      policy opts in; a policy with ``retry_dropped=False`` retries the
+      statuses but not the connections dropped after the request was
+      sent, which the server may have processed;
+    - attempts are spaced with exponential backoff and full jitter, a random
+      delay between 0 and ``backoff_factor * 2 ** retries`` capped at
+      `backoff_max`, unless a 429 or 503 response says when to come back
+      with ``Retry-After``, which is honoured up to `backoff_max` as well;
+    - with a `deadline`, no retry is attempted past that many seconds after
+      the first attempt, and attempts are given the remaining time as their
+      timeout.
+
+    `Configuration.retry_policy` applies to every request and
+    `Configuration.retry_overrides` replaces it for single operations, named
+    like `metrics.RequestInfo.operation`::
+
+        config.retry_overrides[
+            'POST /containers/{container_id}/import/datasources/'
+            '{data_source_id}/imports'] = config.retry_policy.replace(
+                methods=retry.IDEMPOTENT_METHODS | {'POST'})
+
+    The number of retries of a request is reported in the `retries` of
+    `rest.RESTResponse`, of `rest.ApiException` and of the request metrics.
+"""
+from __future__ import absolute_import
+
+import email.utils
+import random
+import time
+
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'])
+RETRY_STATUSES = frozenset([429, 502, 503, 504])
+# statuses whose Retry-After header is honoured
+RETRY_AFTER_STATUSES = frozenset([429, 503])
+
+
+class RetryPolicy(object):
+    """When and how long to wait before retrying a request.
+
+    :param total: most retries of one request; 0 disables retries.
+    :param backoff_factor: seconds of the first backoff; each retry
+        doubles it.
+    :param backoff_max: longest backoff in seconds.
+    :param methods: methods retried after an error status or a dropped
+        connection.
+    :param statuses: response statuses that are retried.
+    :param respect_retry_after: wait as long as the ``Retry-After`` header
+        of 429 and 503 responses asks, up to `backoff_max`, instead of
+        backing off.
+    :param deadline: seconds after the first attempt past which the request
+        is no longer retried; None for no limit.
+    :param retry_dropped: retry connections of `methods` dropped or timed
+        out after the request was sent.
+    """
+
+    def __init__(self, total=3, backoff_factor=0.5, backoff_max=30.0,
+                 methods=IDEMPOTENT_METHODS, statuses=RETRY_STATUSES,
+                 respect_retry_after=True, deadline=None, retry_dropped=True):
+        self.total = total
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.methods = frozenset(m.upper() for m in methods)
+        self.statuses = frozenset(statuses)
+        self.respect_retry_after = respect_retry_after
+        self.deadline = deadline
+        self.retry_dropped = retry_dropped
+
+    def __repr__(self):
+        return ("RetryPolicy(total={0!r}, backoff_factor={1!r}, "
+                "methods={2!r}, deadline={3!r})".format(
+                    self.total, self.backoff_factor, sorted(self.methods),
+                    self.deadline))
+
+    def replace(self, **changes):
+        """Returns a copy of the policy with `changes` applied."""
+        values = dict(vars(self))
+        values.update(changes)
+        return RetryPolicy(**values)
+
+    def backoff(self, retries):
+        """Seconds to wait before retry number `retries` + 1."""
+        ceiling = min(self.backoff_max,
+                      self.backoff_factor * (2 ** retries))
+        return random.uniform(0, ceiling)
+
+    def start(self, method):
+        """Returns the `Attempts` of a request about to be sent."""
+        return Attempts(self, method)
+
+
+class Attempts(object):
+    """Retry state of one request, see `RetryPolicy.start`."""
+
+    def __init__(self, policy, method):
+        self.policy = policy
+        self.method = method.upper()
+        self.retries = 0
+        self.started = time.monotonic()
+
+    def remaining(self):
+        """Seconds left before the deadline, None without one."""
+        if self.policy.deadline is None:
+            return None
+        return max(self.policy.deadline - (time.monotonic() - self.started),
+                   0.0)
+
+    def retry_response(self, status, headers):
+        """Returns the delay before retrying a response with `status`, or
+        None if it should be returned as it is."""
+        if (status not in self.policy.statuses or
+                self.method not in self.policy.methods):
+            return None
+        delay = None
+        if (self.policy.respect_retry_after and
+                status in RETRY_AFTER_STATUSES):
+            delay = parse_retry_after(headers.get('Retry-After'))
+            if delay is not None:
+                # a misbehaving server must not park the caller for hours
+                delay = min(delay, self.policy.backoff_max)
+        return self._next(delay)
+
+    def retry_error(self, connected):
+        """Returns the delay before retrying a request that failed with a
+        connection error, or None if the error should be raised.
+
+        :param connected: False if the request could not connect, so it
+            was never sent.
+        """
+        if connected and (self.method not in self.policy.methods or
+                          not self.policy.retry_dropped):
+            return None
+        return self._next(None)
+
+    def _next(self, delay):
+        if self.retries >= self.policy.total:
+            return None
+        if delay is None:
+            delay = self.policy.backoff(self.retries)
+        remaining = self.remaining()
+        if remaining is not None and delay >= remaining:
+            return None
+        self.retries += 1
+        return delay
+
+
+def parse_retry_after(value):
+    """Seconds to wait according to a ``Retry-After`` header, given either
+    in seconds or as an HTTP date; None if missing or malformed."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    parsed = email.utils.parsedate_tz(value)
+    if parsed is None:
+        return None
+    return max(email.utils.mktime_tz(parsed) - time.time(), 0.0)
@@ -0,0 +1,273 @@
+# coding: utf-8
+"""
+    DeepLynx
+
+    Parallel scans of the nodes of a container.
+
+    Reading a container through `list_nodes` is one long serial stream,
+    and pages deep into a listing get slower to serve. A `ParallelScan`
+    splits the container into shards instead, one per metatype, per data
+    source, or per metatype and data source pair, discovered with
+    `list_metatypes` and `list_data_sources`. A pool of worker threads
+    scans the shards concurrently and the nodes of all shards come out of
+    a single iterator::
+
+        scan = GraphApi(client).scan_nodes(container_id, workers=16)
+        for node in scan:
+            ...
+        scan.progress()   # per shard items, pages and completion
+
+    Workers take shards that have not started first. Once every shard has
+    started, an idle worker steals the next page of the unfinished shard
+    with the fewest pages in flight, so a few huge metatypes are still
+    read by every worker rather than by one. A shard ends with its first
+    page shorter than `page_size`; the pages requested past it come back
+    empty.
+
+    Nodes come in the order their pages arrive, not in any global order.
+    At most `buffer` pages wait for the caller, so memory stays bounded
+    when the caller is slower than the scan. An error from any request
+    stops the scan and is raised by the iterator.
+
+    Sharding by metatype alone covers every node. Sharding by data source
+    only covers nodes with a data source.
+"""
+from __future__ import absolute_import
+
+import asyncio
+import itertools
+import threading
+import time
+
+from six.moves import queue
+
+from deep_lynx import pagination
+
+# shard keys and the `list_nodes` filter of each
+KEYS = {'metatype': 'metatype_id', 'data_source': 'data_source_id'}
+
+DEFAULT_WORKERS = 8
+
+
+def item_id(item):
+    """Returns the id of a model, compact model or decoded JSON object."""
+    if isinstance(item, dict):
+        return item.get('id')
+    return getattr(item, 'id', None)
+
+
+class Shard(object):
+    """One partition of a scan and its progress.
+
+    :param filters: `list_nodes` filters selecting the shard, e.g.
+        ``{'metatype_id': '12'}``.
+    """
+
+    __slots__ = ('filters', 'items', 'pages', 'in_flight', 'done',
+                 'started', 'finished', '_next_offset')
+
+    def __init__(self, filters):
+        self.filters = filters
+        self.items = 0
+        self.pages = 0
+        self.in_flight = 0
+        self.done = False
+        self.started = None
+        self.finished = None
+        self._next_offset = 0
+
+    def __repr__(self):
+        return "Shard({0!r}, items={1}, done={2})".format(
+            self.filters, self.items, self.done)
+
+    @property
+    def elapsed(self):
+        """Seconds the shard has been scanned for, None before it
+        started."""
+        if self.started is None:
+            return None
+        return (self.finished or time.monotonic()) - self.started
+
+
+class ParallelScan(object):
+    """Nodes of a container read by concurrent workers, see the module
+    documentation.
+
+    :param api_client: blocking `ApiClient` to send the requests with.
+    :param container_id: container to scan.
+    :param by: shard keys, any of the `KEYS`.
+    :param workers: requests in flight at a time.
+    :param page_size: nodes requested per page.
+    :param buffer: pages kept for the caller before workers wait, defaults
+        to twice `workers`.
+    :param shards: `Shard` filters to scan instead of discovering them.
+    :param on_progress: called with the `Shard` after each of its pages,
+        from the worker threads.
+    :param filters: other `list_nodes` arguments, such as `history`.
+    """
+
+    def __init__(self, api_client, container_id, by=('metatype',),
+                 workers=DEFAULT_WORKERS,
+                 page_size=pagination.DEFAULT_PAGE_SIZE, buffer=None,
+                 shards=None, on_progress=None, **filters):
+        for key in by:
+            if key not in KEYS:
+                raise ValueError("Unknown shard key `{0}`, must be one of "
+                                 "{1}".format(key, ', '.join(KEYS)))
+        if workers < 1 or page_size < 1:
+            raise ValueError("workers and page_size must be positive")
+        self.api_client = api_client
+        self.container_id = container_id
+        self.by = tuple(by)
+        self.workers = workers
+        self.page_size = page_size
+        self.buffer = buffer or 2 * workers
+        self.on_progress = on_progress
+        self.filters = filters
+        self._shards = ([Shard(dict(shard)) for shard in shards]
+                        if shards is not None else None)
+        self._lock = threading.Lock()
+        # no more pages are fetched once set, after an error or when the
+        # caller stopped reading
+        self._stopped = threading.Event()
+        self._closed = threading.Event()
+
+    def __repr__(self):
+        return "ParallelScan({0!r}, by={1!r})".format(self.container_id,
+                                                      self.by)
+
+    @property
+    def shards(self):
+        """The shards of the scan, discovered on first use."""
+        if self._shards is None:
+            self._shards = self.discover()
+        return self._shards
+
+    def discover(self):
+        """Returns a `Shard` for every metatype and/or data source of the
+        container."""
+        from deep_lynx.api.data_sources_api import DataSourcesApi
+        from deep_lynx.api.metatypes_api import MetatypesApi
+
+        values = []
+        for key in self.by:
+            if key == 'metatype':
+                listing = MetatypesApi(self.api_client).list_metatypes
+                items = pagination.Pages(
+                    lambda **kwargs: listing(self.container_id, **kwargs),
+                    prefetch=0)
+            else:
+                items = pagination.page_items(DataSourcesApi(
+                    self.api_client).list_data_sources(self.container_id))
+            values.append([item_id(item) for item in items])
+        return [Shard(dict(zip([KEYS[key] for key in self.by], ids)))
+                for ids in itertools.product(*values)]
+
+    def progress(self):
+        """Returns ``(filters, items, pages, done)`` for every shard."""
+        with self._lock:
+            return [(shard.filters, shard.items, shard.pages, shard.done)
+                    for shard in self.shards]
+
+    def __iter__(self):
+        # every iteration scans the shards again
+        shards = self._shards = [Shard(shard.filters)
+                                 for shard in self.shards]
+        results = queue.Queue(self.buffer)
+        self._stopped.clear()
+        self._closed.clear()
+        waiting = list(reversed(shards))
+        threads = [threading.Thread(target=self._work,
+                                    args=(waiting, results),
+                                    name='deep_lynx-scan-%d' % number)
+                   for number in range(self.workers if shards else 0)]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        running = len(threads)
+        try:
+            while running:
+                result = results.get()
+                if result is None:
+                    running -= 1
+                elif isinstance(result, BaseException):
+                    raise result
+                else:
+                    for item in result:
+                        yield item
+        finally:
+            # also reached when the caller stops early
+            self._closed.set()
+            self._stopped.set()
+
+    def _next_page(self, waiting):
+        """Returns the shard and offset of the next page to fetch, None
+        when every shard is done."""
+        with self._lock:
+            if waiting:
+                shard = waiting.pop()
+                shard.started = time.monotonic()
+            else:
+                live = [shard for shard in self.shards
+                        if not shard.done and shard.started is not None]
+                if not live:
+                    return None
+                # the shard fewest workers are on, the largest one first
+                shard = min(live, key=lambda s: (s.in_flight, -s.pages))
+            offset = shard._next_offset
+            shard._next_offset += self.page_size
+            shard.in_flight += 1
+            return shard, offset
+
+    def _work(self, waiting, results):
+        listing = self._listing()
+        try:
+            while not self._stopped.is_set():
+                task = self._next_page(waiting)
+                if task is None:
+                    break
+                shard, offset = task
+                try:
+                    page = listing(self.container_id, offset=offset,
+                                   limit=self.page_size,
+                                   **dict(self.filters, **shard.filters))
+                    if asyncio.iscoroutine(page):
+                        page.close()
+                        raise TypeError("Scans need a blocking ApiClient")
+                    items = pagination.page_items(page)
+                except BaseException:
+                    with self._lock:
+                        shard.in_flight -= 1
+                    raise
+                with self._lock:
+                    shard.in_flight -= 1
+                    shard.items += len(items)
+                    shard.pages += 1
+                    if len(items) < self.page_size:
+                        # no new pages; those in flight may still be
+                        # before this one
+                        shard.done = True
+                    if shard.done and not shard.in_flight:
+                        shard.finished = time.monotonic()
+                if self.on_progress is not None:
+                    self.on_progress(shard)
+                if items:
+                    self._put(results, items)
+        except Exception as e:
+            self._stopped.set()
+            self._put(results, e)
+        finally:
+            self._put(results, None)
+
+    def _listing(self):
+        from deep_lynx.api.graph_api import GraphApi
+        return GraphApi(self.api_client).list_nodes
+
+    def _put(self, results, value):
+        # gives up once the caller stopped reading
+        while not self._closed.is_set():
+            try:
+                results.put(value, timeout=0.1)
+                return
+            except queue.Full:
+                pass
@@ -1,6 +1,6 @@
 from typing import Optional
 import os
-from deep_lynx import Configuration, ApiClient, AuthenticationApi
+from deep_lynx import Configuration, ApiClient, AuthenticationApi, TokenManager
 from dotenv import load_dotenv
 
 class DeepLynxConfig:
@@ -9,7 +9,8 @@ class DeepLynxConfig:
         self,
         base_url: str = "http://localhost:8090",
         api_key: Optional[str] = None,
-        api_secret: Optional[str] = None
+        api_secret: Optional[str] = None,
+        token_cache: Optional[str] = None
     ):
         # Initialize configuration
         self.configuration = Configuration()
@@ -24,17 +25,15 @@ class DeepLynxConfig:
             'Content-Type': 'application/json'
         }
         
-        # Get auth token
-        auth_api = AuthenticationApi(self.api_client)
-        token = auth_api.retrieve_o_auth_token(
-            x_api_key=api_key,
-            x_api_secret=api_secret,
-            x_api_expiry='1h'
+        # Tokens are fetched on the first request, shared by every client
+        # of the process and refreshed before they expire; with a token
+        # cache file, other processes reuse them too
+        self.configuration.refresh_api_key_hook = TokenManager.shared(
+            api_key,
+            api_secret,
+            expiry='1h',
+            cache_path=token_cache or os.getenv('DEEP_LYNX_TOKEN_CACHE')
         )
-        
-        # Set token in configuration and headers
-        self.api_client.configuration.access_token = token
-        self.api_client.default_headers['Authorization'] = f'Bearer {token}'
 
     def get_api_client(self) -> ApiClient:
         """Get the configured API client"""
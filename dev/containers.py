@@ -41,7 +41,10 @@ class ContainersAPI:
                 
             container_id = str(response.value[0].id)
             
-            # Verify container creation with retries
+            # Poll until the new container is listed. This waits out eventual
+            # consistency rather than retrying errors, so it stays a fixed
+            # interval outside of the client's retry policy, which retries
+            # failed requests only.
             max_retries = 5
             for attempt in range(max_retries):
                 sleep(2)  # Longer delay between attempts
@@ -206,11 +209,8 @@ class ContainersAPI:
     def get_metatype(self, container_id: str, metatype_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve a specific metatype by ID"""
         try:
-            response = self.client.metatypes_api.list_metatypes(container_id)
-            if not response.value:
-                return None
-                
-            metatype = next((m for m in response.value if str(m.id) == str(metatype_id)), None)
+            response = self.client.metatypes_api.retrieve_metaype(container_id, metatype_id)
+            metatype = response.value
             if not metatype:
                 return None
                 
@@ -1,12 +1,16 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import pandas as pd
 from ..base import DataLoader
 from ...pipeline_config import PipelineConfig
-import asyncio
+from deep_lynx import DataSourcesApi, retry
+import copy
+import inspect
 import logging
 
 logger = logging.getLogger('deep_lynx_pipeline')
 
+MANUAL_IMPORT = 'POST /containers/{container_id}/import/datasources/{data_source_id}/imports'
+
 class DeepLynxLoader(DataLoader):
     """Loader for inserting data into Deep Lynx"""
     def __init__(
@@ -15,14 +19,42 @@ class DeepLynxLoader(DataLoader):
         container_id: str,
         data_source_id: str,
         batch_size: int = 100,
-        retry_attempts: int = 3
+        retry_attempts: Optional[int] = None
     ):
         self.config = config
         self.container_id = container_id
         self.data_source_id = data_source_id
         self.batch_size = batch_size
-        self.retry_attempts = retry_attempts
-        self.datasources_api = config.get_datasources_api()
+        self.retry_attempts = (config.retry_attempts if retry_attempts is None
+                               else retry_attempts)
+        if self.retry_attempts < 1:
+            raise ValueError("retry_attempts must be at least 1")
+
+        # The client retries failed imports itself, backing off from
+        # `retry_delay` seconds. Imports are POSTs, which are only retried
+        # once opted in, and then only when the server refused them (429,
+        # 503) or was never reached. A 500, 502 or 504, a connection
+        # dropped after sending, or an unexpected response body may each
+        # come from an import that was created, so retrying them could
+        # load the batch twice; they fail the batch at once.
+        policy = retry.RetryPolicy(
+            total=self.retry_attempts - 1,
+            backoff_factor=config.retry_delay,
+            methods=retry.IDEMPOTENT_METHODS | {'POST'},
+            statuses=retry.RETRY_AFTER_STATUSES,
+            retry_dropped=False
+        )
+        # The policy goes on a client of the loader's own, so the shared
+        # configuration and the other loaders keep theirs
+        shared = config.get_datasources_api().api_client
+        configuration = copy.copy(shared.configuration)
+        configuration.retry_overrides = dict(shared.configuration.retry_overrides)
+        configuration.retry_overrides[MANUAL_IMPORT] = policy
+        api_client = type(shared)(configuration, cookie=shared.cookie)
+        api_client.default_headers = dict(shared.default_headers)
+        for hook in shared.hooks:
+            api_client.add_hook(hook)
+        self.datasources_api = DataSourcesApi(api_client)
 
     async def load(self, data: pd.DataFrame) -> bool:
         """Load transformed data into Deep Lynx"""
@@ -40,38 +72,33 @@ class DeepLynxLoader(DataLoader):
                 }
             }
 
-            # Attempt to create manual import with retry logic
-            for attempt in range(self.retry_attempts):
-                try:
-                    response = self.datasources_api.create_manual_import(
-                        container_id=self.container_id,
-                        data_source_id=self.data_source_id,
-                        body=import_data
-                    )
-                    
-                    # Check for successful response
-                    if (
-                        isinstance(response, dict) and
-                        'value' in response and
-                        isinstance(response['value'], dict) and
-                        response['value'].get('status', '') in ['ready', 'queued', 'processing']
-                    ):
-                        logger.info(f"Successfully queued batch of {len(data)} records for import")
-                        return True
-                    
-                    logger.warning(f"Import attempt {attempt + 1} returned unexpected response: {response}")
-                    if attempt < self.retry_attempts - 1:
-                        await asyncio.sleep(1 * (attempt + 1))
-                        
-                except Exception as e:
-                    if attempt < self.retry_attempts - 1:
-                        logger.warning(f"Load attempt {attempt + 1} failed: {e}")
-                        await asyncio.sleep(1 * (attempt + 1))
-                    else:
-                        raise Exception(f"Failed to load batch after {self.retry_attempts} attempts: {e}")
-            
+            try:
+                response = self.datasources_api.create_manual_import(
+                    container_id=self.container_id,
+                    data_source_id=self.data_source_id,
+                    body=import_data
+                )
+                # APIs built on an AsyncApiClient return a coroutine,
+                # awaiting it keeps the event loop free during the request
+                if inspect.isawaitable(response):
+                    response = await response
+            except Exception as e:
+                attempts = getattr(e, 'retries', 0) + 1
+                raise Exception(f"Failed to load batch after {attempts} attempts: {e}") from e
+
+            # Check for successful response
+            if (
+                isinstance(response, dict) and
+                'value' in response and
+                isinstance(response['value'], dict) and
+                response['value'].get('status', '') in ['ready', 'queued', 'processing']
+            ):
+                logger.info(f"Successfully queued batch of {len(data)} records for import")
+                return True
+
+            logger.warning(f"Import returned unexpected response: {response}")
             return False
-            
+
         except Exception as e:
             logger.error(f"Error loading data: {e}")
             raise
\ No newline at end of file
@@ -0,0 +1,57 @@
+"""Measure the client-side cost of calling an API method.
+
+Times API methods through an ApiClient whose call_api does nothing, so only
+the argument checks and the assembly of the request parameters by
+deep_lynx.operations are measured, not serialization or I/O.
+
+Usage: PYTHONPATH=. python scripts/benchmark_dispatch.py [--number 100000]
+"""
+import argparse
+import timeit
+
+import deep_lynx
+from deep_lynx.api.data_sources_api import DataSourcesApi
+from deep_lynx.api.graph_api import GraphApi
+from deep_lynx.api.metatypes_api import MetatypesApi
+
+
+class NullClient(deep_lynx.ApiClient):
+    """Client that drops every request"""
+
+    def call_api(self, *args, **kwargs):
+        return None
+
+
+def run_benchmark(number=100000):
+    client = NullClient(deep_lynx.Configuration())
+    graph = GraphApi(client)
+    metatypes = MetatypesApi(client)
+    data_sources = DataSourcesApi(client)
+    calls = {
+        "retrieve_node": lambda: graph.retrieve_node("c1", "n1"),
+        "list_nodes": lambda: graph.list_nodes("c1", limit=10, offset=0),
+        "list_metatypes": lambda: metatypes.list_metatypes(
+            "c1", name="Asset", load_keys=True, sort_by="name"),
+        "create_data_source": lambda: data_sources.create_data_source(
+            {"name": "source"}, "c1"),
+    }
+
+    print(f"\nAPI method dispatch, {number} calls")
+    print("-" * 36)
+    print(f"{'Operation':^22} | {'us/call':^10}")
+    print("-" * 36)
+    results = []
+    for name, call in calls.items():
+        call()  # the dispatcher is generated on first use
+        seconds = min(timeit.repeat(call, number=number, repeat=5))
+        micros = seconds / number * 1e6
+        print(f"{name:^22} | {micros:^10.2f}")
+        results.append({"operation": name, "us_per_call": micros})
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=100000)
+    args = parser.parse_args()
+    run_benchmark(args.number)
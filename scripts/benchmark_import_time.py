@@ -0,0 +1,88 @@
+"""Measure the cold import time of the deep_lynx package.
+
+Imports deep_lynx in --runs fresh interpreters for each scenario and reports
+the median and best wall time, and how many deep_lynx modules got loaded:
+
+- ``package``: ``import deep_lynx``
+- ``client``: ``from deep_lynx import ApiClient, Configuration, MetatypesApi``
+- ``eager``: the same with DEEP_LYNX_EAGER_IMPORT set, i.e. every API and
+  model imported up front
+
+With --max-ms the script exits with status 1 when the median of the client
+scenario is slower, so it can guard against regressions in CI.
+
+Usage: PYTHONPATH=. python scripts/benchmark_import_time.py [--runs 15]
+                                                            [--max-ms 250]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = {
+    "package": ("import deep_lynx", {}),
+    "client": ("from deep_lynx import ApiClient, Configuration, MetatypesApi",
+               {}),
+    "eager": ("from deep_lynx import ApiClient, Configuration, MetatypesApi",
+              {"DEEP_LYNX_EAGER_IMPORT": "1"}),
+}
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - started
+print(json.dumps({{"seconds": elapsed, "modules": len(
+    [name for name in sys.modules if name.startswith("deep_lynx.")])}}))
+"""
+
+
+def measure(statement, env, runs):
+    """Import seconds of each run and the deep_lynx modules loaded"""
+    environ = dict(os.environ, **env)
+    environ.setdefault("PYTHONPATH", os.getcwd())
+    timings = []
+    modules = 0
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE.format(statement=statement)],
+            env=environ, check=True, capture_output=True, text=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        timings.append(result["seconds"])
+        modules = result["modules"]
+    return timings, modules
+
+
+def run_benchmark(runs=15):
+    print(f"\ndeep_lynx cold import, {runs} runs")
+    print("-" * 50)
+    print(f"{'Scenario':^10} | {'Median ms':^10} | {'Best ms':^10} | "
+          f"{'Modules':^8}")
+    print("-" * 50)
+
+    results = []
+    for name, (statement, env) in SCENARIOS.items():
+        timings, modules = measure(statement, env, runs)
+        median = statistics.median(timings) * 1000
+        best = min(timings) * 1000
+        print(f"{name:^10} | {median:^10.1f} | {best:^10.1f} | "
+              f"{modules:^8}")
+        results.append({"scenario": name, "median_ms": median,
+                        "best_ms": best, "modules": modules})
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=15)
+    parser.add_argument("--max-ms", type=float, default=None,
+                        help="fail if the client scenario median is slower")
+    args = parser.parse_args()
+    results = run_benchmark(args.runs)
+    client = next(r for r in results if r["scenario"] == "client")
+    if args.max_ms is not None and client["median_ms"] > args.max_ms:
+        print(f"\nclient import took {client['median_ms']:.1f} ms, "
+              f"over the {args.max_ms:.0f} ms budget")
+        sys.exit(1)
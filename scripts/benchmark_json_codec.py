@@ -0,0 +1,101 @@
+"""Compare the JSON codecs in deep_lynx.codec on realistic Node/Edge traffic.
+
+Usage: PYTHONPATH=. python scripts/benchmark_json_codec.py [--records 10000] [--repeat 5]
+"""
+import argparse
+import json
+import random
+import timeit
+
+from deep_lynx import codec
+
+
+def make_nodes(count):
+    """Bulk create_or_update_nodes body, as built from a pandas frame"""
+    rng = random.Random(0)
+    return [
+        {
+            "container_id": "1",
+            "data_source_id": "12",
+            "metatype_id": str(100 + i % 25),
+            "original_data_id": f"EQ{i:07d}",
+            "properties": {
+                "equipment_name": f"Machine {i}",
+                "process_type": rng.choice(["Machining", "Additive", "QC"]),
+                "duration": rng.randint(10, 500),
+                "temperature": rng.uniform(15.0, 95.0),
+                "active": rng.random() > 0.2,
+                "tags": ["line-a", "shift-2"],
+            },
+        }
+        for i in range(count)
+    ]
+
+
+def make_edges(count):
+    """Bulk create_or_update_edges body"""
+    return [
+        {
+            "container_id": "1",
+            "data_source_id": "12",
+            "relationship_pair_id": "7",
+            "origin_original_id": f"EQ{i:07d}",
+            "destination_original_id": f"EQ{(i + 1) % count:07d}",
+            "origin_metatype_id": str(100 + i % 25),
+            "destination_metatype_id": str(100 + (i + 1) % 25),
+            "properties": {"weight": i % 13, "label": "feeds"},
+        }
+        for i in range(count)
+    ]
+
+
+def make_list_nodes_response(count):
+    """Raw list_nodes response body, as returned by the server"""
+    nodes = []
+    for i, node in enumerate(make_nodes(count)):
+        node = dict(node, id=str(i + 1), metatype_name="Equipment",
+                    import_data_id="3", data_staging_id=float(i),
+                    created_at="2024-03-01T12:00:00.000Z",
+                    modified_at="2024-03-01T12:00:00.000Z",
+                    created_by="0", modified_by="0", metadata={})
+        nodes.append(node)
+    return json.dumps({"value": nodes, "isError": False}).encode("utf-8")
+
+
+def best_of(func, repeat):
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1000
+
+
+def run_benchmark(records=10000, repeat=5):
+    """Time encode/decode for every installed codec, in milliseconds"""
+    nodes = make_nodes(records)
+    edges = make_edges(records)
+    response = make_list_nodes_response(records)
+
+    print(f"\nJSON codec benchmark, {records} records, best of {repeat} (ms)")
+    print("-" * 72)
+    print(f"{'Codec':^10} | {'Encode nodes':^13} | {'Encode edges':^13} | "
+          f"{'Decode list_nodes':^18} | {'Body MB':^7}")
+    print("-" * 72)
+
+    results = []
+    for codec_class in codec.available_codecs():
+        c = codec_class()
+        encode_nodes = best_of(lambda: c.dumps(nodes), repeat)
+        encode_edges = best_of(lambda: c.dumps(edges), repeat)
+        decode = best_of(lambda: c.loads(response), repeat)
+        size = len(c.dumps(nodes)) / 1024 / 1024
+        print(f"{c.name:^10} | {encode_nodes:^13.1f} | {encode_edges:^13.1f} | "
+              f"{decode:^18.1f} | {size:^7.2f}")
+        results.append({"codec": c.name, "encode_nodes_ms": encode_nodes,
+                        "encode_edges_ms": encode_edges,
+                        "decode_list_nodes_ms": decode})
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run_benchmark(args.records, args.repeat)
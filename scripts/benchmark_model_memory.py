@@ -0,0 +1,95 @@
+"""Measure memory held by list_nodes results in each response mode.
+
+Decodes a list_nodes response body of --nodes nodes (one million by default)
+as swagger models, compact models and plain dicts, and reports the memory
+retained by the result (tracemalloc) and the decode time.
+
+Usage: PYTHONPATH=. python scripts/benchmark_model_memory.py [--nodes 1000000]
+"""
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+
+from deep_lynx import codec, deserializer
+
+
+def make_list_nodes_response(count):
+    """Raw list_nodes response body, as returned by the server"""
+    nodes = [
+        {
+            "id": str(i + 1),
+            "container_id": "1",
+            "data_source_id": "12",
+            "metatype_id": str(100 + i % 25),
+            "metatype_name": "Equipment",
+            "metatype": {"id": str(100 + i % 25), "name": "Equipment",
+                         "description": "Production equipment"},
+            "original_data_id": f"EQ{i:07d}",
+            "import_data_id": "3",
+            "data_staging_id": float(i),
+            "properties": {"equipment_name": f"Machine {i}",
+                           "duration": i % 500},
+            "metadata": {},
+            "created_at": "2024-03-01T12:00:00.000Z",
+            "modified_at": "2024-03-01T12:00:00.000Z",
+            "created_by": "0",
+            "modified_by": "0",
+        }
+        for i in range(count)
+    ]
+    return json.dumps({"value": nodes, "isError": False}).encode("utf-8")
+
+
+def measure(body, mode):
+    """Bytes retained by the decoded result and seconds spent decoding"""
+    json_codec = codec.get_default_codec()
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    data = json_codec.loads(body)
+    if mode == "dict":
+        result = data
+    else:
+        result = deserializer.deserialize(data, "ListNodesResponse",
+                                          compact=mode == "compact")
+        # touch the nodes, as callers iterating over the result would
+        len(result.value)
+    elapsed = time.perf_counter() - started
+    del data
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return retained, elapsed
+
+
+def run_benchmark(nodes=1000000):
+    body = make_list_nodes_response(nodes)
+    # compile the plans outside of the measurements
+    for compact in (False, True):
+        deserializer.get_decoder("ListNodesResponse", compact)
+
+    print(f"\nlist_nodes memory, {nodes} nodes, "
+          f"{len(body) / 1024 / 1024:.0f} MB body")
+    print("-" * 56)
+    print(f"{'Mode':^10} | {'Retained MB':^12} | {'Bytes/node':^10} | "
+          f"{'Decode s':^10}")
+    print("-" * 56)
+
+    results = []
+    for mode in ("model", "compact", "dict"):
+        retained, elapsed = measure(body, mode)
+        print(f"{mode:^10} | {retained / 1024 / 1024:^12.1f} | "
+              f"{retained / nodes:^10.0f} | {elapsed:^10.2f}")
+        results.append({"mode": mode, "retained_bytes": retained,
+                        "decode_seconds": elapsed})
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=1000000)
+    args = parser.parse_args()
+    run_benchmark(args.nodes)
@@ -0,0 +1,108 @@
+"""Compare offset and keyset pagination of nodes against a local mock server.
+
+Starts an HTTP server that serves the nodes of one metatype through
+list_nodes (by offset) and through the GraphQL data query (by id), then
+reads every node with GraphApi.iter_nodes using both strategies. The
+server models the database cost of a page: an offset page scans the rows
+before it, a keyset page seeks to its first id, each at --row-cost
+microseconds per row touched.
+
+Usage: PYTHONPATH=. python scripts/benchmark_pagination.py [--nodes 200000] [--page-size 1000] [--row-cost 0.2]
+"""
+import argparse
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import deep_lynx
+from deep_lynx.api.graph_api import GraphApi
+
+
+def make_handler(total, row_cost):
+    nodes = [{"id": str(i + 1), "metatype_id": "m1",
+              "metatype_name": "Asset", "data_source_id": "d1",
+              "properties": {"serial": "S%d" % i}} for i in range(total)]
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def reply(self, value):
+            body = json.dumps(value).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path.endswith("/metatypes/m1"):
+                return self.reply({"value": {"id": "m1", "name": "Asset"}})
+            if url.path.endswith("/keys"):
+                return self.reply({"value": [{"property_name": "serial"}]})
+            query = parse_qs(url.query)
+            offset = int(query["offset"][0])
+            limit = int(query["limit"][0])
+            # the rows before the offset are read and skipped
+            time.sleep((offset + limit) * row_cost)
+            self.reply({"value": nodes[offset:offset + limit]})
+
+        def do_POST(self):
+            length = int(self.headers["Content-Length"])
+            query = json.loads(self.rfile.read(length))["query"]
+            limit = int(re.search(r"limit: (\d+)", query).group(1))
+            after = re.search(r'value: "(\d+)"', query)
+            # ids are positions here; an index finds the first one
+            start = int(after.group(1)) if after else 0
+            time.sleep(limit * row_cost)
+            self.reply({"data": {"metatypes": {"Asset": [
+                {"_record": {"id": node["id"], "metatype_id": "m1",
+                             "metatype_name": "Asset",
+                             "data_source_id": "d1"},
+                 "serial": node["properties"]["serial"]}
+                for node in nodes[start:start + limit]]}}})
+
+    return Handler
+
+
+def run_benchmark(total=200000, page_size=1000, row_cost=0.2):
+    server = ThreadingHTTPServer(("127.0.0.1", 0),
+                                 make_handler(total, row_cost / 1e6))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    configuration = deep_lynx.Configuration()
+    configuration.host = "http://127.0.0.1:%d" % server.server_port
+    configuration.response_mode = "dict"
+    api = GraphApi(deep_lynx.ApiClient(configuration))
+
+    print(f"\nReading {total} nodes, {page_size} per page")
+    print("-" * 40)
+    print(f"{'Strategy':^12} | {'seconds':^10} | {'nodes/s':^10}")
+    print("-" * 40)
+    results = []
+    try:
+        for strategy in ("offset", "keyset"):
+            start = time.perf_counter()
+            count = sum(1 for _ in api.iter_nodes(
+                "c1", metatype_id="m1", page_size=page_size,
+                strategy=strategy))
+            seconds = time.perf_counter() - start
+            assert count == total, (strategy, count)
+            print(f"{strategy:^12} | {seconds:^10.2f} | "
+                  f"{count / seconds:^10.0f}")
+            results.append({"strategy": strategy, "seconds": seconds})
+    finally:
+        server.shutdown()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=200000)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--row-cost", type=float, default=0.2)
+    args = parser.parse_args()
+    run_benchmark(args.nodes, args.page_size, args.row_cost)
@@ -0,0 +1,80 @@
+"""Compare ApiClient.sanitize_for_serialization before and after compiled encoders.
+
+Times the original recursive walk against deep_lynx.serializer on a bulk
+create_or_update_nodes body, both as plain records (as built from a pandas
+frame) and as CreateOrUpdateNodesRequest models.
+
+Usage: PYTHONPATH=. python scripts/benchmark_request_serializer.py [--records 100000] [--repeat 5]
+"""
+import argparse
+import datetime
+import timeit
+
+import six
+
+from deep_lynx import CreateOrUpdateNodesRequest, deserializer, serializer
+
+try:
+    from benchmark_json_codec import make_nodes
+except ImportError:
+    from scripts.benchmark_json_codec import make_nodes
+
+
+def legacy_sanitize(obj):
+    """sanitize_for_serialization as it was before deep_lynx.serializer"""
+    if obj is None:
+        return None
+    elif isinstance(obj, deserializer.PRIMITIVE_TYPES):
+        return obj
+    elif isinstance(obj, list):
+        return [legacy_sanitize(sub_obj) for sub_obj in obj]
+    elif isinstance(obj, tuple):
+        return tuple(legacy_sanitize(sub_obj) for sub_obj in obj)
+    elif isinstance(obj, (datetime.datetime, datetime.date)):
+        return obj.isoformat()
+
+    if isinstance(obj, dict):
+        obj_dict = obj
+    elif not hasattr(obj, 'swagger_types'):
+        return obj
+    else:
+        obj_dict = {obj.attribute_map[attr]: getattr(obj, attr)
+                    for attr, _ in six.iteritems(obj.swagger_types)
+                    if getattr(obj, attr) is not None}
+
+    return {key: legacy_sanitize(val)
+            for key, val in six.iteritems(obj_dict)}
+
+
+def best_of(func, repeat):
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1000
+
+
+def run_benchmark(records=100000, repeat=5):
+    """Time both serializers on each body, in milliseconds"""
+    plain = make_nodes(records)
+    models = [CreateOrUpdateNodesRequest(**node) for node in plain]
+
+    print(f"\nRequest serialization, {records} nodes, best of {repeat} (ms)")
+    print("-" * 52)
+    print(f"{'Body':^10} | {'Legacy':^10} | {'Compiled':^10} | {'Speedup':^9}")
+    print("-" * 52)
+
+    results = []
+    for name, body in (("records", plain), ("models", models)):
+        assert serializer.serialize(body) == legacy_sanitize(body)
+        legacy = best_of(lambda: legacy_sanitize(body), repeat)
+        compiled = best_of(lambda: serializer.serialize(body), repeat)
+        print(f"{name:^10} | {legacy:^10.1f} | {compiled:^10.1f} | "
+              f"{legacy / compiled:^8.1f}x")
+        results.append({"body": name, "legacy_ms": legacy,
+                        "compiled_ms": compiled})
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run_benchmark(args.records, args.repeat)
@@ -21,7 +21,7 @@ VERSION = "0.1.7"
 # prerequisite: setuptools
 # http://pypi.python.org/pypi/setuptools
 
-REQUIRES = ["urllib3 >= 1.15", "six >= 1.10", "certifi", "python-dateutil","pandas", "deep-lynx", "pytest", "pytest-asyncio"]
+REQUIRES = ["urllib3 >= 1.26", "six >= 1.10", "certifi", "python-dateutil","pandas", "deep-lynx", "pytest", "pytest-asyncio"]
 
 with open("README.md", 'r') as f:
     long_description = f.read()
@@ -36,6 +36,7 @@ setup(
     keywords=["Swagger", "Deep Lynx"],
     license="MIT",
     install_requires=REQUIRES,
+    extras_require={"async": ["aiohttp >= 3.7"], "fast": ["orjson"]},
     packages=find_packages(),
     include_package_data=True,
     long_description_content_type='text/markdown',
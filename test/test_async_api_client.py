@@ -0,0 +1,166 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import asyncio
+import io
+import json
+import unittest
+
+from aiohttp import web
+
+import deep_lynx
+from deep_lynx import cache
+from deep_lynx.api.data_sources_api import DataSourcesApi
+from deep_lynx.api.data_type_mappings_api import DataTypeMappingsApi
+from deep_lynx.api.graph_api import GraphApi
+from deep_lynx.async_api_client import AsyncApiClient
+from deep_lynx.rest import ApiException
+
+
+class TestAsyncApiClient(unittest.IsolatedAsyncioTestCase):
+    """AsyncApiClient unit tests against a local aiohttp server"""
+
+    async def asyncSetUp(self):
+        self.requests = []
+        self.uploads = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+        async def list_nodes(request):
+            self.requests.append(request)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.05)
+            self.in_flight -= 1
+            return web.json_response({
+                'isError': False,
+                'value': [{'id': '1', 'container_id':
+                           request.match_info['container_id'],
+                           'properties': {'name': 'pump'}}],
+            })
+
+        async def create_manual_import(request):
+            self.requests.append(request)
+            return web.json_response({'value': await request.json()})
+
+        async def upload_file(request):
+            form = await request.post()
+            field = form['file']
+            self.uploads.append((field.filename, field.content_type,
+                                 field.file.read()))
+            return web.json_response({'isError': False, 'value': []})
+
+        async def list_mappings(request):
+            self.requests.append(request)
+            if request.headers.get('If-None-Match') == '"v1"':
+                return web.Response(status=304, headers={'ETag': '"v1"'})
+            return web.json_response({'isError': False, 'value': []},
+                                     headers={'ETag': '"v1"'})
+
+        async def missing(request):
+            return web.json_response({'error': 'nope'}, status=404)
+
+        app = web.Application()
+        app.router.add_get('/containers/{container_id}/graphs/nodes',
+                           list_nodes)
+        app.router.add_post(
+            '/containers/{container_id}/import/datasources/'
+            '{data_source_id}/imports', create_manual_import)
+        app.router.add_post(
+            '/containers/{container_id}/import/datasources/'
+            '{data_source_id}/files', upload_file)
+        app.router.add_get('/containers/{container_id}/graphs/nodes/{node_id}',
+                           missing)
+        app.router.add_get(
+            '/containers/{container_id}/import/datasources/'
+            '{data_source_id}/mappings', list_mappings)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, '127.0.0.1', 0)
+        await site.start()
+        port = self.runner.addresses[0][1]
+
+        configuration = deep_lynx.Configuration()
+        configuration.host = 'http://127.0.0.1:%d' % port
+        self.client = AsyncApiClient(configuration)
+
+    async def asyncTearDown(self):
+        await self.client.close()
+        await self.runner.cleanup()
+
+    async def test_generated_method_is_awaitable(self):
+        response = await GraphApi(self.client).list_nodes('c1', limit=10)
+        self.assertIsInstance(response, deep_lynx.ListNodesResponse)
+        self.assertEqual(response.value[0].container_id, 'c1')
+        self.assertEqual(response.value[0].properties, {'name': 'pump'})
+        self.assertEqual(self.requests[0].query_string, 'limit=10')
+
+    async def test_initialised_like_api_client(self):
+        client = AsyncApiClient(self.client.configuration, 'X-Trace', 't1',
+                                cookie='c=1')
+        self.addAsyncCleanup(client.close)
+        self.assertIsInstance(client.rest_client,
+                              deep_lynx.async_rest.RESTClientObject)
+        expected = deep_lynx.ApiClient(self.client.configuration, 'X-Trace',
+                                       't1', cookie='c=1')
+        self.assertEqual(client.default_headers, expected.default_headers)
+        self.assertEqual(client.cookie, 'c=1')
+        self.assertEqual(client.hooks, [])
+        self.assertIsNone(client.last_response)
+
+    async def test_with_http_info_returns_status_and_headers(self):
+        data, status, headers = await GraphApi(
+            self.client).list_nodes_with_http_info('c1')
+        self.assertEqual(status, 200)
+        self.assertIn('application/json', headers['Content-Type'])
+
+    async def test_json_body(self):
+        body = {'nodes': [{'id': 1}]}
+        collector = deep_lynx.MetricsCollector()
+        self.client.add_hook(collector)
+        response = await DataSourcesApi(self.client).create_manual_import(
+            'c1', 'ds1', body=body)
+        self.assertEqual(response, {'value': body})
+        recorded, = collector.to_dict().values()
+        self.assertEqual(recorded['statuses'], {'200': 1})
+        self.assertEqual(recorded['request_bytes'],
+                         len(json.dumps(body, separators=(',', ':'))))
+
+    async def test_multipart_upload_streams_file(self):
+        content = b'a,b\n' + b'1,2\n' * 50000
+        calls = []
+        upload = deep_lynx.UploadFile(
+            io.BytesIO(content), filename='scan.csv',
+            progress=lambda *args: calls.append(args))
+        await DataSourcesApi(self.client).upload_file('c1', 'ds1',
+                                                      file=upload)
+        self.assertEqual(self.uploads[0], ('scan.csv', 'text/csv', content))
+        self.assertEqual(calls[-1], (len(content), len(content)))
+
+    async def test_requests_run_concurrently(self):
+        api = GraphApi(self.client)
+        results = await asyncio.gather(
+            *[api.list_nodes('c%d' % i) for i in range(10)])
+        self.assertEqual(len(results), 10)
+        self.assertGreater(self.max_in_flight, 1)
+
+    async def test_error_status_raises_api_exception(self):
+        with self.assertRaises(ApiException) as ctx:
+            await GraphApi(self.client).retrieve_node('c1', 'n1')
+        self.assertEqual(ctx.exception.status, 404)
+        self.assertIn(b'nope', ctx.exception.body)
+
+    async def test_expired_responses_are_revalidated(self):
+        self.client.configuration.response_cache = deep_lynx.ResponseCache(
+            cache.MAPPING_OPERATIONS, ttl=0)
+        api = DataTypeMappingsApi(self.client)
+        first = await api.list_data_type_mappings('c1', 'd1')
+        second = await api.list_data_type_mappings('c1', 'd1')
+        self.assertEqual(second, first)
+        self.assertEqual(self.requests[1].headers['If-None-Match'], '"v1"')
+        self.assertIs(await api.list_data_type_mappings('c1', 'd1'), second)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import base64
+import json
+import os
+import shutil
+import stat
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import deep_lynx
+from deep_lynx import auth
+from deep_lynx.api.graph_api import GraphApi
+
+from test.test_metrics import FakeResponse
+
+
+def jwt(exp):
+    payload = base64.urlsafe_b64encode(
+        json.dumps({'exp': exp}).encode('utf-8')).decode('ascii').rstrip('=')
+    return 'e30.' + payload + '.sig'
+
+
+class TestTokenManager(unittest.TestCase):
+    """Bearer token fetching, sharing and refreshing"""
+
+    def setUp(self):
+        self.fetched = []
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def fetch(self, configuration):
+        self.fetched.append(configuration.host)
+        return 'token-%d' % len(self.fetched)
+
+    def client(self, manager):
+        configuration = deep_lynx.Configuration()
+        configuration.refresh_api_key_hook = manager
+        client = deep_lynx.ApiClient(configuration)
+        sent = []
+
+        def request(method, url, headers=None, **kwargs):
+            sent.append(headers.get('Authorization'))
+            return FakeResponse()
+        client.request = request
+        return GraphApi(client), sent
+
+    def test_token_is_sent_and_shared_between_clients(self):
+        manager = auth.TokenManager('key', 'secret', background=False,
+                                    fetch=self.fetch)
+        first, first_sent = self.client(manager)
+        second, second_sent = self.client(manager)
+        first.list_nodes('c1')
+        second.list_nodes('c1')
+        first.list_nodes('c1')
+        self.assertEqual(len(self.fetched), 1)
+        self.assertEqual(first_sent + second_sent, ['Bearer token-1'] * 3)
+
+    def test_shared_managers(self):
+        self.assertIs(auth.TokenManager.shared('key-a', 'secret'),
+                      auth.TokenManager.shared('key-a', 'secret'))
+        self.assertIsNot(auth.TokenManager.shared('key-a', 'secret'),
+                         auth.TokenManager.shared('key-a', 'secret', '2h'))
+
+    def test_refreshes_before_expiry(self):
+        manager = auth.TokenManager('key', 'secret', expiry='1h',
+                                    refresh_margin=300, background=False,
+                                    fetch=self.fetch)
+        configuration = deep_lynx.Configuration()
+        self.assertEqual(manager.token(configuration), 'token-1')
+        manager._token.expires = time.time() + 299
+        self.assertEqual(manager.token(), 'token-2')
+        self.assertEqual(manager.token(), 'token-2')
+
+    def test_background_refresh(self):
+        manager = auth.TokenManager('key', 'secret', expiry='0.2',
+                                    fetch=self.fetch)
+        self.addCleanup(manager.close)
+        self.assertEqual(manager.refresh_margin, 0.1)
+        manager.token(deep_lynx.Configuration())
+        time.sleep(0.35)
+        self.assertGreaterEqual(len(self.fetched), 3)
+        self.assertEqual(manager.token(), 'token-%d' % len(self.fetched))
+
+    def test_jwt_expiry(self):
+        expires = int(time.time()) + 60
+        self.assertEqual(auth.jwt_expiry(jwt(expires)), expires)
+        self.assertIsNone(auth.jwt_expiry('opaque'))
+        self.assertEqual(auth.parse_expiry('1h'), 3600)
+        self.assertEqual(auth.parse_expiry('30m'), 1800)
+        self.assertIsNone(auth.parse_expiry('never'))
+
+        manager = auth.TokenManager('key', 'secret', background=False,
+                                    fetch=lambda _: jwt(expires))
+        manager.token(deep_lynx.Configuration())
+        self.assertEqual(manager._token.expires, expires)
+
+    def test_file_cache_is_shared_between_managers(self):
+        path = os.path.join(self.directory, 'tokens.json')
+        for _ in range(2):
+            # as if in another process
+            manager = auth.TokenManager('key', 'secret', background=False,
+                                        cache_path=path, fetch=self.fetch)
+            self.assertEqual(manager.token(deep_lynx.Configuration()),
+                             'token-1')
+        self.assertEqual(len(self.fetched), 1)
+        self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o600)
+
+        other = auth.TokenManager('other', 'secret', background=False,
+                                  cache_path=path, fetch=self.fetch)
+        self.assertEqual(other.token(deep_lynx.Configuration()), 'token-2')
+
+    def test_token_request_is_not_authenticated(self):
+        manager = auth.TokenManager('key', 'secret', background=False)
+        sent = []
+
+        def request(client, method, url, headers=None, **kwargs):
+            sent.append((url, dict(headers)))
+            return FakeResponse(data=b'"fresh"')
+        configuration = deep_lynx.Configuration()
+        configuration.host = 'http://deep-lynx'
+        with mock.patch.object(deep_lynx.ApiClient, 'request', request):
+            self.assertEqual(manager.token(configuration), 'fresh')
+        url, headers = sent[0]
+        self.assertEqual(url, 'http://deep-lynx/oauth/token')
+        self.assertEqual(headers['x-api-key'], 'key')
+        self.assertEqual(headers['x-api-expiry'], '1h')
+        self.assertNotIn('Authorization', headers)
+
+
+if __name__ == '__main__':
+    unittest.main()
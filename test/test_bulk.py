@@ -0,0 +1,162 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import json
+import threading
+import time
+import unittest
+
+import deep_lynx
+from deep_lynx import bulk
+from deep_lynx.api.graph_api import GraphApi
+from deep_lynx.models.create_or_update_nodes_request import (
+    CreateOrUpdateNodesRequest)
+from deep_lynx.rest import ApiException
+
+from test.test_metrics import FakeResponse
+
+
+class Server(object):
+    """Upserts nodes, rejecting requests with a node marked bad"""
+
+    def __init__(self, status=400, delay=0.0):
+        self.status = status
+        self.delay = delay
+        self.bodies = []
+        self.in_flight = 0
+        self.most_in_flight = 0
+        self._lock = threading.Lock()
+
+    def request(self, method, url, body=None, **kwargs):
+        with self._lock:
+            self.bodies.append(body)
+            self.in_flight += 1
+            self.most_in_flight = max(self.most_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            if any((node.get('properties') or {}).get('bad')
+                   for node in body):
+                raise ApiException(status=self.status, reason='Bad Request')
+            value = [dict(node, id='n' + node['original_data_id'])
+                     for node in body]
+            return FakeResponse(data=json.dumps(
+                {'value': value}).encode('utf-8'))
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def nodes(count, bad=(), size=0):
+    for i in range(count):
+        yield {'original_data_id': str(i), 'metatype_id': 'm1',
+               'data_source_id': 'd1',
+               'properties': {'bad': i in bad, 'padding': 'x' * size}}
+
+
+class TestBulkUpsertNodes(unittest.TestCase):
+    """Chunked, concurrent node upserts"""
+
+    def api(self, server):
+        client = deep_lynx.ApiClient(deep_lynx.Configuration())
+        client.request = server.request
+        return GraphApi(client)
+
+    def test_upserts_in_chunks(self):
+        server = Server(delay=0.01)
+        result = self.api(server).bulk_upsert_nodes(
+            'c1', nodes(95), chunk_records=10, workers=3)
+        self.assertTrue(result.ok)
+        self.assertEqual(len(result), 95)
+        self.assertEqual(result.ids, ['n%d' % i for i in range(95)])
+        self.assertEqual(sorted(len(body) for body in server.bodies),
+                         [5] + [10] * 9)
+        self.assertLessEqual(server.most_in_flight, 3)
+
+    def test_bad_records_are_isolated(self):
+        server = Server()
+        result = self.api(server).bulk_upsert_nodes(
+            'c1', nodes(40, bad=(3, 17, 18)), chunk_records=16)
+        self.assertEqual(result.failed(), [3, 17, 18])
+        table = result.table()
+        self.assertEqual(table[2], (2, 'n2', None))
+        index, node_id, error = table[17]
+        self.assertIsNone(node_id)
+        self.assertIn('(400) Bad Request', error)
+        self.assertEqual(len([node_id for _, node_id, _ in table
+                              if node_id]), 37)
+        # each bad node costs about log2(chunk_records) requests
+        self.assertLess(len(server.bodies), 3 + 3 * 2 * 4)
+
+    def test_chunks_by_serialized_size(self):
+        server = Server()
+        records = list(nodes(20, size=200))
+        records[7]['properties']['padding'] = 'x' * 5000
+        result = self.api(server).bulk_upsert_nodes(
+            'c1', records, chunk_bytes=1200)
+        self.assertTrue(result.ok)
+        for body in server.bodies:
+            if len(body) > 1:
+                self.assertLessEqual(len(json.dumps(body)), 1200)
+        self.assertIn([records[7]], server.bodies)
+
+    def test_errors_of_the_whole_chunk_are_not_split(self):
+        server = Server(status=401)
+        result = self.api(server).bulk_upsert_nodes(
+            'c1', nodes(20, bad=(4,)), chunk_records=10)
+        self.assertEqual(result.failed(), list(range(10)))
+        self.assertEqual(len(server.bodies), 2)
+
+    def test_overloaded_server_is_not_split(self):
+        server = Server(status=503)
+        result = self.api(server).bulk_upsert_nodes(
+            'c1', nodes(40, bad=range(40)), chunk_records=10)
+        self.assertEqual(result.failed(), list(range(40)))
+        # one request per chunk
+        self.assertEqual(len(server.bodies), 4)
+
+    def test_ids_are_matched_by_key(self):
+        def request(method, url, body=None, **kwargs):
+            # reversed, with the records of the same key merged
+            value = dict((node['original_data_id'],
+                          dict(node, id='n' + node['original_data_id']))
+                         for node in body)
+            return FakeResponse(data=json.dumps(
+                {'value': list(reversed(list(value.values())))}
+            ).encode('utf-8'))
+        api = self.api(Server())
+        api.api_client.request = request
+        records = list(nodes(6)) + list(nodes(2))
+        result = api.bulk_upsert_nodes('c1', records)
+        self.assertTrue(result.ok)
+        self.assertEqual(result.ids, ['n0', 'n1', 'n2', 'n3', 'n4', 'n5',
+                                      'n0', 'n1'])
+
+    def test_short_responses_fail_records_matched_by_position(self):
+        def request(method, url, body=None, **kwargs):
+            value = [{'id': 'e%d' % i} for i in range(len(body) - 1)]
+            return FakeResponse(data=json.dumps(
+                {'value': value}).encode('utf-8'))
+        api = self.api(Server())
+        api.api_client.request = request
+        result = api.bulk_upsert_edges('c1', [
+            {'origin_id': 'n1', 'destination_id': 'n2'}] * 3)
+        self.assertEqual(result.failed(), [0, 1, 2])
+        self.assertIn('2 objects returned for 3 records', result.errors[0])
+
+    def test_models_and_invalid_arguments(self):
+        server = Server()
+        result = self.api(server).bulk_upsert_nodes('c1', [
+            CreateOrUpdateNodesRequest(
+                id='7', container_id='c1', original_data_id='7',
+                data_source_id='d1', metatype_id='m1', properties={})])
+        self.assertEqual(result.ids, ['n7'])
+        self.assertEqual(server.bodies[0][0]['original_data_id'], '7')
+        with self.assertRaises(ValueError):
+            self.api(server).bulk_upsert_nodes('c1', [], workers=0)
+        self.assertEqual(len(self.api(server).bulk_upsert_nodes('c1', [])), 0)
+        self.assertIn('(401)', bulk.describe(ApiException(status=401)))
+
+
+if __name__ == '__main__':
+    unittest.main()
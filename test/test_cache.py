@@ -0,0 +1,219 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import time
+import unittest
+
+import deep_lynx
+from deep_lynx import cache
+from deep_lynx.api.containers_api import ContainersApi
+from deep_lynx.api.data_type_mappings_api import DataTypeMappingsApi
+from deep_lynx.api.metatypes_api import MetatypesApi
+from deep_lynx.models.update_metatype_request import UpdateMetatypeRequest
+from deep_lynx.rest import ApiException
+
+from test.test_metrics import FakeResponse
+
+METATYPES = (b'{"value": [{"id": "1", "name": "Pump", "container_id": "c1"}],'
+             b' "isError": false}')
+MAPPINGS = b'{"value": [{"id": "m1", "active": true}], "isError": false}'
+
+
+class ValidatedResponse(FakeResponse):
+
+    def __init__(self, status=200, data=MAPPINGS, headers=None):
+        super(ValidatedResponse, self).__init__(status, data)
+        self.headers = headers or {}
+
+    def getheaders(self):
+        return self.headers
+
+    def getheader(self, name, default=None):
+        return self.headers.get(name, default)
+
+
+class TestResponseCache(unittest.TestCase):
+    """TTL and LRU bounded cache of ontology reads"""
+
+    def setUp(self):
+        self.configuration = deep_lynx.Configuration()
+        self.configuration.response_cache = deep_lynx.ResponseCache(
+            cache.ONTOLOGY_OPERATIONS)
+        self.configuration.response_mode = 'dict'
+        self.client = deep_lynx.ApiClient(self.configuration)
+        self.sent = []
+
+        def request(method, url, *args, **kwargs):
+            self.sent.append((method, url))
+            return FakeResponse(data=METATYPES)
+        self.client.request = request
+        self.api = MetatypesApi(self.client)
+
+    def test_repeated_reads_are_served_from_memory(self):
+        first = self.api.list_metatypes('c1')
+        second = self.api.list_metatypes('c1')
+        self.assertEqual(len(self.sent), 1)
+        self.assertEqual(second['value'][0]['name'], 'Pump')
+        # every hit is decoded again
+        first['value'][0]['name'] = 'changed'
+        self.assertEqual(self.api.list_metatypes('c1')['value'][0]['name'],
+                         'Pump')
+        self.assertEqual(self.configuration.response_cache.stats()['hits'], 2)
+
+    def test_key_includes_query_and_credentials(self):
+        self.api.list_metatypes('c1')
+        self.api.list_metatypes('c1', name='Pump')
+        self.client.set_default_header('Authorization', 'Bearer other')
+        self.api.list_metatypes('c1')
+        self.api.list_metatypes('c2')
+        self.assertEqual(len(self.sent), 4)
+
+    def test_only_selected_operations(self):
+        self.configuration.response_cache = deep_lynx.ResponseCache(
+            ['GET /containers/{container_id}/metatypes'])
+        self.api.retrieve_metaype('c1', 'm1')
+        self.api.retrieve_metaype('c1', 'm1')
+        self.assertEqual(len(self.sent), 2)
+
+    def test_writes_invalidate_their_container(self):
+        self.api.list_metatypes('c1')
+        self.api.list_metatypes('c2')
+        self.api.update_metatype(
+            UpdateMetatypeRequest(name='Valve', description='A valve'), 'c1',
+            'm1')
+        self.api.list_metatypes('c1')
+        self.api.list_metatypes('c2')
+        self.assertEqual([m for m, _ in self.sent],
+                         ['GET', 'GET', 'PUT', 'GET'])
+        self.assertEqual(
+            self.configuration.response_cache.stats()['invalidations'], 1)
+
+    def test_container_writes_invalidate_the_listing(self):
+        containers = ContainersApi(self.client)
+        containers.list_containers()
+        containers.archive_container('c1')
+        containers.list_containers()
+        self.assertEqual(len(self.sent), 3)
+
+    def test_ttl(self):
+        self.configuration.response_cache.ttl = 0.01
+        self.api.list_metatypes('c1')
+        time.sleep(0.02)
+        self.api.list_metatypes('c1')
+        self.assertEqual(len(self.sent), 2)
+
+    def test_lru(self):
+        self.configuration.response_cache.maxsize = 2
+        for container in ('c1', 'c2', 'c1', 'c3', 'c1', 'c2'):
+            self.api.list_metatypes(container)
+        # c2 was the least recently used when c3 came in
+        self.assertEqual([url.split('/')[-2] for _, url in self.sent],
+                         ['c1', 'c2', 'c3', 'c2'])
+        self.assertEqual(
+            self.configuration.response_cache.stats()['evictions'], 2)
+
+    def test_reads_racing_a_write_are_not_stored(self):
+        responses = self.configuration.response_cache
+        url = 'http://h/containers/c1/metatypes'
+        ticket = responses.ticket('GET /containers/{container_id}/metatypes',
+                                  url)
+        responses.invalidate('http://h/containers/c1/metatypes/m1')
+        responses.put(ticket, FakeResponse())
+        self.assertIsNone(responses.get(ticket))
+
+
+class TestRevalidation(unittest.TestCase):
+    """Conditional GETs of expired responses"""
+
+    def setUp(self):
+        self.configuration = deep_lynx.Configuration()
+        self.configuration.response_cache = deep_lynx.ResponseCache(
+            cache.MAPPING_OPERATIONS, ttl=0)
+        self.configuration.response_mode = 'dict'
+        self.client = deep_lynx.ApiClient(self.configuration)
+        self.sent = []
+        self.responses = []
+
+        def request(method, url, headers=None, **kwargs):
+            self.sent.append(headers)
+            response = self.responses.pop(0)
+            if response.status >= 300:
+                raise ApiException(http_resp=response)
+            return response
+        self.client.request = request
+        self.api = DataTypeMappingsApi(self.client)
+
+    def test_not_modified_reuses_the_decoded_value(self):
+        self.responses = [
+            ValidatedResponse(headers={'ETag': '"v1"'}),
+            ValidatedResponse(304, b'', {'ETag': '"v1"'}),
+            ValidatedResponse(304, b'', {'ETag': '"v1"'}),
+        ]
+        self.api.list_data_type_mappings('c1', 'd1')
+        second = self.api.list_data_type_mappings('c1', 'd1')
+        third = self.api.list_data_type_mappings('c1', 'd1')
+        self.assertNotIn('If-None-Match', self.sent[0])
+        self.assertEqual(self.sent[1]['If-None-Match'], '"v1"')
+        self.assertEqual(second['value'][0]['id'], 'm1')
+        # decoded once, then shared
+        self.assertIs(second, third)
+        self.assertEqual(
+            self.configuration.response_cache.stats()['revalidations'], 2)
+
+    def test_if_modified_since(self):
+        modified = 'Wed, 21 Oct 2026 07:28:00 GMT'
+        self.responses = [
+            ValidatedResponse(headers={'Last-Modified': modified}),
+            ValidatedResponse(304, b''),
+        ]
+        self.api.list_transformations('c1', 'd1', 'm1')
+        data, status, _ = self.api.list_transformations_with_http_info(
+            'c1', 'd1', 'm1')
+        self.assertEqual(self.sent[1]['If-Modified-Since'], modified)
+        self.assertNotIn('If-None-Match', self.sent[1])
+        self.assertEqual(status, 200)
+        self.assertEqual(data['value'][0]['id'], 'm1')
+
+    def test_changed_response_replaces_the_entry(self):
+        changed = b'{"value": [], "isError": false}'
+        self.responses = [
+            ValidatedResponse(headers={'ETag': '"v1"'}),
+            ValidatedResponse(data=changed, headers={'ETag': '"v2"'}),
+            ValidatedResponse(304, b''),
+        ]
+        self.api.list_data_type_mappings('c1', 'd1')
+        self.assertEqual(self.api.list_data_type_mappings('c1', 'd1'),
+                         {'value': [], 'isError': False})
+        self.assertEqual(self.api.list_data_type_mappings('c1', 'd1'),
+                         {'value': [], 'isError': False})
+        self.assertEqual(self.sent[2]['If-None-Match'], '"v2"')
+
+    def test_unchanged_hash_without_validators(self):
+        self.responses = [ValidatedResponse() for _ in range(3)]
+        self.api.list_data_type_mappings('c1', 'd1')
+        second = self.api.list_data_type_mappings('c1', 'd1')
+        third = self.api.list_data_type_mappings('c1', 'd1')
+        self.assertEqual(self.sent[1], self.sent[0])
+        self.assertIs(second, third)
+
+    def test_not_modified_without_a_cached_response_is_an_error(self):
+        self.configuration.response_cache = None
+        self.responses = [ValidatedResponse(304, b'')]
+        with self.assertRaises(ApiException):
+            self.api.list_data_type_mappings('c1', 'd1')
+
+    def test_revalidation_off(self):
+        self.configuration.response_cache = deep_lynx.ResponseCache(
+            cache.MAPPING_OPERATIONS, ttl=0, revalidate=False)
+        self.responses = [ValidatedResponse(headers={'ETag': '"v1"'}),
+                          ValidatedResponse()]
+        self.api.list_data_type_mappings('c1', 'd1')
+        self.api.list_data_type_mappings('c1', 'd1')
+        self.assertNotIn('If-None-Match', self.sent[1])
+        self.assertEqual(
+            self.configuration.response_cache.stats()['revalidations'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
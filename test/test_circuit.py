@@ -0,0 +1,197 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import threading
+import time
+import unittest
+from unittest import mock
+
+import deep_lynx
+from deep_lynx import circuit
+from deep_lynx.api.graph_api import GraphApi
+from deep_lynx.rest import ApiException
+
+from test.test_metrics import OPERATION, FakeResponse
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Closed, open and half-open circuits"""
+
+    def test_opens_after_threshold(self):
+        breaker = circuit.CircuitBreaker('a', failure_threshold=2,
+                                         recovery_timeout=60)
+        self.assertFalse(breaker.failure(breaker.before()))
+        self.assertTrue(breaker.failure(breaker.before()))
+        self.assertEqual(breaker.state, circuit.OPEN)
+        with self.assertRaises(circuit.CircuitOpenError) as ctx:
+            breaker.before()
+        self.assertGreater(ctx.exception.retry_in, 59)
+
+    def test_successes_reset_the_count(self):
+        breaker = circuit.CircuitBreaker('a', failure_threshold=2)
+        breaker.failure(breaker.before())
+        breaker.success(breaker.before())
+        breaker.failure(breaker.before())
+        self.assertEqual(breaker.state, circuit.CLOSED)
+
+    def test_requests_in_flight_when_it_opens_are_ignored(self):
+        breaker = circuit.CircuitBreaker('a', failure_threshold=2,
+                                         recovery_timeout=60)
+        permits = [breaker.before() for _ in range(3)]
+        breaker.failure(permits[0])
+        self.assertTrue(breaker.failure(permits[1]))
+        self.assertFalse(breaker.success(permits[2]))
+        self.assertEqual(breaker.state, circuit.OPEN)
+        with self.assertRaises(circuit.CircuitOpenError):
+            breaker.before()
+
+    def test_half_open(self):
+        breaker = circuit.CircuitBreaker('a', failure_threshold=1,
+                                         recovery_timeout=0.01)
+        breaker.failure(breaker.before())
+        time.sleep(0.02)
+        trial = breaker.before()
+        self.assertTrue(trial.changed)
+        self.assertEqual(breaker.state, circuit.HALF_OPEN)
+        # only one trial at a time
+        with self.assertRaises(circuit.CircuitOpenError):
+            breaker.before()
+        self.assertTrue(breaker.failure(trial))
+        self.assertEqual(breaker.state, circuit.OPEN)
+
+        time.sleep(0.02)
+        self.assertTrue(breaker.success(breaker.before()))
+        self.assertEqual(breaker.state, circuit.CLOSED)
+
+    def test_cancelled_trial(self):
+        breaker = circuit.CircuitBreaker('a', failure_threshold=1,
+                                         recovery_timeout=0)
+        breaker.failure(breaker.before())
+        breaker.cancel(breaker.before())
+        breaker.before()
+
+    def test_keys(self):
+        by_host = circuit.CircuitBreakers(key='host')
+        self.assertIs(by_host.get('GET /a', 'http://h:1/a'),
+                      by_host.get('GET /b', 'http://h:1/b'))
+        by_operation = circuit.CircuitBreakers()
+        self.assertIsNot(by_operation.get('GET /a', 'http://h:1/a'),
+                         by_operation.get('GET /b', 'http://h:1/b'))
+        with self.assertRaises(ValueError):
+            circuit.CircuitBreakers(key='path')
+
+    def test_warns_once_without_request_timeout(self):
+        configuration = deep_lynx.Configuration()
+        configuration.circuit_breakers = deep_lynx.CircuitBreakers()
+        client = deep_lynx.ApiClient(configuration)
+        client.request = lambda *args, **kwargs: FakeResponse(data=b'[]')
+        api = GraphApi(client)
+        with self.assertLogs('deep_lynx.circuit', 'WARNING') as logs:
+            api.list_nodes('c1')
+            api.list_nodes('c1')
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn('request_timeout', logs.output[0])
+
+        configuration.circuit_breakers = deep_lynx.CircuitBreakers()
+        configuration.request_timeout = 30
+        with mock.patch.object(circuit.logger, 'warning') as warning:
+            api.list_nodes('c1')
+        warning.assert_not_called()
+
+
+class TestApiClientCircuits(unittest.TestCase):
+
+    def setUp(self):
+        configuration = deep_lynx.Configuration()
+        configuration.circuit_breakers = deep_lynx.CircuitBreakers(
+            failure_threshold=2, recovery_timeout=60)
+        self.client = deep_lynx.ApiClient(configuration)
+        self.sent = 0
+        self.status = 503
+
+        def request(*args, **kwargs):
+            self.sent += 1
+            response = FakeResponse(status=self.status, data=b'down')
+            if self.status >= 400:
+                raise ApiException(http_resp=response)
+            return response
+        self.client.request = request
+        self.collector = deep_lynx.MetricsCollector()
+        self.client.add_hook(self.collector)
+        self.api = GraphApi(self.client)
+
+    def test_fails_fast_while_open(self):
+        for _ in range(2):
+            with self.assertRaises(ApiException):
+                self.api.list_nodes('c1')
+        with self.assertRaises(deep_lynx.CircuitOpenError):
+            self.api.list_nodes('c1')
+        self.assertEqual(self.sent, 2)
+
+        operation = self.collector.to_dict()[OPERATION]
+        self.assertEqual(operation['errors'],
+                         {'ApiException': 2, 'CircuitOpenError': 1})
+        self.assertEqual(self.collector.circuits(), {OPERATION: 'open'})
+        self.assertIn('deep_lynx_circuit_state{circuit="%s",state="open"} 1'
+                      % OPERATION, self.collector.to_prometheus())
+
+    def test_client_errors_do_not_open_the_circuit(self):
+        self.status = 404
+        for _ in range(3):
+            with self.assertRaises(ApiException):
+                self.api.list_nodes('c1')
+        self.assertEqual(self.sent, 3)
+
+    def test_client_errors_are_neutral(self):
+        breaker = self.client.configuration.circuit_breakers.get(
+            OPERATION, 'http://localhost')
+        with self.assertRaises(ApiException):
+            self.api.list_nodes('c1')
+        self.status = 404
+        with self.assertRaises(ApiException):
+            self.api.list_nodes('c1')
+        # the 404 did not reset the count
+        self.assertEqual(breaker.failures, 1)
+
+    def test_concurrent_requests_in_flight(self):
+        breaker = self.client.configuration.circuit_breakers.get(
+            OPERATION, 'http://localhost')
+        # three requests are in flight when the first two fail
+        sent = threading.Barrier(3)
+        lock = threading.Lock()
+        calls = []
+
+        def request(*args, **kwargs):
+            with lock:
+                calls.append(None)
+                fail = len(calls) <= 2
+            sent.wait()
+            if fail:
+                raise ApiException(http_resp=FakeResponse(status=503,
+                                                          data=b'down'))
+            # succeeds once the failures opened the circuit
+            deadline = time.monotonic() + 5
+            while breaker.state != circuit.OPEN and \
+                    time.monotonic() < deadline:
+                time.sleep(0.001)
+            return FakeResponse(status=200, data=b'{"value": []}')
+        self.client.request = request
+        threads = [threading.Thread(target=self.call) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(breaker.state, circuit.OPEN)
+        with self.assertRaises(deep_lynx.CircuitOpenError):
+            self.api.list_nodes('c1')
+
+    def call(self):
+        try:
+            self.api.list_nodes('c1')
+        except ApiException:
+            pass
+
+
+if __name__ == '__main__':
+    unittest.main()
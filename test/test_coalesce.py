@@ -0,0 +1,116 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import asyncio
+import threading
+import time
+import unittest
+
+import deep_lynx
+from deep_lynx.api.graph_api import GraphApi
+from deep_lynx.async_api_client import AsyncApiClient
+from deep_lynx.rest import ApiException
+
+from test.test_metrics import FakeResponse
+
+NODE = b'{"value": {"id": "n1", "container_id": "c1"}, "isError": false}'
+
+
+class TestSingleFlight(unittest.TestCase):
+    """Coalescing of identical concurrent GETs"""
+
+    def setUp(self):
+        self.configuration = deep_lynx.Configuration()
+        self.configuration.single_flight = deep_lynx.SingleFlight()
+        self.configuration.response_mode = 'dict'
+        self.client = deep_lynx.ApiClient(self.configuration)
+        self.sent = []
+        self.status = 200
+
+        def request(method, url, *args, **kwargs):
+            self.sent.append(url)
+            time.sleep(0.05)
+            response = FakeResponse(status=self.status, data=NODE)
+            if self.status >= 400:
+                raise ApiException(http_resp=response)
+            return response
+        self.client.request = request
+        self.api = GraphApi(self.client)
+
+    def run_threads(self, *node_ids):
+        results = [None] * len(node_ids)
+
+        def worker(i, node_id):
+            try:
+                results[i] = self.api.retrieve_node('c1', node_id)
+            except ApiException as e:
+                results[i] = e
+        threads = [threading.Thread(target=worker, args=(i, node_id))
+                   for i, node_id in enumerate(node_ids)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_concurrent_reads_share_one_request(self):
+        results = self.run_threads(*['n1'] * 8)
+        self.assertEqual(len(self.sent), 1)
+        for result in results:
+            self.assertIs(result, results[0])
+        self.assertEqual(self.configuration.single_flight.stats(),
+                         {'flights': 1, 'shared': 7, 'in_flight': 0})
+
+    def test_different_requests_are_not_shared(self):
+        self.run_threads('n1', 'n2', 'n1', 'n2')
+        self.assertEqual(len(self.sent), 2)
+        self.assertEqual(len(set(self.sent)), 2)
+
+    def test_errors_are_shared(self):
+        self.status = 503
+        results = self.run_threads('n1', 'n1', 'n1')
+        self.assertEqual(len(self.sent), 1)
+        for result in results:
+            self.assertIsInstance(result, ApiException)
+            self.assertEqual(result.status, 503)
+
+    def test_sequential_reads_are_sent(self):
+        self.api.retrieve_node('c1', 'n1')
+        self.api.retrieve_node('c1', 'n1')
+        self.assertEqual(len(self.sent), 2)
+
+    def test_async_req_threads(self):
+        futures = [self.api.retrieve_node('c1', 'n1', async_req=True)
+                   for _ in range(4)]
+        results = [future.get(5) for future in futures]
+        self.assertEqual(len(self.sent), 1)
+        self.assertIs(results[0], results[3])
+
+    def test_coroutines(self):
+        client = AsyncApiClient(self.configuration)
+
+        async def request(method, url, *args, **kwargs):
+            self.sent.append(url)
+            await asyncio.sleep(0.05)
+            return FakeResponse(data=NODE)
+        client.request = request
+        api = GraphApi(client)
+
+        async def run():
+            first = asyncio.ensure_future(api.retrieve_node('c1', 'n1'))
+            await asyncio.sleep(0)
+            # a cancelled caller does not cancel the shared request
+            first.cancel()
+            results = await asyncio.gather(
+                *[api.retrieve_node('c1', 'n1') for _ in range(3)])
+            await client.close()
+            return results
+        results = asyncio.run(run())
+        self.assertEqual(len(self.sent), 1)
+        self.assertIs(results[0], results[2])
+        self.assertEqual(results[0]['value']['id'], 'n1')
+
+
+if __name__ == '__main__':
+    unittest.main()
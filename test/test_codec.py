@@ -0,0 +1,109 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import datetime
+import json
+import unittest
+
+import numpy
+
+import deep_lynx
+from deep_lynx import codec
+from deep_lynx.api.graph_api import GraphApi
+
+
+class TestCodecs(unittest.TestCase):
+    """JSON codec unit tests, run against every installed backend"""
+
+    def codecs(self, nan='null'):
+        return [codec_class(nan) for codec_class in codec.available_codecs()
+                if nan in codec_class.nan_policies]
+
+    def test_round_trip_bytes(self):
+        payload = {'id': '1', 'properties': {'name': u'caf\xe9', 'n': [1, 2.5]}}
+        for c in self.codecs():
+            encoded = c.dumps(payload)
+            self.assertIsInstance(encoded, bytes, c)
+            self.assertEqual(c.loads(encoded), payload, c)
+            self.assertEqual(c.loads(encoded.decode('utf-8')), payload, c)
+
+    def test_numpy_and_datetimes(self):
+        payload = {
+            'int': numpy.int64(3),
+            'float': numpy.float32(1.5),
+            'bool': numpy.bool_(True),
+            'array': numpy.arange(3),
+            'at': datetime.datetime(2024, 1, 2, 3, 4, 5),
+            'on': datetime.date(2024, 1, 2),
+        }
+        expected = {'int': 3, 'float': 1.5, 'bool': True, 'array': [0, 1, 2],
+                    'at': '2024-01-02T03:04:05', 'on': '2024-01-02'}
+        for c in self.codecs():
+            self.assertEqual(json.loads(c.dumps(payload)), expected, c)
+
+    def test_nan_policies(self):
+        payload = {'a': float('nan'), 'b': [numpy.float32('inf'), 1.0]}
+        for c in self.codecs('null'):
+            self.assertEqual(json.loads(c.dumps(payload)),
+                             {'a': None, 'b': [None, 1.0]}, c)
+        for c in self.codecs('raise'):
+            with self.assertRaises(ValueError):
+                c.dumps(payload)
+        for c in self.codecs('allow'):
+            self.assertIn(b'NaN', c.dumps(payload))
+
+    def test_unsupported_policy_is_rejected(self):
+        with self.assertRaises(ValueError):
+            codec.StdlibJSONCodec('ignore')
+        with self.assertRaises(ValueError):
+            codec.get_default_codec('ignore')
+
+    def test_default_codec_honours_policy(self):
+        self.assertIs(type(codec.get_default_codec()),
+                      codec.available_codecs()[0])
+        self.assertIn('raise',
+                      type(codec.get_default_codec('raise')).nan_policies)
+
+
+class TestClientCodec(unittest.TestCase):
+    """The configured codec is used for request and response bodies"""
+
+    def test_client_uses_configured_codec(self):
+        calls = []
+
+        class RecordingCodec(codec.StdlibJSONCodec):
+            def dumps(self, obj):
+                calls.append(('dumps', obj))
+                return super(RecordingCodec, self).dumps(obj)
+
+            def loads(self, data):
+                calls.append(('loads', data))
+                return super(RecordingCodec, self).loads(data)
+
+        class FakeResponse(object):
+            status = 200
+            reason = 'OK'
+            data = b'{"value": {"id": "1"}, "isError": false}'
+            headers = {}
+
+        sent = {}
+
+        def request(method, url, **kwargs):
+            sent['body'] = kwargs.get('body')
+            return FakeResponse()
+
+        configuration = deep_lynx.Configuration()
+        configuration.json_codec = RecordingCodec()
+        client = deep_lynx.ApiClient(configuration)
+        client.rest_client.pool_manager.request = request
+
+        GraphApi(client).create_or_update_nodes(
+            [{'id': '1', 'weight': numpy.int64(7)}], 'c1')
+
+        self.assertEqual(json.loads(sent['body']), [{'id': '1', 'weight': 7}])
+        self.assertEqual([name for name, _ in calls], ['dumps', 'loads'])
+
+
+if __name__ == '__main__':
+    unittest.main()
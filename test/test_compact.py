@@ -0,0 +1,133 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import inspect
+import pickle
+import threading
+import unittest
+
+import deep_lynx
+from deep_lynx import compact, deserializer
+from deep_lynx.api.graph_api import GraphApi
+
+NODE = {'id': '1', 'container_id': '7', 'metatype_name': 'Equipment',
+        'metatype': {'id': '5', 'name': 'Equipment', 'description': 'd'},
+        'properties': {'a': 1}, 'metadata': {}}
+
+
+class FakeResponse(object):
+    status = 200
+    reason = 'OK'
+    data = (b'{"value": [{"id": "1", "metatype": {"id": "5", "name": "n",'
+            b' "description": "d"}}], "isError": false}')
+
+    def getheaders(self):
+        return {}
+
+    def getheader(self, name, default=None):
+        return default
+
+
+class TestCompact(unittest.TestCase):
+    """Slot-based models with lazily decoded nested values"""
+
+    def decode(self, data, klass='ListNodesResponse'):
+        return deserializer.deserialize(data, klass, compact=True)
+
+    def test_slots_and_properties(self):
+        node = self.decode(NODE, 'Node')
+        self.assertIsInstance(node, compact.compact_class(deep_lynx.Node))
+        self.assertFalse(hasattr(node, '__dict__'))
+        self.assertEqual(node.id, '1')
+        self.assertEqual(node.properties, {'a': 1})
+        node.id = '2'
+        self.assertEqual(node.id, '2')
+        with self.assertRaises(AttributeError):
+            node.unknown = 1
+
+    def test_nested_models_decode_on_first_access(self):
+        node = self.decode(NODE, 'Node')
+        self.assertIsInstance(node._metatype, dict)
+        metatype = node.metatype
+        self.assertIsInstance(
+            metatype, compact.compact_class(deep_lynx.NodeMetatypeBody))
+        self.assertEqual(metatype.name, 'Equipment')
+        self.assertIs(node.metatype, metatype)
+
+    def test_matches_generated_models(self):
+        data = {'value': [NODE, None, {'container_id': 5}], 'isError': False}
+        result = self.decode(data)
+        expected = deserializer.deserialize(data, 'ListNodesResponse')
+        self.assertEqual(result.to_model(), expected)
+        self.assertEqual(result.to_dict(), expected.to_dict())
+        self.assertEqual(result.value[2].container_id, '5')
+
+    def test_required_field_raises_like_constructor(self):
+        with self.assertRaises(ValueError) as generated:
+            deserializer.deserialize({'description': 'd'},
+                                     'CreateContainerRequest')
+        with self.assertRaises(ValueError) as compiled:
+            self.decode({'description': 'd'}, 'CreateContainerRequest')
+        self.assertEqual(str(generated.exception), str(compiled.exception))
+
+    def test_repeated_strings_are_shared(self):
+        result = self.decode({'value': [
+            dict(NODE, container_id=''.join(['container', '-7']))
+            for _ in range(3)]})
+        first, second = result.value[:2]
+        self.assertIs(first.container_id, second.container_id)
+
+    def test_every_model_has_a_compact_class(self):
+        import deep_lynx.models
+        for name in deep_lynx.models.__all__:
+            model_class = getattr(deep_lynx.models, name)
+            if not inspect.isclass(model_class):
+                continue
+            klass = compact.compact_class(model_class)
+            self.assertEqual(set(klass.swagger_types),
+                             set(model_class.swagger_types))
+        # a model with a `required` attribute
+        key = compact.compact_class(deep_lynx.models.CreateMetatypeKeyRequest)
+        self.assertTrue(key(name='n', property_name='p', description='d',
+                            data_type='string', required=True,
+                            metatype_id='m1').required)
+
+    def test_lazy_attributes_decode_once_across_threads(self):
+        nodes = [self.decode(NODE, 'Node') for _ in range(200)]
+        lazy = sorted(type(nodes[0])._lazy_fields)
+        barrier = threading.Barrier(len(lazy))
+
+        def read(attr):
+            barrier.wait()
+            for node in nodes:
+                getattr(node, attr)
+
+        threads = [threading.Thread(target=read, args=(attr,))
+                   for attr in lazy]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for node in nodes:
+            self.assertEqual(node._lazy, 0)
+            self.assertEqual(node.metatype.name, 'Equipment')
+            self.assertEqual(node.properties, {'a': 1})
+
+    def test_pickle_keeps_lazy_values(self):
+        node = self.decode(NODE, 'Node')
+        restored = pickle.loads(pickle.dumps(node))
+        self.assertEqual(restored, node)
+        self.assertEqual(restored.metatype.id, '5')
+
+    def test_response_mode(self):
+        client = deep_lynx.ApiClient(deep_lynx.Configuration())
+        client.request = lambda *args, **kwargs: FakeResponse()
+        result = GraphApi(client).list_nodes('c1', _response_mode='compact')
+        self.assertIsInstance(
+            result, compact.compact_class(deep_lynx.ListNodesResponse))
+        self.assertEqual(result.value[0].metatype.description, 'd')
+
+
+if __name__ == '__main__':
+    unittest.main()
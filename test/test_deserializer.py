@@ -0,0 +1,158 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import datetime
+import inspect
+import re
+import unittest
+
+import six
+
+import deep_lynx
+import deep_lynx.models
+from deep_lynx import deserializer
+
+
+def legacy_deserialize(data, klass):
+    """The uncompiled `ApiClient.__deserialize` the plans must match."""
+    if data is None:
+        return None
+
+    if type(klass) == str:
+        if klass.startswith('list['):
+            sub_kls = re.match(r'list\[(.*)\]', klass).group(1)
+            return [legacy_deserialize(sub_data, sub_kls) for sub_data in data]
+        if klass.startswith('dict('):
+            sub_kls = re.match(r'dict\(([^,]*), (.*)\)', klass).group(2)
+            return {k: legacy_deserialize(v, sub_kls)
+                    for k, v in six.iteritems(data)}
+        if klass in deserializer.NATIVE_TYPES_MAPPING:
+            klass = deserializer.NATIVE_TYPES_MAPPING[klass]
+        else:
+            klass = getattr(deep_lynx.models, klass)
+
+    if klass in deserializer.PRIMITIVE_TYPES:
+        try:
+            return klass(data)
+        except TypeError:
+            return data
+    elif klass == object:
+        return data
+    elif klass in (datetime.date, datetime.datetime):
+        return deserializer.deserialize(data, klass)
+
+    if not klass.swagger_types:
+        return data
+    kwargs = {}
+    for attr, attr_type in six.iteritems(klass.swagger_types):
+        if (klass.attribute_map[attr] in data and
+                isinstance(data, (list, dict))):
+            kwargs[attr] = legacy_deserialize(
+                data[klass.attribute_map[attr]], attr_type)
+    return klass(**kwargs)
+
+
+def sample(attr_type, depth=0):
+    """Example JSON for a swagger type string."""
+    if attr_type.startswith('list['):
+        return [sample(attr_type[5:-1], depth + 1) for _ in range(2)]
+    if attr_type.startswith('dict('):
+        return {'k': sample(attr_type[attr_type.index(', ') + 2:-1],
+                            depth + 1)}
+    simple = {'str': 'text', 'int': 7, 'float': 2, 'bool': True,
+              'object': {'nested': [1, 'a']}, 'date': '2024-01-02',
+              'datetime': '2024-01-02T03:04:05Z'}
+    if attr_type in simple:
+        return simple[attr_type]
+    klass = getattr(deep_lynx.models, attr_type)
+    if depth > 3:
+        return {}
+    return {klass.attribute_map[attr]: sample(sub_type, depth + 1)
+            for attr, sub_type in six.iteritems(klass.swagger_types)}
+
+
+def same(left, right):
+    if type(left) is not type(right):
+        return False
+    if isinstance(left, list):
+        return (len(left) == len(right) and
+                all(same(a, b) for a, b in zip(left, right)))
+    if isinstance(left, dict):
+        return (left.keys() == right.keys() and
+                all(same(left[k], right[k]) for k in left))
+    if hasattr(left, 'swagger_types'):
+        return same(left.__dict__, right.__dict__)
+    return left == right
+
+
+class TestDeserializer(unittest.TestCase):
+    """Compiled plans give the same results as the generic deserializer"""
+
+    def models(self):
+        return [klass for _, klass in inspect.getmembers(
+            deep_lynx.models, inspect.isclass)
+            if hasattr(klass, 'swagger_types')]
+
+    def test_every_model_matches_legacy_decoding(self):
+        for klass in self.models():
+            data = sample(klass.__name__)
+            try:
+                expected = legacy_deserialize(data, klass.__name__)
+            except ValueError as e:
+                # deeply nested samples leave out required fields
+                with self.assertRaises(ValueError) as ctx:
+                    deserializer.deserialize(data, klass.__name__)
+                self.assertEqual(str(e), str(ctx.exception))
+                continue
+            actual = deserializer.deserialize(data, klass.__name__)
+            self.assertTrue(same(expected, actual), klass.__name__)
+
+    def test_missing_fields_and_nulls(self):
+        data = {'value': [{'id': '1', 'properties': None},
+                          None,
+                          {'container_id': 5, 'unknown': 'x'}],
+                'isError': False}
+        expected = legacy_deserialize(data, 'ListNodesResponse')
+        actual = deserializer.deserialize(data, 'ListNodesResponse')
+        self.assertTrue(same(expected, actual))
+        self.assertEqual(actual.value[2].container_id, '5')
+        self.assertIsNone(actual.value[1])
+        self.assertIsNone(actual.value[0].metatype)
+
+    def test_required_field_raises_like_constructor(self):
+        with self.assertRaises(ValueError) as legacy:
+            legacy_deserialize({'description': 'd'}, 'CreateContainerRequest')
+        with self.assertRaises(ValueError) as compiled:
+            deserializer.deserialize({'description': 'd'},
+                                     'CreateContainerRequest')
+        self.assertEqual(str(legacy.exception), str(compiled.exception))
+
+    def test_primitive_conversions(self):
+        self.assertEqual(deserializer.deserialize('3', 'int'), 3)
+        self.assertEqual(deserializer.deserialize(3, 'float'), 3.0)
+        self.assertIs(type(deserializer.deserialize(3, 'float')), float)
+        self.assertEqual(deserializer.deserialize({'a': 1}, 'object'),
+                         {'a': 1})
+        self.assertEqual(
+            deserializer.deserialize({'a': '1'}, 'dict(str, int)'), {'a': 1})
+        self.assertEqual(
+            deserializer.deserialize('2024-01-02', 'date'),
+            datetime.date(2024, 1, 2))
+
+    def test_plans_are_cached(self):
+        decoder = deserializer.get_decoder('list[Node]')
+        self.assertIs(decoder, deserializer.get_decoder('list[Node]'))
+
+    def test_api_client_uses_plans(self):
+        class Response(object):
+            data = b'{"value": [{"id": "1"}], "isError": false}'
+
+        result = deep_lynx.ApiClient().deserialize(Response(),
+                                                   'ListNodesResponse')
+        self.assertIsInstance(result.value[0], deep_lynx.Node)
+        self.assertEqual(result.value[0].id, '1')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import os
+import re
+import shutil
+import tempfile
+import threading
+import unittest
+
+import urllib3
+from six.moves import BaseHTTPServer, socketserver
+
+import deep_lynx
+from deep_lynx.api.data_sources_api import DataSourcesApi
+
+CONTENT = bytes(bytearray(range(256))) * 4096
+
+
+class FileHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.ranges.append(self.headers.get('Range'))
+            drop = server.drops > 0
+            server.drops -= 1
+        start, end = 0, len(CONTENT)
+        match = re.match(r'bytes=(\d+)-(\d*)', self.headers.get('Range', ''))
+        if match and server.ranges_supported:
+            start = int(match.group(1))
+            if match.group(2):
+                end = int(match.group(2)) + 1
+            self.send_response(206)
+            self.send_header('Content-Range', 'bytes %d-%d/%d' % (
+                start, end - 1, len(CONTENT)))
+        else:
+            self.send_response(200)
+        if server.ranges_supported:
+            self.send_header('Accept-Ranges', 'bytes')
+        self.send_header('ETag', '"v1"')
+        self.send_header('Content-Type', 'application/octet-stream')
+        self.send_header('Content-Disposition',
+                         'attachment; filename="../model.step"')
+        self.send_header('Content-Length', str(end - start))
+        self.end_headers()
+        if drop:
+            # drop the connection half way through the body
+            self.wfile.write(CONTENT[start:start + (end - start) // 2])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(CONTENT[start:end])
+
+    def log_message(self, *args):
+        pass
+
+
+class Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+class TestDownload(unittest.TestCase):
+    """Streamed, resumable downloads of file responses"""
+
+    def setUp(self):
+        self.server = Server(('127.0.0.1', 0), FileHandler)
+        self.server.lock = threading.Lock()
+        self.server.ranges = []
+        self.server.drops = 0
+        self.server.ranges_supported = True
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+
+        self.tmp = tempfile.mkdtemp()
+        self.configuration = deep_lynx.Configuration()
+        self.configuration.host = ('http://127.0.0.1:%d' %
+                                   self.server.server_port)
+        self.configuration.temp_folder_path = self.tmp
+        self.configuration.download_chunk_size = 8192
+        self.api = DataSourcesApi(deep_lynx.ApiClient(self.configuration))
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        shutil.rmtree(self.tmp)
+
+    def read(self, path):
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def test_streams_to_temp_folder(self):
+        path = self.api.download_file('c1', 'f1')
+        self.assertEqual(path, os.path.join(self.tmp, 'model.step'))
+        self.assertEqual(self.read(path), CONTENT)
+        self.assertEqual(os.listdir(self.tmp), ['model.step'])
+
+    def test_caller_supplied_path(self):
+        target = os.path.join(self.tmp, 'out.bin')
+        self.assertEqual(self.api.download_file('c1', 'f1',
+                                                _download_path=target),
+                         target)
+        self.assertEqual(self.read(target), CONTENT)
+
+        directory = os.path.join(self.tmp, 'dir')
+        os.mkdir(directory)
+        path = self.api.download_file('c1', 'f1', _download_path=directory)
+        self.assertEqual(path, os.path.join(directory, 'model.step'))
+
+    def test_resumes_dropped_connection_with_range(self):
+        self.server.drops = 2
+        path = self.api.download_file('c1', 'f1')
+        self.assertEqual(self.read(path), CONTENT)
+        half = len(CONTENT) // 2
+        self.assertEqual(self.server.ranges, [
+            None, 'bytes=%d-%d' % (half, len(CONTENT) - 1),
+            'bytes=%d-%d' % (half + half // 2, len(CONTENT) - 1)])
+
+    def test_restarts_when_ranges_are_not_supported(self):
+        self.server.drops = 1
+        self.server.ranges_supported = False
+        path = self.api.download_file('c1', 'f1')
+        self.assertEqual(self.read(path), CONTENT)
+
+    def test_gives_up_after_retries(self):
+        self.server.drops = 10
+        self.configuration.download_retries = 0
+        with self.assertRaises(urllib3.exceptions.HTTPError):
+            self.api.download_file('c1', 'f1')
+        self.assertEqual(os.listdir(self.tmp), [])
+
+    def test_parallel_byte_ranges(self):
+        self.configuration.download_workers = 4
+        self.configuration.download_part_size = 100000
+        # the first request only gives the size; the second drop hits a part
+        self.server.drops = 2
+        path = self.api.download_file('c1', 'f1')
+        self.assertEqual(self.read(path), CONTENT)
+        self.assertEqual(len([r for r in self.server.ranges if r]),
+                         -(-len(CONTENT) // 100000) + 1)
+
+    def test_raw_bytes_mode_is_not_streamed(self):
+        self.assertEqual(self.api.download_file('c1', 'f1',
+                                                _response_mode='raw_bytes'),
+                         CONTENT)
+
+
+if __name__ == '__main__':
+    unittest.main()
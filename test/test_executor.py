@@ -0,0 +1,85 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import concurrent.futures
+import threading
+import unittest
+
+import deep_lynx
+from deep_lynx import executor
+from deep_lynx.api.graph_api import GraphApi
+
+
+class FakeResponse(object):
+
+    def __init__(self, data, status=200):
+        self.status = status
+        self.reason = 'OK'
+        self.data = data
+        self.headers = {'Content-Type': 'application/json'}
+
+    def getheaders(self):
+        return self.headers
+
+    def getheader(self, name, default=None):
+        return self.headers.get(name, default)
+
+
+class TestExecutor(unittest.TestCase):
+    """Shared async_req executor unit tests"""
+
+    def setUp(self):
+        executor.shutdown()
+
+    def tearDown(self):
+        executor.shutdown()
+
+    def test_client_construction_starts_no_threads(self):
+        for _ in range(5):
+            deep_lynx.ApiClient()
+        self.assertIsNone(executor._executor)
+
+    def test_clients_share_one_executor(self):
+        configuration = deep_lynx.Configuration()
+        configuration.executor_max_workers = 2
+        first = deep_lynx.ApiClient(configuration)
+        second = deep_lynx.ApiClient()
+        self.assertIs(first.pool, second.pool)
+        self.assertEqual(first.pool._max_workers, 2)
+
+    def test_async_req_returns_future(self):
+        client = deep_lynx.ApiClient()
+        client.request = lambda *args, **kwargs: FakeResponse(
+            b'{"value": [{"id": "1"}], "isError": false}')
+        future = GraphApi(client).list_nodes('c1', async_req=True)
+        self.assertIsInstance(future, concurrent.futures.Future)
+        self.assertEqual(future.get(timeout=5).value[0].id, '1')
+        self.assertTrue(future.ready())
+        self.assertTrue(future.successful())
+
+    def test_exception_is_raised_from_get(self):
+        def fail():
+            raise ValueError('boom')
+
+        future = executor.submit(fail)
+        with self.assertRaises(ValueError):
+            future.get(timeout=5)
+        self.assertFalse(future.successful())
+
+    def test_timeout_and_cancellation(self):
+        release = threading.Event()
+        running = executor.submit(release.wait, max_workers=1)
+        queued = executor.submit(lambda: 'never')
+
+        with self.assertRaises(concurrent.futures.TimeoutError):
+            running.get(timeout=0.01)
+        self.assertTrue(queued.cancel())
+
+        release.set()
+        self.assertTrue(running.get(timeout=5))
+        self.assertTrue(queued.cancelled())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,165 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import os
+import pickle
+import threading
+import time
+import unittest
+
+import deep_lynx
+from deep_lynx import auth
+from deep_lynx import cache
+from deep_lynx import executor
+from deep_lynx import limiter
+from deep_lynx.api.graph_api import GraphApi
+from deep_lynx.api.metatypes_api import MetatypesApi
+
+from test.test_metrics import FakeResponse
+
+
+def run_in_child(fn, timeout=10.0):
+    """Runs `fn` in a forked child; returns its exit status, 0 when `fn`
+    returned True"""
+    pid = os.fork()
+    if pid == 0:
+        try:
+            code = 0 if fn() else 1
+        except BaseException:
+            code = 2
+        os._exit(code)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        done, status = os.waitpid(pid, os.WNOHANG)
+        if done:
+            return os.waitstatus_to_exitcode(status)
+        time.sleep(0.01)
+    os.kill(pid, 9)
+    os.waitpid(pid, 0)
+    return 'deadlocked'
+
+
+class TestForkSafety(unittest.TestCase):
+    """Clients used in forked children"""
+
+    def setUp(self):
+        if not hasattr(os, 'fork'):
+            self.skipTest('needs os.fork')
+        self.configuration = deep_lynx.Configuration()
+        self.configuration.response_mode = 'dict'
+        self.configuration.response_cache = deep_lynx.ResponseCache(
+            cache.ONTOLOGY_OPERATIONS)
+        self.configuration.single_flight = deep_lynx.SingleFlight()
+        self.configuration.limiters = {'read': limiter.Limiter(
+            concurrency=1)}
+        self.client = deep_lynx.ApiClient(self.configuration)
+
+    def test_child_rebuilds_pools_and_locks(self):
+        pool_manager = self.client.rest_client.pool_manager
+        executor.get_executor()
+        parent_executor = executor.get_executor()
+        # held by another thread of the parent while it forks
+        responses = self.configuration.response_cache
+        concurrency = self.configuration.limiters['read'].concurrency
+        responses._lock.acquire()
+        slot = concurrency.acquire()
+        try:
+            def child():
+                self.client.request = (
+                    lambda *args, **kwargs: FakeResponse())
+                MetatypesApi(self.client).list_metatypes('c1')
+                GraphApi(self.client).list_nodes('c1', async_req=True).get()
+                return (self.client.rest_client.pool_manager is not
+                        pool_manager and
+                        executor.get_executor() is not parent_executor and
+                        len(responses) == 1)
+            self.assertEqual(run_in_child(child), 0)
+        finally:
+            responses._lock.release()
+            concurrency.release(slot)
+
+    def test_token_refresh_restarts_in_child(self):
+        manager = auth.TokenManager('key', 'secret', expiry='1h',
+                                    fetch=lambda _: 'token')
+        self.addCleanup(manager.close)
+        manager.token(self.configuration)
+        self.assertIsNotNone(manager._thread)
+
+        def child():
+            return (manager._thread is None and
+                    manager.token() == 'token' and
+                    manager._thread.is_alive())
+        self.assertEqual(run_in_child(child), 0)
+
+
+class TestClientSpec(unittest.TestCase):
+    """Picklable clients for worker processes"""
+
+    def setUp(self):
+        self.configuration = deep_lynx.Configuration()
+        self.configuration.host = 'http://deep-lynx:8090'
+        self.configuration.response_mode = 'compact'
+        self.configuration.response_cache = deep_lynx.ResponseCache(
+            cache.ONTOLOGY_OPERATIONS, ttl=5)
+        self.configuration.limiters = {'write': limiter.Limiter(
+            rate=10, concurrency=limiter.AdaptiveConcurrency(2, 1, 8))}
+        self.configuration.circuit_breakers = deep_lynx.CircuitBreakers(
+            'host', failure_threshold=2)
+        self.client = deep_lynx.ApiClient(self.configuration, 'X-Job', '7')
+        self.client.add_hook(deep_lynx.MetricsCollector(prefix='job'))
+
+    def test_pickled_client(self):
+        self.configuration.response_cache.put(
+            self.configuration.response_cache.ticket(
+                next(iter(cache.ONTOLOGY_OPERATIONS)), 'http://x'),
+            FakeResponse())
+        copy = pickle.loads(pickle.dumps(self.client))
+        configuration = copy.configuration
+        self.assertIsInstance(copy, deep_lynx.ApiClient)
+        self.assertEqual(configuration.host, 'http://deep-lynx:8090')
+        self.assertEqual(configuration.response_mode, 'compact')
+        self.assertEqual(copy.default_headers['X-Job'], '7')
+        # same settings, no state
+        self.assertEqual(configuration.response_cache.ttl, 5)
+        self.assertEqual(len(configuration.response_cache), 0)
+        write = configuration.limiters['write']
+        self.assertEqual((write.bucket.rate, write.concurrency.limit,
+                          write.concurrency.maximum), (10.0, 2, 8))
+        self.assertEqual(configuration.circuit_breakers.key, 'host')
+        self.assertEqual(
+            configuration.circuit_breakers.kwargs['failure_threshold'], 2)
+        self.assertEqual(copy.hooks[0].prefix, 'job')
+        self.assertIsNot(copy.rest_client, self.client.rest_client)
+
+    def test_spec_client_is_built_once_per_process(self):
+        spec = pickle.loads(pickle.dumps(self.client.spec()))
+        again = pickle.loads(pickle.dumps(spec))
+        self.assertIs(spec.client(), again.client())
+        self.assertIsNot(spec.client(),
+                         self.client.spec().client())
+
+    def test_token_manager_is_shared_after_unpickling(self):
+        manager = auth.TokenManager.shared('spec-key', 'secret',
+                                           background=False)
+        self.configuration.refresh_api_key_hook = manager
+        copy = pickle.loads(pickle.dumps(self.client))
+        self.assertIs(copy.configuration.refresh_api_key_hook, manager)
+
+    def test_last_response_is_per_thread(self):
+        responses = {'main': FakeResponse(), 'other': FakeResponse()}
+        self.client.last_response = responses['main']
+        seen = []
+
+        def other():
+            seen.append(self.client.last_response)
+            self.client.last_response = responses['other']
+        thread = threading.Thread(target=other)
+        thread.start()
+        thread.join()
+        self.assertEqual(seen, [None])
+        self.assertIs(self.client.last_response, responses['main'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,164 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import json
+import re
+import threading
+import unittest
+
+import deep_lynx
+from deep_lynx import keyset
+from deep_lynx import pagination
+from deep_lynx.api.graph_api import GraphApi
+from deep_lynx.models.node import Node
+from deep_lynx.rest import ApiException
+
+from test.test_metrics import FakeResponse
+
+
+class Server(object):
+    """Serves the nodes of metatype m1 by offset and through GraphQL"""
+
+    def __init__(self, total, graphql=True, fail_after=None):
+        self.nodes = [{'id': str(100 + i), 'container_id': 'c1',
+                       'metatype_id': 'm1', 'metatype_name': 'Asset Type',
+                       'data_source_id': 'd%d' % (i % 2),
+                       'properties': {'serial number': 'S%d' % i}}
+                      for i in range(total)]
+        self.graphql = graphql
+        self.fail_after = fail_after
+        self.queries = []
+        self.offsets = []
+        self._lock = threading.Lock()
+
+    def data(self, query):
+        if self.graphql == 'errors':
+            return {'errors': [{'message': 'Unknown argument "sortBy"'}]}
+        after = re.search(r'id: \{operator: ">", value: "(\d+)"\}', query)
+        if after and after.group(1) == self.fail_after:
+            raise ApiException(status=500, reason='Server Error')
+        source = re.search(r'data_source_id: \{operator: "eq", '
+                           r'value: "(\w+)"\}', query)
+        limit = int(re.search(r'limit: (\d+)', query).group(1))
+        nodes = [node for node in self.nodes
+                 if (not after or int(node['id']) > int(after.group(1))) and
+                 (not source or node['data_source_id'] == source.group(1))]
+        return {'data': {'metatypes': {'Asset_Type': [
+            {'_record': {'id': node['id'], 'metatype_id': 'm1',
+                         'metatype_name': 'Asset Type',
+                         'data_source_id': node['data_source_id']},
+             'serial_number': node['properties']['serial number']}
+            for node in nodes[:limit]]}}}
+
+    def request(self, method, url, query_params=None, body=None, **kwargs):
+        query = dict(query_params or [])
+        if url.endswith('/data'):
+            if not self.graphql:
+                raise ApiException(status=404, reason='Not Found')
+            with self._lock:
+                self.queries.append(body['query'])
+            value = self.data(body['query'])
+        elif url.endswith('/metatypes/m1'):
+            value = {'value': {'id': 'm1', 'name': 'Asset Type'}}
+        elif url.endswith('/metatypes/m1/keys'):
+            value = {'value': [{'property_name': 'serial number'},
+                               {'property_name': 'old', 'archived': True}]}
+        else:
+            offset, limit = int(query['offset']), int(query['limit'])
+            with self._lock:
+                self.offsets.append(offset)
+            value = {'value': self.nodes[offset:offset + limit]}
+        return FakeResponse(data=json.dumps(value).encode('utf-8'))
+
+
+class TestKeysetPages(unittest.TestCase):
+    """Reading nodes by keyset through GraphQL"""
+
+    def api(self, server, response_mode='dict'):
+        configuration = deep_lynx.Configuration()
+        configuration.response_mode = response_mode
+        client = deep_lynx.ApiClient(configuration)
+        client.request = server.request
+        return GraphApi(client)
+
+    def test_pages_by_id(self):
+        server = Server(25)
+        nodes = self.api(server).iter_nodes('c1', metatype_id='m1',
+                                            page_size=10, strategy='auto')
+        self.assertIsInstance(nodes, pagination.KeysetPages)
+        nodes = list(nodes)
+        self.assertEqual([node['id'] for node in nodes],
+                         [str(100 + i) for i in range(25)])
+        self.assertEqual(nodes[3]['properties'], {'serial number': 'S3'})
+        self.assertEqual(server.offsets, [])
+        self.assertEqual(
+            [re.search(r'value: "(\d+)"', query).group(1)
+             for query in server.queries[1:]], ['109', '119'])
+        self.assertNotIn('value:', server.queries[0])
+
+    def test_same_items_as_offsets(self):
+        server = Server(12)
+        api = self.api(server, 'model')
+        by_key = list(api.iter_nodes_by_metatype_id('c1', 'm1', page_size=5,
+                                                    strategy='keyset'))
+        by_offset = list(api.iter_nodes_by_metatype_id('c1', 'm1',
+                                                       page_size=5))
+        self.assertIsInstance(by_key[0], Node)
+        self.assertEqual([(node.id, node.properties) for node in by_key],
+                         [(node.id, node.properties) for node in by_offset])
+
+        server = Server(12)
+        nodes = list(self.api(server).iter_nodes(
+            'c1', metatype_id='m1', data_source_id='d1', page_size=5,
+            strategy='auto'))
+        self.assertEqual(len(nodes), 6)
+        self.assertEqual(server.offsets, [])
+
+    def test_falls_back_to_offsets(self):
+        for graphql in (False, 'errors'):
+            server = Server(12, graphql=graphql)
+            nodes = list(self.api(server).iter_nodes(
+                'c1', metatype_id='m1', page_size=5, strategy='auto'))
+            self.assertEqual(len(nodes), 12)
+            self.assertEqual(sorted(server.offsets)[:3], [0, 5, 10])
+
+        server = Server(12, graphql='errors')
+        with self.assertRaises(pagination.KeysetUnavailable):
+            list(self.api(server).iter_nodes('c1', metatype_id='m1',
+                                             strategy='keyset'))
+
+    def test_offsets_without_metatype(self):
+        api = self.api(Server(1))
+        self.assertIsInstance(api.iter_nodes('c1'), pagination.Pages)
+        # keysets are opt-in
+        self.assertIsInstance(api.iter_nodes('c1', metatype_id='m1'),
+                              pagination.Pages)
+        self.assertIsInstance(api.iter_nodes_by_metatype_id('c1', 'm1'),
+                              pagination.Pages)
+        self.assertIsInstance(api.iter_nodes('c1', metatype_id='m1',
+                                             history=True), pagination.Pages)
+        with self.assertRaises(ValueError):
+            api.iter_nodes('c1', strategy='keyset')
+        with self.assertRaises(ValueError):
+            api.iter_nodes('c1', metatype_id='m1', strategy='cursor')
+
+    def test_later_errors_are_raised(self):
+        server = Server(30, fail_after='109')
+        nodes = iter(self.api(server).iter_nodes('c1', metatype_id='m1',
+                                                 page_size=10,
+                                                 strategy='auto'))
+        for _ in range(10):
+            next(nodes)
+        with self.assertRaises(ApiException):
+            next(nodes)
+        self.assertEqual(server.offsets, [])
+
+    def test_graphql_name(self):
+        self.assertEqual(keyset.graphql_name('Asset Type'), 'Asset_Type')
+        self.assertEqual(keyset.graphql_name('2nd-part (new)'),
+                         '_2ndpart_new')
+
+
+if __name__ == '__main__':
+    unittest.main()
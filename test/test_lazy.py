@@ -0,0 +1,71 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+import deep_lynx
+import deep_lynx.api
+import deep_lynx.models
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def loaded_after(statement):
+    """deep_lynx modules loaded by `statement` in a fresh interpreter"""
+    probe = ("import json, sys\n" + statement + "\n"
+             "print(json.dumps(sorted(name for name in sys.modules\n"
+             "                        if name.startswith('deep_lynx'))))")
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    env.pop('DEEP_LYNX_EAGER_IMPORT', None)
+    output = subprocess.check_output([sys.executable, '-c', probe], env=env,
+                                     cwd=ROOT)
+    return set(json.loads(output.decode('utf-8').splitlines()[-1]))
+
+
+class TestLazyImports(unittest.TestCase):
+    """Lazy loading of the package, api and model names"""
+
+    def test_import_loads_no_apis_or_models(self):
+        modules = loaded_after('import deep_lynx')
+        self.assertFalse([m for m in modules
+                          if m.startswith(('deep_lynx.api.',
+                                           'deep_lynx.models.'))])
+        self.assertNotIn('deep_lynx.api_client', modules)
+
+    def test_only_used_modules_are_loaded(self):
+        modules = loaded_after(
+            'from deep_lynx import ApiClient, MetatypesApi, Metatype')
+        self.assertIn('deep_lynx.api.metatypes_api', modules)
+        self.assertIn('deep_lynx.models.metatype', modules)
+        self.assertNotIn('deep_lynx.api.graph_api', modules)
+        self.assertNotIn('deep_lynx.models.node', modules)
+        # numpy and aiohttp are only needed by callers that use them
+        modules = loaded_after('from deep_lynx import ApiClient\n'
+                               'assert "numpy" not in sys.modules\n'
+                               'assert "aiohttp" not in sys.modules')
+        self.assertIn('deep_lynx.api_client', modules)
+
+    def test_every_name_resolves(self):
+        for package in (deep_lynx, deep_lynx.api, deep_lynx.models):
+            for name in package.__all__:
+                value = getattr(package, name)
+                self.assertEqual(value.__name__, name)
+                self.assertIn(name, dir(package))
+        self.assertIs(deep_lynx.Metatype, deep_lynx.models.Metatype)
+        self.assertIs(deep_lynx.GraphApi, deep_lynx.api.GraphApi)
+
+    def test_submodules_and_missing_names(self):
+        self.assertIs(deep_lynx.rest, sys.modules['deep_lynx.rest'])
+        with self.assertRaises(AttributeError):
+            deep_lynx.NoSuchApi
+        with self.assertRaises(ImportError):
+            from deep_lynx import NoSuchApi  # noqa: F401
+
+
+if __name__ == '__main__':
+    unittest.main()
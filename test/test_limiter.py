@@ -0,0 +1,180 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import asyncio
+import socket
+import threading
+import time
+import unittest
+from unittest import mock
+
+import deep_lynx
+from deep_lynx import limiter
+from deep_lynx.api.data_sources_api import DataSourcesApi
+from deep_lynx.api.graph_api import GraphApi
+from deep_lynx.rest import ApiException
+
+from test.test_metrics import FakeResponse
+
+
+class TestLimiter(unittest.TestCase):
+    """Client-side rate and adaptive concurrency limits"""
+
+    def test_token_bucket(self):
+        bucket = limiter.TokenBucket(rate=10, burst=2)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertAlmostEqual(bucket.reserve(), 0.1, delta=0.02)
+        self.assertAlmostEqual(bucket.reserve(), 0.2, delta=0.02)
+
+    def test_additive_increase(self):
+        concurrency = limiter.AdaptiveConcurrency(initial=2, maximum=4)
+        for _ in range(20):
+            slots = [concurrency.acquire() for _ in range(concurrency.limit)]
+            for slot in slots:
+                concurrency.release(slot, latency=0.01)
+        self.assertEqual(concurrency.limit, 4)
+        self.assertEqual(concurrency.in_flight, 0)
+
+    def test_multiplicative_decrease_once_per_limit(self):
+        concurrency = limiter.AdaptiveConcurrency(initial=8, maximum=8)
+        slots = [concurrency.acquire() for _ in range(8)]
+        # a burst of failures of requests sent under the same limit only
+        # halves it once
+        for slot in slots:
+            concurrency.release(slot, latency=0.01, failed=True)
+        self.assertEqual(concurrency.limit, 4)
+        concurrency.release(concurrency.acquire(), failed=True)
+        self.assertEqual(concurrency.limit, 2)
+
+    def test_latency_spike_backs_off(self):
+        concurrency = limiter.AdaptiveConcurrency(initial=8, maximum=8)
+        for _ in range(10):
+            concurrency.release(concurrency.acquire(), latency=0.01)
+        concurrency.release(concurrency.acquire(), latency=1.0)
+        self.assertEqual(concurrency.limit, 4)
+
+    def test_waiters_are_woken_in_order(self):
+        concurrency = limiter.AdaptiveConcurrency(1, 1, 1)
+        first = concurrency.acquire()
+        order = []
+
+        def worker(name):
+            slot = concurrency.acquire()
+            order.append(name)
+            concurrency.release(slot)
+        threads = []
+        for name in range(3):
+            thread = threading.Thread(target=worker, args=(name,))
+            thread.start()
+            threads.append(thread)
+            while len(concurrency._waiters) <= name:
+                time.sleep(0.001)
+        concurrency.release(first)
+        for thread in threads:
+            thread.join()
+        self.assertEqual(order, [0, 1, 2])
+
+    def test_interrupted_waiters_give_their_slot_back(self):
+        concurrency = limiter.AdaptiveConcurrency(1, 1, 1)
+        slot = concurrency.acquire()
+
+        class Interrupted(object):
+            # the slot is handed over just before the interrupt when `handed`
+            handed = False
+
+            def set(self):
+                pass
+
+            def wait(self):
+                if self.handed:
+                    concurrency.release(slot)
+                raise KeyboardInterrupt
+
+        with mock.patch.object(limiter.threading, 'Event', Interrupted):
+            with self.assertRaises(KeyboardInterrupt):
+                concurrency.acquire()
+            self.assertEqual(len(concurrency._waiters), 0)
+            self.assertEqual(concurrency.in_flight, 1)
+            Interrupted.handed = True
+            with self.assertRaises(KeyboardInterrupt):
+                concurrency.acquire()
+        self.assertEqual(concurrency.in_flight, 0)
+        self.assertEqual(len(concurrency._waiters), 0)
+
+    def test_cancelled_coroutines_give_their_slot_back(self):
+        concurrency = limiter.AdaptiveConcurrency(1, 1, 1)
+
+        async def run():
+            slot = await concurrency.acquire_async()
+            waiter = asyncio.ensure_future(concurrency.acquire_async())
+            await asyncio.sleep(0)
+            waiter.cancel()
+            concurrency.release(slot)
+            await asyncio.sleep(0.01)
+            return await asyncio.wait_for(concurrency.acquire_async(), 1)
+        asyncio.run(run())
+        self.assertEqual(concurrency.in_flight, 1)
+
+    def test_overloaded(self):
+        self.assertTrue(limiter.overloaded(ApiException(status=503)))
+        self.assertTrue(limiter.overloaded(ApiException(status=429)))
+        self.assertFalse(limiter.overloaded(ApiException(status=404)))
+        self.assertTrue(limiter.overloaded(ConnectionResetError()))
+        self.assertTrue(limiter.overloaded(socket.timeout()))
+        self.assertFalse(limiter.overloaded(ValueError()))
+        self.assertFalse(limiter.overloaded(FileNotFoundError()))
+        self.assertFalse(limiter.overloaded(PermissionError()))
+
+    def test_local_errors_are_not_overload(self):
+        configuration = deep_lynx.Configuration()
+        configuration.host = 'http://127.0.0.1:9'
+        concurrency = limiter.AdaptiveConcurrency(initial=4)
+        configuration.limiters = {
+            'upload': limiter.Limiter(concurrency=concurrency)}
+        configuration.circuit_breakers = deep_lynx.CircuitBreakers(
+            key='host', failure_threshold=1)
+        api = DataSourcesApi(deep_lynx.ApiClient(configuration))
+        for _ in range(3):
+            with self.assertRaises(FileNotFoundError):
+                api.upload_file('c1', 'd1', file='/missing/upload.csv')
+        self.assertEqual(concurrency.limit, 4)
+        self.assertEqual(concurrency.in_flight, 0)
+        self.assertEqual(configuration.circuit_breakers.states(),
+                         {'127.0.0.1:9': 'closed'})
+
+    def test_operation_group(self):
+        self.assertEqual(limiter.operation_group('GET'), 'read')
+        self.assertEqual(limiter.operation_group('POST', {'file': None}),
+                         'write')
+        self.assertEqual(limiter.operation_group('POST', {'file': 'a.csv'}),
+                         'upload')
+
+    def test_api_client_bounds_requests_in_flight(self):
+        configuration = deep_lynx.Configuration()
+        configuration.limiters = {'read': limiter.Limiter(concurrency=2)}
+        client = deep_lynx.ApiClient(configuration)
+        lock = threading.Lock()
+        state = {'in_flight': 0, 'max': 0}
+
+        def request(*args, **kwargs):
+            with lock:
+                state['in_flight'] += 1
+                state['max'] = max(state['max'], state['in_flight'])
+            time.sleep(0.02)
+            with lock:
+                state['in_flight'] -= 1
+            return FakeResponse()
+        client.request = request
+
+        api = GraphApi(client)
+        results = [api.list_nodes('c%d' % i, async_req=True)
+                   for i in range(8)]
+        for result in results:
+            result.get(5)
+        self.assertEqual(state['max'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import deep_lynx
+from deep_lynx import metrics
+from deep_lynx.api.graph_api import GraphApi
+from deep_lynx.rest import ApiException
+
+BODY = b'{"value": [{"id": "1"}], "isError": false}'
+OPERATION = 'GET /containers/{container_id}/graphs/nodes'
+
+
+class FakeResponse(object):
+
+    def __init__(self, status=200, data=BODY):
+        self.status = status
+        self.reason = 'OK'
+        self.data = data
+        self.request_bytes = None
+        self.retries = 1
+
+    def getheaders(self):
+        return {}
+
+    def getheader(self, name, default=None):
+        return default
+
+
+class Recorder(object):
+
+    def __init__(self):
+        self.events = []
+
+    def on_request(self, info):
+        self.events.append(('request', info.operation))
+
+    def on_response(self, info):
+        self.events.append(('response', info.status))
+
+    def on_error(self, info):
+        self.events.append(('error', info.status, type(info.error)))
+
+
+class TestMetrics(unittest.TestCase):
+    """Request hooks and the in-memory metrics collector"""
+
+    def setUp(self):
+        self.client = deep_lynx.ApiClient(deep_lynx.Configuration())
+        self.response = FakeResponse()
+
+        def request(*args, **kwargs):
+            if self.response.status >= 400:
+                raise ApiException(http_resp=self.response)
+            return self.response
+        self.client.request = request
+        self.api = GraphApi(self.client)
+        self.collector = metrics.MetricsCollector()
+        self.client.add_hook(self.collector)
+
+    def test_hooks_see_requests_and_errors(self):
+        recorder = Recorder()
+        self.client.add_hook(recorder)
+        self.api.list_nodes('c1')
+        self.response = FakeResponse(status=503, data=b'down')
+        with self.assertRaises(ApiException):
+            self.api.list_nodes('c1')
+        self.assertEqual(recorder.events, [
+            ('request', OPERATION), ('response', 200),
+            ('request', OPERATION), ('error', 503, ApiException)])
+
+    def test_failing_hook_does_not_break_requests(self):
+        class Broken(object):
+            def on_response(self, info):
+                raise RuntimeError('boom')
+
+        self.client.add_hook(Broken())
+        with self.assertLogs('deep_lynx.api_client', 'ERROR'):
+            self.assertEqual(self.api.list_nodes('c1').value[0].id, '1')
+
+    def test_collector(self):
+        self.api.list_nodes('c1')
+        self.api.list_nodes('c2')
+        self.response = FakeResponse(status=503, data=b'down')
+        with self.assertRaises(ApiException):
+            self.api.list_nodes('c1')
+
+        operation = self.collector.to_dict()[OPERATION]
+        self.assertEqual(operation['requests'], 3)
+        self.assertEqual(operation['statuses'], {'200': 2, '503': 1})
+        self.assertEqual(operation['errors'], {'ApiException': 1})
+        self.assertEqual(operation['response_bytes'], 2 * len(BODY) + 4)
+        self.assertEqual(operation['retries'], 2)
+        self.assertEqual(operation['latency_seconds']['buckets']['+Inf'], 3)
+
+    def test_prometheus_export(self):
+        self.api.list_nodes('c1')
+        text = self.collector.to_prometheus()
+        labels = 'operation="%s"' % OPERATION
+        self.assertIn('# TYPE deep_lynx_request_duration_seconds histogram',
+                      text)
+        self.assertIn('deep_lynx_request_duration_seconds_bucket{%s,le="+Inf"}'
+                      ' 1' % labels, text)
+        self.assertIn('deep_lynx_requests_total{%s,status="200"} 1' % labels,
+                      text)
+        self.assertIn('deep_lynx_response_bytes_total{%s} %d' % (
+            labels, len(BODY)), text)
+
+        tmp = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp, 'deep_lynx.prom')
+            self.collector.write_prometheus(path)
+            with open(path) as f:
+                self.assertEqual(f.read(), text)
+            self.assertEqual(os.listdir(tmp), ['deep_lynx.prom'])
+        finally:
+            shutil.rmtree(tmp)
+
+    def test_pool_wait_of_async_requests(self):
+        self.api.list_nodes('c1', async_req=True).get(5)
+        operation = self.collector.to_dict()[OPERATION]
+        self.assertEqual(operation['pool_wait_seconds']['count'], 1)
+
+    def test_histogram(self):
+        histogram = metrics.Histogram((0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+        self.assertEqual(histogram.to_dict()['buckets'],
+                         {'0.1': 2, '1.0': 3, '+Inf': 4})
+        self.assertEqual(histogram.quantile(0.5), 0.1)
+        self.assertIsNone(histogram.quantile(0.99))
+
+
+if __name__ == '__main__':
+    unittest.main()
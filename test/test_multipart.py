@@ -0,0 +1,140 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from six.moves import BaseHTTPServer
+from urllib3.filepost import encode_multipart_formdata
+
+import deep_lynx
+from deep_lynx.api.data_sources_api import DataSourcesApi
+from deep_lynx.multipart import MultipartEncoder, UploadFile
+
+
+class UploadHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+
+    def do_POST(self):
+        length = int(self.headers['Content-Length'])
+        self.server.received.append((dict(self.headers),
+                                     self.rfile.read(length)))
+        body = json.dumps({'value': [], 'isError': False}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestMultipart(unittest.TestCase):
+    """Streaming multipart/form-data uploads"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, 'scan.csv')
+        self.content = b'a,b\n' + b'1,2\n' * 50000
+        with open(self.path, 'wb') as f:
+            f.write(self.content)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_body_matches_urllib3(self):
+        fields = [('metadata', 'x'), ('count', 3),
+                  ('file', ('scan.csv', self.content, 'text/csv'))]
+        expected, content_type = encode_multipart_formdata(fields, 'b0und')
+
+        streamed = [('metadata', 'x'), ('count', 3),
+                    ('file', ('scan.csv', UploadFile(self.path), 'text/csv'))]
+        encoder = MultipartEncoder(streamed, boundary='b0und')
+        self.assertEqual(b''.join(encoder), expected)
+        self.assertEqual(encoder.content_type, content_type)
+        self.assertEqual(encoder.content_length, len(expected))
+        # every iteration produces the whole body again
+        self.assertEqual(b''.join(encoder), expected)
+
+    def test_files_are_read_in_chunks(self):
+        encoder = MultipartEncoder([('file', ('scan.csv', UploadFile(
+            self.path), 'text/csv'))], chunk_size=4096)
+        self.assertLessEqual(max(len(chunk) for chunk in encoder), 4096)
+
+    def test_progress(self):
+        calls = []
+        upload = UploadFile(self.path, progress=lambda *args: calls.append(
+            args))
+        b''.join(MultipartEncoder([('file', (upload.filename, upload,
+                                             upload.mimetype))],
+                                  chunk_size=65536))
+        self.assertEqual(calls[-1], (len(self.content), len(self.content)))
+        self.assertEqual(len(calls), -(-len(self.content) // 65536))
+
+    def test_file_objects(self):
+        stream = io.BytesIO(b'skip' + self.content)
+        stream.seek(4)
+        upload = UploadFile(stream, filename='scan.csv')
+        self.assertEqual(upload.size, len(self.content))
+        self.assertEqual(upload.mimetype, 'text/csv')
+        self.assertEqual(b''.join(upload.chunks()), self.content)
+        self.assertEqual(b''.join(upload.chunks()), self.content)
+        self.assertFalse(stream.closed)
+
+    def test_unknown_size(self):
+        class Pipe(object):
+            def __init__(self, data):
+                self.read = io.BytesIO(data).read
+
+        encoder = MultipartEncoder([('file', ('f', UploadFile(
+            Pipe(self.content)), 'text/plain'))])
+        self.assertIsNone(encoder.content_length)
+
+    def test_prepare_post_parameters_does_not_read_files(self):
+        params = deep_lynx.ApiClient().prepare_post_parameters(
+            [], {'file': self.path, 'metadata': None})
+        self.assertEqual(len(params), 1)
+        name, (filename, upload, mimetype) = params[0]
+        self.assertEqual((name, filename, mimetype),
+                         ('file', 'scan.csv', 'text/csv'))
+        self.assertIsInstance(upload, UploadFile)
+
+    def test_upload_file_streams_to_server(self):
+        server = BaseHTTPServer.HTTPServer(('127.0.0.1', 0), UploadHandler)
+        server.received = []
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            configuration = deep_lynx.Configuration()
+            configuration.host = 'http://127.0.0.1:%d' % server.server_port
+            configuration.upload_chunk_size = 8192
+            calls = []
+            client = deep_lynx.ApiClient(configuration)
+            collector = deep_lynx.MetricsCollector()
+            client.add_hook(collector)
+            DataSourcesApi(client).upload_file(
+                'c1', 'd1', file=UploadFile(
+                    self.path, progress=lambda *args: calls.append(args)))
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+        headers, body = server.received[0]
+        self.assertTrue(headers['Content-Type'].startswith(
+            'multipart/form-data; boundary='))
+        self.assertIn(b'filename="scan.csv"', body)
+        self.assertIn(self.content, body)
+        self.assertEqual(calls[-1], (len(self.content), len(self.content)))
+        recorded, = collector.to_dict().values()
+        self.assertEqual(recorded['request_bytes'], len(body))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,214 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import unittest
+
+import deep_lynx
+from deep_lynx import bulk
+from deep_lynx.api.graph_api import GraphApi
+from deep_lynx.node_index import NodeIndex
+
+from test.test_metrics import FakeResponse
+
+
+class Server(object):
+    """Stores nodes and edges, and finds nodes by original id through
+    GraphQL"""
+
+    def __init__(self, nodes=(), graphql=True):
+        # (metatype_id, original id) -> node id
+        self.nodes = dict(nodes)
+        self.graphql = graphql
+        self.edges = []
+        self.queries = []
+        self._lock = threading.Lock()
+
+    def data(self, query):
+        with self._lock:
+            self.queries.append(query)
+        operator, value = re.search(
+            r'original_id: \{operator: "(\w+)", value: "([^"]*)"\}',
+            query).groups()
+        wanted = value.split(',') if operator == 'in' else [value]
+        return {'data': {'metatypes': {'Asset': [
+            {'_record': {'id': self.nodes[('m1', original_id)],
+                         'original_id': original_id}}
+            for original_id in wanted if ('m1', original_id) in self.nodes]}}}
+
+    def request(self, method, url, query_params=None, body=None, **kwargs):
+        query = dict(query_params or [])
+        if url.endswith('/data'):
+            if not self.graphql:
+                raise deep_lynx.rest.ApiException(status=400,
+                                                  reason='Bad Request')
+            value = self.data(body['query'])
+        elif url.endswith('/metatypes/m1'):
+            value = {'value': {'id': 'm1', 'name': 'Asset'}}
+        elif url.endswith('/metatypes'):
+            value = {'value': [{'id': 'm1', 'name': 'Asset'}]}
+        elif url.endswith('/graphs/edges'):
+            with self._lock:
+                self.edges.extend(body)
+            value = {'value': [dict(edge, id='e%s-%s' % (
+                edge['origin_id'], edge['destination_id']))
+                for edge in body]}
+        elif method == 'POST':
+            value = {'value': []}
+            for node in body:
+                node_id = 'n' + node['original_data_id']
+                with self._lock:
+                    self.nodes[(node['metatype_id'],
+                                node['original_data_id'])] = node_id
+                value['value'].append(dict(node, id=node_id))
+        else:
+            nodes = [{'id': node_id, 'metatype_id': metatype_id,
+                      'original_data_id': original_id}
+                     for (metatype_id, original_id), node_id
+                     in sorted(self.nodes.items())
+                     if metatype_id == query['metatypeID']]
+            offset, limit = int(query['offset']), int(query['limit'])
+            value = {'value': nodes[offset:offset + limit]}
+        return FakeResponse(data=json.dumps(value).encode('utf-8'))
+
+
+def edge(origin, destination):
+    return {'origin_metatype_id': 'm1', 'origin_original_id': origin,
+            'destination_metatype_id': 'm1',
+            'destination_original_id': destination,
+            'relationship_pair_id': 'p1', 'properties': {}}
+
+
+class TestNodeIndex(unittest.TestCase):
+    """Resolving edge endpoints with a local node index"""
+
+    def api(self, server):
+        client = deep_lynx.ApiClient(deep_lynx.Configuration())
+        client.request = server.request
+        return GraphApi(client)
+
+    def test_nodes_upserted_resolve_edges_locally(self):
+        server = Server()
+        api = self.api(server)
+        index = NodeIndex()
+        api.bulk_upsert_nodes('c1', [
+            {'metatype_id': 'm1', 'original_data_id': str(i),
+             'data_source_id': 'd1', 'properties': {}} for i in range(30)],
+            index=index, chunk_records=7)
+        self.assertEqual(len(index), 30)
+        self.assertEqual(index.get(('m1', '4')), 'n4')
+
+        result = api.bulk_upsert_edges(
+            'c1', [edge(str(i), str(i + 1)) for i in range(29)],
+            index=index, chunk_records=10)
+        self.assertTrue(result.ok)
+        self.assertEqual(result.ids[3], 'en3-n4')
+        self.assertEqual(server.queries, [])
+
+    def test_missing_keys_are_looked_up_in_batches(self):
+        server = Server(dict((('m1', str(i)), 'n%d' % i)
+                             for i in range(50)))
+        index = NodeIndex()
+        edges = [edge(str(i), str(i + 1)) for i in range(49)]
+        edges.append(edge('0', 'unknown'))
+        edges.append(dict(edge('1', 'unknown'), destination_id='n7'))
+        result = self.api(server).bulk_upsert_edges('c1', edges,
+                                                     index=index,
+                                                     chunk_records=20)
+        self.assertEqual(result.failed(), [49])
+        self.assertIn("destination ('m1', 'unknown')", result.errors[49])
+        self.assertEqual(result.ids[50], 'en1-n7')
+        self.assertEqual(len(server.edges), 50)
+        # a query per batch of edges for its unknown endpoints, and one
+        # more for the 21 original ids of the first batch
+        self.assertEqual(len(server.queries), 4)
+        self.assertTrue(all(len(re.search(r'value: "([^"]*)"', query)
+                                .group(1).split(',')) <= 20
+                            for query in server.queries))
+        self.assertEqual(len(index), 50)
+
+    def test_failed_lookups_reject_their_edges(self):
+        server = Server(graphql=False)
+        index = NodeIndex()
+        index.add(('m1', 'a'), 'na')
+        index.add(('m1', 'b'), 'nb')
+        edges = [edge('a', 'b'), edge('a', 'c')]
+        with self.assertLogs('deep_lynx.node_index', 'WARNING'):
+            result = self.api(server).bulk_upsert_edges('c1', edges,
+                                                         index=index)
+        self.assertEqual(result.ids[0], 'ena-nb')
+        self.assertEqual(result.failed(), [1])
+        self.assertIn("destination ('m1', 'c') (lookup failed: ",
+                      result.errors[1])
+
+    def test_user_keys_and_no_lookups(self):
+        server = Server(dict([(('m1', 'a'), 'n1')]))
+        index = NodeIndex()
+        index.add('pump-1', 'n1')
+        index.add('pump-2', 'n2')
+        edges = [{'from': 'pump-1', 'to': 'pump-2'},
+                 {'from': 'pump-1', 'to': 'pump-3'}]
+        result = self.api(server).bulk_upsert_edges(
+            'c1', edges, index=index, origin=lambda edge: edge['from'],
+            destination=lambda edge: edge['to'])
+        self.assertEqual(result.ids[0], 'en1-n2')
+        self.assertEqual(result.failed(), [1])
+
+        result = self.api(server).bulk_upsert_edges(
+            'c1', [edge('a', 'a')], index=NodeIndex(), resolve=False)
+        self.assertEqual(result.failed(), [0])
+        self.assertEqual(server.queries, [])
+
+    def test_user_keys_are_not_looked_up(self):
+        server = Server(dict([(('m1', 'a'), 'n1'), (('m1', 'b'), 'n2')]))
+        edges = [{'from': 'a', 'to': 'b'}]
+        result = self.api(server).bulk_upsert_edges(
+            'c1', edges, index=NodeIndex(),
+            origin=lambda edge: ('m1', edge['from']),
+            destination=lambda edge: ('m1', edge['to']))
+        self.assertEqual(result.failed(), [0])
+        self.assertNotIn("lookup failed", result.errors[0])
+        self.assertEqual(server.queries, [])
+
+    def test_scan_fills_the_index(self):
+        server = Server(dict((('m1', str(i)), 'n%d' % i) for i in range(25)))
+        index = NodeIndex()
+        client = self.api(server).api_client
+        client.configuration.response_mode = 'dict'
+        self.assertEqual(index.scan(client, 'c1', page_size=10), 25)
+        self.assertEqual(index.get(('m1', '24')), 'n24')
+
+    def test_disk_backed_index(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, 'nodes')
+        with NodeIndex(path) as index:
+            index.add(('m1', 'a'), 'n1')
+            index.add_node({'id': 'n2', 'metatype_id': 'm1',
+                            'original_data_id': 'b'})
+        with NodeIndex(path) as index:
+            self.assertEqual(len(index), 2)
+            self.assertEqual(index.get(('m1', 'b')), 'n2')
+            self.assertIsNone(index.get(('m1', 'c')))
+            index.add(('m1', 'b'), 'n3')
+            for i in range(2500):
+                index.add(('m2', str(i)), 'n%d' % i)
+        self.assertTrue(os.path.isfile(path))
+        with NodeIndex(path) as index:
+            self.assertEqual(len(index), 2502)
+            self.assertEqual(index.get(('m1', 'b')), 'n3')
+            self.assertEqual(index.get(('m2', '2499')), 'n2499')
+        client = self.api(Server()).api_client
+        self.assertIsInstance(
+            next(NodeIndex().edges(client, 'c1', [edge('x', 'y')],
+                                   resolve=False)), bulk.Rejected)
+
+
+if __name__ == '__main__':
+    unittest.main()
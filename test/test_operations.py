@@ -0,0 +1,105 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import inspect
+import re
+import unittest
+
+import deep_lynx
+import deep_lynx.api
+from deep_lynx import operations
+from deep_lynx.api.data_sources_api import DataSourcesApi
+from deep_lynx.api.graph_api import GraphApi
+
+
+class RecordingClient(deep_lynx.ApiClient):
+    """Client that returns the arguments of call_api instead of sending"""
+
+    def call_api(self, *args, **kwargs):
+        return args, kwargs
+
+
+class TestOperations(unittest.TestCase):
+    """The operation registry and its dispatcher"""
+
+    def setUp(self):
+        self.client = RecordingClient(deep_lynx.Configuration())
+
+    def test_every_api_method_is_registered(self):
+        methods = set()
+        for name in deep_lynx.api.__all__:
+            for attr, method in vars(getattr(deep_lynx.api, name)).items():
+                if attr.endswith('_with_http_info'):
+                    attr = attr[:-len('_with_http_info')]
+                    methods.add(attr)
+                    operation = operations.OPERATIONS[attr]
+                    params = [p for p in inspect.signature(method).parameters
+                              if p not in ('self', 'kwargs')]
+                    self.assertEqual(tuple(params), operation.params, attr)
+        self.assertEqual(methods, set(operations.OPERATIONS))
+
+    def test_path_params_match_templates(self):
+        for name, operation in operations.OPERATIONS.items():
+            self.assertEqual(name, operation.name)
+            self.assertEqual(
+                set(re.findall(r'\{(\w+)\}', operation.path)),
+                set(wire for wire, _ in operation.path_params), name)
+            declared = set(operation.params + operation.optional)
+            for table in (operation.path_params, operation.query,
+                          operation.headers, operation.form,
+                          operation.files):
+                for _, param in table:
+                    self.assertIn(param, declared, name)
+
+    def test_dispatch(self):
+        api = GraphApi(self.client)
+        args, kwargs = api.list_nodes('c1', limit=10, metatype_id='m1',
+                                      _response_mode='dict')
+        path, method, path_params, query_params, header_params = args
+        self.assertEqual(path, '/containers/{container_id}/graphs/nodes')
+        self.assertEqual(method, 'GET')
+        self.assertEqual(path_params, {'container_id': 'c1'})
+        self.assertEqual(query_params, [('limit', 10),
+                                        ('metatypeID', 'm1')])
+        self.assertEqual(header_params, {'Accept': 'application/json'})
+        self.assertEqual(kwargs['response_type'], 'ListNodesResponse')
+        self.assertEqual(kwargs['auth_settings'], ['BearerAuth'])
+        self.assertTrue(kwargs['_return_http_data_only'])
+        self.assertTrue(kwargs['_preload_content'])
+        self.assertEqual(kwargs['_response_mode'], 'dict')
+        self.assertIsNone(kwargs['body'])
+
+        # fresh containers on every call, call_api may modify them
+        again, _ = api.list_nodes('c2')
+        self.assertEqual(again[2], {'container_id': 'c2'})
+        self.assertEqual(again[3], [])
+        self.assertIsNot(again[4], header_params)
+
+    def test_body_form_and_options(self):
+        api = DataSourcesApi(self.client)
+        args, kwargs = api.create_data_source({'name': 's'}, 'c1')
+        self.assertEqual(kwargs['body'], {'name': 's'})
+        self.assertEqual(args[4]['Content-Type'], 'application/json')
+
+        args, kwargs = api.download_file('c1', 'f1',
+                                         _download_path='/tmp/out')
+        self.assertEqual(args[4], {'Accept': 'application/octet-stream'})
+        self.assertEqual(kwargs['_download_path'], '/tmp/out')
+
+    def test_argument_errors(self):
+        api = GraphApi(self.client)
+        with self.assertRaises(TypeError) as context:
+            api.list_nodes('c1', bogus=1)
+        self.assertEqual(str(context.exception),
+                         "Got an unexpected keyword argument 'bogus' to "
+                         "method list_nodes")
+        with self.assertRaises(ValueError) as context:
+            api.retrieve_node('c1', None)
+        self.assertEqual(str(context.exception),
+                         "Missing the required parameter `node_id` when "
+                         "calling `retrieve_node`")
+
+
+if __name__ == '__main__':
+    unittest.main()
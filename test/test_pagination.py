@@ -0,0 +1,149 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import asyncio
+import json
+import threading
+import unittest
+
+import deep_lynx
+from deep_lynx import pagination
+from deep_lynx.api.data_sources_api import DataSourcesApi
+from deep_lynx.api.graph_api import GraphApi
+from deep_lynx.async_api_client import AsyncApiClient
+from deep_lynx.rest import ApiException
+
+from test.test_metrics import FakeResponse
+
+
+class Listing(object):
+    """Serves `total` numbered items by offset and limit"""
+
+    def __init__(self, total, fail_at=None):
+        self.total = total
+        self.fail_at = fail_at
+        self.offsets = []
+        self.in_flight = 0
+        self.most_in_flight = 0
+        self._lock = threading.Lock()
+
+    def page(self, query_params):
+        query = dict(query_params or [])
+        offset, limit = int(query['offset']), int(query['limit'])
+        with self._lock:
+            self.offsets.append(offset)
+        if offset == self.fail_at:
+            raise ApiException(status=500, reason='Server Error')
+        items = [{'id': str(i)}
+                 for i in range(offset, min(offset + limit, self.total))]
+        return FakeResponse(data=json.dumps(
+            {'value': items, 'isError': False}).encode('utf-8'))
+
+    def request(self, method, url, query_params=None, **kwargs):
+        with self._lock:
+            self.in_flight += 1
+            self.most_in_flight = max(self.most_in_flight, self.in_flight)
+        try:
+            return self.page(query_params)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+class TestPages(unittest.TestCase):
+    """Iterating over paginated listings"""
+
+    def api(self, listing, api_class=GraphApi):
+        configuration = deep_lynx.Configuration()
+        configuration.response_mode = 'dict'
+        client = deep_lynx.ApiClient(configuration)
+        client.request = listing.request
+        return api_class(client)
+
+    def test_iterates_every_page(self):
+        listing = Listing(25)
+        nodes = self.api(listing).iter_nodes('c1', metatype_id='m1',
+                                             page_size=10, strategy='offset')
+        self.assertEqual([node['id'] for node in nodes],
+                         [str(i) for i in range(25)])
+        self.assertEqual(sorted(listing.offsets)[:3], [0, 10, 20])
+        # pages past the short one may have been requested, no more than
+        # the prefetch window
+        self.assertLessEqual(len(listing.offsets),
+                             3 + pagination.DEFAULT_PREFETCH)
+
+    def test_short_listing_costs_one_request(self):
+        listing = Listing(3)
+        edges = list(self.api(listing).iter_edges('c1', page_size=10))
+        self.assertEqual(len(edges), 3)
+        self.assertEqual(listing.offsets, [0])
+
+    def test_prefetch_window(self):
+        listing = Listing(100)
+        pages = self.api(listing).iter_nodes_by_metatype_id(
+            'c1', 'm1', page_size=5, prefetch=3, strategy='offset')
+        seen = 0
+        for _ in pages:
+            seen += 1
+            if seen % 5 == 0:
+                # the current page and at most three ahead of it
+                self.assertLessEqual(max(listing.offsets), seen + 15)
+        self.assertEqual(seen, 100)
+        self.assertLessEqual(listing.most_in_flight, 3)
+
+        listing = Listing(30)
+        pages = self.api(listing).iter_nodes('c1', page_size=10, prefetch=0)
+        for index, _ in enumerate(pages):
+            self.assertEqual(len(listing.offsets), index // 10 + 1)
+
+    def test_errors_surface_at_their_page(self):
+        listing = Listing(100, fail_at=20)
+        pages = iter(self.api(listing).iter_nodes('c1', page_size=10))
+        for _ in range(20):
+            next(pages)
+        with self.assertRaises(ApiException):
+            next(pages)
+
+    def test_imports_for_data_source(self):
+        listing = Listing(12)
+        imports = self.api(listing, DataSourcesApi)
+        self.assertEqual(
+            len(list(imports.iter_imports_for_data_source(
+                'c1', 'd1', page_size=5))), 12)
+
+    def test_invalid_arguments(self):
+        api = self.api(Listing(1))
+        with self.assertRaises(ValueError):
+            api.iter_nodes('c1', page_size=0)
+        with self.assertRaises(ValueError):
+            list(api.iter_nodes('c1', _response_mode='raw_bytes'))
+
+
+class TestAsyncPages(unittest.TestCase):
+    """``async for`` over paginated listings"""
+
+    def test_async_iteration(self):
+        listing = Listing(23)
+
+        async def request(method, url, query_params=None, **kwargs):
+            await asyncio.sleep(0)
+            return listing.page(query_params)
+
+        async def read():
+            configuration = deep_lynx.Configuration()
+            configuration.response_mode = 'dict'
+            async with AsyncApiClient(configuration) as client:
+                client.request = request
+                pages = GraphApi(client).iter_nodes('c1', page_size=5,
+                                                    prefetch=2)
+                with self.assertRaises(TypeError):
+                    iter(pages).__next__()
+                return [node['id'] async for node in pages]
+
+        self.assertEqual(asyncio.run(read()), [str(i) for i in range(23)])
+        self.assertEqual(sorted(listing.offsets)[:5], [0, 5, 10, 15, 20])
+
+
+if __name__ == '__main__':
+    unittest.main()
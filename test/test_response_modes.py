@@ -0,0 +1,80 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import inspect
+import unittest
+
+import deep_lynx
+import deep_lynx.api
+from deep_lynx import operations
+from deep_lynx.api.graph_api import GraphApi
+
+BODY = b'{"value": [{"id": "1", "properties": {"a": 1}}], "isError": false}'
+
+
+class FakeResponse(object):
+
+    def __init__(self, data=BODY, status=200):
+        self.status = status
+        self.reason = 'OK'
+        self.data = data
+
+    def getheaders(self):
+        return {}
+
+    def getheader(self, name, default=None):
+        return default
+
+
+class TestResponseModes(unittest.TestCase):
+    """model / dict / raw_bytes response modes"""
+
+    def setUp(self):
+        self.configuration = deep_lynx.Configuration()
+        self.client = deep_lynx.ApiClient(self.configuration)
+        self.client.request = lambda *args, **kwargs: FakeResponse()
+        self.api = GraphApi(self.client)
+
+    def test_model_is_default(self):
+        result = self.api.list_nodes('c1')
+        self.assertIsInstance(result, deep_lynx.ListNodesResponse)
+
+    def test_per_call_dict(self):
+        result = self.api.list_nodes('c1', _response_mode='dict')
+        self.assertEqual(result, {'value': [{'id': '1',
+                                             'properties': {'a': 1}}],
+                                  'isError': False})
+
+    def test_per_call_raw_bytes(self):
+        result = self.api.list_nodes('c1', _response_mode='raw_bytes')
+        self.assertEqual(result, BODY)
+
+    def test_per_client_mode_and_override(self):
+        self.configuration.response_mode = 'dict'
+        self.assertIsInstance(self.api.list_nodes('c1'), dict)
+        self.assertIsInstance(self.api.list_nodes('c1', _response_mode='model'),
+                              deep_lynx.ListNodesResponse)
+
+    def test_with_http_info(self):
+        data, status, _ = self.api.list_nodes_with_http_info(
+            'c1', _response_mode='raw_bytes')
+        self.assertEqual((data, status), (BODY, 200))
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            self.api.list_nodes('c1', _response_mode='xml')
+
+    def test_every_generated_method_accepts_mode(self):
+        for _, api_class in inspect.getmembers(deep_lynx.api,
+                                               inspect.isclass):
+            for name, _ in inspect.getmembers(api_class,
+                                              inspect.isfunction):
+                if name.endswith('_with_http_info'):
+                    operation = operations.OPERATIONS[
+                        name[:-len('_with_http_info')]]
+                    self.assertIn('_response_mode', operation.allowed, name)
+
+
+if __name__ == '__main__':
+    unittest.main()
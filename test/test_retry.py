@@ -0,0 +1,195 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import asyncio
+import email.utils
+import json
+import socket
+import threading
+import time
+import unittest
+
+import urllib3
+from six.moves import BaseHTTPServer, socketserver
+
+import deep_lynx
+from deep_lynx import retry
+from deep_lynx.api.containers_api import ContainersApi
+from deep_lynx.api.data_sources_api import DataSourcesApi
+from deep_lynx.async_api_client import AsyncApiClient
+from deep_lynx.rest import ApiException
+
+BODY = json.dumps({'value': [], 'isError': False}).encode('utf-8')
+IMPORTS = ('POST /containers/{container_id}/import/datasources/'
+           '{data_source_id}/imports')
+
+
+class FlakyHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def handle_request(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        self.rfile.read(length)
+        server = self.server
+        with server.lock:
+            server.requests.append(self.command)
+            failure = server.failures.pop(0) if server.failures else None
+        if failure is None:
+            status, headers, body = 200, {}, BODY
+        else:
+            status, headers = failure
+            body = b'busy'
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = handle_request
+
+    def log_message(self, *args):
+        pass
+
+
+class Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+class TestRetry(unittest.TestCase):
+    """Retries with backoff, Retry-After and deadlines"""
+
+    def setUp(self):
+        self.server = Server(('127.0.0.1', 0), FlakyHandler)
+        self.server.lock = threading.Lock()
+        self.server.requests = []
+        self.server.failures = []
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+
+        self.configuration = deep_lynx.Configuration()
+        self.configuration.host = ('http://127.0.0.1:%d' %
+                                   self.server.server_port)
+        self.configuration.retry_policy = retry.RetryPolicy(
+            backoff_factor=0.01)
+        self.client = deep_lynx.ApiClient(self.configuration)
+        self.collector = deep_lynx.MetricsCollector()
+        self.client.add_hook(self.collector)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+    def retries(self):
+        return sum(operation['retries'] for operation in
+                   self.collector.to_dict().values())
+
+    def test_retries_error_statuses(self):
+        self.server.failures = [(503, {}), (502, {})]
+        ContainersApi(self.client).list_containers()
+        self.assertEqual(self.server.requests, ['GET'] * 3)
+        self.assertEqual(self.client.last_response.retries, 2)
+        self.assertEqual(self.retries(), 2)
+
+    def test_gives_up_after_total(self):
+        self.server.failures = [(503, {})] * 5
+        with self.assertRaises(ApiException) as ctx:
+            ContainersApi(self.client).list_containers()
+        self.assertEqual(ctx.exception.status, 503)
+        self.assertEqual(ctx.exception.retries, 3)
+        self.assertEqual(len(self.server.requests), 4)
+        self.assertEqual(self.retries(), 3)
+
+    def test_honours_retry_after(self):
+        self.server.failures = [(429, {'Retry-After': '1'})]
+        started = time.monotonic()
+        ContainersApi(self.client).list_containers()
+        self.assertGreaterEqual(time.monotonic() - started, 1.0)
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_post_is_opt_in(self):
+        api = DataSourcesApi(self.client)
+        self.server.failures = [(503, {})]
+        with self.assertRaises(ApiException):
+            api.create_manual_import('c1', 'd1', body={'a': 1})
+        self.assertEqual(self.server.requests, ['POST'])
+
+        self.configuration.retry_overrides[IMPORTS] = \
+            self.configuration.retry_policy.replace(
+                methods=retry.IDEMPOTENT_METHODS | {'POST'})
+        self.server.failures = [(503, {})]
+        api.create_manual_import('c1', 'd1', body={'a': 1})
+        self.assertEqual(self.server.requests, ['POST'] * 3)
+
+    def test_deadline(self):
+        self.configuration.retry_policy = retry.RetryPolicy(
+            total=10, deadline=0.5)
+        self.server.failures = [(503, {'Retry-After': '2'})]
+        started = time.monotonic()
+        with self.assertRaises(ApiException):
+            ContainersApi(self.client).list_containers()
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_connection_errors_are_retried_for_any_method(self):
+        sock = socket.socket()
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+        sock.close()
+        self.configuration.host = 'http://127.0.0.1:%d' % port
+        client = deep_lynx.ApiClient(self.configuration)
+        with self.assertRaises(urllib3.exceptions.MaxRetryError) as ctx:
+            DataSourcesApi(client).create_manual_import('c1', 'd1',
+                                                        body={'a': 1})
+        self.assertEqual(ctx.exception.retries, 3)
+
+    def test_async_client(self):
+        self.server.failures = [(503, {}), (429, {'Retry-After': '0'})]
+
+        async def run():
+            async with AsyncApiClient(self.configuration) as client:
+                await ContainersApi(client).list_containers()
+                return client.last_response.retries
+        self.assertEqual(asyncio.run(run()), 2)
+        self.assertEqual(len(self.server.requests), 3)
+
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def test_full_jitter(self):
+        policy = retry.RetryPolicy(backoff_factor=1, backoff_max=5)
+        for retries in range(6):
+            delay = policy.backoff(retries)
+            self.assertGreaterEqual(delay, 0)
+            self.assertLessEqual(delay, min(5, 2 ** retries))
+
+    def test_retry_after_is_capped(self):
+        attempts = retry.RetryPolicy(backoff_max=5).start('GET')
+        self.assertEqual(
+            attempts.retry_response(429, {'Retry-After': '86400'}), 5)
+        self.assertEqual(attempts.retry_response(503, {'Retry-After': '2'}),
+                         2)
+
+    def test_statuses_without_dropped_connections(self):
+        policy = retry.RetryPolicy(methods={'POST'}, retry_dropped=False)
+        attempts = policy.start('POST')
+        self.assertIsNone(attempts.retry_error(connected=True))
+        self.assertIsNotNone(attempts.retry_error(connected=False))
+        self.assertIsNotNone(attempts.retry_response(503, {}))
+        self.assertFalse(policy.replace(total=1).retry_dropped)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(retry.parse_retry_after('7'), 7.0)
+        self.assertIsNone(retry.parse_retry_after('soon'))
+        self.assertIsNone(retry.parse_retry_after(None))
+        date = email.utils.formatdate(time.time() + 60, usegmt=True)
+        self.assertAlmostEqual(retry.parse_retry_after(date), 60, delta=2)
+        past = email.utils.formatdate(time.time() - 60, usegmt=True)
+        self.assertEqual(retry.parse_retry_after(past), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import json
+import threading
+import time
+import unittest
+
+import deep_lynx
+from deep_lynx import scan
+from deep_lynx.api.graph_api import GraphApi
+from deep_lynx.rest import ApiException
+
+from test.test_metrics import FakeResponse
+
+
+class Container(object):
+    """Serves the metatypes, data sources and nodes of one container"""
+
+    def __init__(self, sizes, delay=0.0, fail_metatype=None):
+        # nodes per metatype; every other node has data source d1
+        self.sizes = sizes
+        self.delay = delay
+        self.fail_metatype = fail_metatype
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def nodes(self, metatype_id):
+        return [{'id': '%s-%d' % (metatype_id, i), 'metatype_id': metatype_id,
+                 'data_source_id': 'd1' if i % 2 == 0 else None}
+                for i in range(self.sizes[metatype_id])]
+
+    def request(self, method, url, query_params=None, **kwargs):
+        query = dict(query_params or [])
+        with self._lock:
+            self.requests.append((url, query))
+        if url.endswith('/metatypes'):
+            offset = int(query.get('offset', 0))
+            limit = int(query.get('limit', len(self.sizes)))
+            value = [{'id': metatype_id} for metatype_id in
+                     sorted(self.sizes)[offset:offset + limit]]
+        elif url.endswith('/datasources'):
+            value = [{'id': 'd1'}]
+        else:
+            metatype_id = query['metatypeID']
+            if metatype_id == self.fail_metatype:
+                raise ApiException(status=500, reason='Server Error')
+            time.sleep(self.delay)
+            value = [node for node in self.nodes(metatype_id)
+                     if node['data_source_id'] ==
+                     query.get('dataSourceID', node['data_source_id'])]
+            offset, limit = int(query['offset']), int(query['limit'])
+            value = value[offset:offset + limit]
+        return FakeResponse(data=json.dumps(
+            {'value': value, 'isError': False}).encode('utf-8'))
+
+
+class TestParallelScan(unittest.TestCase):
+    """Scanning container nodes in parallel shards"""
+
+    def api(self, container):
+        configuration = deep_lynx.Configuration()
+        configuration.response_mode = 'dict'
+        client = deep_lynx.ApiClient(configuration)
+        client.request = container.request
+        return GraphApi(client)
+
+    def test_scans_every_node(self):
+        container = Container({'m1': 23, 'm2': 0, 'm3': 5})
+        nodes = self.api(container).scan_nodes('c1', workers=4, page_size=5)
+        ids = [node['id'] for node in nodes]
+        self.assertEqual(sorted(ids), sorted(
+            node['id'] for metatype_id in container.sizes
+            for node in container.nodes(metatype_id)))
+        progress = sorted(nodes.progress(),
+                          key=lambda shard: shard[0]['metatype_id'])
+        self.assertEqual([(filters, items, done)
+                          for filters, items, _, done in progress],
+                         [({'metatype_id': 'm1'}, 23, True),
+                          ({'metatype_id': 'm2'}, 0, True),
+                          ({'metatype_id': 'm3'}, 5, True)])
+        # pages past the end of a shard may have been requested
+        self.assertEqual([pages >= least for (_, _, pages, _), least
+                          in zip(progress, [5, 1, 2])], [True] * 3)
+
+    def test_workers_steal_pages_of_large_shards(self):
+        container = Container({'m1': 200, 'm2': 1}, delay=0.005)
+        seen = []
+        nodes = self.api(container).scan_nodes(
+            'c1', workers=4, page_size=10, on_progress=seen.append)
+        self.assertEqual(len(list(nodes)), 201)
+        offsets = [int(query['offset']) for url, query in container.requests
+                   if query.get('metatypeID') == 'm1']
+        # every page fetched once, no more than the workers past the end
+        self.assertEqual(sorted(offsets)[:20], list(range(0, 200, 10)))
+        self.assertLessEqual(len(offsets), 20 + 4)
+        large = [shard for shard in nodes.shards
+                 if shard.filters['metatype_id'] == 'm1'][0]
+        self.assertTrue(large.done)
+        self.assertIsNotNone(large.finished)
+        self.assertIn(large, seen)
+
+    def test_shards_by_metatype_and_data_source(self):
+        container = Container({'m1': 9, 'm2': 4})
+        nodes = self.api(container).scan_nodes(
+            'c1', by=('metatype', 'data_source'), page_size=2)
+        self.assertEqual(len(list(nodes)), 5 + 2)
+        self.assertEqual(sorted(shard.filters['metatype_id']
+                                for shard in nodes.shards), ['m1', 'm2'])
+        self.assertTrue(all(shard.filters['data_source_id'] == 'd1'
+                            for shard in nodes.shards))
+
+        nodes = self.api(container).scan_nodes(
+            'c1', shards=[{'metatype_id': 'm2'}], page_size=2)
+        self.assertEqual(len(list(nodes)), 4)
+
+    def test_errors_stop_the_scan(self):
+        container = Container({'m1': 50, 'm2': 50}, fail_metatype='m2')
+        with self.assertRaises(ApiException):
+            list(self.api(container).scan_nodes('c1', workers=2,
+                                                page_size=5))
+
+    def test_caller_stops_early(self):
+        container = Container({'m%d' % i: 100 for i in range(8)})
+        nodes = self.api(container).scan_nodes('c1', workers=4, page_size=1,
+                                               buffer=1)
+        for index, _ in enumerate(nodes):
+            if index == 3:
+                break
+        time.sleep(0.3)
+        count = len(container.requests)
+        time.sleep(0.2)
+        self.assertEqual(len(container.requests), count)
+        self.assertFalse(any(thread.name.startswith('deep_lynx-scan')
+                             for thread in threading.enumerate()))
+
+    def test_invalid_arguments(self):
+        api = self.api(Container({}))
+        with self.assertRaises(ValueError):
+            api.scan_nodes('c1', by=('owner',))
+        with self.assertRaises(ValueError):
+            api.scan_nodes('c1', workers=0)
+        self.assertEqual(list(api.scan_nodes('c1')), [])
+        self.assertEqual(scan.item_id({'id': 'a'}), 'a')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import datetime
+import inspect
+import unittest
+
+import numpy
+import six
+
+import deep_lynx
+import deep_lynx.models
+from deep_lynx import deserializer, serializer
+from test.test_deserializer import sample
+
+
+def legacy_sanitize(obj):
+    """The uncompiled `ApiClient.sanitize_for_serialization` the encoders
+    must match."""
+    if obj is None:
+        return None
+    elif isinstance(obj, deserializer.PRIMITIVE_TYPES):
+        return obj
+    elif isinstance(obj, list):
+        return [legacy_sanitize(sub_obj) for sub_obj in obj]
+    elif isinstance(obj, tuple):
+        return tuple(legacy_sanitize(sub_obj) for sub_obj in obj)
+    elif isinstance(obj, (datetime.datetime, datetime.date)):
+        return obj.isoformat()
+
+    if isinstance(obj, dict):
+        obj_dict = obj
+    elif not hasattr(obj, 'swagger_types'):
+        return obj
+    else:
+        obj_dict = {obj.attribute_map[attr]: getattr(obj, attr)
+                    for attr, _ in six.iteritems(obj.swagger_types)
+                    if getattr(obj, attr) is not None}
+
+    return {key: legacy_sanitize(val)
+            for key, val in six.iteritems(obj_dict)}
+
+
+class TestSerializer(unittest.TestCase):
+    """Compiled encoders give the same results as the generic walk"""
+
+    def models(self):
+        for _, klass in inspect.getmembers(deep_lynx.models,
+                                           inspect.isclass):
+            if hasattr(klass, 'swagger_types'):
+                try:
+                    yield deserializer.deserialize(
+                        sample(klass.__name__), klass.__name__)
+                except ValueError:
+                    # deeply nested samples leave out required fields
+                    continue
+
+    def test_every_model_matches_legacy_encoding(self):
+        for model in self.models():
+            self.assertEqual(serializer.serialize(model),
+                             legacy_sanitize(model), type(model).__name__)
+
+    def test_plain_data_is_returned_untouched(self):
+        records = [{'container_id': '1', 'properties': {'a': [1, 2.5]},
+                    'active': True, 'missing': None} for _ in range(3)]
+        self.assertIs(serializer.serialize(records), records)
+        self.assertIs(serializer.serialize(records[0]), records[0])
+
+    def test_containers_are_copied_on_change(self):
+        when = datetime.datetime(2024, 1, 2, 3, 4, 5)
+        node = deep_lynx.CreateOrUpdateNodesRequest(
+            container_id='1', data_source_id='2', metatype_id='3')
+        body = {'nodes': [{'id': '1'}, node], 'at': (when, 'x'),
+                'n': numpy.int64(3)}
+        result = serializer.serialize(body)
+        self.assertEqual(result, legacy_sanitize(body))
+        self.assertEqual(result['at'], ('2024-01-02T03:04:05', 'x'))
+        self.assertIs(result['nodes'][0], body['nodes'][0])
+        self.assertIsInstance(body['nodes'][1],
+                              deep_lynx.CreateOrUpdateNodesRequest)
+
+    def test_compact_models_send_undecoded_fields(self):
+        data = {'id': '1', 'metatype': {'id': '5', 'name': 'n',
+                                        'description': 'd'},
+                'properties': {'a': 1}}
+        node = deserializer.deserialize(data, 'Node', compact=True)
+        self.assertEqual(serializer.serialize(node), data)
+        node.metatype.name = 'm'
+        self.assertEqual(serializer.serialize(node)['metatype']['name'], 'm')
+
+    def test_custom_properties_are_used(self):
+        class Model(object):
+            swagger_types = {'name': 'str'}
+            attribute_map = {'name': 'Name'}
+
+            @property
+            def name(self):
+                return 'computed'
+
+        self.assertEqual(serializer.serialize(Model()), {'Name': 'computed'})
+
+    def test_api_client_uses_encoders(self):
+        client = deep_lynx.ApiClient()
+        records = [{'id': '1'}]
+        self.assertIs(client.sanitize_for_serialization(records), records)
+
+
+if __name__ == '__main__':
+    unittest.main()